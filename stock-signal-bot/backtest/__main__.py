@@ -0,0 +1,34 @@
+"""
+python -m backtest [--start YYYY-MM-DD] [--end YYYY-MM-DD] [--universe KOSPI200]
+                   [종목코드 ...]
+"""
+from __future__ import annotations
+
+import argparse
+from datetime import date
+
+import pandas as pd
+
+from backtest.engine import run_backtest
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="캐시 일봉 기반 전략/앙상블 백테스트")
+    parser.add_argument("codes", nargs="*", help="종목코드 (생략 시 캐시 전체)")
+    parser.add_argument("--start", type=date.fromisoformat)
+    parser.add_argument("--end", type=date.fromisoformat)
+    parser.add_argument("--universe", help="시점 기준 편입 종목만 진입 (예: KOSPI200)")
+    args = parser.parse_args()
+
+    report = run_backtest(
+        args.codes or None, args.start, args.end, universe=args.universe
+    )
+    print(f"기간: {report.start} ~ {report.end}, 종목 {report.tickers}개")
+    with pd.option_context(
+        "display.float_format", "{:.3f}".format, "display.width", 120
+    ):
+        print(report.to_frame())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,264 @@
+"""앙상블 백테스트 — 캐시된 일봉 전체 이력을 벡터 시리즈로 재생
+
+체결 규칙 (롱 온리, 종목당 1포지션, 자본 1/N 균등 배분):
+- t일 종가 기준 시그널 → t+1일 시가에 진입/청산
+- 진입: BUY 이상, 청산: SELL 이하
+- 손절: 장중 저가가 진입가 × (1 - 손절률) 이하 → 손절가(갭하락 시 시가)에 청산
+- 청산 주문 다음 날 시가가 없으면(거래정지) 시가가 생기는 첫날로 미룬다
+"""
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass, field
+from datetime import date
+
+import numpy as np
+import pandas as pd
+from config import LIVERMORE_STOP_LOSS_PCT, ONEIL_STOP_LOSS_PCT
+from data.cache import cached_stock_codes, load_panel
+from signals.models import SignalType
+from strategies.base import BaseStrategy
+from strategies.ensemble import _STRATEGIES, _apply_consensus_filter_array
+from strategies.livermore import LivermoreStrategy
+from strategies.panel import Panel, aligned_groups
+
+ENSEMBLE_NAME = "앙상블"
+_TRADING_DAYS = 252
+
+
+@dataclass
+class SignalTensor:
+    """전략별 전 날짜 시그널 — values: (날짜, 종목, 전략) int8"""
+    dates: pd.DatetimeIndex
+    tickers: list[str]
+    strategy_names: list[str]
+    weights: np.ndarray
+    values: np.ndarray
+
+    def ensemble(
+        self, weights: np.ndarray | None = None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """(가중 점수, 컨센서스 필터 후 시그널) — 둘 다 (날짜, 종목)"""
+        weights = self.weights if weights is None else weights
+        scores = np.zeros(self.values.shape[:2])
+        for j, w in enumerate(weights):
+            scores = scores + self.values[:, :, j] * w
+        return scores, _apply_consensus_filter_array(scores, self.values)
+
+
+@dataclass
+class PerformanceStats:
+    name: str
+    total_return: float      # 누적 수익률
+    cagr: float              # 연환산 수익률
+    max_drawdown: float      # 최대 낙폭 (음수)
+    hit_rate: float          # 수익 거래 비율
+    trades: int              # 청산 완료 거래 수
+    turnover: float          # 연간 회전율 (진입 금액 / 자본)
+    exposure: float          # 평균 투자 비중
+
+
+@dataclass
+class BacktestReport:
+    start: date
+    end: date
+    tickers: int
+    stats: list[PerformanceStats] = field(default_factory=list)
+
+    def to_frame(self) -> pd.DataFrame:
+        return pd.DataFrame([asdict(s) for s in self.stats]).set_index("name")
+
+
+def stop_loss_pct(strategy: BaseStrategy | None) -> float:
+    """
+    전략별 손절률 — 오닐/리버모어는 config 값,
+    그 외·앙상블은 오닐 기준(일간 리포트와 동일)
+    """
+    if isinstance(strategy, LivermoreStrategy):
+        return LIVERMORE_STOP_LOSS_PCT
+    return ONEIL_STOP_LOSS_PCT
+
+
+def compute_signal_tensor(
+    panel: Panel, strategies: list[BaseStrategy] | None = None
+) -> SignalTensor:
+    """각 전략의 evaluate_panel 을 실행해 (날짜, 종목, 전략) 시그널 텐서 구성"""
+    strategies = _STRATEGIES if strategies is None else strategies
+    values = np.stack([_strategy_signals(s, panel) for s in strategies], axis=-1)
+    close = panel["Close"]
+    return SignalTensor(
+        dates=close.index,
+        tickers=[str(c) for c in close.columns],
+        strategy_names=[s.name for s in strategies],
+        weights=np.array([s.weight for s in strategies]),
+        values=values,
+    )
+
+
+def _strategy_signals(strategy: BaseStrategy, panel: Panel) -> np.ndarray:
+    """
+    전 날짜 시그널 (날짜 × 종목 int8) — 실시간 경로(analyze_panel)와 같은 입력.
+    종목마다 종가가 있는 봉만으로 평가하고(aligned_groups), 그때까지 봉 수가
+    min_bars 미만인 날짜와 종가가 없는 날짜는 NEUTRAL.
+    """
+    close = panel["Close"]
+    signal = np.full(close.shape, SignalType.NEUTRAL.value, dtype=np.int8)
+    for cols, group in aligned_groups(panel):
+        rows = close.index.get_indexer(group["Close"].index)
+        values = strategy.evaluate_panel(group)["signal"].to_numpy().astype(np.int8)
+        values[: strategy.min_bars - 1] = SignalType.NEUTRAL.value
+        signal[np.ix_(rows, cols)] = values
+    return signal
+
+
+def simulate(
+    panel: Panel,
+    signal: np.ndarray,
+    stop_pct: float,
+    name: str = "",
+) -> tuple[PerformanceStats, pd.Series]:
+    """
+    (날짜, 종목) 시그널로 체결을 시뮬레이션.
+    시그널은 전 구간 벡터로 계산돼 있고, 포지션 상태만 날짜 순으로 갱신(종목 축 벡터화).
+
+    Returns:
+        (성과 요약, 포트폴리오 일간 수익률)
+    """
+    open_ = panel["Open"].to_numpy()
+    low = panel["Low"].to_numpy()
+    close = panel["Close"].to_numpy()
+    n_days, n_tickers = close.shape
+
+    buy = signal >= SignalType.BUY.value
+    sell = signal <= SignalType.SELL.value
+
+    holding = np.zeros(n_tickers, dtype=bool)
+    entry = np.full(n_tickers, np.nan)
+    stop = np.full(n_tickers, np.nan)
+    ref = np.full(n_tickers, np.nan)       # 당일 수익률 기준가 (전일 종가 또는 진입가)
+    pending_entry = np.zeros(n_tickers, dtype=bool)
+    pending_exit = np.zeros(n_tickers, dtype=bool)
+
+    daily = np.zeros(n_days)
+    invested = np.zeros(n_days)
+    pnl: list[np.ndarray] = []
+    entries = 0
+
+    for t in range(n_days):
+        o, lo, c = open_[t], low[t], close[t]
+        ret = np.zeros(n_tickers)
+
+        # ── 시가 체결: 전일 시그널 청산 → 진입 ─────────────
+        exit_open = pending_exit & holding & ~np.isnan(o)
+        ret[exit_open] = o[exit_open] / ref[exit_open] - 1
+        pnl.append(o[exit_open] / entry[exit_open] - 1)
+        holding &= ~exit_open
+        carried_exit = pending_exit & holding  # 시가 없음 → 다음 시가로 이월
+
+        enter = pending_entry & ~holding & ~np.isnan(o)
+        holding |= enter
+        entry[enter] = o[enter]
+        stop[enter] = o[enter] * (1 - stop_pct)
+        ref[enter] = o[enter]
+        entries += int(enter.sum())
+
+        # ── 장중 손절 ───────────────────────────────────
+        stopped = holding & (lo <= stop)
+        fill = np.where(o < stop, o, stop)  # 갭하락이면 시가 체결
+        ret[stopped] += fill[stopped] / ref[stopped] - 1
+        pnl.append(fill[stopped] / entry[stopped] - 1)
+        holding &= ~stopped
+
+        # ── 종가 평가 (거래정지 등 종가 없음 → 보합) ──────
+        marked = holding & ~np.isnan(c)
+        ret[marked] += c[marked] / ref[marked] - 1
+        ref[marked] = c[marked]
+
+        daily[t] = ret.sum() / n_tickers
+        invested[t] = holding.mean()
+
+        # ── 종가 시그널 → 익일 시가 주문 ─────────────────
+        pending_entry = buy[t] & ~holding
+        pending_exit = (sell[t] | carried_exit) & holding
+
+    returns = pd.Series(daily, index=panel["Close"].index)
+    closed = np.concatenate(pnl) if pnl else np.array([])
+    return _stats(name, returns, closed, entries, n_tickers, invested.mean()), returns
+
+
+def run_backtest(
+    stock_codes: list[str] | None = None,
+    start: date | None = None,
+    end: date | None = None,
+    panel: Panel | None = None,
+    universe: str | None = None,
+) -> BacktestReport:
+    """
+    캐시된 daily_market_data 로 7개 전략 + 앙상블 성과 비교.
+    universe 를 주면 그 날짜에 편입돼 있던 종목만 신규 진입한다 (data.universe 스냅샷 —
+    편출·상장폐지 종목을 포함해 생존 편향 제거). 청산 시그널은 편입 여부와 무관.
+    """
+    if universe:
+        from data.universe import all_members
+
+        stock_codes = stock_codes or all_members(universe)
+    if panel is None:
+        stock_codes = stock_codes or cached_stock_codes()
+        panel = load_panel(stock_codes, start or date(2000, 1, 1), end or date.today())
+    if not panel:
+        raise ValueError("백테스트할 캐시 데이터가 없습니다")
+
+    tensor = compute_signal_tensor(panel)
+    mask = None
+    if universe:
+        from data.universe import membership_mask
+
+        mask = membership_mask(universe, tensor.dates, tensor.tickers)
+    report = BacktestReport(
+        start=tensor.dates[0].date(),
+        end=tensor.dates[-1].date(),
+        tickers=len(tensor.tickers),
+    )
+
+    for j, strategy in enumerate(_STRATEGIES):
+        signal = _point_in_time(tensor.values[:, :, j], mask)
+        stats, _ = simulate(panel, signal, stop_loss_pct(strategy), strategy.name)
+        report.stats.append(stats)
+
+    _, final = tensor.ensemble()
+    final = _point_in_time(final, mask)
+    stats, _ = simulate(panel, final, stop_loss_pct(None), ENSEMBLE_NAME)
+    report.stats.append(stats)
+    return report
+
+
+def _point_in_time(signal: np.ndarray, mask: np.ndarray | None) -> np.ndarray:
+    """편입되지 않은 (날짜, 종목)의 매수 시그널 → NEUTRAL"""
+    if mask is None:
+        return signal
+    keep = mask | (signal < SignalType.BUY.value)
+    return np.where(keep, signal, SignalType.NEUTRAL.value).astype(signal.dtype)
+
+
+def _stats(
+    name: str,
+    returns: pd.Series,
+    closed: np.ndarray,
+    entries: int,
+    n_tickers: int,
+    exposure: float,
+) -> PerformanceStats:
+    equity = (1 + returns).cumprod()
+    years = max(len(returns) / _TRADING_DAYS, 1e-9)
+    total = float(equity.iloc[-1] - 1) if len(equity) else 0.0
+    drawdown = equity / equity.cummax() - 1
+
+    return PerformanceStats(
+        name=name,
+        total_return=total,
+        cagr=float((1 + total) ** (1 / years) - 1) if total > -1 else -1.0,
+        max_drawdown=float(drawdown.min()) if len(drawdown) else 0.0,
+        hit_rate=float((closed > 0).mean()) if len(closed) else 0.0,
+        trades=int(len(closed)),
+        turnover=entries / n_tickers / years,
+        exposure=float(exposure),
+    )
@@ -0,0 +1,233 @@
+"""앙상블 가중치·임계값 파라미터 스윕 (워크포워드 검증)
+
+전략 시그널 텐서는 한 번만 계산하고, 파라미터 조합마다
+(날짜, 종목, 전략) 텐서 × 가중치 벡터 행렬곱으로 점수만 다시 매긴다.
+조합 평가는 프로세스 풀로 분산한다.
+"""
+from __future__ import annotations
+
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+from config import (
+    ENSEMBLE_BUY_THRESHOLD,
+    ENSEMBLE_SELL_THRESHOLD,
+    ENSEMBLE_STRONG_BUY_THRESHOLD,
+    ENSEMBLE_STRONG_SELL_THRESHOLD,
+    SWEEP_WORKERS,
+)
+from strategies.ensemble import _apply_consensus_filter_array
+from strategies.panel import Panel
+
+from backtest.engine import (
+    PerformanceStats,
+    SignalTensor,
+    compute_signal_tensor,
+    simulate,
+    stop_loss_pct,
+)
+
+_TRADING_DAYS = 252
+
+
+@dataclass(frozen=True)
+class SweepParams:
+    weights: tuple[float, ...]
+    buy: float = ENSEMBLE_BUY_THRESHOLD
+    strong_buy: float = ENSEMBLE_STRONG_BUY_THRESHOLD
+    sell: float = ENSEMBLE_SELL_THRESHOLD
+    strong_sell: float = ENSEMBLE_STRONG_SELL_THRESHOLD
+
+
+# ── 파라미터 생성 ──────────────────────────────────────────────────────────
+
+def grid_params(
+    weight_sets: list[tuple[float, ...]],
+    buy_values: list[float],
+    strong_buy_values: list[float],
+    symmetric: bool = True,
+) -> list[SweepParams]:
+    """격자 탐색. symmetric 이면 매도 임계값 = -매수 임계값"""
+    params = []
+    grid = itertools.product(weight_sets, buy_values, strong_buy_values)
+    for weights, buy, strong_buy in grid:
+        if strong_buy <= buy:
+            continue
+        sell, strong_sell = (
+            (-buy, -strong_buy) if symmetric
+            else (ENSEMBLE_SELL_THRESHOLD, ENSEMBLE_STRONG_SELL_THRESHOLD)
+        )
+        params.append(SweepParams(tuple(weights), buy, strong_buy, sell, strong_sell))
+    return params
+
+
+def random_params(
+    n: int,
+    base_weights: np.ndarray,
+    seed: int = 0,
+    concentration: float = 20.0,
+    buy_range: tuple[float, float] = (0.3, 1.0),
+    strong_gap_range: tuple[float, float] = (0.3, 1.0),
+) -> list[SweepParams]:
+    """기본 가중치 주변 디리클레 샘플 + 균등분포 임계값 (대칭)"""
+    rng = np.random.default_rng(seed)
+    params = []
+    for _ in range(n):
+        weights = rng.dirichlet(np.asarray(base_weights) * concentration)
+        buy = rng.uniform(*buy_range)
+        strong_buy = buy + rng.uniform(*strong_gap_range)
+        params.append(SweepParams(
+            tuple(round(float(w), 4) for w in weights),
+            round(buy, 3), round(strong_buy, 3), round(-buy, 3), round(-strong_buy, 3),
+        ))
+    return params
+
+
+def walk_forward_splits(n_days: int, n_splits: int = 4) -> list[tuple[slice, slice]]:
+    """
+    확장 윈도우 워크포워드 — 구간을 n_splits+1 등분,
+    k번째 분할은 [0, k] 학습 / k+1 검증
+    """
+    bounds = np.linspace(0, n_days, n_splits + 2).astype(int)
+    return [
+        (slice(0, bounds[k + 1]), slice(bounds[k + 1], bounds[k + 2]))
+        for k in range(n_splits)
+    ]
+
+
+# ── 평가 ───────────────────────────────────────────────────────────────────
+
+# 워커 프로세스 전역 — 초기화 시 한 번만 전달받음
+_WORKER: dict = {}
+
+
+def _init_worker(
+    values: np.ndarray,
+    prices: dict[str, np.ndarray],
+    dates: pd.DatetimeIndex,
+    splits: list[tuple[slice, slice]],
+    stop_pct: float,
+) -> None:
+    _WORKER.update(
+        values=values,
+        panel={k: pd.DataFrame(v, index=dates) for k, v in prices.items()},
+        splits=splits,
+        stop_pct=stop_pct,
+    )
+
+
+def _evaluate(param_id: int, params: SweepParams) -> list[dict]:
+    """
+    분할마다 학습·검증 구간을 각각 무포지션에서 다시 시뮬레이션한다.
+    (시그널은 인과적이라 전 구간 텐서를 그대로 잘라 쓴다)
+    """
+    values = _WORKER["values"]
+    scores = values @ np.asarray(params.weights)
+    final = _apply_consensus_filter_array(
+        scores, values, params.buy, params.strong_buy, params.sell, params.strong_sell
+    )
+
+    rows = []
+    for k, (train, test) in enumerate(_WORKER["splits"]):
+        train_stats, train_ret = _simulate_split(final, train)
+        test_stats, test_ret = _simulate_split(final, test)
+        rows.append({
+            "param_id": param_id,
+            "split": k,
+            "train_return": _total(train_ret),
+            "train_sharpe": _sharpe(train_ret),
+            "train_hit_rate": train_stats.hit_rate,
+            "train_trades": train_stats.trades,
+            "test_return": _total(test_ret),
+            "test_sharpe": _sharpe(test_ret),
+            "test_max_drawdown": _max_drawdown(test_ret),
+            "test_hit_rate": test_stats.hit_rate,
+            "test_trades": test_stats.trades,
+        })
+    return rows
+
+
+def _simulate_split(
+    final: np.ndarray, rows: slice
+) -> tuple[PerformanceStats, pd.Series]:
+    """한 구간만 잘라 시뮬레이션 — 이전 구간에서 넘어온 포지션 없음"""
+    panel = {k: v.iloc[rows] for k, v in _WORKER["panel"].items()}
+    return simulate(panel, final[rows], _WORKER["stop_pct"])
+
+
+def run_sweep(
+    params: list[SweepParams],
+    panel: Panel,
+    tensor: SignalTensor | None = None,
+    n_splits: int = 4,
+    workers: int = SWEEP_WORKERS,
+) -> pd.DataFrame:
+    """
+    파라미터 조합별 워크포워드 성과 테이블 (분할당 1행).
+    학습·검증 성과와 거래 통계는 구간별로 따로 시뮬레이션한 값이다.
+
+    Returns:
+        param_id, split, 가중치(w_전략명), 임계값, 학습/검증 성과 컬럼 DataFrame
+    """
+    tensor = tensor or compute_signal_tensor(panel)
+    splits = walk_forward_splits(len(tensor.dates), n_splits)
+    initargs = (
+        tensor.values,
+        {k: panel[k].to_numpy() for k in ("Open", "Low", "Close")},
+        tensor.dates,
+        splits,
+        stop_loss_pct(None),
+    )
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        _init_worker(*initargs)
+        results = [_evaluate(i, p) for i, p in enumerate(params)]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=initargs
+        ) as pool:
+            results = list(pool.map(_evaluate, range(len(params)), params,
+                                    chunksize=max(1, len(params) // (workers * 4))))
+
+    table = pd.DataFrame([row for rows in results for row in rows])
+    described = pd.DataFrame([
+        {
+            "param_id": i,
+            **{f"w_{name}": w for name, w in zip(tensor.strategy_names, p.weights)},
+            "buy": p.buy,
+            "strong_buy": p.strong_buy,
+            "sell": p.sell,
+            "strong_sell": p.strong_sell,
+        }
+        for i, p in enumerate(params)
+    ])
+    return described.merge(table, on="param_id")
+
+
+def walk_forward_summary(
+    table: pd.DataFrame, metric: str = "train_sharpe"
+) -> pd.DataFrame:
+    """분할마다 학습 구간 최고 조합을 골라 검증 구간 성과를 나열 (표본 외 성과)"""
+    best = table.loc[table.groupby("split")[metric].idxmax()]
+    return best.sort_values("split").reset_index(drop=True)
+
+
+def _total(returns: pd.Series) -> float:
+    return float((1 + returns).prod() - 1)
+
+
+def _sharpe(returns: pd.Series) -> float:
+    std = returns.std()
+    if not std or np.isnan(std):
+        return 0.0
+    return float(returns.mean() / std * np.sqrt(_TRADING_DAYS))
+
+
+def _max_drawdown(returns: pd.Series) -> float:
+    equity = (1 + returns).cumprod()
+    return float((equity / equity.cummax() - 1).min()) if len(equity) else 0.0
@@ -0,0 +1,53 @@
+"""스크리닝 실행 방식 벤치마크 — 스레드 풀 vs 공유 메모리 프로세스 풀
+
+실행: python -m benchmarks.bench_screener_modes [--sizes 200 2500] [--threads 3]
+                                               [--processes 0]
+
+합성 패널(고정 시드, 네트워크·DB 없음)에서 종목 단위 앙상블 평가 시간만 비교한다.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import time
+
+import pandas as pd
+from config import SCREENER_WORKERS
+from signals.process_pool import screen_with_processes, screen_with_threads
+from strategies.ensemble import required_lookback_days
+
+from benchmarks.synthetic import synthetic_panel
+
+
+def run(sizes: list[int], threads: int, processes: int) -> list[dict]:
+    n_days = required_lookback_days() * 5 // 7
+    rows = []
+    for n in sizes:
+        panel = synthetic_panel(n, n_days)
+        for mode, fn, workers in (
+            ("threads", screen_with_threads, threads),
+            ("processes", screen_with_processes, processes or os.cpu_count() or 1),
+        ):
+            started = time.perf_counter()
+            results = fn(panel, workers)
+            elapsed = time.perf_counter() - started
+            evaluated = sum(signal is not None for _, signal, _, _ in results)
+            rows.append({"tickers": n, "mode": mode, "workers": workers,
+                         "seconds": round(elapsed, 2), "evaluated": evaluated})
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[200, 2500])
+    parser.add_argument("--threads", type=int, default=SCREENER_WORKERS)
+    parser.add_argument("--processes", type=int, default=0, help="0 → CPU 코어 수")
+    args = parser.parse_args()
+
+    print(f"CPU 코어: {os.cpu_count()}")
+    rows = run(args.sizes, args.threads, args.processes)
+    print(pd.DataFrame(rows).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""시그널 결과 타입 마이크로벤치마크 — pydantic 모델 vs __slots__ 내부 타입
+
+실행: python -m benchmarks.bench_signal_models [--stocks 2500] [--repeat 5]
+
+종목 1개 = 전략 7개 결과 + 앙상블 결과 1개 생성 비용만 측정한다 (지표 계산 제외).
+"""
+from __future__ import annotations
+
+import argparse
+import timeit
+
+from signals.models import (
+    EnsembleResult,
+    EnsembleSignal,
+    SignalType,
+    StrategyResult,
+    StrategySignal,
+)
+
+_N_STRATEGIES = 7
+_INDICATORS = {
+    "rsi_14": 55.3, "vol_ratio": 1.42, "ma150": 71200.0, "weekly_bullish": True
+}
+
+
+def _pydantic_stock() -> EnsembleSignal:
+    signals = [
+        StrategySignal(
+            strategy_name=f"전략{i}", signal=SignalType.BUY, confidence=0.6,
+            reason="조건 충족", indicators=dict(_INDICATORS),
+        )
+        for i in range(_N_STRATEGIES)
+    ]
+    return EnsembleSignal(
+        stock_code="005930", stock_name="삼성전자", signal=SignalType.BUY,
+        ensemble_score=0.7, strategy_signals=signals, price=75000.0, change_pct=1.2,
+    )
+
+
+def _slots_stock() -> EnsembleResult:
+    signals = [
+        StrategyResult(f"전략{i}", SignalType.BUY, 0.6, "조건 충족", dict(_INDICATORS))
+        for i in range(_N_STRATEGIES)
+    ]
+    return EnsembleResult(
+        "005930", "삼성전자", SignalType.BUY, 0.7, signals, 75000.0, 1.2
+    )
+
+
+def run(stocks: int, repeat: int) -> dict[str, float]:
+    """종목 stocks 개 처리 시간(초, repeat 회 중 최소)"""
+    results = {}
+    for name, fn in (("pydantic", _pydantic_stock), ("slots", _slots_stock)):
+        results[name] = min(timeit.repeat(fn, number=stocks, repeat=repeat))
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--stocks", type=int, default=2500)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    results = run(args.stocks, args.repeat)
+    for name, seconds in results.items():
+        print(f"{name:>9}: {seconds * 1000:8.1f} ms / {args.stocks}종목 "
+              f"({seconds / args.stocks * 1e6:.1f} µs/종목)")
+    print(f"  speedup: {results['pydantic'] / results['slots']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
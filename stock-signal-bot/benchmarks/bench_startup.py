@@ -0,0 +1,74 @@
+"""시작 비용 벤치마크 — 새 인터프리터에서 모듈 임포트 시간과 함께 로드되는 무거운 패키지
+
+실행: python -m benchmarks.bench_startup [--repeat 5]   (또는 python main.py bench)
+
+Telegram 환경변수 없이 실행해 설정 검증이 임포트 시점으로 돌아오지 않았는지도
+함께 확인한다.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+_ROOT = Path(__file__).resolve().parent.parent
+
+# 측정 대상 — CLI/스케줄러 진입점과 작업이 실제로 쓰는 모듈
+TARGETS = ["config", "main", "signals.generator", "signals.screener"]
+
+# 지연 임포트 대상 — 진입점 임포트만으로는 로드되지 않아야 함
+HEAVY = [
+    "pandas", "pykrx", "yfinance", "telegram", "matplotlib",
+    "apscheduler", "benchmarks.suite",
+]
+
+_PROBE = """
+import json, sys, time
+started = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - started
+loaded = [m for m in {heavy!r} if m in sys.modules]
+print(json.dumps({{"seconds": elapsed, "loaded": loaded}}))
+"""
+
+
+def measure(module: str) -> dict:
+    """새 프로세스에서 module 1회 임포트 → {"seconds", "loaded"}"""
+    env = {k: v for k, v in os.environ.items() if not k.startswith("TELEGRAM_")}
+    out = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(module=module, heavy=HEAVY)],
+        cwd=_ROOT, env=env, capture_output=True, text=True, check=True,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def run(repeat: int = 5, targets: list[str] = TARGETS) -> dict[str, dict]:
+    """모듈별 임포트 시간(초, repeat 회 중 최소)과 로드된 무거운 패키지"""
+    results = {}
+    for module in targets:
+        samples = [measure(module) for _ in range(repeat)]
+        results[module] = {
+            "seconds": min(s["seconds"] for s in samples),
+            "loaded": samples[-1]["loaded"],
+        }
+    return results
+
+
+def report(results: dict[str, dict]) -> None:
+    for module, r in results.items():
+        loaded = ", ".join(r["loaded"]) or "-"
+        print(f"{module:<20} {r['seconds'] * 1000:8.1f} ms   로드: {loaded}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    report(run(args.repeat))
+
+
+if __name__ == "__main__":
+    main()
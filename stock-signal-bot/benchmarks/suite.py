@@ -0,0 +1,355 @@
+"""벤치마크 스위트 — 전략·앙상블·캐시·스크리닝·시작 비용을 합성 데이터로 측정
+
+결과는 JSON 으로 저장한다.
+
+실행: python -m benchmarks.suite [--quick] [--only strategies ensemble ...] [--out PATH]
+비교: python -m benchmarks.suite --compare OLD.json NEW.json [--threshold 0.1]
+      (python main.py bench 도 같은 인자)
+
+- 데이터는 모두 고정 시드 합성 데이터, 네트워크 없음. DB 는 임시 디렉터리의 signals.db
+- 스크리닝은 실제 run_screening 경로 (캐시 조회 → 1차 필터 → 앙상블 → 순위)
+  — 현재가·유니버스·마켓 필터만 합성 값으로 바꾼다
+- 결과 기본 위치: benchmarks/results/<커밋>.json. 항목 키 = (suite, name, params)
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import ExitStack, contextmanager
+from datetime import date, datetime
+from pathlib import Path
+from typing import Callable, Iterator
+from unittest import mock
+
+_ROOT = Path(__file__).resolve().parent.parent
+RESULTS_DIR = _ROOT / "benchmarks" / "results"
+
+SUITES = ["strategies", "ensemble", "cache", "screening", "startup"]
+
+# (전체, --quick) 파라미터
+_HISTORY_DAYS = ([120, 250, 500, 1000], [250])
+_CACHE_TICKERS = ([50, 200], [50])
+_SCREENING_TICKERS = ([50, 200, 2500], [50])
+
+
+def _best(fn: Callable[[], object], repeat: int, number: int = 1) -> float:
+    """fn 1회 평균 시간(초) — repeat 회 중 최솟값"""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(number):
+            fn()
+        best = min(best, (time.perf_counter() - started) / number)
+    return best
+
+
+def _result(
+    suite: str, name: str, params: dict, seconds: float, ops: int = 1, **extra
+) -> dict:
+    """seconds: 1회 실행 시간, ops: 1회에 처리한 단위 수 (행·종목)"""
+    return {
+        "suite": suite, "name": name, "params": params,
+        "seconds": round(seconds, 6),
+        "ops_per_s": round(ops / seconds, 1) if seconds else None,
+        **extra,
+    }
+
+
+@contextmanager
+def _workspace() -> Iterator[Path]:
+    """임시 디렉터리에 DB 초기화 후 그 안에서 실행 (DB_PATH 는 상대 경로)"""
+    from db.database import init_db
+
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory(prefix="bench-") as tmp:
+        os.chdir(tmp)
+        try:
+            init_db()
+            yield Path(tmp)
+        finally:
+            os.chdir(cwd)
+
+
+# ── 스위트 ───────────────────────────────────────────────────────────────────
+
+def bench_strategies(quick: bool, repeat: int) -> list[dict]:
+    """전략별 analyze — 이력 길이별"""
+    from strategies.ensemble import _STRATEGIES
+
+    from benchmarks.synthetic import synthetic_frame
+
+    rows = []
+    for days in _HISTORY_DAYS[quick]:
+        df = synthetic_frame(days, seed=1)
+        for strategy in _STRATEGIES:
+            seconds = _best(lambda: strategy.analyze(df, "000001"), repeat)
+            rows.append(_result(
+                "strategies", type(strategy).__name__, {"days": days}, seconds
+            ))
+    return rows
+
+
+def bench_ensemble(quick: bool, repeat: int) -> list[dict]:
+    """종목 1개 앙상블 — 메모 없음 / 메모 적중"""
+    from strategies.ensemble import generate_ensemble_signal, required_lookback_days
+
+    from benchmarks.synthetic import synthetic_frame
+
+    df = synthetic_frame(required_lookback_days() * 5 // 7, seed=2)
+    price = float(df["Close"].iloc[-1])
+    rows = [_result(
+        "ensemble", "generate_ensemble_signal", {"memo": False},
+        _best(lambda: generate_ensemble_signal("000001", df, price, 0.0), repeat),
+    )]
+    with _workspace():
+        def memoized():
+            return generate_ensemble_signal("000001", df, price, 0.0, memo=True)
+
+        memoized()
+        rows.append(_result(
+            "ensemble", "generate_ensemble_signal", {"memo": True},
+            _best(memoized, repeat),
+        ))
+    return rows
+
+
+def bench_cache(quick: bool, repeat: int) -> list[dict]:
+    """
+    일봉 캐시 처리량 — 쓰기(save_to_cache)·종목별 읽기(load_cached)·
+    패널 읽기(load_panel)
+    """
+    from data.cache import load_cached, load_panel, save_to_cache
+
+    from benchmarks.synthetic import synthetic_frame
+
+    days = 250
+    rows = []
+    for n in _CACHE_TICKERS[quick]:
+        frames = {f"{i:06d}": synthetic_frame(days, seed=i) for i in range(n)}
+        start, end = frames["000000"].index[0].date(), frames["000000"].index[-1].date()
+        with _workspace():
+            def write():
+                for code, df in frames.items():
+                    save_to_cache(code, df)
+
+            write_s = _best(write, repeat=1)
+            read_s = _best(
+                lambda: [load_cached(code, start, end) for code in frames], repeat
+            )
+            panel_s = _best(lambda: load_panel(list(frames), start, end), repeat)
+        params = {"tickers": n, "days": days}
+        ops = n * days
+        rows += [
+            _result("cache", "save_to_cache", params, write_s, ops=ops, unit="rows"),
+            _result("cache", "load_cached", params, read_s, ops=ops, unit="rows"),
+            _result("cache", "load_panel", params, panel_s, ops=ops, unit="rows"),
+        ]
+    return rows
+
+
+def bench_screening(quick: bool, repeat: int) -> list[dict]:
+    """run_screening 전체 — 첫 실행(cold) / 입력이 같은 재실행(warm, 증분 재사용)"""
+    from db.database import get_conn
+    from signals import screener
+    from signals.models import MarketRegime
+    from strategies.ensemble import required_lookback_days
+
+    from benchmarks.synthetic import panel_rows, synthetic_panel
+
+    n_days = required_lookback_days() * 5 // 7 + 10
+    rows = []
+    for n in _SCREENING_TICKERS[quick]:
+        panel = synthetic_panel(n, n_days, seed=3, end=date.today())
+        close = panel["Close"]
+        universe = {code: f"종목{code}" for code in close.columns}
+        change = (close.iloc[-1] / close.iloc[-2] - 1) * 100
+        quotes = {
+            code: (float(close[code].iloc[-1]), float(change[code]))
+            for code in close.columns
+        }
+        with _workspace(), ExitStack() as stack:
+            with get_conn() as conn:
+                conn.executemany(
+                    """
+                    INSERT INTO daily_market_data
+                        (stock_code, date, open, high, low, close, volume,
+                         foreign_net_buy, institutional_net_buy)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    panel_rows(panel),
+                )
+            stack.enter_context(mock.patch.object(
+                screener, "get_universe", lambda name: universe
+            ))
+            stack.enter_context(mock.patch.object(
+                screener, "get_current_price", lambda code: quotes[code]
+            ))
+            stack.enter_context(mock.patch.object(
+                screener, "check_global_market_status",
+                lambda *args: MarketRegime(
+                    is_bull=True, message="벤치마크 (필터 생략)"
+                ),
+            ))
+
+            for phase in ("cold", "warm"):
+                started = time.perf_counter()
+                result = screener.run_screening()
+                seconds = time.perf_counter() - started
+                summary = result.summary
+                rows.append(_result(
+                    "screening", "run_screening", {"tickers": n, "phase": phase},
+                    seconds, ops=n, unit="tickers", mode=screener.SCREENER_MODE,
+                    prefiltered=summary.prefiltered if summary else None,
+                    reused=summary.reused if summary else None,
+                ))
+    return rows
+
+
+def bench_startup(quick: bool, repeat: int) -> list[dict]:
+    from benchmarks import bench_startup as startup
+
+    return [
+        _result("startup", f"import {module}", {}, r["seconds"], loaded=r["loaded"])
+        for module, r in startup.run(min(repeat, 3) if quick else repeat).items()
+    ]
+
+
+_RUNNERS = {
+    "strategies": bench_strategies,
+    "ensemble": bench_ensemble,
+    "cache": bench_cache,
+    "screening": bench_screening,
+    "startup": bench_startup,
+}
+
+
+# ── 실행·저장·비교 ────────────────────────────────────────────────────────────
+
+def _git(*args: str) -> str:
+    try:
+        out = subprocess.run(
+            ["git", *args], cwd=_ROOT, capture_output=True, text=True, check=True
+        )
+        return out.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def metadata(quick: bool) -> dict:
+    import numpy as np
+    import pandas as pd
+
+    return {
+        "commit": _git("rev-parse", "--short", "HEAD") or "unknown",
+        "dirty": bool(_git("status", "--porcelain", "--untracked-files=no")),
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "quick": quick,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+    }
+
+
+def run(suites: list[str] = SUITES, quick: bool = False, repeat: int = 5) -> dict:
+    results = []
+    for name in suites:
+        started = time.perf_counter()
+        results += _RUNNERS[name](quick, repeat)
+        elapsed = time.perf_counter() - started
+        print(f"[bench] {name} 완료 ({elapsed:.1f}초)", file=sys.stderr)
+    return {"meta": metadata(quick), "results": results}
+
+
+def save(report: dict, path: Path | None = None) -> Path:
+    if path is None:
+        RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+        suffix = "-quick" if report["meta"]["quick"] else ""
+        path = RESULTS_DIR / f"{report['meta']['commit']}{suffix}.json"
+    path.write_text(json.dumps(report, ensure_ascii=False, indent=2))
+    return path
+
+
+def _key(row: dict) -> tuple:
+    return row["suite"], row["name"], tuple(sorted(row["params"].items()))
+
+
+def compare(old: dict, new: dict, threshold: float = 0.1) -> list[dict]:
+    """
+    같은 항목의 시간 비율 (new / old).
+    threshold 이상 느려진 항목은 regression=True.
+    """
+    before = {_key(r): r for r in old["results"]}
+    rows = []
+    for r in new["results"]:
+        prev = before.get(_key(r))
+        if prev is None or not prev["seconds"]:
+            continue
+        ratio = r["seconds"] / prev["seconds"]
+        rows.append({
+            "suite": r["suite"], "name": r["name"], "params": r["params"],
+            "old_s": prev["seconds"], "new_s": r["seconds"], "ratio": round(ratio, 3),
+            "regression": ratio > 1 + threshold,
+        })
+    return rows
+
+
+def print_report(report: dict) -> None:
+    for r in report["results"]:
+        params = " ".join(f"{k}={v}" for k, v in r["params"].items())
+        rate = f"{r['ops_per_s']:>12,.1f}/s" if r.get("unit") else ""
+        print(f"{r['suite']:<10} {r['name']:<28} {params:<24} "
+              f"{r['seconds'] * 1000:10.2f} ms {rate}")
+
+
+def print_comparison(rows: list[dict]) -> None:
+    for r in rows:
+        params = " ".join(f"{k}={v}" for k, v in r["params"].items())
+        mark = "  ← 느려짐" if r["regression"] else ""
+        print(f"{r['suite']:<10} {r['name']:<28} {params:<24} "
+              f"{r['old_s'] * 1000:9.2f} → {r['new_s'] * 1000:9.2f} ms  "
+              f"({r['ratio']:.2f}x){mark}")
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--quick", action="store_true", help="작은 파라미터만 (스크리닝 50종목 등)"
+    )
+    parser.add_argument("--only", nargs="+", choices=SUITES, default=SUITES)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--out", type=Path,
+        help="결과 JSON 경로 (기본: benchmarks/results/<커밋>.json)",
+    )
+    parser.add_argument(
+        "--compare", nargs=2, type=Path, metavar=("OLD", "NEW"),
+        help="결과 두 개 비교",
+    )
+    parser.add_argument("--threshold", type=float, default=0.1, help="느려짐 판정 비율")
+
+
+def main(args: argparse.Namespace) -> int:
+    """결과 저장 또는 비교 — 비교에서 느려진 항목이 있으면 1 반환"""
+    if args.compare:
+        old, new = (json.loads(p.read_text()) for p in args.compare)
+        rows = compare(old, new, args.threshold)
+        print_comparison(rows)
+        return int(any(r["regression"] for r in rows))
+
+    report = run(args.only, args.quick, args.repeat)
+    print_report(report)
+    print(f"저장: {save(report, args.out)}")
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    add_arguments(parser)
+    sys.exit(main(parser.parse_args()))
@@ -0,0 +1,72 @@
+"""벤치마크용 합성 시장 데이터 — 고정 시드, 네트워크·DB 없음
+
+    synthetic_panel(200, 300)          → 필드별 (날짜 × 종목) 패널
+    synthetic_frame(250, seed=1)       → 종목 1개 OHLCV + 수급 DataFrame
+    end=date 를 주면 그 날 이전 KRX 거래일로 인덱스를 만든다
+    — 캐시에 넣으면 추가 수집 없이 조회된다.
+"""
+from __future__ import annotations
+
+from datetime import date
+
+import numpy as np
+import pandas as pd
+from data.market_calendar import last_trading_day, previous_trading_day
+from strategies.panel import Panel
+
+
+def trading_days(n_days: int, end: date | None = None) -> pd.DatetimeIndex:
+    """end 이전(포함) KRX 거래일 n_days 개. end=None → 2023-01-02 부터 영업일"""
+    if end is None:
+        return pd.bdate_range("2023-01-02", periods=n_days)
+    days = [last_trading_day(end)]
+    while len(days) < n_days:
+        days.append(previous_trading_day(days[-1]))
+    return pd.DatetimeIndex(days[::-1])
+
+
+def synthetic_panel(
+    n_tickers: int, n_days: int, seed: int = 0, end: date | None = None
+) -> Panel:
+    rng = np.random.default_rng(seed)
+    idx = trading_days(n_days, end)
+    cols = [f"{i:06d}" for i in range(n_tickers)]
+
+    def frame(values: np.ndarray) -> pd.DataFrame:
+        return pd.DataFrame(values, index=idx, columns=cols)
+
+    returns = rng.normal(0.0003, 0.02, (n_days, n_tickers))
+    close = frame(50000 * np.exp(np.cumsum(returns, axis=0)))
+    open_ = close * (1 + rng.normal(0, 0.01, close.shape))
+    return {
+        "Open": open_,
+        "High": np.maximum(open_, close) * 1.01,
+        "Low": np.minimum(open_, close) * 0.99,
+        "Close": close,
+        "Volume": frame(rng.lognormal(15, 0.5, close.shape)),
+        "ForeignNetBuy": frame(rng.normal(0, 1e9, close.shape)),
+        "InstitutionNetBuy": frame(rng.normal(0, 1e9, close.shape)),
+    }
+
+
+def synthetic_frame(
+    n_days: int, seed: int = 0, end: date | None = None
+) -> pd.DataFrame:
+    """종목 1개 — get_ohlcv 와 같은 컬럼"""
+    panel = synthetic_panel(1, n_days, seed, end)
+    return pd.DataFrame({field: frame.iloc[:, 0] for field, frame in panel.items()})
+
+
+def panel_rows(panel: Panel):
+    """
+    daily_market_data 행 — 캐시 일괄 적재용
+    (stock_code, date, open, high, low, close, volume, 외국인, 기관)
+    """
+    dates = [d.strftime("%Y-%m-%d") for d in panel["Close"].index]
+    fields = [
+        "Open", "High", "Low", "Close", "Volume", "ForeignNetBuy", "InstitutionNetBuy"
+    ]
+    values = {f: panel[f].to_numpy() for f in fields}
+    for j, code in enumerate(panel["Close"].columns):
+        for i, day in enumerate(dates):
+            yield (code, day, *(float(values[f][i, j]) for f in fields))
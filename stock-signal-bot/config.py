@@ -1,11 +1,55 @@
 import os
+from datetime import date, time
+
 from dotenv import load_dotenv
 
 load_dotenv()
 
 # ── Telegram ──────────────────────────────────────────
-TELEGRAM_BOT_TOKEN: str = os.environ["TELEGRAM_BOT_TOKEN"]
-TELEGRAM_CHAT_ID: str = os.environ["TELEGRAM_CHAT_ID"]
+# 임포트 시점에는 검사하지 않음 — 실제 발송 전에 require_telegram() 으로 확인
+TELEGRAM_BOT_TOKEN: str = os.getenv("TELEGRAM_BOT_TOKEN", "")
+TELEGRAM_CHAT_ID: str = os.getenv("TELEGRAM_CHAT_ID", "")
+# 여러 채팅에 보내려면 쉼표로 구분 (TELEGRAM_CHAT_ID=123,-100456) — 채팅별로 동시에 발송
+TELEGRAM_CHAT_IDS: list[str] = [
+    c.strip() for c in TELEGRAM_CHAT_ID.split(",") if c.strip()
+]
+
+# 발송 파이프라인 (notifications.delivery)
+# Bot API 주소 — 비우면 api.telegram.org
+# (로컬 Bot API 서버·테스트용 가짜 서버 지정 시 사용)
+TELEGRAM_API_URL: str = os.getenv("TELEGRAM_API_URL", "")
+# 속도 제한 — 전체 초당 메시지 수, 같은 채팅 연속 메시지 최소 간격(초)
+# (Telegram 권장: 30/s, 채팅당 1/s)
+TELEGRAM_GLOBAL_RATE: int = int(os.getenv("TELEGRAM_GLOBAL_RATE", "25"))
+TELEGRAM_CHAT_INTERVAL_SECONDS: float = float(
+    os.getenv("TELEGRAM_CHAT_INTERVAL_SECONDS", "1.0")
+)
+# 429·5xx·네트워크 오류 재시도 — 최대 횟수, 지수 백오프 시작 간격(초)
+TELEGRAM_MAX_RETRIES: int = int(os.getenv("TELEGRAM_MAX_RETRIES", "5"))
+TELEGRAM_RETRY_BASE_SECONDS: float = float(
+    os.getenv("TELEGRAM_RETRY_BASE_SECONDS", "1.0")
+)
+
+# 시그널 다이제스트 (notifications.digest) — 종목별 메시지 대신 스캔 결과를 모아
+# 최소 개수 메시지로, 같은 거래일에 이미 보낸 것과 시그널·전략 투표가 같으면 생략
+SIGNAL_DIGEST: bool = os.getenv("SIGNAL_DIGEST", "false").lower() == "true"
+# 0 → 스캔마다 발송, >0 → 첫 시그널 후 이 시간(초) 동안 모아서 발송
+SIGNAL_DIGEST_WINDOW_SECONDS: float = float(
+    os.getenv("SIGNAL_DIGEST_WINDOW_SECONDS", "0")
+)
+
+
+def require_telegram() -> None:
+    """Telegram 발송에 필요한 설정 확인 — 빠진 항목을 모아 RuntimeError"""
+    missing = [
+        name for name, value in (
+            ("TELEGRAM_BOT_TOKEN", TELEGRAM_BOT_TOKEN),
+            ("TELEGRAM_CHAT_ID", TELEGRAM_CHAT_ID),
+        )
+        if not value
+    ]
+    if missing:
+        raise RuntimeError(f"환경변수 미설정: {', '.join(missing)} (.env 확인)")
 
 # ── 감시 종목 ──────────────────────────────────────────
 TARGETS: dict[str, dict] = {
@@ -26,6 +70,7 @@ ONEIL_STOP_LOSS_PCT: float = float(os.getenv("ONEIL_STOP_LOSS_PCT", "0.07"))
 
 # ── 데이터 기간 ─────────────────────────────────────────
 LOOKBACK_DAYS: int = int(os.getenv("LOOKBACK_DAYS", "400"))  # 여유있게 400일
+# 엘더 주봉 분석 구간 (주) — MACD 정의 구간 이후 남는 주는 EMA 수렴 여유로 쓴다
 WEEKLY_LOOKBACK_WEEKS: int = int(os.getenv("WEEKLY_LOOKBACK_WEEKS", "60"))
 
 # ── 스케줄 (KST) ───────────────────────────────────────────────
@@ -36,7 +81,6 @@ SCHEDULE = {
     "midday_check": {"hour": 12, "minute": 30},
     "closing_signal": {"hour": 15, "minute": 20},
     "daily_report": {"hour": 15, "minute": 40},
-    "stop_loss_interval_minutes": 5,
     # KOSPI200 스크리닝: 일간리포트 전 09:00, 장중 12:00, 장 마감 15:10
     "kospi200_screening": [
         {"hour": 9, "minute": 0},
@@ -45,6 +89,56 @@ SCHEDULE = {
     ],
 }
 
+# 스케줄 작업 실행 레인 (scheduling.runtime)
+# io: 시그널 스캔·리포트, cpu: 스크리닝, 손절 모니터는 전용 레인
+JOB_IO_WORKERS: int = int(os.getenv("JOB_IO_WORKERS", "4"))
+JOB_CPU_WORKERS: int = int(os.getenv("JOB_CPU_WORKERS", "1"))
+JOB_DELAY_WARN_SECONDS: float = float(os.getenv("JOB_DELAY_WARN_SECONDS", "30"))
+
+# 운영 지표 (metrics) — 0 이 아니면 METRICS_HOST:METRICS_PORT/metrics 로
+# Prometheus 텍스트 형식 노출
+METRICS_PORT: int = int(os.getenv("METRICS_PORT", "0"))
+METRICS_HOST: str = os.getenv("METRICS_HOST", "127.0.0.1")
+
+# 손절 모니터 (signals.stop_engine)
+# 장중 이 간격(초)마다 보유 종목 일괄 시세로 손절 판정
+STOP_MONITOR_INTERVAL_SECONDS: int = int(
+    os.getenv("STOP_MONITOR_INTERVAL_SECONDS", "60")
+)
+# 기본 트레일링 스탑 비율 — 고점 대비 이 비율 하락가로 손절가를 끌어올림
+# (0 → 포지션별 지정만)
+STOP_TRAIL_PCT: float = float(os.getenv("STOP_TRAIL_PCT", "0"))
+
+# ── KRX 거래일 (data.market_calendar) ───────────────────────
+# 내장 휴장일 표 보정: KRX_HOLIDAYS=2027-01-01,2027-02-08
+# 개장·마감 시각 변경일:
+#   KRX_SPECIAL_SESSIONS=2027-11-18=10:00-16:30;2028-01-03=10:00-15:30
+def _load_holidays() -> frozenset[date]:
+    days = set()
+    for item in os.getenv("KRX_HOLIDAYS", "").split(","):
+        try:
+            days.add(date.fromisoformat(item.strip()))
+        except ValueError:
+            pass
+    return frozenset(days)
+
+
+def _load_special_sessions() -> dict[date, tuple[time, time]]:
+    sessions = {}
+    for item in os.getenv("KRX_SPECIAL_SESSIONS", "").split(";"):
+        try:
+            day, hours = item.strip().split("=")
+            open_, close = hours.split("-")
+            sessions[date.fromisoformat(day)] = (
+                time.fromisoformat(open_), time.fromisoformat(close)
+            )
+        except ValueError:
+            pass
+    return sessions
+
+KRX_HOLIDAYS: frozenset[date] = _load_holidays()
+KRX_SPECIAL_SESSIONS: dict[date, tuple[time, time]] = _load_special_sessions()
+
 # ── DB ─────────────────────────────────────────────────
 DB_PATH = "signals.db"
 
@@ -94,9 +188,62 @@ SCREENING_UNIVERSE = {
     k: v for k, v in SCREENING_UNIVERSE.items() if k not in TARGETS
 }
 
+# 스크리닝 유니버스 (data.universe): KOSPI200 | KOSDAQ150 | STATIC(위 목록)
+# "+" 로 합집합
+# 조회 실패·빈 결과면 위 SCREENING_UNIVERSE 로 대체
+SCREENER_UNIVERSE: str = os.getenv("SCREENER_UNIVERSE", "KOSPI200")
+
 # 추천 종목 최대 수
 MAX_RECOMMENDATIONS: int = int(os.getenv("MAX_RECOMMENDATIONS", "5"))
 
 # KOSPI200 스크리닝 병렬 워커 수
 # 펢뢡 제한 종목(DB IO 많음) → 3개 정도가 안전
 SCREENER_WORKERS: int = int(os.getenv("SCREENER_WORKERS", "3"))
+
+# 스크리닝 실행 방식: thread(종목별 병렬) | panel(전 종목 패널 벡터 평가)
+#                   | process(공유 메모리 패널 + 프로세스 풀)
+SCREENER_MODE: str = os.getenv("SCREENER_MODE", "thread")
+
+# process 모드 프로세스 수 (0 → CPU 코어 수)
+SCREENER_PROCESSES: int = int(os.getenv("SCREENER_PROCESSES", "0"))
+
+# 파라미터 스윕 프로세스 수 (0 → CPU 코어 수)
+SWEEP_WORKERS: int = int(os.getenv("SWEEP_WORKERS", "0"))
+
+# 전략 시그널 메모이제이션 — 입력 일봉이 같으면 SQLite 에 저장된 결과 재사용
+SIGNAL_MEMO: bool = os.getenv("SIGNAL_MEMO", "true").lower() == "true"
+
+# 장중 재스캔 스트리밍 지표 — 재귀 지표 상태를 SQLite 에 두고 새 봉만큼만 갱신
+STREAMING_INDICATORS: bool = (
+    os.getenv("STREAMING_INDICATORS", "true").lower() == "true"
+)
+
+# 전략 호출 프로파일링 (시그널 스캔·스크리닝 단위 집계)
+PROFILE_STRATEGIES: bool = os.getenv("PROFILE_STRATEGIES", "false").lower() == "true"
+PROFILE_TRACEMALLOC: bool = os.getenv("PROFILE_TRACEMALLOC", "false").lower() == "true"
+PROFILE_DIR: str = os.getenv("PROFILE_DIR", "")  # 지정 시 스캔별 JSON 저장
+
+# 스크리닝 조기 종료 — BUY 계열이 될 수 없는 것이 확정되면 남은 전략 평가 생략
+SCREENER_EARLY_EXIT: bool = os.getenv("SCREENER_EARLY_EXIT", "false").lower() == "true"
+
+# 2단계 스크리닝 — 패널 1차 필터(BUY 도달 불가 종목 제외) 후
+# 통과 종목만 전체 앙상블 (thread·process 모드)
+SCREENER_PREFILTER: bool = os.getenv("SCREENER_PREFILTER", "true").lower() == "true"
+
+# 증분 스크리닝 — 일봉·수급 입력이 같고 현재가 변동이 허용 비율 이내인 종목은
+# 저장된 결과 재사용
+SCREENER_INCREMENTAL: bool = os.getenv("SCREENER_INCREMENTAL", "true").lower() == "true"
+SCREENER_PRICE_TOLERANCE: float = float(os.getenv("SCREENER_PRICE_TOLERANCE", "0.005"))
+
+# 잠정 추천 — 유니버스의 이 비율 이상 채점되면 중간 순위를 먼저 보내고
+# 완료 시 같은 메시지 수정 (0 → 사용 안 함)
+SCREENER_PROVISIONAL_SHARE: float = float(os.getenv("SCREENER_PROVISIONAL_SHARE", "0"))
+
+# 예약 스크리닝(SCHEDULE["kospi200_screening"]) 마감
+# 시작 후 이 시간이 지나면 채점을 멈추고 부분 결과 발송
+# 15:10 회차가 15:40 일간 리포트 전에 끝나도록 기본 25분
+SCREENER_DEADLINE_MINUTES: int = int(os.getenv("SCREENER_DEADLINE_MINUTES", "25"))
+
+# 세션 산출물 재사용 (signals.session) — 같은 거래일의
+# 시그널·스크리닝·지수·마켓 필터 결과가 신선하면 일간 리포트 등에서 다시 계산하지 않음
+SESSION_REUSE: bool = os.getenv("SESSION_REUSE", "true").lower() == "true"
@@ -5,6 +5,8 @@ from datetime import date, timedelta
 
 import pandas as pd
 
+import metrics
+from data.market_calendar import last_trading_day
 from db.database import get_conn
 
 
@@ -40,6 +42,65 @@ def load_cached(stock_code: str, start: date, end: date) -> pd.DataFrame:
     return df
 
 
+_COLUMN_NAMES = {
+    "open": "Open",
+    "high": "High",
+    "low": "Low",
+    "close": "Close",
+    "volume": "Volume",
+    "foreign_net_buy": "ForeignNetBuy",
+    "institutional_net_buy": "InstitutionNetBuy",
+}
+
+# SQLite 바인딩 변수 제한(기본 999) 대응
+_PANEL_CHUNK = 500
+
+
+def load_panel(
+    stock_codes: list[str], start: date, end: date
+) -> dict[str, pd.DataFrame]:
+    """
+    여러 종목을 한 번에 로드해 필드별 (날짜 × 종목) DataFrame 반환.
+    캐시에 없는 종목은 열에서 빠진다.
+    """
+    frames = []
+    with get_conn() as conn:
+        for i in range(0, len(stock_codes), _PANEL_CHUNK):
+            chunk = stock_codes[i:i + _PANEL_CHUNK]
+            marks = ",".join("?" * len(chunk))
+            frames.append(pd.read_sql_query(
+                f"""
+                SELECT stock_code, date, open, high, low, close, volume,
+                       foreign_net_buy, institutional_net_buy
+                FROM daily_market_data
+                WHERE stock_code IN ({marks}) AND date BETWEEN ? AND ?
+                """,
+                conn,
+                params=[*chunk, start.isoformat(), end.isoformat()],
+            ))
+
+    rows = pd.concat(frames) if frames else pd.DataFrame()
+    if rows.empty:
+        return {}
+
+    rows["date"] = pd.to_datetime(rows["date"])
+    wide = rows.pivot(index="date", columns="stock_code").sort_index()
+    codes = [c for c in stock_codes if c in wide["close"].columns]
+    return {
+        name: wide[col][codes].astype(float)
+        for col, name in _COLUMN_NAMES.items()
+    }
+
+
+def cached_stock_codes() -> list[str]:
+    """캐시에 일봉이 있는 전체 종목코드"""
+    with get_conn() as conn:
+        rows = conn.execute(
+            "SELECT DISTINCT stock_code FROM daily_market_data ORDER BY stock_code"
+        ).fetchall()
+    return [r["stock_code"] for r in rows]
+
+
 def save_to_cache(stock_code: str, df: pd.DataFrame) -> None:
     """DataFrame을 캐시에 upsert"""
     if df.empty:
@@ -77,12 +138,16 @@ def missing_dates(
     """캐시에 없는 날짜 범위 반환 (start, end). 모두 있으면 (None, None)."""
     cached = load_cached(stock_code, start, end)
     if cached.empty:
+        metrics.cache_lookup("ohlcv", hit=False)
         return start, end
 
     cached_dates = set(cached.index.date)
     # 간단 체크: 가장 최근 캐시 날짜 이후가 빠져있는지 확인
+    # (end 이전 마지막 거래일까지만 — 휴장일은 받을 게 없음)
     last_cached = max(cached_dates)
-    if last_cached < end:
+    if last_cached < last_trading_day(end):
+        metrics.cache_lookup("ohlcv", hit=False)
         return last_cached + timedelta(days=1), end
 
+    metrics.cache_lookup("ohlcv", hit=True)
     return None, None
@@ -5,11 +5,14 @@ import time
 from datetime import date, timedelta
 
 import pandas as pd
-from pykrx import stock as krx
 
 from config import LOOKBACK_DAYS
-from data.cache import load_cached, missing_dates, save_to_cache
+from data.cache import load_cached, load_panel, missing_dates, save_to_cache
 from db.database import init_db
+from lazy import LazyModule
+
+# pykrx 는 임포트에 matplotlib 까지 끌어오므로 첫 조회 때 로드
+krx = LazyModule("pykrx.stock", api="pykrx")
 
 
 def get_ohlcv(
@@ -40,6 +43,36 @@ def get_ohlcv(
     return df
 
 
+def get_panel(
+    stock_codes: list[str],
+    end_date: date | None = None,
+    lookback_days: int = LOOKBACK_DAYS,
+) -> dict[str, pd.DataFrame]:
+    """
+    여러 종목의 필드별 (날짜 × 종목) 패널 반환.
+    종목별로 빠진 날짜만 pykrx로 채운 뒤 캐시에서 한 번에 로드.
+    """
+    init_db()
+
+    if end_date is None:
+        end_date = date.today()
+    start_date = end_date - timedelta(days=lookback_days)
+
+    for code in stock_codes:
+        fetch_start, fetch_end = missing_dates(code, start_date, end_date)
+        if fetch_start and fetch_end:
+            _fetch_and_cache(code, fetch_start, fetch_end)
+
+    return load_panel(stock_codes, start_date, end_date)
+
+
+def get_kospi200_tickers() -> dict[str, str]:
+    """KOSPI200 구성종목 {종목코드: 종목명} (data.universe — 거래일당 1회 갱신)"""
+    from data.universe import get_universe
+
+    return get_universe("KOSPI200")
+
+
 def get_current_price(stock_code: str) -> tuple[float, float]:
     """(현재가, 전일 대비 등락률%) 반환"""
     today = date.today().strftime("%Y%m%d")
@@ -70,6 +103,31 @@ def get_current_price(stock_code: str) -> tuple[float, float]:
         return price, round(change_pct, 2)
 
 
+def get_current_prices(stock_codes: list[str]) -> dict[str, tuple[float, float]]:
+    """
+    여러 종목 {종목코드: (현재가, 등락률%)} — 전 종목 당일 시세를 한 번에 조회.
+    일괄 조회에 없거나 가격이 0 인 종목(휴장·조회 실패)만
+    get_current_price 로 개별 조회.
+    """
+    today = date.today().strftime("%Y%m%d")
+    quotes: dict[str, tuple[float, float]] = {}
+    try:
+        df = krx.get_market_ohlcv_by_ticker(today, market="ALL")
+        for code in stock_codes:
+            if code in df.index and df.at[code, "종가"] > 0:
+                change_pct = (
+                    float(df.at[code, "등락률"]) if "등락률" in df.columns else 0.0
+                )
+                quotes[code] = (float(df.at[code, "종가"]), round(change_pct, 2))
+    except Exception:
+        pass
+
+    for code in stock_codes:
+        if code not in quotes:
+            quotes[code] = get_current_price(code)
+    return quotes
+
+
 def get_kospi_data() -> tuple[float, float]:
     """(KOSPI 현재지수, 등락률%) 반환"""
     today = date.today().strftime("%Y%m%d")
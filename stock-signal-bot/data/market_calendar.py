@@ -0,0 +1,133 @@
+"""KRX 거래일·정규장 시간
+
+휴장일과 개장 시각이 바뀌는 날(연초 첫 거래일, 수능일)을 반영한다.
+
+    session(day)    → TradingSession(open, close) | None (휴장)
+    is_open(now)    → 정규장 중인지
+    previous_trading_day / next_trading_day
+
+휴장일은 KRX 공표 기준 내장 표(_HOLIDAYS)에 config.KRX_HOLIDAYS 를 더해 쓴다.
+표에 없는 연도는 주말·양력 고정 휴장일만 반영하므로(설·추석·대체공휴일 누락),
+새해 휴장일 공표 후 표나 환경변수를 갱신해야 한다.
+"""
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+
+from config import KRX_HOLIDAYS, KRX_SPECIAL_SESSIONS
+
+logger = logging.getLogger(__name__)
+
+REGULAR_OPEN = time(9, 0)
+REGULAR_CLOSE = time(15, 30)
+# 연초 첫 거래일은 1시간 늦게 개장
+NEW_YEAR_OPEN = time(10, 0)
+
+_HOLIDAYS: frozenset[date] = frozenset(date.fromisoformat(d) for d in [
+    # 2025
+    "2025-01-01", "2025-01-27", "2025-01-28", "2025-01-29", "2025-01-30", "2025-03-03",
+    "2025-05-01", "2025-05-05", "2025-05-06", "2025-06-03", "2025-06-06", "2025-08-15",
+    "2025-10-03", "2025-10-06", "2025-10-07", "2025-10-08", "2025-10-09", "2025-12-25",
+    "2025-12-31",
+    # 2026
+    "2026-01-01", "2026-02-16", "2026-02-17", "2026-02-18", "2026-03-02", "2026-05-01",
+    "2026-05-05", "2026-05-25", "2026-06-03", "2026-08-17", "2026-09-24", "2026-09-25",
+    "2026-10-05", "2026-10-09", "2026-12-25", "2026-12-31",
+])
+_COVERED_YEARS = {d.year for d in _HOLIDAYS}
+
+# 표에 없는 연도에 쓰는 양력 고정 휴장일
+# (신정·삼일절·근로자의날·어린이날·현충일·광복절·개천절·한글날·성탄절)
+_FIXED_HOLIDAYS = {
+    (1, 1), (3, 1), (5, 1), (5, 5), (6, 6), (8, 15), (10, 3), (10, 9), (12, 25)
+}
+
+# 수능일 — 개장 1시간 지연, 마감 1시간 연장
+_SPECIAL: dict[date, tuple[time, time]] = {
+    date(2025, 11, 13): (time(10, 0), time(16, 30)),
+    date(2026, 11, 19): (time(10, 0), time(16, 30)),
+}
+
+_warned_years: set[int] = set()
+
+
+@dataclass(frozen=True)
+class TradingSession:
+    day: date
+    open: time
+    close: time
+
+    @property
+    def regular(self) -> bool:
+        return (self.open, self.close) == (REGULAR_OPEN, REGULAR_CLOSE)
+
+    def opens_at(self, tzinfo=None) -> datetime:
+        return datetime.combine(self.day, self.open, tzinfo)
+
+    def closes_at(self, tzinfo=None) -> datetime:
+        return datetime.combine(self.day, self.close, tzinfo)
+
+    def contains(self, moment: datetime) -> bool:
+        return moment.date() == self.day and self.open <= moment.time() <= self.close
+
+
+def is_holiday(day: date) -> bool:
+    if day.weekday() >= 5:
+        return True
+    if day in KRX_HOLIDAYS:
+        return True
+    if day.year in _COVERED_YEARS:
+        return day in _HOLIDAYS
+    if day.year not in _warned_years:
+        _warned_years.add(day.year)
+        logger.warning(
+            f"[calendar] {day.year}년 휴장일 표 없음 — "
+            "양력 고정 휴장일만 처리 (KRX_HOLIDAYS 로 보정)"
+        )
+    return (day.month, day.day) in _FIXED_HOLIDAYS
+
+
+def is_trading_day(day: date) -> bool:
+    return not is_holiday(day)
+
+
+def session(day: date) -> TradingSession | None:
+    """day 의 정규장 (휴장이면 None)"""
+    if is_holiday(day):
+        return None
+    if day in KRX_SPECIAL_SESSIONS:
+        return TradingSession(day, *KRX_SPECIAL_SESSIONS[day])
+    if day in _SPECIAL:
+        return TradingSession(day, *_SPECIAL[day])
+    if previous_trading_day(day).year < day.year:
+        return TradingSession(day, NEW_YEAR_OPEN, REGULAR_CLOSE)
+    return TradingSession(day, REGULAR_OPEN, REGULAR_CLOSE)
+
+
+def is_open(moment: datetime) -> bool:
+    """moment(거래소 시간대 기준)가 정규장 중인지"""
+    current = session(moment.date())
+    return current is not None and current.contains(moment)
+
+
+def previous_trading_day(day: date) -> date:
+    """day 이전(당일 제외) 가장 가까운 거래일"""
+    day -= timedelta(days=1)
+    while is_holiday(day):
+        day -= timedelta(days=1)
+    return day
+
+
+def next_trading_day(day: date) -> date:
+    """day 이후(당일 제외) 가장 가까운 거래일"""
+    day += timedelta(days=1)
+    while is_holiday(day):
+        day += timedelta(days=1)
+    return day
+
+
+def last_trading_day(day: date) -> date:
+    """day 가 거래일이면 day, 아니면 직전 거래일"""
+    return day if is_trading_day(day) else previous_trading_day(day)
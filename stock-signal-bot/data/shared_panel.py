@@ -0,0 +1,81 @@
+"""패널을 multiprocessing.shared_memory 에 올려 프로세스 간 복사 없이 공유
+
+부모 프로세스가 SharedPanel.create() 로 (필드, 날짜, 종목) float64 블록 하나를 만들고,
+워커는 spec(이름·형상·라벨, 수 KB)만 받아 attach_panel() 로 같은 메모리를
+DataFrame 으로 본다.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+from strategies.panel import Panel
+
+
+@dataclass(frozen=True)
+class SharedPanelSpec:
+    """워커에 전달하는 공유 패널 메타데이터 (피클 대상)"""
+    name: str
+    shape: tuple[int, int, int]        # (필드, 날짜, 종목)
+    fields: tuple[str, ...]
+    dates: np.ndarray                  # datetime64[ns]
+    tickers: tuple[str, ...]
+
+
+class SharedPanel:
+    """공유 메모리 패널 소유자 — with 블록 종료 시 해제(unlink)"""
+
+    def __init__(self, shm: shared_memory.SharedMemory, spec: SharedPanelSpec) -> None:
+        self.shm = shm
+        self.spec = spec
+
+    @classmethod
+    def create(cls, panel: Panel) -> "SharedPanel":
+        close = panel["Close"]
+        fields = tuple(panel)
+        shape = (len(fields), *close.shape)
+        size = max(int(np.prod(shape)) * 8, 1)
+        shm = shared_memory.SharedMemory(create=True, size=size)
+        block = np.ndarray(shape, dtype=np.float64, buffer=shm.buf)
+        for k, f in enumerate(fields):
+            frame = panel[f].reindex(index=close.index, columns=close.columns)
+            block[k] = frame.to_numpy(float)
+
+        spec = SharedPanelSpec(
+            name=shm.name,
+            shape=shape,
+            fields=fields,
+            dates=close.index.to_numpy(),
+            tickers=tuple(str(c) for c in close.columns),
+        )
+        return cls(shm, spec)
+
+    def close(self) -> None:
+        self.shm.close()
+        self.shm.unlink()
+
+    def __enter__(self) -> "SharedPanel":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def attach_panel(spec: SharedPanelSpec) -> tuple[shared_memory.SharedMemory, Panel]:
+    """
+    공유 블록에 붙어 Panel 구성 (복사 없음).
+    반환된 SharedMemory 는 Panel 을 쓰는 동안 참조를 유지해야 한다.
+    """
+    # 풀 워커는 부모의 resource_tracker 를 공유하므로 해제(unlink)는 부모가 담당
+    shm = shared_memory.SharedMemory(name=spec.name)
+
+    block = np.ndarray(spec.shape, dtype=np.float64, buffer=shm.buf)
+    index = pd.DatetimeIndex(spec.dates)
+    columns = pd.Index(spec.tickers)
+    panel = {
+        f: pd.DataFrame(block[k], index=index, columns=columns, copy=False)
+        for k, f in enumerate(spec.fields)
+    }
+    return shm, panel
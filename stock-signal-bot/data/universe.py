@@ -0,0 +1,178 @@
+"""스크리닝 유니버스 — 지수 구성종목·상장 정보를 거래일당 한 번 수집해 SQLite 에서 제공
+
+유니버스 이름: KOSPI200, KOSDAQ150, STATIC(config.SCREENING_UNIVERSE),
+"+" 로 합집합 (예: "KOSPI200+KOSDAQ150").
+구성종목은 적용일 스냅샷으로 쌓이므로 과거 날짜 기준 조회(백테스트)에도 쓸 수 있다.
+"""
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from datetime import date
+
+import numpy as np
+import pandas as pd
+from config import SCREENING_UNIVERSE
+from db.database import init_db
+from db.universe import (
+    Listing,
+    get_refreshed_on,
+    load_listings,
+    load_members,
+    load_snapshots,
+    save_listings,
+    save_snapshot,
+    set_refreshed_on,
+)
+from lazy import LazyModule
+
+from data.market_calendar import last_trading_day
+
+logger = logging.getLogger(__name__)
+
+krx = LazyModule("pykrx.stock", api="pykrx")
+
+
+@dataclass(frozen=True)
+class IndexUniverse:
+    index_code: str     # pykrx 지수 코드
+    market: str         # 업종 분류 조회용 시장 (KOSPI / KOSDAQ)
+
+
+UNIVERSES: dict[str, IndexUniverse] = {
+    "KOSPI200": IndexUniverse("1028", "KOSPI"),
+    "KOSDAQ150": IndexUniverse("2203", "KOSDAQ"),
+}
+
+STATIC = "STATIC"
+
+
+def trading_day(day: date) -> date:
+    """day 가 거래일이면 day, 아니면 직전 거래일 (KRX 휴장일 반영)"""
+    return last_trading_day(day)
+
+
+def refresh_universe(name: str, as_of: date | None = None, force: bool = False) -> bool:
+    """
+    지수 구성종목·상장 정보 수집 — 같은 거래일에 이미 수집했으면 건너뜀.
+    구성이 직전 스냅샷과 다를 때만 새 스냅샷(적용일 = 거래일) 저장.
+
+    Returns:
+        새로 수집했으면 True
+    """
+    source = UNIVERSES[name]
+    init_db()
+    day = trading_day(as_of or date.today())
+    if not force and get_refreshed_on(name) == day:
+        return False
+
+    codes = krx.get_index_portfolio_deposit_file(
+        source.index_code, day.strftime("%Y%m%d")
+    )
+    codes = sorted(codes or [])
+    if not codes:
+        logger.warning(
+            f"[universe] {name} {day} 구성종목 조회 결과 없음 → 저장된 구성 유지"
+        )
+        return False
+
+    if set(codes) != set(load_members(name, day)):
+        save_snapshot(name, day, codes)
+        logger.info(f"[universe] {name} {day} 구성 변경 저장 ({len(codes)}종목)")
+    save_listings(_fetch_listings(source.market, day, codes), day)
+    set_refreshed_on(name, day)
+    return True
+
+
+def get_universe(name: str, as_of: date | None = None) -> dict[str, str]:
+    """
+    {종목코드: 종목명} — as_of 시점 구성 (None → 오늘, 필요 시 먼저 갱신).
+    수집에 실패하면 저장된 최신 구성을 그대로 쓴다.
+    """
+    if name == STATIC:
+        return dict(SCREENING_UNIVERSE)
+
+    init_db()
+    members: dict[str, None] = {}
+    for part in name.split("+"):
+        if as_of is None:
+            try:
+                refresh_universe(part)
+            except Exception as e:
+                logger.warning(f"[universe] {part} 갱신 실패 (저장된 구성 사용): {e}")
+        members.update(dict.fromkeys(load_members(part, as_of or date.today())))
+
+    codes = list(members)
+    listings = load_listings(codes)
+    return {code: listings[code][0] if code in listings else code for code in codes}
+
+
+def universe_listings(name: str, as_of: date | None = None) -> pd.DataFrame:
+    """유니버스 종목의 상장 정보 — index: 종목코드, columns: name, market, sector"""
+    codes = list(get_universe(name, as_of))
+    listings = load_listings(codes)
+    return pd.DataFrame(
+        [listings.get(code, (code, None, None)) for code in codes],
+        index=pd.Index(codes, name="stock_code"),
+        columns=["name", "market", "sector"],
+    )
+
+
+def all_members(name: str) -> list[str]:
+    """저장된 모든 스냅샷에 한 번이라도 포함된 종목 (편출 종목 포함)"""
+    codes: set[str] = set()
+    for part in name.split("+"):
+        for _, members in load_snapshots(part):
+            codes |= members
+    return sorted(codes)
+
+
+def membership_mask(
+    name: str, dates: pd.DatetimeIndex, tickers: list[str]
+) -> np.ndarray:
+    """
+    (날짜, 종목) 시점 기준 편입 여부 — 백테스트 진입 제한용.
+    첫 스냅샷 이전 날짜는 구성을 알 수 없으므로 모두 False.
+    """
+    mask = np.zeros((len(dates), len(tickers)), dtype=bool)
+    column = {code: j for j, code in enumerate(tickers)}
+    for part in name.split("+"):
+        snapshots = load_snapshots(part)
+        if not snapshots:
+            logger.warning(
+                f"[universe] {part} 스냅샷 없음 — "
+                "refresh_universe(as_of=...)로 과거 구성 수집 필요"
+            )
+            continue
+        starts = pd.DatetimeIndex([pd.Timestamp(d) for d, _ in snapshots])
+        # 각 날짜에 적용되는 스냅샷 번호 (-1 → 첫 스냅샷 이전)
+        which = starts.searchsorted(dates, side="right") - 1
+        for k, (_, codes) in enumerate(snapshots):
+            rows = which == k
+            cols = [column[c] for c in codes if c in column]
+            if rows.any() and cols:
+                mask[np.ix_(rows, cols)] = True
+    return mask
+
+
+def _fetch_listings(market: str, day: date, codes: list[str]) -> dict[str, Listing]:
+    """종목명·업종 — 시장 업종 분류 1회 조회, 실패 시 종목명만 개별 조회"""
+    try:
+        table = krx.get_market_sector_classifications(day.strftime("%Y%m%d"), market)
+    except Exception as e:
+        logger.warning(f"[universe] {market} 업종 분류 조회 실패: {e}")
+        table = pd.DataFrame()
+
+    listings: dict[str, Listing] = {}
+    for code in codes:
+        if code in table.index:
+            row = table.loc[code]
+            sector = row.get("업종명")
+            stock_name = str(row.get("종목명", code))
+            listings[code] = (stock_name, market, str(sector) if sector else None)
+            continue
+        try:
+            listings[code] = (str(krx.get_market_ticker_name(code)), market, None)
+        except Exception:
+            listings[code] = (code, market, None)
+    return listings
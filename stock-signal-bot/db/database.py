@@ -2,11 +2,19 @@
 from __future__ import annotations
 
 import sqlite3
+import time
 from contextlib import contextmanager
 from typing import Generator
 
+import metrics
 from config import DB_PATH
 
+SQLITE_QUERY_SECONDS = metrics.histogram(
+    "stockbot_sqlite_query_seconds",
+    "SQLite 문 실행 시간 (execute / executemany)",
+    ["op"],
+)
+
 _CREATE_SIGNAL_HISTORY = """
 CREATE TABLE IF NOT EXISTS signal_history (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -35,6 +43,14 @@ CREATE TABLE IF NOT EXISTS positions (
 );
 """
 
+_CREATE_POSITION_TRAILING = """
+CREATE TABLE IF NOT EXISTS position_trailing (
+    position_id INTEGER PRIMARY KEY,
+    trail_pct REAL NOT NULL,
+    high_water REAL NOT NULL
+);
+"""
+
 _CREATE_DAILY_MARKET_DATA = """
 CREATE TABLE IF NOT EXISTS daily_market_data (
     stock_code TEXT NOT NULL,
@@ -50,18 +66,164 @@ CREATE TABLE IF NOT EXISTS daily_market_data (
 );
 """
 
+_CREATE_INDICATOR_STATE = """
+CREATE TABLE IF NOT EXISTS indicator_state (
+    stock_code TEXT NOT NULL,
+    name TEXT NOT NULL,
+    last_date TEXT NOT NULL,
+    last_value REAL,
+    state TEXT NOT NULL,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (stock_code, name)
+);
+"""
+
+_CREATE_SIGNAL_MEMO = """
+CREATE TABLE IF NOT EXISTS signal_memo (
+    stock_code TEXT NOT NULL,
+    strategy TEXT NOT NULL,
+    version TEXT NOT NULL,
+    last_date TEXT NOT NULL,
+    input_hash TEXT NOT NULL,
+    result TEXT NOT NULL,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (stock_code, strategy)
+);
+"""
+
+_CREATE_SCREENING_RESULTS = """
+CREATE TABLE IF NOT EXISTS screening_results (
+    stock_code TEXT PRIMARY KEY,
+    stock_name TEXT NOT NULL,
+    stage TEXT NOT NULL,
+    signal INTEGER,
+    ensemble_score REAL,
+    price REAL NOT NULL,
+    change_pct REAL NOT NULL,
+    top_reasons TEXT NOT NULL,
+    last_date TEXT NOT NULL,
+    input_hash TEXT NOT NULL,
+    evaluated_at TIMESTAMP NOT NULL
+);
+"""
+
+_CREATE_SCREENING_RUNS = """
+CREATE TABLE IF NOT EXISTS screening_runs (
+    run_id TEXT PRIMARY KEY,
+    universe TEXT NOT NULL,
+    status TEXT NOT NULL,
+    total INTEGER NOT NULL DEFAULT 0,
+    scored INTEGER NOT NULL DEFAULT 0,
+    started_at TIMESTAMP NOT NULL,
+    deadline TIMESTAMP,
+    finished_at TIMESTAMP
+);
+"""
+
+_CREATE_SCREENING_CHECKPOINTS = """
+CREATE TABLE IF NOT EXISTS screening_checkpoints (
+    run_id TEXT NOT NULL,
+    stock_code TEXT NOT NULL,
+    PRIMARY KEY (run_id, stock_code)
+);
+"""
+
+_CREATE_SESSION_ARTIFACTS = """
+CREATE TABLE IF NOT EXISTS session_artifacts (
+    session TEXT NOT NULL,
+    name TEXT NOT NULL,
+    produced_at TIMESTAMP NOT NULL,
+    payload TEXT NOT NULL,
+    PRIMARY KEY (session, name)
+);
+"""
+
+_CREATE_UNIVERSE_MEMBERSHIP = """
+CREATE TABLE IF NOT EXISTS universe_membership (
+    universe TEXT NOT NULL,
+    effective_date TEXT NOT NULL,
+    stock_code TEXT NOT NULL,
+    PRIMARY KEY (universe, effective_date, stock_code)
+);
+"""
+
+_CREATE_STOCK_LISTING = """
+CREATE TABLE IF NOT EXISTS stock_listing (
+    stock_code TEXT PRIMARY KEY,
+    stock_name TEXT NOT NULL,
+    market TEXT,
+    sector TEXT,
+    updated_on TEXT NOT NULL
+);
+"""
+
+_CREATE_UNIVERSE_REFRESH = """
+CREATE TABLE IF NOT EXISTS universe_refresh (
+    universe TEXT PRIMARY KEY,
+    refreshed_on TEXT NOT NULL
+);
+"""
+
+_CREATE_NOTIFICATION_FINGERPRINTS = """
+CREATE TABLE IF NOT EXISTS notification_fingerprints (
+    key TEXT PRIMARY KEY,
+    fingerprint TEXT NOT NULL,
+    session TEXT NOT NULL,
+    sent_at TIMESTAMP NOT NULL
+);
+"""
+
 
 def init_db(db_path: str = DB_PATH) -> None:
     with sqlite3.connect(db_path) as conn:
         conn.execute(_CREATE_SIGNAL_HISTORY)
         conn.execute(_CREATE_POSITIONS)
+        conn.execute(_CREATE_POSITION_TRAILING)
         conn.execute(_CREATE_DAILY_MARKET_DATA)
+        conn.execute(_CREATE_INDICATOR_STATE)
+        conn.execute(_CREATE_SIGNAL_MEMO)
+        conn.execute(_CREATE_SCREENING_RESULTS)
+        conn.execute(_CREATE_SCREENING_RUNS)
+        conn.execute(_CREATE_SCREENING_CHECKPOINTS)
+        conn.execute(_CREATE_SESSION_ARTIFACTS)
+        conn.execute(_CREATE_UNIVERSE_MEMBERSHIP)
+        conn.execute(_CREATE_STOCK_LISTING)
+        conn.execute(_CREATE_UNIVERSE_REFRESH)
+        conn.execute(_CREATE_NOTIFICATION_FINGERPRINTS)
         conn.commit()
 
 
+class _TimedConnection(sqlite3.Connection):
+    """지표가 켜져 있으면 문 실행 시간을 문 종류(SELECT/INSERT/...)별로 기록"""
+
+    def execute(self, sql, parameters=(), /):
+        if not metrics.enabled():
+            return super().execute(sql, parameters)
+        started = time.perf_counter()
+        try:
+            return super().execute(sql, parameters)
+        finally:
+            elapsed = time.perf_counter() - started
+            SQLITE_QUERY_SECONDS.observe(elapsed, op=_statement(sql))
+
+    def executemany(self, sql, parameters, /):
+        if not metrics.enabled():
+            return super().executemany(sql, parameters)
+        started = time.perf_counter()
+        try:
+            return super().executemany(sql, parameters)
+        finally:
+            elapsed = time.perf_counter() - started
+            SQLITE_QUERY_SECONDS.observe(elapsed, op=_statement(sql))
+
+
+def _statement(sql: str) -> str:
+    return sql.lstrip().split(None, 1)[0].upper() if sql.strip() else "-"
+
+
 @contextmanager
 def get_conn(db_path: str = DB_PATH) -> Generator[sqlite3.Connection, None, None]:
-    conn = sqlite3.connect(db_path)
+    conn = sqlite3.connect(db_path, factory=_TimedConnection)
     conn.row_factory = sqlite3.Row
     try:
         yield conn
@@ -0,0 +1,91 @@
+"""스트리밍 지표 상태 저장/복원 — 장중 재스캔 시 O(1) 갱신"""
+from __future__ import annotations
+
+import json
+from typing import Callable
+
+import pandas as pd
+from strategies.streaming import StreamingIndicator, indicator_from_state
+
+from db.database import get_conn
+
+
+def load_indicator_state(
+    stock_code: str, name: str
+) -> tuple[str, float | None, StreamingIndicator] | None:
+    """(마지막 봉 날짜, 마지막 봉 값, 지표) 반환. 없으면 None."""
+    with get_conn() as conn:
+        row = conn.execute(
+            """
+            SELECT last_date, last_value, state FROM indicator_state
+            WHERE stock_code = ? AND name = ?
+            """,
+            (stock_code, name),
+        ).fetchone()
+
+    if row is None:
+        return None
+    indicator = indicator_from_state(json.loads(row["state"]))
+    return row["last_date"], row["last_value"], indicator
+
+
+def save_indicator_state(
+    stock_code: str,
+    name: str,
+    last_date: str,
+    last_value: float | None,
+    indicator: StreamingIndicator,
+) -> None:
+    with get_conn() as conn:
+        conn.execute(
+            """
+            INSERT OR REPLACE INTO indicator_state
+                (stock_code, name, last_date, last_value, state, updated_at)
+            VALUES (?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+            """,
+            (stock_code, name, last_date, last_value, json.dumps(indicator.to_state())),
+        )
+
+
+def sync_indicator(
+    stock_code: str,
+    name: str,
+    series: pd.Series,
+    factory: Callable[[], StreamingIndicator],
+) -> StreamingIndicator:
+    """
+    저장된 상태를 series(일봉, 날짜 인덱스)의 마지막 봉까지 맞춘 뒤 저장.
+
+    - 같은 날짜 → revise (장중 당일 봉 갱신)
+    - 하루 뒤   → 직전 봉이 확정값과 다르면 revise 후 update
+    - 그 외(최초 실행, 공백 발생) → factory()로 전체 재계산
+    """
+    series = series.dropna()
+    if series.empty:
+        return factory()
+
+    dates = [d.strftime("%Y-%m-%d") for d in pd.to_datetime(series.index[-2:])]
+    last_date, last_value = dates[-1], float(series.iloc[-1])
+
+    saved = load_indicator_state(stock_code, name)
+    indicator: StreamingIndicator | None = None
+
+    if saved is not None:
+        saved_date, saved_value, indicator = saved
+        if saved_date == last_date:
+            indicator.revise(last_value)
+        elif len(dates) == 2 and saved_date == dates[0]:
+            prev_value = float(series.iloc[-2])
+            if saved_value is None or saved_value != prev_value:
+                indicator.revise(prev_value)
+            indicator.update(last_value)
+        else:
+            indicator = None
+
+    if indicator is None:
+        indicator = factory()
+        for x in series.to_numpy(dtype=float):
+            indicator.update(x)
+
+    save_indicator_state(stock_code, name, last_date, last_value, indicator)
+    return indicator
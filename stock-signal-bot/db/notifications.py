@@ -0,0 +1,40 @@
+"""발송한 알림 지문 — 키(예: signal:005930)별 마지막 발송 내용 요약
+
+같은 세션 중복 발송 억제용.
+"""
+from __future__ import annotations
+
+from datetime import datetime
+
+from db.database import get_conn
+
+
+def load_fingerprints(keys: list[str], session: str) -> dict[str, str]:
+    """session 중 발송한 키별 지문 (다른 세션에 보낸 것은 제외)"""
+    if not keys:
+        return {}
+    marks = ",".join("?" * len(keys))
+    with get_conn() as conn:
+        rows = conn.execute(
+            f"""
+            SELECT key, fingerprint FROM notification_fingerprints
+            WHERE session = ? AND key IN ({marks})
+            """,
+            (session, *keys),
+        ).fetchall()
+    return {row["key"]: row["fingerprint"] for row in rows}
+
+
+def save_fingerprints(
+    fingerprints: dict[str, str], session: str, sent_at: datetime | None = None
+) -> None:
+    stamp = (sent_at or datetime.now()).isoformat(timespec="seconds")
+    with get_conn() as conn:
+        conn.executemany(
+            """
+            INSERT OR REPLACE INTO notification_fingerprints
+                (key, fingerprint, session, sent_at)
+            VALUES (?, ?, ?, ?)
+            """,
+            [(key, fp, session, stamp) for key, fp in fingerprints.items()],
+        )
@@ -0,0 +1,128 @@
+"""종목별 스크리닝 결과 저장/조회 — 입력 워터마크로 재평가 여부 판단, 전체 순위 조회
+
+종목당 최신 결과 1건만 유지한다 (추천 여부와 무관하게 전 종목).
+"""
+from __future__ import annotations
+
+import json
+import sqlite3
+from datetime import datetime
+
+from signals.models import ScreenedStock, SignalType
+
+from db.database import get_conn
+
+# SQLite 바인딩 변수 제한(구버전 기본 999) 대응 — data.cache.load_panel 과 같은 크기
+_CHUNK = 500
+
+
+def save_screening_results(stocks: list[ScreenedStock]) -> None:
+    if not stocks:
+        return
+    with get_conn() as conn:
+        conn.executemany(
+            """
+            INSERT OR REPLACE INTO screening_results
+                (stock_code, stock_name, stage, signal, ensemble_score, price,
+                 change_pct, top_reasons, last_date, input_hash, evaluated_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            [
+                (
+                    s.stock_code,
+                    s.stock_name,
+                    s.stage,
+                    s.signal.value if s.signal is not None else None,
+                    s.ensemble_score,
+                    s.price,
+                    s.change_pct,
+                    json.dumps(s.top_reasons, ensure_ascii=False),
+                    s.last_date,
+                    s.input_hash,
+                    s.evaluated_at.isoformat(timespec="seconds"),
+                )
+                for s in stocks
+            ],
+        )
+
+
+def load_screening_results(
+    stock_codes: list[str] | None = None,
+    min_signal: SignalType | None = None,
+    limit: int | None = None,
+) -> list[ScreenedStock]:
+    """
+    저장된 결과를 앙상블 점수 내림차순으로 (1차 필터 제외 종목은 뒤).
+
+    Args:
+        stock_codes: 지정 시 해당 종목만 (_CHUNK 개씩 나눠 조회 후 병합)
+        min_signal: 지정 시 이 시그널 이상만 (예: BUY → 추천 후보 순위)
+        limit: 상위 N개
+    """
+    chunks: list[list[str] | None] = [None]
+    if stock_codes is not None:
+        chunks = [
+            stock_codes[i:i + _CHUNK] for i in range(0, len(stock_codes), _CHUNK)
+        ]
+
+    stocks: list[ScreenedStock] = []
+    with get_conn() as conn:
+        for chunk in chunks:
+            query = "SELECT * FROM screening_results WHERE 1 = 1"
+            params: list = []
+            if chunk is not None:
+                query += f" AND stock_code IN ({', '.join('?' * len(chunk))})"
+                params += chunk
+            if min_signal is not None:
+                query += " AND signal >= ?"
+                params.append(min_signal.value)
+            query += " ORDER BY ensemble_score IS NULL, ensemble_score DESC, stock_code"
+            if limit is not None:
+                query += " LIMIT ?"
+                params.append(limit)
+            stocks += [_to_stock(row) for row in conn.execute(query, params)]
+
+    if len(chunks) > 1:
+        stocks.sort(key=_rank)
+    return stocks[:limit] if limit is not None else stocks
+
+
+def prune_screening_results(stock_codes: list[str]) -> int:
+    """유니버스(stock_codes)에서 빠진 종목의 결과 삭제 — 삭제 건수 반환"""
+    keep = set(stock_codes)
+    with get_conn() as conn:
+        stale = [
+            row["stock_code"]
+            for row in conn.execute("SELECT stock_code FROM screening_results")
+            if row["stock_code"] not in keep
+        ]
+        for i in range(0, len(stale), _CHUNK):
+            chunk = stale[i:i + _CHUNK]
+            conn.execute(
+                "DELETE FROM screening_results "
+                f"WHERE stock_code IN ({', '.join('?' * len(chunk))})",
+                chunk,
+            )
+    return len(stale)
+
+
+def _rank(stock: ScreenedStock) -> tuple[bool, float, str]:
+    """load_screening_results 의 ORDER BY 와 같은 순서"""
+    score = stock.ensemble_score
+    return score is None, -(score or 0.0), stock.stock_code
+
+
+def _to_stock(row: sqlite3.Row) -> ScreenedStock:
+    return ScreenedStock(
+        stock_code=row["stock_code"],
+        stock_name=row["stock_name"],
+        stage=row["stage"],
+        signal=SignalType(row["signal"]) if row["signal"] is not None else None,
+        ensemble_score=row["ensemble_score"],
+        price=row["price"],
+        change_pct=row["change_pct"],
+        top_reasons=json.loads(row["top_reasons"]),
+        last_date=row["last_date"],
+        input_hash=row["input_hash"],
+        evaluated_at=datetime.fromisoformat(row["evaluated_at"]),
+    )
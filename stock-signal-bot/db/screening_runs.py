@@ -0,0 +1,121 @@
+"""예약 스크리닝 회차·종목별 체크포인트 저장/조회
+
+체크포인트는 "이 회차에서 채점을 마친 종목" 표시만 남긴다 — 결과 자체는
+screening_results 에 먼저 저장되므로, 재시작한 회차는 체크포인트 종목을 건너뛰고
+저장된 결과로 순위를 채운다. 회차가 끝나면(complete/partial) 체크포인트는 지운다.
+"""
+from __future__ import annotations
+
+import sqlite3
+from datetime import datetime
+
+from signals.models import ScreeningRun
+
+from db.database import get_conn
+
+
+def start_run(
+    run_id: str, universe: str, deadline: datetime | None = None
+) -> ScreeningRun:
+    """
+    회차 시작 — 이미 있는 회차면 상태만 running 으로 되돌리고
+    기존 시작 시각·마감은 유지.
+    저장된 회차를 반환.
+    """
+    with get_conn() as conn:
+        conn.execute(
+            """
+            INSERT OR IGNORE INTO screening_runs
+                (run_id, universe, status, started_at, deadline)
+            VALUES (?, ?, 'running', ?, ?)
+            """,
+            (
+                run_id,
+                universe,
+                datetime.now().isoformat(timespec="seconds"),
+                deadline.isoformat(timespec="seconds") if deadline else None,
+            ),
+        )
+        conn.execute(
+            """
+            UPDATE screening_runs SET status = 'running', finished_at = NULL
+            WHERE run_id = ?
+            """,
+            (run_id,),
+        )
+    return load_run(run_id)
+
+
+def finish_run(run_id: str, status: str, total: int, scored: int) -> None:
+    """
+    회차 종료 기록 — complete/partial 이면 체크포인트 삭제
+    (failed 는 재시도용으로 유지)
+    """
+    finished_at = datetime.now().isoformat(timespec="seconds")
+    with get_conn() as conn:
+        conn.execute(
+            """
+            UPDATE screening_runs SET status = ?, total = ?, scored = ?, finished_at = ?
+            WHERE run_id = ?
+            """,
+            (status, total, scored, finished_at, run_id),
+        )
+        if status in ("complete", "partial"):
+            conn.execute(
+                "DELETE FROM screening_checkpoints WHERE run_id = ?", (run_id,)
+            )
+
+
+def load_run(run_id: str) -> ScreeningRun | None:
+    with get_conn() as conn:
+        row = conn.execute(
+            "SELECT * FROM screening_runs WHERE run_id = ?", (run_id,)
+        ).fetchone()
+    return _to_run(row) if row else None
+
+
+def unfinished_runs(now: datetime | None = None) -> list[ScreeningRun]:
+    """중단된 채(running) 마감 전인 회차 — 재시작 시 이어서 실행할 대상"""
+    now = now or datetime.now()
+    with get_conn() as conn:
+        rows = conn.execute(
+            "SELECT * FROM screening_runs WHERE status = 'running' ORDER BY started_at"
+        ).fetchall()
+    return [run for run in map(_to_run, rows) if not run.expired(now)]
+
+
+def save_checkpoints(run_id: str, stock_codes: list[str]) -> None:
+    if not stock_codes:
+        return
+    with get_conn() as conn:
+        conn.executemany(
+            """
+            INSERT OR IGNORE INTO screening_checkpoints (run_id, stock_code)
+            VALUES (?, ?)
+            """,
+            [(run_id, code) for code in stock_codes],
+        )
+
+
+def load_checkpoints(run_id: str) -> set[str]:
+    with get_conn() as conn:
+        rows = conn.execute(
+            "SELECT stock_code FROM screening_checkpoints WHERE run_id = ?", (run_id,)
+        ).fetchall()
+    return {row["stock_code"] for row in rows}
+
+
+def _to_run(row: sqlite3.Row) -> ScreeningRun:
+    def parse(value: str | None) -> datetime | None:
+        return datetime.fromisoformat(value) if value else None
+
+    return ScreeningRun(
+        run_id=row["run_id"],
+        universe=row["universe"],
+        status=row["status"],
+        total=row["total"],
+        scored=row["scored"],
+        started_at=datetime.fromisoformat(row["started_at"]),
+        deadline=parse(row["deadline"]),
+        finished_at=parse(row["finished_at"]),
+    )
@@ -0,0 +1,67 @@
+"""거래일(세션) 단위 산출물 저장/조회
+
+세션·이름당 최신 1건만 두고, 이전 세션 산출물은 저장 시 정리한다.
+"""
+from __future__ import annotations
+
+import json
+from datetime import datetime
+from enum import Enum
+from typing import TypeVar
+
+import numpy as np
+from pydantic import BaseModel
+
+from db.database import get_conn
+
+M = TypeVar("M", bound=BaseModel)
+
+
+class _Encoder(json.JSONEncoder):
+    """model_dump() 결과 직렬화 — 전략 indicators 의 numpy 스칼라, Enum, datetime"""
+
+    def default(self, obj):
+        if isinstance(obj, (np.bool_, np.integer)):
+            return obj.item()
+        if isinstance(obj, np.floating):
+            return float(obj)
+        if isinstance(obj, Enum):
+            return obj.value
+        if isinstance(obj, datetime):
+            return obj.isoformat()
+        return super().default(obj)
+
+
+def save_artifact(
+    session: str, name: str, value: BaseModel, produced_at: datetime | None = None
+) -> None:
+    payload = json.dumps(value.model_dump(), ensure_ascii=False, cls=_Encoder)
+    produced = (produced_at or datetime.now()).isoformat(timespec="seconds")
+    with get_conn() as conn:
+        conn.execute("DELETE FROM session_artifacts WHERE session < ?", (session,))
+        conn.execute(
+            """
+            INSERT OR REPLACE INTO session_artifacts
+                (session, name, produced_at, payload)
+            VALUES (?, ?, ?, ?)
+            """,
+            (session, name, produced, payload),
+        )
+
+
+def load_artifact(
+    session: str, name: str, model: type[M]
+) -> tuple[datetime, M] | None:
+    """(생성 시각, 산출물) — 없으면 None"""
+    with get_conn() as conn:
+        row = conn.execute(
+            """
+            SELECT produced_at, payload FROM session_artifacts
+            WHERE session = ? AND name = ?
+            """,
+            (session, name),
+        ).fetchone()
+    if row is None:
+        return None
+    value = model.model_validate(json.loads(row["payload"]))
+    return datetime.fromisoformat(row["produced_at"]), value
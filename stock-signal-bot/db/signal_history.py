@@ -92,7 +92,11 @@ def save_position(
     stock_code: str,
     entry_price: float,
     stop_loss_price: float,
+    trail_pct: float | None = None,
 ) -> int:
+    """
+    trail_pct 지정 시 트레일링 스탑 — 고점 대비 trail_pct 하락가로 손절가를 끌어올림
+    """
     with get_conn() as conn:
         cur = conn.execute(
             """
@@ -101,17 +105,61 @@ def save_position(
             """,
             (stock_code, entry_price, datetime.now().isoformat(), stop_loss_price),
         )
+        if trail_pct:
+            conn.execute(
+                """
+                INSERT INTO position_trailing (position_id, trail_pct, high_water)
+                VALUES (?, ?, ?)
+                """,
+                (cur.lastrowid, trail_pct, entry_price),
+            )
         return cur.lastrowid
 
 
 def get_open_positions() -> list[dict]:
+    """보유 포지션 (트레일링 스탑이면 trail_pct·high_water 포함, 아니면 None)"""
     with get_conn() as conn:
         rows = conn.execute(
-            "SELECT * FROM positions WHERE status = 'OPEN'"
+            """
+            SELECT p.*, t.trail_pct, t.high_water FROM positions p
+            LEFT JOIN position_trailing t ON t.position_id = p.id
+            WHERE p.status = 'OPEN'
+            """
         ).fetchall()
         return [dict(r) for r in rows]
 
 
+def open_positions_version() -> tuple[int, int]:
+    """보유 포지션 변경 감지용 (개수, 최대 id) — 포지션 추가·청산 시 바뀜"""
+    with get_conn() as conn:
+        row = conn.execute(
+            """
+            SELECT COUNT(*) AS cnt, COALESCE(MAX(id), 0) AS max_id FROM positions
+            WHERE status = 'OPEN'
+            """
+        ).fetchone()
+        return row["cnt"], row["max_id"]
+
+
+def update_trailing_stops(updates: list[tuple[int, float, float, float]]) -> None:
+    """트레일링 상태 저장 — (포지션 id, 손절가, trail_pct, 고점) 목록"""
+    if not updates:
+        return
+    with get_conn() as conn:
+        conn.executemany(
+            "UPDATE positions SET stop_loss_price = ? WHERE id = ?",
+            [(stop, pid) for pid, stop, _, _ in updates],
+        )
+        conn.executemany(
+            """
+            INSERT OR REPLACE INTO position_trailing
+                (position_id, trail_pct, high_water)
+            VALUES (?, ?, ?)
+            """,
+            [(pid, trail, high) for pid, _, trail, high in updates],
+        )
+
+
 def close_position(
     position_id: int,
     exit_price: float,
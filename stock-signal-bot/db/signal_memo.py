@@ -0,0 +1,56 @@
+"""전략 시그널 메모 — 입력 구간이 바뀌지 않은 종목은 재분석 없이 재사용
+
+키: (종목, 전략) → (전략 버전, 마지막 봉 날짜, 입력 구간 해시)
+종목·전략당 최신 결과 1건만 유지한다.
+"""
+from __future__ import annotations
+
+import json
+
+from signals.models import StrategyResult
+
+from db.database import get_conn
+
+# (version, last_date, input_hash)
+MemoKey = tuple[str, str, str]
+
+
+def load_signal_memo(stock_code: str) -> dict[str, tuple[MemoKey, StrategyResult]]:
+    """{전략명: (키, 시그널)}"""
+    with get_conn() as conn:
+        rows = conn.execute(
+            """
+            SELECT strategy, version, last_date, input_hash, result FROM signal_memo
+            WHERE stock_code = ?
+            """,
+            (stock_code,),
+        ).fetchall()
+
+    return {
+        row["strategy"]: (
+            (row["version"], row["last_date"], row["input_hash"]),
+            StrategyResult.from_dict(json.loads(row["result"])),
+        )
+        for row in rows
+    }
+
+
+def save_signal_memo(
+    stock_code: str, entries: dict[str, tuple[MemoKey, StrategyResult]]
+) -> None:
+    with get_conn() as conn:
+        conn.executemany(
+            """
+            INSERT OR REPLACE INTO signal_memo
+                (stock_code, strategy, version, last_date, input_hash, result,
+                 updated_at)
+            VALUES (?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+            """,
+            [
+                (
+                    stock_code, strategy, *key,
+                    json.dumps(sig.as_dict(), ensure_ascii=False),
+                )
+                for strategy, (key, sig) in entries.items()
+            ],
+        )
@@ -0,0 +1,120 @@
+"""유니버스 구성종목 스냅샷 / 종목 상장 정보 저장·조회
+
+구성종목은 (유니버스, 적용일) 스냅샷으로 저장하고, 특정 날짜의 구성은
+그 날짜 이전 가장 최근 스냅샷으로 본다 (시점 기준 조회 — 생존 편향 방지).
+"""
+from __future__ import annotations
+
+from datetime import date
+from typing import Optional
+
+from db.database import get_conn
+
+# (종목명, 시장, 업종) — 런타임에 평가되므로 `X | None` 대신 Optional (3.9)
+Listing = tuple[str, Optional[str], Optional[str]]
+
+# SQLite 바인딩 변수 제한(구버전 기본 999) 대응 — data.cache.load_panel 과 같은 크기
+_CHUNK = 500
+
+
+def save_snapshot(universe: str, effective_date: date, stock_codes: list[str]) -> None:
+    with get_conn() as conn:
+        conn.execute(
+            "DELETE FROM universe_membership WHERE universe = ? AND effective_date = ?",
+            (universe, effective_date.isoformat()),
+        )
+        conn.executemany(
+            """
+            INSERT INTO universe_membership (universe, effective_date, stock_code)
+            VALUES (?, ?, ?)
+            """,
+            [(universe, effective_date.isoformat(), code) for code in stock_codes],
+        )
+
+
+def load_members(universe: str, as_of: date) -> list[str]:
+    """as_of 시점의 구성종목 (이전 스냅샷이 없으면 빈 리스트)"""
+    with get_conn() as conn:
+        rows = conn.execute(
+            """
+            SELECT stock_code FROM universe_membership
+            WHERE universe = ? AND effective_date = (
+                SELECT MAX(effective_date) FROM universe_membership
+                WHERE universe = ? AND effective_date <= ?
+            )
+            ORDER BY stock_code
+            """,
+            (universe, universe, as_of.isoformat()),
+        ).fetchall()
+    return [row["stock_code"] for row in rows]
+
+
+def load_snapshots(universe: str) -> list[tuple[date, set[str]]]:
+    """적용일 오름차순 전체 스냅샷"""
+    with get_conn() as conn:
+        rows = conn.execute(
+            """
+            SELECT effective_date, stock_code FROM universe_membership
+            WHERE universe = ? ORDER BY effective_date
+            """,
+            (universe,),
+        ).fetchall()
+
+    snapshots: dict[str, set[str]] = {}
+    for row in rows:
+        snapshots.setdefault(row["effective_date"], set()).add(row["stock_code"])
+    return [(date.fromisoformat(d), codes) for d, codes in snapshots.items()]
+
+
+def save_listings(listings: dict[str, Listing], updated_on: date) -> None:
+    with get_conn() as conn:
+        conn.executemany(
+            """
+            INSERT OR REPLACE INTO stock_listing
+                (stock_code, stock_name, market, sector, updated_on)
+            VALUES (?, ?, ?, ?, ?)
+            """,
+            [
+                (code, name, market, sector, updated_on.isoformat())
+                for code, (name, market, sector) in listings.items()
+            ],
+        )
+
+
+def load_listings(stock_codes: list[str]) -> dict[str, Listing]:
+    """{종목코드: 상장 정보} — _CHUNK 개씩 나눠 조회 (바인딩 변수 제한)"""
+    listings: dict[str, Listing] = {}
+    with get_conn() as conn:
+        for i in range(0, len(stock_codes), _CHUNK):
+            chunk = stock_codes[i:i + _CHUNK]
+            rows = conn.execute(
+                f"""
+                SELECT stock_code, stock_name, market, sector FROM stock_listing
+                WHERE stock_code IN ({', '.join('?' * len(chunk))})
+                """,
+                chunk,
+            )
+            for row in rows:
+                listings[row["stock_code"]] = (
+                    row["stock_name"], row["market"], row["sector"]
+                )
+    return listings
+
+
+def get_refreshed_on(universe: str) -> date | None:
+    with get_conn() as conn:
+        row = conn.execute(
+            "SELECT refreshed_on FROM universe_refresh WHERE universe = ?", (universe,)
+        ).fetchone()
+    return date.fromisoformat(row["refreshed_on"]) if row else None
+
+
+def set_refreshed_on(universe: str, day: date) -> None:
+    with get_conn() as conn:
+        conn.execute(
+            """
+            INSERT OR REPLACE INTO universe_refresh (universe, refreshed_on)
+            VALUES (?, ?)
+            """,
+            (universe, day.isoformat()),
+        )
@@ -0,0 +1,44 @@
+"""무거운 외부 모듈 지연 임포트 — 첫 속성 접근 시점에 실제 임포트
+
+    krx = LazyModule("pykrx.stock")   # 여기서는 임포트하지 않음
+    krx.get_market_ohlcv_by_date(...)  # 첫 호출에서 pykrx(+matplotlib) 로드
+
+모듈 속성으로 남으므로 테스트의 monkeypatch.setattr(module, "krx", fake) 도
+그대로 동작한다. api 를 주면 지표가 켜져 있을 때 함수 호출마다 시간·예외 수를
+기록한다 (metrics.external_call).
+"""
+from __future__ import annotations
+
+import functools
+import importlib
+from types import ModuleType
+
+import metrics
+
+
+class LazyModule:
+    def __init__(self, name: str, api: str | None = None) -> None:
+        self._name = name
+        self._api = api
+        self._module: ModuleType | None = None
+
+    def _load(self) -> ModuleType:
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return self._module
+
+    def __getattr__(self, attr: str):
+        value = getattr(self._load(), attr)
+        if self._api is None or not metrics.enabled() or not callable(value):
+            return value
+
+        @functools.wraps(value)
+        def timed(*args, **kwargs):
+            with metrics.external_call(self._api, attr):
+                return value(*args, **kwargs)
+
+        return timed
+
+    def __repr__(self) -> str:
+        state = "loaded" if self._module is not None else "not loaded"
+        return f"<LazyModule {self._name} ({state})>"
@@ -1,20 +1,34 @@
-"""엔트리포인트 — APScheduler 기반 자동 실행"""
+"""엔트리포인트 — APScheduler 기반 자동 실행, 또는 작업 1회 실행 CLI
+
+    python main.py                    스케줄러 실행 (= python main.py run)
+    python main.py scan [--dry-run]   시그널 스캔 1회
+    python main.py screen [--dry-run] 스크리닝 1회
+    python main.py report [--dry-run] 일간 리포트 1회
+    python main.py bench [--quick]    벤치마크 스위트 → benchmarks/results/<커밋>.json
+
+--dry-run 은 Telegram 발송 대신 메시지를 표준 출력으로 보낸다 (토큰 불필요).
+pandas·pykrx·python-telegram-bot 등 무거운 모듈은 작업이 처음 필요로 할 때 임포트한다.
+"""
 from __future__ import annotations
 
+import argparse
 import asyncio
 import logging
-
-from apscheduler.schedulers.asyncio import AsyncIOScheduler
-from apscheduler.triggers.cron import CronTrigger
+import sys
+from datetime import date, datetime, timedelta
+from typing import TYPE_CHECKING
+from zoneinfo import ZoneInfo
 
 import config
+import metrics
 from config import SCHEDULE, TIMEZONE
-from db.database import init_db
-from notifications.telegram import send_daily_report, send_error, send_signal, send_stop_loss_alert
-from signals.generator import build_daily_report, run_signal_scan
-from signals.models import SignalType
-from db.signal_history import get_open_positions, close_position
-from data.fetcher import get_current_price
+from data import market_calendar
+from scheduling.runtime import JobPolicy, JobRuntime
+
+if TYPE_CHECKING:
+    from apscheduler.schedulers.asyncio import AsyncIOScheduler
+    from scheduling.triggers import SessionTrigger
+    from signals.stop_engine import StopEngine
 
 logging.basicConfig(
     level=logging.INFO,
@@ -23,17 +37,48 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+RUNTIME = JobRuntime(
+    config.JOB_IO_WORKERS, config.JOB_CPU_WORKERS, config.JOB_DELAY_WARN_SECONDS
+)
+_stop_engine: StopEngine | None = None
+
+# 작업별 실행 정책 — 모두 단일 인스턴스, 밀린 회차는 한 번으로 합침
+# 손절 모니터는 곧 다음 회차가 있으므로 늦은 회차는 버리고, 리포트는 늦어도 보낸다
+POLICIES = {
+    "signal_scan": JobPolicy(misfire_grace_time=300),
+    "daily_report": JobPolicy(misfire_grace_time=1800),
+    "screening": JobPolicy(misfire_grace_time=600),
+    "stop_loss_monitor": JobPolicy(
+        misfire_grace_time=max(1, config.STOP_MONITOR_INTERVAL_SECONDS // 2)
+    ),
+}
+
+
+def stop_engine() -> StopEngine:
+    """손절 엔진 (첫 모니터링 회차에 생성)"""
+    global _stop_engine
+    if _stop_engine is None:
+        from signals.stop_engine import StopEngine
+
+        _stop_engine = StopEngine()
+    return _stop_engine
+
 
 # ── 스케줄 작업 ─────────────────────────────────────────────────────────────
 
 async def job_signal_scan() -> None:
-    """시그널 스캔 → 유효 시그널 Telegram 발송"""
+    """시그널 스캔 → 유효 시그널 Telegram 발송 (SIGNAL_DIGEST 면 모아서 변동분만)"""
+    from notifications.telegram import queue_signals, send_error, send_signals
+    from signals.generator import run_signal_scan
+    from signals.models import SignalType
+
     logger.info("시그널 스캔 시작")
     try:
-        signals = run_signal_scan()
-        for signal in signals:
-            if signal.signal != SignalType.NEUTRAL:
-                await send_signal(signal)
+        signals = await RUNTIME.run_io(run_signal_scan)
+        if config.SIGNAL_DIGEST:
+            await queue_signals(signals)
+        else:
+            await send_signals([s for s in signals if s.signal != SignalType.NEUTRAL])
         logger.info(f"시그널 스캔 완료: {len(signals)}건")
     except Exception as e:
         logger.error(f"시그널 스캔 오류: {e}")
@@ -41,109 +86,144 @@ async def job_signal_scan() -> None:
 
 
 async def job_daily_report() -> None:
-    """장 마감 후 종합 리포트"""
+    """
+    장 마감 후 종합 리포트
+    — 15:20 시그널·15:10 스크리닝 결과가 신선하면 재사용해 조립만
+    """
+    from notifications.telegram import deliver_screening, send_daily_report, send_error
+    from signals.generator import build_daily_report, session_signals
+    from signals.session import SCREENING
+    from signals.session import load as load_session
+
     logger.info("일간 리포트 생성 시작")
     try:
-        signals = run_signal_scan(notify_neutral=True)
-        report = build_daily_report(signals)
-        await send_daily_report(report)
+        signals = await RUNTIME.run_io(session_signals)
+        screening = await RUNTIME.run_io(load_session, SCREENING)
+        streamed = False
+        if screening is None and config.SCREENER_PROVISIONAL_SHARE > 0:
+            from signals.screener import stream_screening
+
+            # 잠정 추천을 먼저 보내고 스크리닝이 끝나면 같은 메시지를 최종 결과로 수정
+            screening = await deliver_screening(stream_screening(RUNTIME.run_cpu))
+            streamed = True
+        # 신선한 스크리닝 결과가 없으면 여기서 스크리닝까지 수행 → cpu 레인
+        report = await RUNTIME.run_cpu(build_daily_report, signals, screening=screening)
+        await send_daily_report(report, include_recommendations=not streamed)
         logger.info("일간 리포트 발송 완료")
     except Exception as e:
         logger.error(f"일간 리포트 오류: {e}")
         await send_error(str(e))
 
 
-async def job_stop_loss_monitor() -> None:
-    """장중 5분 간격 손절 모니터링"""
-    positions = get_open_positions()
-    if not positions:
-        return
+async def job_screening(slot: str) -> None:
+    """
+    예약 스크리닝 — SCREENER_DEADLINE_MINUTES 안에 끝나지 않으면 부분 결과 발송.
+    같은 날 같은 회차(slot="0900" 등)를 다시 실행하면 체크포인트부터 이어서 채점.
+    """
+    from signals.screener import screening_run_id
 
-    for pos in positions:
-        code = pos["stock_code"]
-        stop_price = pos["stop_loss_price"]
-        entry_price = pos["entry_price"]
+    deadline = datetime.now() + timedelta(minutes=config.SCREENER_DEADLINE_MINUTES)
+    await run_screening_job(screening_run_id(date.today(), slot), deadline)
 
-        try:
-            current_price, _ = get_current_price(code)
-            if current_price == 0:
-                continue
-
-            loss_pct = (current_price - entry_price) / entry_price
-
-            if current_price <= stop_price:
-                reason = (
-                    f"리버모어/오닐 손절선 도달 "
-                    f"({loss_pct*100:.1f}%, 진입가:{entry_price:,.0f}원)"
-                )
-                close_position(pos["id"], current_price, "STOP_LOSS")
-                await send_stop_loss_alert(
-                    code,
-                    config.TARGETS.get(code, {}).get("name", code),
-                    current_price,
-                    stop_price,
-                    reason,
-                )
-        except Exception as e:
-            logger.error(f"[{code}] 손절 모니터링 오류: {e}")
 
+async def run_screening_job(
+    run_id: str | None, deadline: datetime | None = None
+) -> None:
+    """
+    회차 실행 → 결과 발송 (잠정 추천 사용 시 중간 순위를 먼저 보내고 같은 메시지 수정).
+    run_id=None 이면 회차 기록·체크포인트 없는 1회 실행 (CLI).
+    """
+    from notifications.telegram import deliver_screening, send_error, send_screening
+    from signals.screener import run_screening, stream_screening
 
-# ── 스케줄러 설정 ───────────────────────────────────────────────────────────
+    logger.info(f"스크리닝 회차 시작: {run_id or '수동'}")
+    try:
+        if config.SCREENER_PROVISIONAL_SHARE > 0:
+            result = await deliver_screening(
+                stream_screening(RUNTIME.run_cpu, run_id=run_id, deadline=deadline)
+            )
+        else:
+            result = await RUNTIME.run_cpu(
+                run_screening, run_id=run_id, deadline=deadline
+            )
+            await send_screening(result)
+        status = result.summary.status if result and result.summary else "complete"
+        logger.info(f"스크리닝 회차 종료: {run_id or '수동'} ({status})")
+    except Exception as e:
+        logger.error(f"스크리닝 오류 ({run_id or '수동'}): {e}")
+        await send_error(str(e))
 
-def build_scheduler() -> AsyncIOScheduler:
-    scheduler = AsyncIOScheduler(timezone=TIMEZONE)
 
-    pre = SCHEDULE["pre_market_scan"]
-    scheduler.add_job(
-        job_signal_scan,
-        CronTrigger(hour=pre["hour"], minute=pre["minute"], timezone=TIMEZONE),
-        id="pre_market_scan",
-        name="장 시작 전 사전 스캔",
-    )
+async def job_stop_loss_monitor() -> None:
+    """
+    장중 손절 모니터링 (STOP_MONITOR_INTERVAL_SECONDS 간격)
+    — 보유 종목 일괄 시세로 판정.
+    판정·청산 기록은 우선 레인에서 (스캔·스크리닝과 무관하게 즉시 실행)
+    """
+    if not market_calendar.is_open(datetime.now(ZoneInfo(TIMEZONE))):
+        return
+    from notifications.telegram import send_stop_loss_alert
 
-    mo = SCHEDULE["market_open_signal"]
-    scheduler.add_job(
-        job_signal_scan,
-        CronTrigger(hour=mo["hour"], minute=mo["minute"], timezone=TIMEZONE),
-        id="market_open_signal",
-        name="장 시작 직후 시그널",
-    )
+    for hit in await RUNTIME.run_priority(stop_engine().poll):
+        pos = hit.position
+        await send_stop_loss_alert(
+            pos.stock_code,
+            config.TARGETS.get(pos.stock_code, {}).get("name", pos.stock_code),
+            hit.price,
+            pos.stop_price,
+            hit.reason(),
+        )
 
-    mid = SCHEDULE["midday_check"]
-    scheduler.add_job(
-        job_signal_scan,
-        CronTrigger(hour=mid["hour"], minute=mid["minute"], timezone=TIMEZONE),
-        id="midday_check",
-        name="점심 중간 점검",
-    )
 
-    closing = SCHEDULE["closing_signal"]
-    scheduler.add_job(
-        job_signal_scan,
-        CronTrigger(hour=closing["hour"], minute=closing["minute"], timezone=TIMEZONE),
-        id="closing_signal",
-        name="장 마감 직전 시그널",
-    )
+# ── 스케줄러 설정 ───────────────────────────────────────────────────────────
+
+def build_scheduler(runtime: JobRuntime = RUNTIME) -> AsyncIOScheduler:
+    from apscheduler.schedulers.asyncio import AsyncIOScheduler
+    from scheduling.triggers import SessionIntervalTrigger, SessionTrigger
 
-    daily = SCHEDULE["daily_report"]
-    scheduler.add_job(
-        job_daily_report,
-        CronTrigger(hour=daily["hour"], minute=daily["minute"], timezone=TIMEZONE),
-        id="daily_report",
-        name="일간 종합 리포트",
+    scheduler = AsyncIOScheduler(timezone=TIMEZONE)
+    runtime.attach(scheduler)
+
+    # 거래일에만 실행 — 개장·마감 무렵 작업은
+    # 개장/마감 시각이 바뀌는 날(연초·수능일) 함께 이동
+    def cron(entry: dict) -> SessionTrigger:
+        return SessionTrigger.at(entry["hour"], entry["minute"], TIMEZONE)
+
+    for key, name in [
+        ("pre_market_scan", "장 시작 전 사전 스캔"),
+        ("market_open_signal", "장 시작 직후 시그널"),
+        ("midday_check", "점심 중간 점검"),
+        ("closing_signal", "장 마감 직전 시그널"),
+    ]:
+        runtime.add_job(
+            scheduler, job_signal_scan, cron(SCHEDULE[key]),
+            id=key, name=name, policy=POLICIES["signal_scan"],
+        )
+
+    runtime.add_job(
+        scheduler, job_daily_report, cron(SCHEDULE["daily_report"]),
+        id="daily_report", name="일간 종합 리포트", policy=POLICIES["daily_report"],
     )
 
-    # 장중 5분 간격 손절 모니터링 (09:05 ~ 15:30)
-    scheduler.add_job(
+    # KOSPI200 스크리닝 회차 (09:00 / 12:00 / 15:10)
+    for slot in SCHEDULE["kospi200_screening"]:
+        hhmm = f"{slot['hour']:02d}{slot['minute']:02d}"
+        runtime.add_job(
+            scheduler, job_screening, cron(slot),
+            args=[hhmm],
+            id=f"kospi200_screening_{hhmm}",
+            name=f"KOSPI200 스크리닝 {slot['hour']:02d}:{slot['minute']:02d}",
+            policy=POLICIES["screening"],
+        )
+
+    # 장중 손절 모니터링 — 그 날 정규장 동안만 간격 실행
+    runtime.add_job(
+        scheduler,
         job_stop_loss_monitor,
-        CronTrigger(
-            hour="9-15",
-            minute="*/5",
-            second=0,
-            timezone=TIMEZONE,
-        ),
+        SessionIntervalTrigger(config.STOP_MONITOR_INTERVAL_SECONDS, TIMEZONE),
         id="stop_loss_monitor",
         name="손절 모니터링",
+        policy=POLICIES["stop_loss_monitor"],
     )
 
     return scheduler
@@ -152,15 +232,33 @@ def build_scheduler() -> AsyncIOScheduler:
 # ── 진입점 ──────────────────────────────────────────────────────────────────
 
 async def main() -> None:
+    from db.database import init_db
+    from db.screening_runs import unfinished_runs
+    from notifications.telegram import close_delivery
+
+    config.require_telegram()
     logger.info("봇 시작 중...")
     init_db()
 
+    if config.METRICS_PORT:
+        metrics.serve(config.METRICS_HOST, config.METRICS_PORT)
+        metrics.register_collector(RUNTIME.metric_families)
+
     scheduler = build_scheduler()
     scheduler.start()
     logger.info("스케줄러 시작 완료")
 
-    # 시작 직후 즉시 1회 스캔
-    await job_signal_scan()
+    # 재시작 전 중단된 스크리닝 회차 — 마감 전이면 체크포인트부터 이어서 실행
+    for run in unfinished_runs():
+        logger.info(f"중단된 스크리닝 회차 재개 예약: {run.run_id}")
+        RUNTIME.add_job(
+            scheduler, run_screening_job, args=[run.run_id],
+            id=f"resume_{run.run_id}", policy=POLICIES["screening"],
+        )
+
+    # 시작 직후 즉시 1회 스캔 (휴장일 제외)
+    if market_calendar.is_trading_day(date.today()):
+        await job_signal_scan()
 
     try:
         # asyncio 루프 유지
@@ -169,7 +267,75 @@ async def main() -> None:
     except (KeyboardInterrupt, SystemExit):
         logger.info("봇 종료")
         scheduler.shutdown()
+        RUNTIME.shutdown()
+        await close_delivery()
+
+
+# ── CLI ─────────────────────────────────────────────────────────────────────
+
+def _run_once(job, *args) -> None:
+    """스케줄러 없이 작업 1회 실행"""
+    from db.database import init_db
+    from notifications.telegram import close_delivery
 
+    async def once() -> None:
+        try:
+            await job(*args)
+        finally:
+            await close_delivery()
+
+    init_db()
+    try:
+        asyncio.run(once())
+    finally:
+        RUNTIME.shutdown()
+
+
+def cli(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="주식 시그널 봇")
+    commands = parser.add_subparsers(dest="command")
+    commands.add_parser("run", help="스케줄러 실행 (기본)")
+    for name, help_text in [
+        ("scan", "시그널 스캔 1회"),
+        ("screen", "스크리닝 1회 (회차 기록 없음)"),
+        ("report", "일간 리포트 1회"),
+    ]:
+        command = commands.add_parser(name, help=help_text)
+        command.add_argument(
+            "--dry-run", action="store_true", help="발송 대신 표준 출력"
+        )
+    bench = commands.add_parser("bench", help="벤치마크 스위트 (합성 데이터)")
+    argv = sys.argv[1:] if argv is None else argv
+    if argv[:1] == ["bench"]:
+        # 벤치마크 옵션은 bench 명령일 때만 등록 (스위트 임포트 비용)
+        from benchmarks import suite
+
+        suite.add_arguments(bench)
+    args = parser.parse_args(argv)
+
+    if args.command == "bench":
+        return suite.main(args)
+
+    dry_run = getattr(args, "dry_run", False)
+    if not dry_run:
+        try:
+            config.require_telegram()
+        except RuntimeError as e:
+            parser.error(str(e))
+    if args.command in (None, "run"):
+        asyncio.run(main())
+        return 0
+
+    from notifications import telegram
+
+    telegram.set_dry_run(dry_run)
+    job = {
+        "scan": job_signal_scan,
+        "screen": run_screening_job,
+        "report": job_daily_report,
+    }[args.command]
+    _run_once(job, *([None] if args.command == "screen" else []))
+    return 0
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    sys.exit(cli())
@@ -0,0 +1,308 @@
+"""운영 지표 — 카운터·게이지·히스토그램을 모아 Prometheus 텍스트 형식으로 로컬 HTTP 노출
+
+    CALLS = metrics.counter("stockbot_x_total", "설명", ["kind"])
+    CALLS.inc(kind="a")
+    with metrics.histogram("stockbot_y_seconds", "설명", ["op"]).time(op="read"): ...
+
+METRICS_PORT 가 설정된 경우에만 serve() 로 켜진다. 꺼져 있으면 기록 메서드는
+플래그 확인만 하고 바로 돌아가므로 계측 지점의 비용은 무시할 수 있다.
+외부 의존성 없음 (prometheus_client 미사용).
+"""
+from __future__ import annotations
+
+import bisect
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Iterable, Iterator
+
+logger = logging.getLogger(__name__)
+
+_enabled = False
+
+# 지연 시간 히스토그램 기본 구간(초) — SQLite 쿼리(ms 이하)부터 스크리닝(수 분)까지
+DEFAULT_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+    1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0, 900.0,
+)
+
+
+def enable(on: bool = True) -> None:
+    global _enabled
+    _enabled = on
+
+
+def enabled() -> bool:
+    return _enabled
+
+
+@dataclass
+class Family:
+    """렌더링 단위 — 같은 이름의 샘플 묶음 (수집 함수도 이 형태로 반환)"""
+    name: str
+    type: str                       # counter | gauge | histogram
+    help: str
+    samples: list[tuple[str, dict[str, str], float]] = field(default_factory=list)
+
+
+class _Metric:
+    type = ""
+
+    def __init__(self, name: str, help: str, labels: Iterable[str] = ()) -> None:
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labels)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict[str, str]) -> tuple[str, ...]:
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _labels(self, key: tuple[str, ...]) -> dict[str, str]:
+        return dict(zip(self.labelnames, key))
+
+    def family(self) -> Family:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    type = "counter"
+
+    def __init__(self, name: str, help: str, labels: Iterable[str] = ()) -> None:
+        super().__init__(name, help, labels)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        if not _enabled:
+            return
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def family(self) -> Family:
+        with self._lock:
+            items = list(self._values.items())
+        samples = [(self.name, self._labels(k), v) for k, v in items]
+        return Family(self.name, self.type, self.help, samples)
+
+
+class Gauge(Counter):
+    type = "gauge"
+
+    def set(self, value: float, **labels: str) -> None:
+        if not _enabled:
+            return
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+
+class Histogram(_Metric):
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labels: Iterable[str] = (),
+        buckets: Iterable[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, help, labels)
+        self.buckets = tuple(sorted(buckets))
+        # 라벨별 [구간별 개수..., +Inf 개수], 합계
+        self._counts: dict[tuple[str, ...], list[int]] = {}
+        self._sums: dict[tuple[str, ...], float] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        if not _enabled:
+            return
+        key = self._key(labels)
+        slot = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            counts = self._counts.get(key)
+            if counts is None:
+                counts = self._counts[key] = [0] * (len(self.buckets) + 1)
+                self._sums[key] = 0.0
+            counts[slot] += 1
+            self._sums[key] += value
+
+    @contextmanager
+    def time(self, **labels: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def family(self) -> Family:
+        with self._lock:
+            items = [(k, list(c), self._sums[k]) for k, c in self._counts.items()]
+        samples = []
+        for key, counts, total in items:
+            labels = self._labels(key)
+            cumulative = 0
+            for bound, count in zip((*self.buckets, float("inf")), counts):
+                cumulative += count
+                bucket = {**labels, "le": _format_bound(bound)}
+                samples.append((f"{self.name}_bucket", bucket, cumulative))
+            samples.append((f"{self.name}_sum", labels, total))
+            samples.append((f"{self.name}_count", labels, cumulative))
+        return Family(self.name, self.type, self.help, samples)
+
+
+# ── 레지스트리 ───────────────────────────────────────────────────────────────
+
+_registry: dict[str, _Metric] = {}
+_collectors: list[Callable[[], Iterable[Family]]] = []
+_registry_lock = threading.Lock()
+
+
+def _get(cls: type, name: str, help: str, labels: Iterable[str], **kwargs) -> _Metric:
+    """같은 이름은 한 번만 등록 — 여러 모듈이 같은 지표를 선언해도 같은 객체"""
+    with _registry_lock:
+        metric = _registry.get(name)
+        if metric is None:
+            metric = _registry[name] = cls(name, help, labels, **kwargs)
+        elif type(metric) is not cls:
+            raise ValueError(f"지표 {name} 이(가) 이미 {metric.type} 로 등록됨")
+        return metric
+
+
+def counter(name: str, help: str, labels: Iterable[str] = ()) -> Counter:
+    return _get(Counter, name, help, labels)
+
+
+def gauge(name: str, help: str, labels: Iterable[str] = ()) -> Gauge:
+    return _get(Gauge, name, help, labels)
+
+
+def histogram(
+    name: str,
+    help: str,
+    labels: Iterable[str] = (),
+    buckets: Iterable[float] = DEFAULT_BUCKETS,
+) -> Histogram:
+    return _get(Histogram, name, help, labels, buckets=buckets)
+
+
+def register_collector(collect: Callable[[], Iterable[Family]]) -> None:
+    """렌더링 때마다 호출해 Family 를 받는 수집 함수 (다른 곳에 집계된 값 노출용)"""
+    with _registry_lock:
+        if collect not in _collectors:
+            _collectors.append(collect)
+
+
+# ── 공용 계측 ────────────────────────────────────────────────────────────────
+
+EXTERNAL_CALL_SECONDS = histogram(
+    "stockbot_external_call_seconds",
+    "외부 데이터 API 호출 시간 (pykrx, yfinance)",
+    ["api", "method"],
+)
+EXTERNAL_CALL_ERRORS = counter(
+    "stockbot_external_call_errors_total",
+    "외부 데이터 API 호출 예외 수",
+    ["api", "method"],
+)
+CACHE_REQUESTS = counter(
+    "stockbot_cache_requests_total", "캐시 조회 결과 (hit / miss)", ["cache", "result"]
+)
+
+
+@contextmanager
+def external_call(api: str, method: str) -> Iterator[None]:
+    """외부 API 호출 1회 — 시간과 예외 수 기록"""
+    if not _enabled:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    except Exception:
+        EXTERNAL_CALL_ERRORS.inc(api=api, method=method)
+        raise
+    finally:
+        elapsed = time.perf_counter() - started
+        EXTERNAL_CALL_SECONDS.observe(elapsed, api=api, method=method)
+
+
+def cache_lookup(cache: str, hit: bool) -> None:
+    CACHE_REQUESTS.inc(cache=cache, result="hit" if hit else "miss")
+
+
+# ── 노출 ─────────────────────────────────────────────────────────────────────
+
+def render() -> str:
+    """Prometheus 텍스트 형식 (version 0.0.4)"""
+    with _registry_lock:
+        families = [m.family() for m in _registry.values()]
+        collectors = list(_collectors)
+    for collect in collectors:
+        try:
+            families.extend(collect())
+        except Exception as e:
+            name = getattr(collect, "__qualname__", collect)
+            logger.warning(f"[metrics] 수집 실패 ({name}): {e}")
+
+    lines = []
+    for family in families:
+        lines.append(f"# HELP {family.name} {_escape(family.help, quote=False)}")
+        lines.append(f"# TYPE {family.name} {family.type}")
+        for name, labels, value in family.samples:
+            lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+    return "\n".join(lines) + "\n"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_GET(self) -> None:
+        if self.path.split("?")[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = render().encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+def serve(host: str, port: int) -> ThreadingHTTPServer:
+    """
+    지표 기록을 켜고 http://host:port/metrics 를 데몬 스레드로 제공
+    (port=0 → 임의 포트)
+    """
+    enable()
+    server = ThreadingHTTPServer((host, port), _Handler)
+    threading.Thread(
+        target=server.serve_forever, name="metrics-http", daemon=True
+    ).start()
+    logger.info(f"[metrics] http://{host}:{server.server_port}/metrics")
+    return server
+
+
+def _format_labels(labels: dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items()) + "}"
+
+
+def _escape(value: str, quote: bool = True) -> str:
+    value = str(value).replace("\\", "\\\\").replace("\n", "\\n")
+    return value.replace('"', '\\"') if quote else value
+
+
+def _format_value(value: float) -> str:
+    if value != value:
+        return "NaN"
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+def _format_bound(bound: float) -> str:
+    return "+Inf" if bound == float("inf") else repr(float(bound))
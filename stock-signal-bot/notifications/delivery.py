@@ -0,0 +1,217 @@
+"""Telegram 발송 파이프라인 — 장수 Bot(HTTP 커넥션 풀) 1개, 채팅별 큐, 속도 제한, 재시도
+
+    delivery = TelegramDelivery(token)
+    # 즉시 큐에 넣고 Future 반환
+    future = delivery.submit(chat_id, "send_message", text=...)
+    message_id = await future
+
+- 채팅마다 워커 1개가 큐를 순서대로 처리 → 같은 채팅의 메시지 순서 보장,
+  채팅끼리는 동시 발송
+- 같은 채팅 연속 발송은 chat_interval 초 이상 간격, 전체는 초당 global_rate 건 이하
+- urgent(손절 알림)는 같은 채팅 큐에서 대기 중인 일반 메시지보다 먼저 보냄
+- 429 는 retry_after 만큼, 5xx·네트워크 오류는 지수 백오프로 재시도.
+  400·403 등은 바로 실패
+
+Bot 의 HTTP 클라이언트는 생성한 asyncio 루프에 묶이므로 루프마다 인스턴스 하나를 쓴다.
+"""
+from __future__ import annotations
+
+import asyncio
+import itertools
+import logging
+import warnings
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import timedelta
+from typing import Any
+
+import metrics
+import telegram
+from telegram.error import BadRequest, NetworkError, RetryAfter
+from telegram.request import HTTPXRequest
+from telegram.warnings import PTBDeprecationWarning
+
+logger = logging.getLogger(__name__)
+
+REQUEST_SECONDS = metrics.histogram(
+    "stockbot_telegram_request_seconds",
+    "Telegram Bot API 요청 1회 시간 (재시도 포함 각 시도)",
+    ["method"],
+)
+MESSAGES = metrics.counter(
+    "stockbot_telegram_messages_total", "Telegram 요청 결과", ["result"]
+)
+RETRIES = metrics.counter("stockbot_telegram_retries_total", "Telegram 요청 재시도 수")
+RATE_LIMIT_WAIT = metrics.counter(
+    "stockbot_rate_limit_wait_seconds_total",
+    "속도 제한으로 기다린 시간 합",
+    ["limiter"],
+)
+
+# 백오프 상한(초)
+_MAX_BACKOFF = 30.0
+
+
+@dataclass(order=True)
+class _Request:
+    priority: int
+    seq: int
+    method: str = field(compare=False)
+    kwargs: dict = field(compare=False)
+    future: asyncio.Future = field(compare=False)
+
+
+class _Window:
+    """period 초 동안 최대 limit 건 (슬라이딩 윈도)"""
+
+    def __init__(self, limit: int, period: float = 1.0) -> None:
+        self.limit = max(1, limit)
+        self.period = period
+        self._stamps: deque[float] = deque()
+
+    async def acquire(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            now = loop.time()
+            while self._stamps and now - self._stamps[0] >= self.period:
+                self._stamps.popleft()
+            if len(self._stamps) < self.limit:
+                self._stamps.append(now)
+                return
+            await asyncio.sleep(self.period - (now - self._stamps[0]))
+
+
+@dataclass
+class DeliveryStats:
+    sent: int = 0
+    retried: int = 0
+    failed: int = 0
+    throttled_s: float = 0.0        # 속도 제한·429 로 기다린 시간 합
+
+
+class TelegramDelivery:
+    def __init__(
+        self,
+        token: str,
+        *,
+        base_url: str = "",
+        global_rate: int = 25,
+        chat_interval: float = 1.0,
+        max_retries: int = 5,
+        retry_base: float = 1.0,
+    ) -> None:
+        kwargs: dict[str, Any] = {"request": HTTPXRequest(connection_pool_size=8)}
+        if base_url:
+            kwargs["base_url"] = base_url
+        self.bot = telegram.Bot(token, **kwargs)
+        self.loop = asyncio.get_running_loop()
+        self.chat_interval = chat_interval
+        self.max_retries = max_retries
+        self.retry_base = retry_base
+        self.stats = DeliveryStats()
+        self._global = _Window(global_rate)
+        self._queues: dict[str, asyncio.PriorityQueue[_Request]] = {}
+        self._workers: dict[str, asyncio.Task] = {}
+        self._last_sent: dict[str, float] = {}
+        self._seq = itertools.count()
+
+    def submit(
+        self, chat_id: str, method: str, *, urgent: bool = False, **kwargs
+    ) -> asyncio.Future:
+        """
+        chat_id 큐에 Bot 메서드 호출을 넣고 결과 Future 반환
+        (호출 순서 = 발송 순서)
+        """
+        if chat_id not in self._queues:
+            self._queues[chat_id] = asyncio.PriorityQueue()
+            self._workers[chat_id] = self.loop.create_task(self._worker(chat_id))
+        future = self.loop.create_future()
+        request = _Request(
+            0 if urgent else 1,
+            next(self._seq),
+            method,
+            {"chat_id": chat_id, **kwargs},
+            future,
+        )
+        self._queues[chat_id].put_nowait(request)
+        return future
+
+    async def close(self) -> None:
+        """남은 큐를 비운 뒤 워커 종료, HTTP 커넥션 정리"""
+        for queue in self._queues.values():
+            await queue.join()
+        for worker in self._workers.values():
+            worker.cancel()
+        await asyncio.gather(*self._workers.values(), return_exceptions=True)
+        await self.bot.shutdown()
+
+    async def _worker(self, chat_id: str) -> None:
+        queue = self._queues[chat_id]
+        while True:
+            request = await queue.get()
+            try:
+                if not request.future.cancelled():
+                    result = await self._call(chat_id, request)
+                    if not request.future.done():
+                        request.future.set_result(result)
+            except Exception as e:
+                self.stats.failed += 1
+                MESSAGES.inc(result="failed")
+                logger.error(f"[delivery] {chat_id} {request.method} 실패: {e}")
+                if not request.future.done():
+                    request.future.set_exception(e)
+            finally:
+                queue.task_done()
+
+    async def _call(self, chat_id: str, request: _Request) -> Any:
+        method = getattr(self.bot, request.method)
+        for attempt in itertools.count():
+            await self._throttle(chat_id)
+            try:
+                with REQUEST_SECONDS.time(method=request.method):
+                    result = await method(**request.kwargs)
+                self.stats.sent += 1
+                MESSAGES.inc(result="sent")
+                return result
+            except RetryAfter as e:
+                if attempt >= self.max_retries:
+                    raise
+                delay = _retry_after(e)
+                self.stats.throttled_s += delay
+                RATE_LIMIT_WAIT.inc(delay, limiter="retry_after")
+                logger.warning(f"[delivery] {chat_id} 429 — {delay:.0f}초 대기")
+            except BadRequest:
+                raise
+            except NetworkError as e:           # 5xx, 타임아웃, 연결 오류
+                if attempt >= self.max_retries:
+                    raise
+                delay = min(_MAX_BACKOFF, self.retry_base * 2 ** attempt)
+                logger.warning(
+                    f"[delivery] {chat_id} {request.method} 오류 — "
+                    f"{delay:.1f}초 후 재시도: {e}"
+                )
+            self.stats.retried += 1
+            RETRIES.inc()
+            await asyncio.sleep(delay)
+
+    async def _throttle(self, chat_id: str) -> None:
+        started = self.loop.time()
+        last = self._last_sent.get(chat_id)
+        if last is not None:
+            wait = last + self.chat_interval - self.loop.time()
+            if wait > 0:
+                await asyncio.sleep(wait)
+        acquiring = self.loop.time()
+        await self._global.acquire()
+        now = self._last_sent[chat_id] = self.loop.time()
+        self.stats.throttled_s += now - started
+        RATE_LIMIT_WAIT.inc(acquiring - started, limiter="chat")
+        RATE_LIMIT_WAIT.inc(now - acquiring, limiter="global")
+
+
+def _retry_after(error: RetryAfter) -> float:
+    # PTB 22.2+ 는 retry_after 를 int 로 읽으면 경고 (다음 메이저에서 timedelta 로 변경)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", PTBDeprecationWarning)
+        value = error.retry_after
+    return value.total_seconds() if isinstance(value, timedelta) else float(value)
@@ -0,0 +1,89 @@
+"""시그널 다이제스트 — 한 스캔(또는 window 초) 동안의 시그널을 모아 한 번에 발송
+
+- 같은 종목이 여러 번 들어오면 마지막 시그널만 남김
+- 지문(시그널 방향 + 전략별 투표)이 같은 세션에 이미 보낸 것과 같으면 생략
+  — 가격·점수 변동만으로는 재발송 안 함
+- NEUTRAL 은 보내지 않지만 지문은 남겨, 중립을 거쳐 다시 BUY 가 되면 새 알림으로 발송
+- window > 0 이면 첫 시그널 도착 후 window 초 뒤에 발송 (지연 상한)
+
+메시지 분할(4096자)은 notifications.telegram.send_signal_digest 가 맡는다.
+"""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+from datetime import datetime
+from typing import Awaitable, Callable
+
+from db.notifications import load_fingerprints, save_fingerprints
+from signals.models import EnsembleSignal, SignalType
+
+logger = logging.getLogger(__name__)
+
+
+def fingerprint(signal: EnsembleSignal) -> str:
+    """알림 내용 요약 — 시그널 방향과 전략별 투표 (가격·점수·사유 문구 제외)"""
+    votes = sorted((s.strategy_name, s.signal.name) for s in signal.strategy_signals)
+    raw = "|".join([signal.signal.name, *(f"{name}={vote}" for name, vote in votes)])
+    return hashlib.sha1(raw.encode()).hexdigest()[:16]
+
+
+def _key(signal: EnsembleSignal) -> str:
+    return f"signal:{signal.stock_code}"
+
+
+class SignalDigest:
+    def __init__(
+        self,
+        send: Callable[[list[EnsembleSignal]], Awaitable[None]],
+        window: float = 0.0,
+        remember: bool = True,
+    ) -> None:
+        """
+        send: 모은 시그널 발송, remember=False 면 발송 지문을 저장하지 않음 (드라이런)
+        """
+        self.send = send
+        self.window = window
+        self.remember = remember
+        self.loop = asyncio.get_running_loop()
+        self._pending: dict[str, EnsembleSignal] = {}
+        self._timer: asyncio.Task | None = None
+
+    async def add(self, signals: list[EnsembleSignal]) -> None:
+        """스캔 결과 전체(NEUTRAL 포함)를 넣음 — window 가 0 이면 바로 발송"""
+        for signal in signals:
+            self._pending[signal.stock_code] = signal
+        if self.window <= 0:
+            await self.flush()
+        elif self._pending and self._timer is None:
+            self._timer = self.loop.create_task(self._flush_later())
+
+    async def flush(self, now: datetime | None = None) -> list[EnsembleSignal]:
+        """모인 시그널 중 새로 알릴 것만 발송 → 발송한 시그널"""
+        if self._timer is not None and self._timer is not asyncio.current_task():
+            self._timer.cancel()
+        self._timer = None
+        signals, self._pending = list(self._pending.values()), {}
+        if not signals:
+            return []
+
+        now = now or datetime.now()
+        session = now.date().isoformat()
+        sent = load_fingerprints([_key(s) for s in signals], session)
+        current = {_key(s): (s, fingerprint(s)) for s in signals}
+        changed = {k: v for k, v in current.items() if sent.get(k) != v[1]}
+        fresh = [s for s, _ in changed.values() if s.signal != SignalType.NEUTRAL]
+
+        if fresh:
+            await self.send(fresh)
+        if self.remember and changed:
+            fingerprints = {key: fp for key, (_, fp) in changed.items()}
+            save_fingerprints(fingerprints, session, now)
+        skipped = sum(s.signal != SignalType.NEUTRAL for s in signals) - len(fresh)
+        logger.info(f"[digest] {len(fresh)}종목 발송, 변동 없음 {skipped}종목 생략")
+        return fresh
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self.window)
+        await self.flush()
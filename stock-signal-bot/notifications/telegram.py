@@ -1,30 +1,170 @@
 """Telegram 메시지 포맷팅 및 발송"""
 from __future__ import annotations
 
+import asyncio
 import logging
+from typing import TYPE_CHECKING, AsyncIterator
 
-import telegram
+import config
+from config import SCREENER_PROVISIONAL_SHARE
+from signals.models import (
+    DailyReport,
+    EnsembleSignal,
+    Leaderboard,
+    Recommendation,
+    ScreeningResult,
+    ScreeningSummary,
+)
 
-from config import TELEGRAM_BOT_TOKEN, TELEGRAM_CHAT_ID
-from signals.models import DailyReport, EnsembleSignal, SignalType
+if TYPE_CHECKING:
+    from notifications.delivery import TelegramDelivery
+    from notifications.digest import SignalDigest
 
 logger = logging.getLogger(__name__)
 
+# Telegram 메시지 최대 길이
+MAX_MESSAGE_CHARS = 4096
 
-def _get_bot() -> telegram.Bot:
-    return telegram.Bot(token=TELEGRAM_BOT_TOKEN)
+# 드라이런 — 발송 대신 표준 출력 (CLI --dry-run)
+_dry_run = False
+
+_delivery: TelegramDelivery | None = None
+_digest: SignalDigest | None = None
+
+
+def set_dry_run(enabled: bool) -> None:
+    global _dry_run
+    _dry_run = enabled
+
+
+def _get_delivery() -> TelegramDelivery:
+    """실행 중인 루프의 발송 파이프라인 (Bot·HTTP 커넥션을 프로세스 동안 재사용)"""
+    global _delivery
+    if _delivery is None or _delivery.loop is not asyncio.get_running_loop():
+        from notifications.delivery import TelegramDelivery
+
+        config.require_telegram()
+        _delivery = TelegramDelivery(
+            config.TELEGRAM_BOT_TOKEN,
+            base_url=config.TELEGRAM_API_URL,
+            global_rate=config.TELEGRAM_GLOBAL_RATE,
+            chat_interval=config.TELEGRAM_CHAT_INTERVAL_SECONDS,
+            max_retries=config.TELEGRAM_MAX_RETRIES,
+            retry_base=config.TELEGRAM_RETRY_BASE_SECONDS,
+        )
+    return _delivery
+
+
+def _get_digest() -> SignalDigest:
+    global _digest
+    if _digest is None or _digest.loop is not asyncio.get_running_loop():
+        from notifications.digest import SignalDigest
+
+        _digest = SignalDigest(
+            send_signal_digest,
+            config.SIGNAL_DIGEST_WINDOW_SECONDS,
+            remember=not _dry_run,
+        )
+    return _digest
+
+
+async def close_delivery() -> None:
+    """
+    모으던 다이제스트와 대기 중인 메시지를 모두 보낸 뒤 Bot 세션 종료
+    (프로세스 종료 전)
+    """
+    global _delivery, _digest
+    if _digest is not None and _digest.loop is asyncio.get_running_loop():
+        await _digest.flush()
+    _digest = None
+    if _delivery is not None and _delivery.loop is asyncio.get_running_loop():
+        await _delivery.close()
+    _delivery = None
+
+
+def _submit(text: str, urgent: bool = False) -> dict[str, asyncio.Future]:
+    delivery = _get_delivery()
+    return {
+        chat: delivery.submit(
+            chat, "send_message", urgent=urgent, text=text, parse_mode="HTML"
+        )
+        for chat in config.TELEGRAM_CHAT_IDS
+    }
+
+
+async def _collect(pending: dict[str, asyncio.Future]) -> dict[str, int]:
+    """
+    채팅별 발송 결과 → {chat_id: message_id}
+    (실패한 채팅은 파이프라인에서 로그 후 제외)
+    """
+    results = await asyncio.gather(*pending.values(), return_exceptions=True)
+    return {
+        chat: result.message_id
+        for chat, result in zip(pending, results)
+        if not isinstance(result, BaseException)
+    }
+
+
+async def _send(text: str, urgent: bool = False) -> dict[str, int]:
+    """모든 채팅에 메시지 1건 → {chat_id: message_id} (드라이런이면 출력만)"""
+    if _dry_run:
+        print(text, end="\n\n")
+        return {}
+    return await _collect(_submit(text, urgent))
+
+
+async def _send_all(texts: list[str]) -> None:
+    """여러 메시지를 한꺼번에 큐에 넣고 완료 대기 (채팅별 순서 유지, 채팅끼리 동시)"""
+    if _dry_run:
+        for text in texts:
+            print(text, end="\n\n")
+        return
+    pending = [_submit(text) for text in texts]
+    await asyncio.gather(*(_collect(p) for p in pending))
+
+
+async def _edit(message_ids: dict[str, int], text: str) -> None:
+    """보낸 메시지 수정 — 첫 발송에 실패했던 채팅에는 새로 보냄"""
+    if _dry_run:
+        print(text, end="\n\n")
+        return
+    delivery = _get_delivery()
+    pending = {
+        chat: delivery.submit(
+            chat, "edit_message_text",
+            message_id=message_ids[chat], text=text, parse_mode="HTML",
+        )
+        if chat in message_ids
+        else delivery.submit(chat, "send_message", text=text, parse_mode="HTML")
+        for chat in config.TELEGRAM_CHAT_IDS
+    }
+    await asyncio.gather(*pending.values(), return_exceptions=True)
 
 
 async def send_signal(signal: EnsembleSignal) -> None:
-    bot = _get_bot()
-    await bot.send_message(
-        chat_id=TELEGRAM_CHAT_ID,
-        text=_format_signal(signal),
-        parse_mode="HTML",
-    )
+    await _send(_format_signal(signal))
     logger.info(f"[Telegram] 시그널 발송: {signal.stock_name} {signal.signal.name}")
 
 
+async def send_signals(signals: list[EnsembleSignal]) -> None:
+    """스캔 결과 시그널을 한꺼번에 큐에 넣어 발송"""
+    await _send_all([_format_signal(s) for s in signals])
+    logger.info(f"[Telegram] 시그널 {len(signals)}건 발송")
+
+
+async def queue_signals(signals: list[EnsembleSignal]) -> None:
+    """다이제스트 모드 — 스캔 결과 전체(NEUTRAL 포함)를 넘기면 모아서 변동분만 발송"""
+    await _get_digest().add(signals)
+
+
+async def send_signal_digest(signals: list[EnsembleSignal]) -> None:
+    """여러 종목 시그널을 4096자 이내 메시지 최소 개수로 묶어 발송"""
+    header = f"📊 <b>매매 시그널 ({len(signals)}종목)</b>\n━━━━━━━━━━━━━━━━━━"
+    footer = f"⏰ {max(s.timestamp for s in signals).strftime('%Y-%m-%d %H:%M')} KST"
+    await _send_all(_pack(header, [_format_signal_entry(s) for s in signals], footer))
+    logger.info(f"[Telegram] 시그널 다이제스트 발송: {len(signals)}종목")
+
+
 async def send_stop_loss_alert(
     stock_code: str,
     stock_name: str,
@@ -32,7 +172,6 @@ async def send_stop_loss_alert(
     stop_price: float,
     reason: str,
 ) -> None:
-    bot = _get_bot()
     change = (current_price - stop_price) / stop_price * 100
     msg = (
         "🚨 <b>긴급 손절 알림</b>\n"
@@ -43,23 +182,59 @@ async def send_stop_loss_alert(
         "즉시 매도를 권고합니다.\n"
         "━━━━━━━━━━━━━━━━━━"
     )
-    await bot.send_message(chat_id=TELEGRAM_CHAT_ID, text=msg, parse_mode="HTML")
+    await _send(msg, urgent=True)
+
+
+async def send_daily_report(
+    report: DailyReport, include_recommendations: bool = True
+) -> None:
+    """
+    include_recommendations=False → 추천 종목은 deliver_screening 으로
+    이미 발송한 경우
+    """
+    await _send_all(_format_daily_report(report, include_recommendations))
+
+
+async def send_screening(result: ScreeningResult) -> None:
+    """예약 스크리닝 결과 (마감 도달 시 부분 결과로 표시)"""
+    await _send(_format_recommendations(result.recommendations, result.summary))
+
 
+async def deliver_screening(
+    boards: AsyncIterator[Leaderboard],
+    share: float = SCREENER_PROVISIONAL_SHARE,
+) -> ScreeningResult | None:
+    """
+    스크리닝 순위표 스트림을 받아, 유니버스의 share 이상이 채점되면 잠정 추천 메시지를
+    먼저 보내고 최종 결과가 나오면 같은 메시지를 수정한다. 최종 ScreeningResult 반환.
+    """
+    message_ids: dict[str, int] = {}
+    provisional = False
 
-async def send_daily_report(report: DailyReport) -> None:
-    bot = _get_bot()
-    messages = _format_daily_report(report)
-    for msg in messages:
-        await bot.send_message(chat_id=TELEGRAM_CHAT_ID, text=msg, parse_mode="HTML")
+    async for board in boards:
+        if not board.final:
+            if not provisional and board.recommendations and board.progress >= share:
+                text = _format_recommendations(
+                    board.recommendations, progress=(board.scored, board.total)
+                )
+                message_ids = await _send(text)
+                provisional = True
+                logger.info(f"[Telegram] 잠정 추천 발송 ({board.progress:.0%} 채점)")
+            continue
+
+        result = board.result
+        text = _format_recommendations(result.recommendations, result.summary)
+        if not provisional:
+            await _send(text)
+        else:
+            await _edit(message_ids, text)
+            logger.info("[Telegram] 잠정 추천 → 최종 결과로 수정")
+        return result
+    return None
 
 
 async def send_error(error_msg: str) -> None:
-    bot = _get_bot()
-    await bot.send_message(
-        chat_id=TELEGRAM_CHAT_ID,
-        text=f"❌ <b>봇 오류</b>\n{error_msg}",
-        parse_mode="HTML",
-    )
+    await _send(f"❌ <b>봇 오류</b>\n{error_msg}")
 
 
 # ── 포맷터 ─────────────────────────────────────────────────────────────────
@@ -85,7 +260,50 @@ def _format_signal(signal: EnsembleSignal) -> str:
     return "\n".join(lines)
 
 
-def _format_daily_report(report: DailyReport) -> list[str]:
+def _format_signal_entry(signal: EnsembleSignal) -> str:
+    """다이제스트용 종목 1개 블록"""
+    arrow = "▲" if signal.change_pct >= 0 else "▼"
+    lines = [
+        f"{signal.signal.emoji()} <b>{signal.stock_name}</b> ({signal.stock_code}) "
+        f"{signal.price:,.0f}원 ({arrow}{abs(signal.change_pct):.1f}%)",
+        f"  {signal.signal.label()} (Score: {signal.ensemble_score:.2f})",
+    ]
+    for i, s in enumerate(signal.strategy_signals):
+        prefix = "└" if i == len(signal.strategy_signals) - 1 else "├"
+        lines.append(f"  {prefix} {s.strategy_name}: {s.signal.emoji()} {s.reason}")
+    return "\n".join(lines)
+
+
+def _pack(
+    header: str, entries: list[str], footer: str = "", limit: int = MAX_MESSAGE_CHARS
+) -> list[str]:
+    """
+    header·footer 를 붙인 메시지들로 entries 를 순서대로 채움
+    — 메시지마다 limit 자 이하
+    """
+    frame = len(header) + len(footer) + 4
+    messages: list[str] = []
+    body: list[str] = []
+    size = frame
+    for entry in entries:
+        entry = entry[: limit - frame]
+        if body and size + len(entry) + 2 > limit:
+            messages.append(_frame(header, body, footer))
+            body, size = [], frame
+        body.append(entry)
+        size += len(entry) + 2
+    if body:
+        messages.append(_frame(header, body, footer))
+    return messages
+
+
+def _frame(header: str, body: list[str], footer: str) -> str:
+    return "\n\n".join([header, *body, *([footer] if footer else [])])
+
+
+def _format_daily_report(
+    report: DailyReport, include_recommendations: bool = True
+) -> list[str]:
     """리포트를 여러 메시지로 분리 반환 (Telegram 4096자 제한 대응)"""
     messages = []
 
@@ -147,24 +365,10 @@ def _format_daily_report(report: DailyReport) -> list[str]:
         messages.append("\n".join(lines))
 
     # ── 3. 신규 추천 종목 ───────────────────────────────
-    if report.recommendations:
-        lines = [
-            "🔍 <b>신규 추천 종목 (투자 거장 앙상블)</b>",
-            "━━━━━━━━━━━━━━━━━━━━━━━━━━",
-            "",
-        ]
-        for i, r in enumerate(report.recommendations, 1):
-            arrow = "▲" if r.change_pct >= 0 else "▼"
-            lines += [
-                f"{i}. {r.signal.emoji()} <b>{r.stock_name}</b> ({r.stock_code})",
-                f"   현재가: {r.price:,.0f}원 ({arrow}{abs(r.change_pct):.1f}%)",
-                f"   앙상블 스코어: {r.ensemble_score:.2f} | {r.signal.label()}",
-            ]
-            for reason in r.top_reasons:
-                lines.append(f"   • {reason}")
-            lines.append("")
-
-        messages.append("\n".join(lines))
+    if report.recommendations and include_recommendations:
+        messages.append(
+            _format_recommendations(report.recommendations, report.screening)
+        )
 
     if not messages:
         messages.append(
@@ -172,3 +376,52 @@ def _format_daily_report(report: DailyReport) -> list[str]:
         )
 
     return messages
+
+
+def _format_recommendations(
+    recommendations: list[Recommendation],
+    screening: ScreeningSummary | None = None,
+    progress: tuple[int, int] | None = None,
+) -> str:
+    """신규 추천 종목 메시지. progress=(채점, 전체) 이면 잠정 순위로 표시"""
+    title = "🔍 <b>신규 추천 종목 (투자 거장 앙상블)</b>"
+    if progress is not None:
+        scored, total = progress
+        title = (
+            f"⏳ <b>잠정 추천 종목</b> — {scored}/{total}종목 채점 "
+            f"({scored / total:.0%})"
+        )
+    elif screening and screening.status == "partial":
+        title = (
+            f"⏱️ <b>신규 추천 종목 (부분 결과)</b> — "
+            f"{screening.scored}/{screening.universe}종목 채점"
+        )
+    lines = [title, "━━━━━━━━━━━━━━━━━━━━━━━━━━", ""]
+
+    for i, r in enumerate(recommendations, 1):
+        arrow = "▲" if r.change_pct >= 0 else "▼"
+        lines += [
+            f"{i}. {r.signal.emoji()} <b>{r.stock_name}</b> ({r.stock_code})",
+            f"   현재가: {r.price:,.0f}원 ({arrow}{abs(r.change_pct):.1f}%)",
+            f"   앙상블 스코어: {r.ensemble_score:.2f} | {r.signal.label()}",
+        ]
+        for reason in r.top_reasons:
+            lines.append(f"   • {reason}")
+        lines.append("")
+
+    if progress is not None:
+        lines.append("※ 스크리닝 진행 중 — 완료되면 이 메시지가 최종 결과로 바뀝니다.")
+    elif screening:
+        lines.append(
+            f"🧮 스캔 {screening.universe}종목 → 1차 필터 {screening.prefiltered}개 "
+            f"({screening.selectivity:.0%}) → 후보 {screening.candidates}개 | "
+            f"재사용 {screening.reused} | {screening.elapsed_s:.0f}초"
+        )
+        if screening.resumed:
+            lines.append(f"↩️ 중단된 회차에서 {screening.resumed}종목 이어받음")
+        if screening.status == "partial":
+            lines.append(
+                "※ 마감 시각 도달 — 보유 종목과 직전 상위 종목부터 채점한 "
+                "부분 결과입니다."
+            )
+    return "\n".join(lines)
@@ -0,0 +1,276 @@
+"""스케줄 작업 실행 환경 — 작업 종류별 실행 레인, 작업별 중복·지연 정책, 대기 지연 집계
+
+잡 코루틴은 asyncio 루프에서 돌고,
+동기 본문(스캔·스크리닝·현재가 조회)은 레인으로 넘긴다.
+
+    io       : 짧은 I/O 위주 작업 (시그널 스캔, 리포트 조립)      — JOB_IO_WORKERS
+    cpu      : 오래 걸리는 계산 (스크리닝)                        — JOB_CPU_WORKERS
+    priority : 손절 모니터 전용 1스레드 — 다른 레인이 밀려도 바로 실행
+
+대기 지연 = 스케줄러 지연(예정 시각 → 제출) + 레인 대기(제출 → 레인 스레드 시작).
+스크리닝의 CPU 병렬화는 SCREENER_MODE=process 가 따로 맡으므로 cpu 레인은 스레드
+풀로 두고 동시에 도는 긴 작업 수만 제한한다.
+"""
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, TypeVar
+
+import metrics
+
+# apscheduler 는 스케줄러를 붙일 때만 임포트 — 1회 실행 CLI·벤치마크는 불필요
+if TYPE_CHECKING:
+    from apscheduler.events import JobEvent
+    from apscheduler.schedulers.base import BaseScheduler
+
+logger = logging.getLogger(__name__)
+
+JOB_SECONDS = metrics.histogram(
+    "stockbot_job_duration_seconds", "스케줄 작업 실행 시간", ["job"]
+)
+JOB_QUEUE_DELAY = metrics.histogram(
+    "stockbot_job_queue_delay_seconds",
+    "스케줄 작업 대기 지연 (스케줄러 지연 + 레인 대기)",
+    ["job"],
+)
+
+T = TypeVar("T")
+
+# 레인 호출이 어느 잡에서 왔는지 (잡 래퍼가 설정)
+_current_job: contextvars.ContextVar[str] = contextvars.ContextVar(
+    "current_job", default="-"
+)
+
+
+@dataclass(frozen=True)
+class JobPolicy:
+    """
+    APScheduler 작업 옵션.
+    max_instances: 동시에 실행 가능한 인스턴스 수 (초과 시 이번 회차 건너뜀)
+    coalesce: 밀린 회차가 여럿이면 한 번만 실행
+    misfire_grace_time: 예정 시각에서 이 초 이상 늦으면 실행하지 않음 (None → 무제한)
+    """
+    max_instances: int = 1
+    coalesce: bool = True
+    misfire_grace_time: int | None = 60
+
+
+@dataclass
+class JobStats:
+    runs: int = 0
+    errors: int = 0
+    missed: int = 0                 # misfire_grace_time 초과로 실행 안 함
+    skipped: int = 0                # max_instances 초과로 건너뜀
+    last_scheduler_lag_s: float = 0.0
+    last_lane_wait_s: float = 0.0
+    max_queue_delay_s: float = 0.0
+    total_queue_delay_s: float = 0.0
+    last_duration_s: float = 0.0
+
+    @property
+    def last_queue_delay_s(self) -> float:
+        return self.last_scheduler_lag_s + self.last_lane_wait_s
+
+
+class JobRuntime:
+    def __init__(
+        self, io_workers: int, cpu_workers: int, warn_delay_s: float = 30.0
+    ) -> None:
+        self.warn_delay_s = warn_delay_s
+        self._lanes = {
+            "io": ThreadPoolExecutor(io_workers, thread_name_prefix="job-io"),
+            "cpu": ThreadPoolExecutor(cpu_workers, thread_name_prefix="job-cpu"),
+            "priority": ThreadPoolExecutor(1, thread_name_prefix="job-priority"),
+        }
+        self._stats: dict[str, JobStats] = {}
+        self._lock = threading.Lock()
+
+    # ── 등록 ─────────────────────────────────────────────────────────────
+
+    def attach(self, scheduler: BaseScheduler) -> None:
+        """스케줄러 이벤트로 스케줄러 지연·누락·중복 건너뜀 집계"""
+        from apscheduler.events import (
+            EVENT_JOB_ERROR,
+            EVENT_JOB_EXECUTED,
+            EVENT_JOB_MAX_INSTANCES,
+            EVENT_JOB_MISSED,
+            EVENT_JOB_SUBMITTED,
+        )
+
+        scheduler.add_listener(
+            self._on_event,
+            EVENT_JOB_SUBMITTED | EVENT_JOB_EXECUTED | EVENT_JOB_ERROR
+            | EVENT_JOB_MISSED | EVENT_JOB_MAX_INSTANCES,
+        )
+
+    def add_job(
+        self,
+        scheduler: BaseScheduler,
+        func: Callable[..., Awaitable[None]],
+        trigger: Any = None,
+        *,
+        id: str,
+        name: str | None = None,
+        policy: JobPolicy = JobPolicy(),
+        args: list | None = None,
+    ) -> None:
+        """정책을 적용해 등록 — 잡 안의 레인 호출은 이 id 로 집계된다"""
+        async def run(*job_args: Any) -> None:
+            token = _current_job.set(id)
+            started = time.perf_counter()
+            try:
+                await func(*job_args)
+            finally:
+                elapsed = time.perf_counter() - started
+                self._update(id, last_duration_s=elapsed)
+                _current_job.reset(token)
+                JOB_SECONDS.observe(elapsed, job=id)
+                with self._lock:
+                    delay = self._stats[id].last_queue_delay_s
+                JOB_QUEUE_DELAY.observe(delay, job=id)
+
+        run.__name__ = run.__qualname__ = func.__name__
+        scheduler.add_job(
+            run,
+            trigger,
+            args=args,
+            id=id,
+            name=name or id,
+            max_instances=policy.max_instances,
+            coalesce=policy.coalesce,
+            misfire_grace_time=policy.misfire_grace_time,
+        )
+
+    # ── 레인 실행 ─────────────────────────────────────────────────────────
+
+    async def run_io(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        return await self._run("io", fn, *args, **kwargs)
+
+    async def run_cpu(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        return await self._run("cpu", fn, *args, **kwargs)
+
+    async def run_priority(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        return await self._run("priority", fn, *args, **kwargs)
+
+    async def _run(
+        self, lane: str, fn: Callable[..., T], *args: Any, **kwargs: Any
+    ) -> T:
+        job_id = _current_job.get()
+        queued = time.perf_counter()
+
+        def call() -> T:
+            wait = time.perf_counter() - queued
+            self._record_wait(job_id, lane, wait)
+            return fn(*args, **kwargs)
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._lanes[lane], call)
+
+    # ── 집계 ─────────────────────────────────────────────────────────────
+
+    def stats(self) -> dict[str, JobStats]:
+        with self._lock:
+            return {job_id: JobStats(**asdict(s)) for job_id, s in self._stats.items()}
+
+    def metric_families(self) -> list[metrics.Family]:
+        """metrics.register_collector 용 — 작업별 누적 집계를 지표로"""
+        stats = self.stats()
+        families = [
+            metrics.Family(name, kind, help_text)
+            for name, kind, help_text in (
+                ("stockbot_job_runs_total", "counter", "스케줄 작업 실행 수"),
+                ("stockbot_job_errors_total", "counter", "스케줄 작업 예외 수"),
+                ("stockbot_job_missed_total", "counter",
+                 "허용 지연 초과로 실행하지 않은 회차"),
+                ("stockbot_job_skipped_total", "counter",
+                 "이전 실행이 끝나지 않아 건너뛴 회차"),
+                ("stockbot_job_last_duration_seconds", "gauge", "직전 실행 시간"),
+                ("stockbot_job_last_queue_delay_seconds", "gauge", "직전 대기 지연"),
+                ("stockbot_job_max_queue_delay_seconds", "gauge", "최대 대기 지연"),
+            )
+        ]
+        for job_id, s in sorted(stats.items()):
+            values = (
+                s.runs, s.errors, s.missed, s.skipped,
+                s.last_duration_s, s.last_queue_delay_s, s.max_queue_delay_s,
+            )
+            for family, value in zip(families, values):
+                family.samples.append((family.name, {"job": job_id}, value))
+        return families
+
+    def shutdown(self) -> None:
+        for executor in self._lanes.values():
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _on_event(self, event: JobEvent) -> None:
+        from apscheduler.events import (
+            EVENT_JOB_ERROR,
+            EVENT_JOB_EXECUTED,
+            EVENT_JOB_MAX_INSTANCES,
+            EVENT_JOB_MISSED,
+            EVENT_JOB_SUBMITTED,
+        )
+
+        job_id = event.job_id
+        if event.code == EVENT_JOB_SUBMITTED:
+            scheduled = event.scheduled_run_times[-1]
+            lag = max(0.0, (datetime.now(scheduled.tzinfo) - scheduled).total_seconds())
+            with self._lock:
+                stats = self._stats.setdefault(job_id, JobStats())
+                stats.last_scheduler_lag_s = lag
+                stats.last_lane_wait_s = 0.0
+                self._add_delay(stats)
+            if lag >= self.warn_delay_s:
+                logger.warning(
+                    f"[runtime] {job_id} 예정 시각보다 {lag:.0f}초 늦게 시작"
+                )
+        elif event.code == EVENT_JOB_EXECUTED:
+            self._update(job_id, runs=1)
+        elif event.code == EVENT_JOB_ERROR:
+            self._update(job_id, runs=1, errors=1)
+        elif event.code == EVENT_JOB_MISSED:
+            self._update(job_id, missed=1)
+            logger.warning(
+                f"[runtime] {job_id} 실행 누락 "
+                f"(예정 {event.scheduled_run_time:%H:%M:%S}, 허용 지연 초과)"
+            )
+        elif event.code == EVENT_JOB_MAX_INSTANCES:
+            self._update(job_id, skipped=1)
+            logger.warning(
+                f"[runtime] {job_id} 이전 실행이 끝나지 않아 이번 회차 건너뜀"
+            )
+
+    def _record_wait(self, job_id: str, lane: str, wait: float) -> None:
+        with self._lock:
+            stats = self._stats.setdefault(job_id, JobStats())
+            stats.last_lane_wait_s += wait
+            self._add_delay(stats, wait)
+        if wait >= self.warn_delay_s:
+            logger.warning(f"[runtime] {job_id} {lane} 레인 대기 {wait:.0f}초")
+
+    def _add_delay(self, stats: JobStats, extra: float | None = None) -> None:
+        """
+        제출 시 스케줄러 지연, 레인 대기 때마다 추가분을 누적
+        (lock 보유 상태에서 호출)
+        """
+        if extra is None:
+            extra = stats.last_scheduler_lag_s
+        stats.total_queue_delay_s += extra
+        stats.max_queue_delay_s = max(stats.max_queue_delay_s, stats.last_queue_delay_s)
+
+    def _update(self, job_id: str, **changes: float) -> None:
+        """runs/errors/missed/skipped 는 증가분, 그 외 필드는 값 설정"""
+        with self._lock:
+            stats = self._stats.setdefault(job_id, JobStats())
+            for field, value in changes.items():
+                if field in ("runs", "errors", "missed", "skipped"):
+                    setattr(stats, field, getattr(stats, field) + value)
+                else:
+                    setattr(stats, field, value)
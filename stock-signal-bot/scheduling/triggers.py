@@ -0,0 +1,116 @@
+"""KRX 거래일 기준 APScheduler 트리거
+
+휴장일은 건너뛰고, 개장·마감 시각이 바뀌면 함께 이동한다.
+
+
+    SessionTrigger("open", +5분)   → 거래일마다 개장 5분 후 (수능일 10:05)
+    SessionTrigger("close", -10분) → 거래일마다 마감 10분 전 (수능일 16:20)
+    SessionTrigger(None, 12:30)    → 거래일마다 12:30
+    SessionIntervalTrigger(60)     → 정규장 중에만 60초 간격,
+                                     장이 끝나면 다음 거래일 개장부터
+"""
+from __future__ import annotations
+
+from datetime import datetime, time, timedelta, tzinfo
+from zoneinfo import ZoneInfo
+
+from apscheduler.triggers.base import BaseTrigger
+from data import market_calendar as cal
+
+# 다음 실행 시각 탐색 범위 (연휴가 길어도 충분)
+_MAX_DAYS = 30
+
+
+def _zone(timezone: str | tzinfo) -> tzinfo:
+    return ZoneInfo(timezone) if isinstance(timezone, str) else timezone
+
+
+class SessionTrigger(BaseTrigger):
+    """
+    거래일마다 한 번 — anchor 가 open/close 면 그 날 개장/마감 시각 + offset,
+    None 이면 offset 을 자정 기준 시각으로 사용.
+    """
+
+    def __init__(
+        self, anchor: str | None, offset: timedelta, timezone: str | tzinfo
+    ) -> None:
+        if anchor not in ("open", "close", None):
+            raise ValueError(f"anchor 는 open / close / None: {anchor!r}")
+        self.anchor = anchor
+        self.offset = offset
+        self.timezone = _zone(timezone)
+
+    @classmethod
+    def at(cls, hour: int, minute: int, timezone: str | tzinfo) -> SessionTrigger:
+        """
+        정규장 기준 시각(hour:minute)을 개장·마감 기준으로 환산.
+        10:00 이하 → 개장 기준, 14:00 이상 → 마감 기준, 그 사이(점심 등) → 시각 고정.
+        """
+        clock = timedelta(hours=hour, minutes=minute)
+        if clock <= timedelta(hours=10):
+            return cls("open", clock - _since_midnight(cal.REGULAR_OPEN), timezone)
+        if clock >= timedelta(hours=14):
+            return cls("close", clock - _since_midnight(cal.REGULAR_CLOSE), timezone)
+        return cls(None, clock, timezone)
+
+    def fire_time(self, session: cal.TradingSession) -> datetime:
+        if self.anchor == "open":
+            base = session.opens_at()
+        elif self.anchor == "close":
+            base = session.closes_at()
+        else:
+            base = datetime.combine(session.day, time())
+        return (base + self.offset).replace(tzinfo=self.timezone)
+
+    def get_next_fire_time(
+        self, previous_fire_time: datetime | None, now: datetime
+    ) -> datetime | None:
+        now = now.astimezone(self.timezone)
+        day = now.date()
+        for _ in range(_MAX_DAYS):
+            session = cal.session(day)
+            if session is not None:
+                fire = self.fire_time(session)
+                after_previous = (
+                    previous_fire_time is None or fire > previous_fire_time
+                )
+                if fire >= now and after_previous:
+                    return fire
+            day += timedelta(days=1)
+        return None
+
+    def __str__(self) -> str:
+        return f"session[{self.anchor or 'clock'}{self.offset}]"
+
+
+class SessionIntervalTrigger(BaseTrigger):
+    """정규장(개장 ~ 마감) 중에만 interval 초 간격 — 장 밖이면 다음 거래일 개장 시각"""
+
+    def __init__(self, seconds: int, timezone: str | tzinfo) -> None:
+        self.interval = timedelta(seconds=seconds)
+        self.timezone = _zone(timezone)
+
+    def get_next_fire_time(
+        self, previous_fire_time: datetime | None, now: datetime
+    ) -> datetime | None:
+        candidate = (previous_fire_time + self.interval) if previous_fire_time else now
+        candidate = candidate.astimezone(self.timezone)
+        day = candidate.date()
+        for _ in range(_MAX_DAYS):
+            session = cal.session(day)
+            if session is not None:
+                opens = session.opens_at(self.timezone)
+                if candidate < opens:
+                    return opens
+                if candidate <= session.closes_at(self.timezone):
+                    return candidate
+            day += timedelta(days=1)
+            candidate = datetime.combine(day, time(), self.timezone)
+        return None
+
+    def __str__(self) -> str:
+        return f"session_interval[{self.interval}]"
+
+
+def _since_midnight(clock: time) -> timedelta:
+    return timedelta(hours=clock.hour, minutes=clock.minute)
@@ -4,29 +4,41 @@ from __future__ import annotations
 import logging
 from datetime import date
 
-from config import MY_POSITIONS, TARGETS
+from config import MY_POSITIONS, SIGNAL_MEMO, STREAMING_INDICATORS, TARGETS
 from data.fetcher import get_current_price, get_ohlcv, get_kospi_data
 from db.signal_history import is_duplicate, save_signal
 from signals.models import (
-    DailyReport, EnsembleSignal, PositionStatus, SignalType
+    DailyReport,
+    EnsembleSignal,
+    IndexQuote,
+    PositionStatus,
+    ScreeningResult,
+    SignalSnapshot,
+    SignalType,
 )
-from strategies.ensemble import generate_ensemble_signal
+from signals.session import KOSPI, SCREENING, SIGNALS, load, record, reuse_or_produce
+from strategies.ensemble import generate_ensemble_signal, required_lookback_days
+from strategies.profiling import profiled
 
 logger = logging.getLogger(__name__)
 
 
+@profiled("signal_scan")
 def run_signal_scan(notify_neutral: bool = False) -> list[EnsembleSignal]:
     """
     보유 종목(TARGETS) 시그널 생성.
     중복 시그널 제외. 결과 리스트 반환.
+    분석한 전 종목 시그널은 세션 산출물(SIGNALS)로 기록 — 일간 리포트가 재사용.
     """
     results: list[EnsembleSignal] = []
+    analyzed: list[EnsembleSignal] = []
 
     for code in TARGETS:
         try:
             signal = _analyze_stock(code)
             if signal is None:
                 continue
+            analyzed.append(signal)
 
             if signal.signal == SignalType.NEUTRAL and not notify_neutral:
                 results.append(signal)
@@ -42,9 +54,21 @@ def run_signal_scan(notify_neutral: bool = False) -> list[EnsembleSignal]:
         except Exception as e:
             logger.error(f"[{code}] 시그널 생성 오류: {e}")
 
+    record(SIGNALS, SignalSnapshot(signals=analyzed))
     return results
 
 
+def session_signals() -> list[EnsembleSignal]:
+    """
+    보유 종목 최신 시그널 — 직전 스캔 결과가 신선하면 재사용,
+    아니면 새로 스캔 (NEUTRAL 포함)
+    """
+    snapshot = load(SIGNALS)
+    if snapshot is not None:
+        return snapshot.signals
+    return run_signal_scan(notify_neutral=True)
+
+
 def build_position_status(signals: list[EnsembleSignal]) -> list[PositionStatus]:
     """보유 포지션별 현재가 수익률 계산"""
     if not MY_POSITIONS:
@@ -84,30 +108,44 @@ def build_position_status(signals: list[EnsembleSignal]) -> list[PositionStatus]
 def build_daily_report(
     signals: list[EnsembleSignal],
     run_screener: bool = True,
+    screening: ScreeningResult | None = None,
 ) -> DailyReport:
+    """
+    screening 이 주어지면 (잠정 추천으로 이미 스크리닝한 경우) 다시 스캔하지 않고 사용.
+    없으면 세션의 신선한 스크리닝 결과(예약 회차)를 쓰고,
+    그것도 없을 때만 새로 스크리닝.
+    """
     from signals.screener import run_screening
 
-    kospi, kospi_chg = get_kospi_data()
+    kospi = reuse_or_produce(KOSPI, _kospi_quote)
     positions = build_position_status(signals)
 
-    recommendations = []
-    if run_screener:
+    if screening is None and run_screener:
+        screening = load(SCREENING)
+    if screening is None and run_screener:
         logger.info("신규 종목 스크리닝 시작...")
-        recommendations = run_screening()
-        logger.info(f"스크리닝 완료: {len(recommendations)}개 추천 종목")
+        screening = run_screening()
+        logger.info(f"스크리닝 완료: {len(screening.recommendations)}개 추천 종목")
+    recommendations = screening.recommendations if screening else []
 
     return DailyReport(
         date=date.today().isoformat(),
         signals=signals,
         positions=positions,
         recommendations=recommendations,
-        kospi=kospi,
-        kospi_change_pct=kospi_chg,
+        screening=screening.summary if screening else None,
+        kospi=kospi.price,
+        kospi_change_pct=kospi.change_pct,
     )
 
 
+def _kospi_quote() -> IndexQuote:
+    price, change_pct = get_kospi_data()
+    return IndexQuote(price=price, change_pct=change_pct)
+
+
 def _analyze_stock(stock_code: str) -> EnsembleSignal | None:
-    df = get_ohlcv(stock_code)
+    df = get_ohlcv(stock_code, lookback_days=required_lookback_days())
     if df.empty or len(df) < 60:
         logger.warning(f"[{stock_code}] 데이터 부족 ({len(df)}일)")
         return None
@@ -117,4 +155,7 @@ def _analyze_stock(stock_code: str) -> EnsembleSignal | None:
         logger.warning(f"[{stock_code}] 현재가 조회 실패")
         return None
 
-    return generate_ensemble_signal(stock_code, df, price, change_pct)
+    return generate_ensemble_signal(
+        stock_code, df, price, change_pct,
+        memo=SIGNAL_MEMO, streaming=STREAMING_INDICATORS,
+    )
@@ -0,0 +1,117 @@
+"""스크리닝 순위 스트리밍 — 상위 K개 힙과 중간 순위표 비동기 이터레이터
+
+run_screening 은 후보 전체 리스트 대신 TopK 에 점수를 밀어 넣고, 진행 중에는
+on_progress 콜백으로 중간 순위표(Leaderboard)를 내보낸다.
+stream_leaderboards() 는 이 콜백을 asyncio 쪽의 async iterator 로 연결한다.
+스크리닝 본체는 submit 으로 실행 — 스케줄 작업은 RUNTIME.run_cpu 를 넘겨
+cpu 레인의 동시 실행 제한과 대기 지연 집계를 그대로 따른다.
+
+    async for board in stream_screening():
+        if board.final: ...
+"""
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import threading
+from typing import AsyncIterator, Awaitable, Callable, Generic, TypeVar
+
+from signals.models import Leaderboard, ScreeningResult
+
+T = TypeVar("T")
+
+ProgressCallback = Callable[[Leaderboard], None]
+# submit(fn, *args) → fn(*args) 결과의 awaitable (asyncio.to_thread 와 같은 모양)
+Submit = Callable[..., Awaitable[ScreeningResult]]
+
+
+class TopK(Generic[T]):
+    """점수 상위 k개만 유지하는 최소 힙 — 동점이면 먼저 들어온 항목 우선"""
+
+    def __init__(self, k: int) -> None:
+        self.k = k
+        self.pushed = 0                                  # 지금까지 들어온 후보 수
+        self._heap: list[tuple[float, int, T]] = []      # (점수, -순번, 항목)
+        self._seq = itertools.count()
+        self._lock = threading.Lock()
+
+    def push(self, score: float, item: T) -> bool:
+        """상위 k개에 들면 True"""
+        entry = (score, -next(self._seq), item)
+        with self._lock:
+            self.pushed += 1
+            if len(self._heap) < self.k:
+                heapq.heappush(self._heap, entry)
+                return True
+            if self._heap and entry[:2] > self._heap[0][:2]:
+                heapq.heapreplace(self._heap, entry)
+                return True
+            return False
+
+    def items(self) -> list[T]:
+        """점수 내림차순"""
+        with self._lock:
+            entries = sorted(self._heap, key=lambda e: e[:2], reverse=True)
+        return [item for _, _, item in entries]
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+
+async def stream_leaderboards(
+    run: Callable[[ProgressCallback], ScreeningResult],
+    submit: Submit | None = None,
+) -> AsyncIterator[Leaderboard]:
+    """
+    run(on_progress) 을 submit 으로 (기본 asyncio.to_thread) 실행하며
+    중간 순위표를 차례로 내보내고, 마지막에 최종 결과를 담은 final 순위표를 내보낸다.
+    소비가 늦으면 밀린 중간 순위표는 건너뛰고 최신 것만 전달한다
+    (누적 순위이므로 손실 없음).
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue[Leaderboard] = asyncio.Queue()
+
+    def on_progress(board: Leaderboard) -> None:
+        loop.call_soon_threadsafe(queue.put_nowait, board)
+
+    submit = submit or asyncio.to_thread
+    task = asyncio.ensure_future(submit(run, on_progress))
+    try:
+        while True:
+            getter = asyncio.ensure_future(queue.get())
+            done, _ = await asyncio.wait(
+                {getter, task}, return_when=asyncio.FIRST_COMPLETED
+            )
+            if getter not in done:
+                getter.cancel()
+                break
+            board = getter.result()
+            while not queue.empty():
+                board = queue.get_nowait()
+            yield board
+
+        # 작업 종료 전에 예약된 콜백은 이미 큐에 들어와 있음
+        latest = None
+        while not queue.empty():
+            latest = queue.get_nowait()
+        if latest is not None:
+            yield latest
+
+        result = task.result()
+        total = (
+            result.summary.universe
+            if result.summary
+            else len(result.recommendations)
+        )
+        yield Leaderboard(
+            recommendations=result.recommendations,
+            scored=total,
+            total=total,
+            final=True,
+            result=result,
+        )
+    finally:
+        if not task.done():
+            # 소비자가 중간에 멈춰도 스크리닝 스레드는 끝까지 실행됨 — 결과만 버림
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())
@@ -43,6 +43,70 @@ class StrategySignal(BaseModel):
     model_config = {"arbitrary_types_allowed": True}
 
 
+class StrategyResult:
+    """
+    전략 평가 결과 (내부용) — 검증 없는 __slots__ 객체.
+    스캔 루프에서는 이 타입을 쓰고,
+    알림·저장 경계에서만 to_model() 로 StrategySignal 생성.
+    """
+
+    __slots__ = ("strategy_name", "signal", "confidence", "reason", "indicators")
+
+    def __init__(
+        self,
+        strategy_name: str,
+        signal: SignalType,
+        confidence: float = 0.0,
+        reason: str = "",
+        indicators: dict | None = None,
+    ) -> None:
+        self.strategy_name = strategy_name
+        self.signal = signal
+        self.confidence = confidence
+        self.reason = reason
+        self.indicators = indicators if indicators is not None else {}
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, StrategyResult):
+            return NotImplemented
+        return self.as_dict() == other.as_dict()
+
+    def __repr__(self) -> str:
+        return (
+            f"StrategyResult({self.strategy_name!r}, {self.signal.name}, "
+            f"confidence={self.confidence}, reason={self.reason!r})"
+        )
+
+    def as_dict(self) -> dict:
+        """JSON 직렬화용 dict (signal 은 정수값)"""
+        return {
+            "strategy_name": self.strategy_name,
+            "signal": self.signal.value,
+            "confidence": self.confidence,
+            "reason": self.reason,
+            "indicators": self.indicators,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "StrategyResult":
+        return cls(
+            data["strategy_name"],
+            SignalType(data["signal"]),
+            data["confidence"],
+            data["reason"],
+            data["indicators"],
+        )
+
+    def to_model(self) -> StrategySignal:
+        return StrategySignal(
+            strategy_name=self.strategy_name,
+            signal=self.signal,
+            confidence=self.confidence,
+            reason=self.reason,
+            indicators=self.indicators,
+        )
+
+
 class EnsembleSignal(BaseModel):
     stock_code: str
     stock_name: str
@@ -56,6 +120,46 @@ class EnsembleSignal(BaseModel):
     model_config = {"arbitrary_types_allowed": True}
 
 
+class EnsembleResult:
+    """앙상블 평가 결과 (내부용) — to_model() 로 EnsembleSignal 생성"""
+
+    __slots__ = (
+        "stock_code", "stock_name", "signal", "ensemble_score",
+        "strategy_signals", "price", "change_pct", "timestamp",
+    )
+
+    def __init__(
+        self,
+        stock_code: str,
+        stock_name: str,
+        signal: SignalType,
+        ensemble_score: float,
+        strategy_signals: list[StrategyResult],
+        price: float,
+        change_pct: float,
+    ) -> None:
+        self.stock_code = stock_code
+        self.stock_name = stock_name
+        self.signal = signal
+        self.ensemble_score = ensemble_score
+        self.strategy_signals = strategy_signals
+        self.price = price
+        self.change_pct = change_pct
+        self.timestamp = datetime.now()
+
+    def to_model(self) -> EnsembleSignal:
+        return EnsembleSignal(
+            stock_code=self.stock_code,
+            stock_name=self.stock_name,
+            signal=self.signal,
+            ensemble_score=self.ensemble_score,
+            strategy_signals=[s.to_model() for s in self.strategy_signals],
+            price=self.price,
+            change_pct=self.change_pct,
+            timestamp=self.timestamp,
+        )
+
+
 class PositionStatus(BaseModel):
     """보유 포지션 현황"""
     stock_code: str
@@ -82,11 +186,124 @@ class Recommendation(BaseModel):
     model_config = {"arbitrary_types_allowed": True}
 
 
+class ScreenedStock(BaseModel):
+    """
+    종목별 최신 스크리닝 결과 (db.screening_results)
+    — 추천 여부와 무관하게 전 종목 저장.
+    stage: full(전체 앙상블) | prefilter(1차 필터 제외 — 시그널·점수 없음)
+    last_date·input_hash·price 는 평가 시점 입력 워터마크.
+    """
+    stock_code: str
+    stock_name: str
+    stage: str = "full"
+    signal: Optional[SignalType] = None
+    ensemble_score: Optional[float] = None
+    price: float = 0.0
+    change_pct: float = 0.0
+    top_reasons: list[str] = Field(default_factory=list)
+    last_date: str = ""
+    input_hash: str = ""
+    evaluated_at: datetime = Field(default_factory=datetime.now)
+
+    model_config = {"arbitrary_types_allowed": True}
+
+    def reusable_for(self, input_hash: str, price: float, tolerance: float) -> bool:
+        """일봉·수급 입력이 같고 현재가 변동이 허용 범위(비율) 이내면 재평가 불필요"""
+        if self.stage != "full" or self.input_hash != input_hash or self.price <= 0:
+            return False
+        return abs(price - self.price) / self.price <= tolerance
+
+    def to_recommendation(self) -> Recommendation:
+        return Recommendation(
+            stock_code=self.stock_code,
+            stock_name=self.stock_name,
+            signal=self.signal,
+            ensemble_score=self.ensemble_score,
+            price=self.price,
+            change_pct=self.change_pct,
+            top_reasons=self.top_reasons,
+        )
+
+
+class ScreeningSummary(BaseModel):
+    """스크리닝 단계별 종목 수 — 리포트 표시용"""
+    mode: str
+    universe: int           # 스캔 대상 종목 수
+    prefiltered: int        # 1차 필터 통과 (필터 미사용 시 universe 와 같음)
+    candidates: int         # BUY 이상 후보
+    reused: int = 0         # 저장된 결과 재사용 (입력 변화 없음)
+    resumed: int = 0        # 중단된 회차의 체크포인트에서 이어받음
+    # 채점 완료 종목 수 (1차 필터 제외 포함, None → universe)
+    scored: Optional[int] = None
+    status: str = "complete"        # complete | partial(마감 시각 도달로 일부만 채점)
+    elapsed_s: float
+
+    @property
+    def selectivity(self) -> float:
+        """1차 필터 통과 비율"""
+        return self.prefiltered / self.universe if self.universe else 0.0
+
+
+class ScreeningRun(BaseModel):
+    """
+    예약 스크리닝 1회차 (db.screening_runs) — 종목별 체크포인트와 함께 저장되어
+    중단 후 같은 회차를 다시 실행하면 채점을 마친 종목은 건너뛴다.
+    status: running | complete | partial(마감 도달) | failed
+    """
+    run_id: str
+    universe: str
+    status: str = "running"
+    total: int = 0
+    scored: int = 0
+    started_at: datetime = Field(default_factory=datetime.now)
+    deadline: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    def expired(self, now: datetime | None = None) -> bool:
+        return self.deadline is not None and (now or datetime.now()) >= self.deadline
+
+
+class ScreeningResult(BaseModel):
+    recommendations: list[Recommendation] = Field(default_factory=list)
+    summary: Optional[ScreeningSummary] = None   # 마켓 필터로 스캔을 생략하면 None
+
+
+class Leaderboard(BaseModel):
+    """스크리닝 순위표 — 진행 중(잠정) 또는 최종"""
+    recommendations: list[Recommendation] = Field(default_factory=list)
+    scored: int             # 채점 완료 종목 수 (1차 필터 제외 포함)
+    total: int
+    final: bool = False
+    result: Optional[ScreeningResult] = None    # final 일 때만
+
+    @property
+    def progress(self) -> float:
+        return self.scored / self.total if self.total else 1.0
+
+
+class SignalSnapshot(BaseModel):
+    """보유 종목(TARGETS) 시그널 스캔 결과 전체 — 중복 발송 여부와 무관 (세션 산출물)"""
+    signals: list[EnsembleSignal] = Field(default_factory=list)
+
+
+class IndexQuote(BaseModel):
+    price: float
+    change_pct: float
+
+
+class MarketRegime(BaseModel):
+    """글로벌 마켓 필터 판정 (signals.screener.check_global_market_status)"""
+    is_bull: bool
+    message: str
+    degraded: bool = False  # 지수 데이터 수집 실패·오류로 필터를 (일부) 건너뜀
+
+
 class DailyReport(BaseModel):
     date: str
     signals: list[EnsembleSignal]
     positions: list[PositionStatus] = Field(default_factory=list)
     recommendations: list[Recommendation] = Field(default_factory=list)
+    screening: Optional[ScreeningSummary] = None
     kospi: Optional[float] = None
     kospi_change_pct: Optional[float] = None
     timestamp: datetime = Field(default_factory=datetime.now)
@@ -0,0 +1,63 @@
+"""2단계 스크리닝의 1차 필터 — 전 종목 패널에서 BUY 도달 불가 종목을 한 번에 제외
+
+전략마다 buy_setup()(BUY 분기의 저렴한 필요조건)을 패널 전체에 벡터로 계산한다.
+필요조건을 못 채운 전략은 NEUTRAL 이하만 낼 수 있으므로, 나머지 전략이 모두
+STRONG_BUY(+2)를 내도 가중 합이 매수 임계값에 못 미치는 종목은 전체 앙상블·현재가
+조회 없이 제외한다. 통과 종목만 2차(종목 단위 앙상블)로 넘어간다.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+from config import ENSEMBLE_BUY_THRESHOLD
+from strategies.ensemble import _STRATEGIES
+from strategies.panel import Panel, panel_tickers
+
+from signals.models import SignalType
+
+# 종목 단위 스크리닝과 같은 최소 일수
+MIN_BARS = 60
+
+# 합산 순서에 따른 부동소수점 오차 여유 (경계 종목은 통과시킴)
+_EPS = 1e-9
+
+
+@dataclass
+class PrefilterResult:
+    """1차 필터 결과 — (종목 × 전략) BUY 가능 여부와 점수 상한"""
+    tickers: list[str]
+    strategy_names: list[str]
+    possible: np.ndarray               # (종목, 전략) bool
+    upper_bound: np.ndarray            # (종목,) 도달 가능한 최대 앙상블 점수
+    passed: np.ndarray                 # (종목,) bool
+
+    @property
+    def survivors(self) -> list[str]:
+        return [t for t, ok in zip(self.tickers, self.passed) if ok]
+
+    @property
+    def selectivity(self) -> float:
+        """통과 비율 (0 ~ 1, 낮을수록 많이 걸러냄)"""
+        return float(self.passed.mean()) if len(self.passed) else 0.0
+
+
+def prefilter_panel(panel: Panel, min_bars: int = MIN_BARS) -> PrefilterResult:
+    """
+    마지막 날짜 기준 BUY 이상이 될 수 있는 종목만 통과.
+
+    점수 상한 = Σ(BUY 가능 전략 가중치 × STRONG_BUY). 컨센서스 필터는 임계값 미만 점수를
+    BUY 로 올리지 않으므로 상한이 매수 임계값 미만이면 최종 시그널도 BUY 미만이다.
+    """
+    possible = np.column_stack([s.can_buy(panel) for s in _STRATEGIES])
+    weights = np.array([s.weight for s in _STRATEGIES])
+    upper_bound = possible @ (weights * SignalType.STRONG_BUY.value)
+
+    enough = (panel["Close"].notna().sum() >= min_bars).to_numpy()
+    return PrefilterResult(
+        tickers=panel_tickers(panel),
+        strategy_names=[s.name for s in _STRATEGIES],
+        possible=possible,
+        upper_bound=upper_bound,
+        passed=enough & (upper_bound >= ENSEMBLE_BUY_THRESHOLD - _EPS),
+    )
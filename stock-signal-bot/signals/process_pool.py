@@ -0,0 +1,113 @@
+"""공유 메모리 패널 기반 종목 단위 앙상블 병렬 평가
+
+부모가 유니버스 패널을 한 번 로드해 공유 메모리에 올리고, 프로세스 풀 워커는
+패널에 복사 없이 붙어 종목 인덱스 묶음만 받아 평가한다.
+워커는 I/O(SQLite·pykrx)를 하지 않고 (종목코드, 시그널, 점수, 매수 근거) 튜플만
+돌려준다. 일수 미달로 평가하지 않은 종목도 시그널 None 으로 돌려줘
+부모가 다른 모드와 같이 채점·체크포인트에 반영한다.
+"""
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, Optional
+
+import numpy as np
+from config import SCREENER_EARLY_EXIT
+from data.shared_panel import SharedPanel, SharedPanelSpec, attach_panel
+from strategies.ensemble import evaluate_ensemble
+from strategies.panel import Panel, panel_tickers, ticker_frame
+
+from signals.models import EnsembleResult, SignalType
+
+# 종목 단위 스크리닝과 같은 최소 일수
+MIN_BARS = 60
+
+_BUY_SIGNALS = {SignalType.BUY, SignalType.STRONG_BUY}
+
+# (종목코드, 최종 시그널 값, 앙상블 점수, 매수 근거 — BUY 이상만)
+# 시그널 None → 최소 일수 미달로 건너뜀 (점수 0, 근거 없음)
+TickerScore = tuple[str, Optional[int], float, list[str]]
+
+
+def top_reasons(ensemble: EnsembleResult, limit: int = 3) -> list[str]:
+    """BUY+ 시그널을 낸 전략들의 사유"""
+    return [
+        f"{s.strategy_name}: {s.reason}"
+        for s in ensemble.strategy_signals
+        if s.signal in _BUY_SIGNALS
+    ][:limit]
+
+
+def _evaluate(
+    panel: Panel, tickers: list[str], indices: np.ndarray
+) -> list[TickerScore]:
+    scores: list[TickerScore] = []
+    for i in indices:
+        df = ticker_frame(panel, int(i))
+        code = tickers[int(i)]
+        if len(df) < MIN_BARS:
+            scores.append((code, None, 0.0, []))
+            continue
+        result = evaluate_ensemble(
+            code, df, 0.0, 0.0, stock_name=code, early_exit=SCREENER_EARLY_EXIT
+        )
+        reasons = top_reasons(result) if result.signal in _BUY_SIGNALS else []
+        scores.append((code, result.signal.value, result.ensemble_score, reasons))
+    return scores
+
+
+# ── 프로세스 풀 ────────────────────────────────────────────────────────────
+
+# 워커 프로세스 전역 — 초기화 시 공유 패널에 한 번 붙음
+_WORKER: dict = {}
+
+
+def _attach_worker(spec: SharedPanelSpec) -> None:
+    shm, panel = attach_panel(spec)
+    _WORKER.update(shm=shm, panel=panel, tickers=list(spec.tickers))
+
+
+def _evaluate_chunk(indices: np.ndarray) -> list[TickerScore]:
+    return _evaluate(_WORKER["panel"], _WORKER["tickers"], indices)
+
+
+def screen_with_processes(
+    panel: Panel,
+    workers: int = 0,
+    on_chunk: Callable[[list[TickerScore]], None] | None = None,
+    timeout: float | None = None,
+) -> list[TickerScore]:
+    """
+    패널 전 종목을 프로세스 풀로 평가 (workers=0 → CPU 코어 수).
+    on_chunk 가 있으면 묶음 결과가 나올 때마다 (제출 순서대로) 호출한다.
+    timeout(초) 안에 끝나지 않으면 남은 묶음을 취소하고 concurrent.futures.TimeoutError
+    — 그때까지의 결과는 on_chunk 로 전달됨.
+    """
+    workers = workers or os.cpu_count() or 1
+    n = len(panel["Close"].columns)
+    # 종목별 비용 편차를 흡수하도록 워커당 4묶음
+    chunks = [c for c in np.array_split(np.arange(n), workers * 4) if len(c)]
+
+    results: list[TickerScore] = []
+    with SharedPanel.create(panel) as shared:
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_attach_worker, initargs=(shared.spec,)
+        ) as pool:
+            for part in pool.map(_evaluate_chunk, chunks, timeout=timeout):
+                results.extend(part)
+                if on_chunk is not None:
+                    on_chunk(part)
+    return results
+
+
+def screen_with_threads(panel: Panel, workers: int) -> list[TickerScore]:
+    """같은 평가를 스레드 풀로 수행 (비교·벤치마크용)"""
+    tickers = panel_tickers(panel)
+    chunks = [c for c in np.array_split(np.arange(len(tickers)), workers * 4) if len(c)]
+
+    results: list[TickerScore] = []
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for part in pool.map(lambda c: _evaluate(panel, tickers, c), chunks):
+            results.extend(part)
+    return results
@@ -1,51 +1,124 @@
-"""KOSPI200 전체 종목 스크리닝 — 신규 추천 종목 발굴"""
+"""KOSPI200 (config.SCREENER_UNIVERSE) 전체 종목 스크리닝 — 신규 추천 종목 발굴"""
 from __future__ import annotations
 
+import concurrent.futures
+import contextvars
 import logging
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from functools import partial
+from typing import AsyncIterator, Callable
 
-from config import MAX_RECOMMENDATIONS, SCREENING_UNIVERSE, SCREENER_WORKERS
-from data.fetcher import get_current_price, get_ohlcv, get_kospi200_tickers
-from signals.models import Recommendation, SignalType
-from strategies.ensemble import generate_ensemble_signal
+import metrics
+from config import (
+    MAX_RECOMMENDATIONS,
+    MY_POSITIONS,
+    SCREENER_EARLY_EXIT,
+    SCREENER_INCREMENTAL,
+    SCREENER_MODE,
+    SCREENER_PREFILTER,
+    SCREENER_PRICE_TOLERANCE,
+    SCREENER_PROCESSES,
+    SCREENER_UNIVERSE,
+    SCREENER_WORKERS,
+    SCREENING_UNIVERSE,
+    SIGNAL_MEMO,
+    TARGETS,
+)
+from data.fetcher import get_current_price, get_ohlcv, get_panel
+from data.universe import get_universe
+from db.screening_results import (
+    load_screening_results,
+    prune_screening_results,
+    save_screening_results,
+)
+from db.screening_runs import finish_run, load_checkpoints, save_checkpoints, start_run
+from strategies.ensemble import (
+    evaluate_ensemble,
+    generate_panel_ensemble,
+    input_watermark,
+    required_lookback_days,
+)
+from strategies.panel import Panel, panel_tickers, ticker_frame
+from strategies.profiling import profiled
+
+from signals.leaderboard import ProgressCallback, Submit, TopK, stream_leaderboards
+from signals.models import (
+    Leaderboard,
+    MarketRegime,
+    Recommendation,
+    ScreenedStock,
+    ScreeningResult,
+    ScreeningRun,
+    ScreeningSummary,
+    SignalType,
+)
+from signals.prefilter import prefilter_panel
+from signals.process_pool import TickerScore, screen_with_processes, top_reasons
+from signals.session import REGIME, SCREENING, load, record
 
 logger = logging.getLogger(__name__)
 
+SCREENING_SECONDS = metrics.histogram(
+    "stockbot_screening_duration_seconds", "스크리닝 1회 소요 시간", ["mode", "status"]
+)
+SCREENING_TICKERS = metrics.counter(
+    "stockbot_screening_tickers_total",
+    "스크리닝에서 채점한 종목 수 (1차 필터 제외분 포함)",
+    ["mode"],
+)
+SCREENING_RATE = metrics.gauge(
+    "stockbot_screening_tickers_per_second",
+    "직전 스크리닝 처리량 (채점 종목 / 소요 시간)",
+    ["mode"],
+)
+
 # 추천 대상 시그널 (BUY 이상만)
 _BUY_SIGNALS = {SignalType.BUY, SignalType.STRONG_BUY}
 
 
-import yfinance as yf
-from datetime import date, timedelta
-
-def check_global_market_status(ma_period: int = 120) -> tuple[bool, str]:
+def check_global_market_status(ma_period: int = 120) -> MarketRegime:
     """
     한국(KOSPI) 및 글로벌(SPY, QQQ) 지수의 120일 이동평균선(MA)을 확인.
     KOSPI가 강세(>120MA)이면서, SPY나 QQQ 중 하나라도 강세여야 BULL 마켓으로 판단.
+    데이터 수집 실패·오류로 필터를 (일부) 건너뛴 판정은 degraded=True.
     """
     import pandas as pd
+    import yfinance as yf
+
     try:
         end_d = date.today()
         start_d = end_d - timedelta(days=300)
-        s_date, e_date = start_d.strftime("%Y%m%d"), end_d.strftime("%Y%m%d")
         
         # 1. KOSPI 필터
         krx_df = get_ohlcv("069500") # KODEX200 proxy
         if krx_df.empty:
             # krx로 호출시 069500 (KODEX200) fallback. 안되면 통과
-            return True, "KOSPI 데이터 수집 실패 (필터 무시)"
+            return MarketRegime(
+                is_bull=True, message="KOSPI 데이터 수집 실패 (필터 무시)",
+                degraded=True,
+            )
             
         k_close = krx_df["Close"].iloc[-1]
         k_ma = krx_df["Close"].rolling(ma_period).mean().iloc[-1]
         kospi_bull = (k_close > k_ma)
         
         # 2. 글로벌 필터 (SPY, QQQ)
-        spy = yf.download("SPY", start=start_d, progress=False)
-        qqq = yf.download("QQQ", start=start_d, progress=False)
+        with metrics.external_call("yfinance", "download"):
+            spy = yf.download("SPY", start=start_d, progress=False)
+        with metrics.external_call("yfinance", "download"):
+            qqq = yf.download("QQQ", start=start_d, progress=False)
         
         if spy.empty or qqq.empty:
-            return kospi_bull, f"KOSPI > {ma_period}MA: {kospi_bull} (글로벌 데이터 수집 실패)"
+            return MarketRegime(
+                is_bull=bool(kospi_bull),
+                message=(
+                    f"KOSPI > {ma_period}MA: {kospi_bull} (글로벌 데이터 수집 실패)"
+                ),
+                degraded=True,
+            )
             
         def get_close(df):
             if isinstance(df.columns, pd.MultiIndex):
@@ -66,25 +139,133 @@ def check_global_market_status(ma_period: int = 120) -> tuple[bool, str]:
         msgs.append(f"NASDAQ {'강세' if qqq_bull else '약세'}")
         status_msg = f"{ma_period}일선 기준: " + ", ".join(msgs)
         
-        return is_bull, status_msg
+        return MarketRegime(is_bull=bool(is_bull), message=status_msg)
         
     except Exception as e:
         logger.warning(f"마켓 필터 오류: {e}")
-        return True, "마켓 필터 오류 (필터 무시)"
+        return MarketRegime(
+            is_bull=True, message="마켓 필터 오류 (필터 무시)", degraded=True
+        )
+
+@dataclass
+class _Run:
+    """스크리닝 1회 실행 상태 — 순위 힙, 진행 보고, 마감 시각, 체크포인트 대기열"""
+    top: TopK[Recommendation]
+    report: Callable[[int, TopK[Recommendation]], None]
+    run_id: str | None = None               # 예약 회차 (None → 체크포인트 없음)
+    deadline: datetime | None = None
+    done: set[str] = field(default_factory=set)     # 중단 전 채점을 마친 종목
+    candidates: int = 0
+    reused: int = 0
+    resumed: int = 0
+    scored: int = 0                          # 채점 완료 (체크포인트 이어받은 종목 포함)
+    timed_out: bool = False
+    _pending: list[ScreenedStock] = field(default_factory=list)
+    _checked: list[str] = field(default_factory=list)
+
+    def remaining(self) -> float | None:
+        """마감까지 남은 초 (마감 없음 → None)"""
+        if self.deadline is None:
+            return None
+        return max(0.0, (self.deadline - datetime.now()).total_seconds())
+
+    def record(self, code: str, stock: ScreenedStock | None = None) -> None:
+        """채점 완료 — stock 은 새로 평가한 결과만 (재사용·데이터 부족이면 None)"""
+        if stock is not None:
+            self._pending.append(stock)
+        self._checked.append(code)
+
+    def flush(self) -> None:
+        """
+        대기 결과 저장 후 체크포인트.
+        재개 시 체크포인트 종목의 결과를 읽을 수 있도록 이 순서를 유지한다.
+        """
+        save_screening_results(self._pending)
+        if self.run_id is not None:
+            save_checkpoints(self.run_id, self._checked)
+        self._pending, self._checked = [], []
+
+
+def screening_run_id(day: date, slot: str) -> str:
+    """
+    예약 회차 ID — 같은 날 같은 시각 회차는 재시작해도 같은 ID.
+    예: KOSPI200@2024-05-02T0900
+    """
+    return f"{SCREENER_UNIVERSE}@{day.isoformat()}T{slot}"
 
-def run_screening() -> list[Recommendation]:
+
+@profiled("screening")
+def run_screening(
+    on_progress: ProgressCallback | None = None,
+    run_id: str | None = None,
+    deadline: datetime | None = None,
+) -> ScreeningResult:
     """
-    KOSPI200 (혹은 정적 유니버스) 전체 종목을 스캔해 BUY 이상 시그널 종목을 반환.
+    KOSPI200 (혹은 정적 유니버스) 전체 종목을 스캔해
+    BUY 이상 시그널 종목과 단계별 집계를 반환.
     단, 글로벌 글로벌 마켓 필터가 '약세'를 가리키면 추천 스킵.
+    후보는 상위 MAX_RECOMMENDATIONS 개만 유지하며,
+    on_progress 가 있으면 중간 순위표를 전달한다.
+
+    run_id 가 주어지면 예약 회차로 기록하고 종목별 체크포인트를 남긴다.
+    중단 후 같은 run_id 로 다시 부르면 채점을 마친 종목은 건너뛴다
+    (마감은 처음 시작할 때의 값 유지).
+    deadline 이 지나면 남은 종목을 취소하고 summary.status="partial" 로 반환.
+    """
+    if run_id is None:
+        result = _run_screening(on_progress, None, deadline)
+        record(SCREENING, result)
+        return result
+
+    scheduled = start_run(run_id, SCREENER_UNIVERSE, deadline)
+    try:
+        result = _run_screening(on_progress, scheduled, scheduled.deadline)
+    except Exception:
+        finish_run(run_id, "failed", 0, 0)
+        raise
+
+    summary = result.summary
+    if summary is None:
+        finish_run(run_id, "complete", 0, 0)
+    else:
+        finish_run(run_id, summary.status, summary.universe, summary.scored or 0)
+    record(SCREENING, result)
+    return result
+
+
+def _observe(summary: ScreeningSummary, elapsed: float) -> None:
+    SCREENING_SECONDS.observe(elapsed, mode=summary.mode, status=summary.status)
+    SCREENING_TICKERS.inc(summary.scored or 0, mode=summary.mode)
+    if elapsed > 0:
+        SCREENING_RATE.set((summary.scored or 0) / elapsed, mode=summary.mode)
+
+
+def _market_regime() -> MarketRegime:
+    """
+    마켓 필터 판정 — 세션 내 신선한 판정 재사용.
+    데이터 수집 실패로 필터를 건너뛴 판정은 기록하지 않음.
     """
+    regime = load(REGIME)
+    if regime is None:
+        regime = check_global_market_status(120)
+        if not regime.degraded:
+            record(REGIME, regime)
+    return regime
+
+
+def _run_screening(
+    on_progress: ProgressCallback | None,
+    scheduled: ScreeningRun | None,
+    deadline: datetime | None,
+) -> ScreeningResult:
     # ── 1. 마켓 상태 확인 ───────────────────────────────────────────────
-    import pandas as pd
-    is_bull, market_msg = check_global_market_status(120)
+    regime = _market_regime()
+    is_bull, market_msg = regime.is_bull, regime.message
     logger.info(f"[screener] 글로벌 마켓 상태 확인: {market_msg}")
     
     if not is_bull:
         logger.info("[screener] 글로벌 연동 120일 MA 약세장 ⚠️ → 현금 관망 모드")
-        return [
+        return ScreeningResult(recommendations=[
             Recommendation(
                 stock_code="MARKET_WEAK",
                 stock_name="⚠️ 관망장세",
@@ -93,51 +274,79 @@ def run_screening() -> list[Recommendation]:
                 price=0.0,
                 change_pct=0.0,
                 top_reasons=[
-                    f"글로벌 마켓 연동 필터 발동",
+                    "글로벌 마켓 연동 필터 발동",
                     market_msg,
-                    "시장 약세 국면이므로 안전을 위해 신규 종목 추천을 생략하고 현금 대기(관망)를 권장합니다."
+                    "시장 약세 국면이므로 안전을 위해 신규 종목 추천을 생략하고 "
+                    "현금 대기(관망)를 권장합니다."
                 ]
             )
-        ]
+        ])
 
     # ── 유니버스 결정 ──────────────────────────────────────────────────────
     try:
-        target_universe = get_kospi200_tickers()
-    except Exception:
+        target_universe = get_universe(SCREENER_UNIVERSE)
+    except Exception as e:
+        logger.warning(f"[screener] 유니버스 조회 오류: {e}")
         target_universe = {}
         
     if not target_universe:
-        logger.warning("KOSPI200 목록 조회 실패 → config.SCREENING_UNIVERSE 사용")
+        logger.warning(
+            f"{SCREENER_UNIVERSE} 목록 조회 실패 → config.SCREENING_UNIVERSE 사용"
+        )
         target_universe = SCREENING_UNIVERSE
     else:
-        logger.info(f"KOSPI200 종목 {len(target_universe)}개 스캔 시작")
+        logger.info(f"{SCREENER_UNIVERSE} 종목 {len(target_universe)}개 스캔 시작")
+        # 유니버스에서 빠진 종목의 지난 결과는 순위 조회에 남지 않도록 정리
+        pruned = prune_screening_results(list(target_universe))
+        if pruned:
+            logger.info(f"[screener] 유니버스 제외 종목 결과 {pruned}건 삭제")
 
-    # ── 병렬 스크리닝 ──────────────────────────────────────────────────────
-    candidates: list[tuple[float, Recommendation]] = []
-    total = len(target_universe)
-    done = 0
+    started = time.perf_counter()
+    screened, panel = target_universe, None
+    if SCREENER_PREFILTER and SCREENER_MODE != "panel":
+        screened, panel = _prefilter(target_universe)
 
-    with ThreadPoolExecutor(max_workers=SCREENER_WORKERS) as pool:
-        futures = {
-            pool.submit(_screen_stock, code, name): (code, name)
-            for code, name in target_universe.items()
-        }
-        for future in as_completed(futures):
-            code, name = futures[future]
-            done += 1
-            try:
-                rec = future.result()
-                if rec and rec.signal in _BUY_SIGNALS:
-                    candidates.append((rec.ensemble_score, rec))
-                    logger.debug(f"[screener] ✅ {name}({code}) 추천 후보 추가 (score={rec.ensemble_score:.2f})")
-            except Exception as e:
-                logger.warning(f"[screener] {name}({code}) 분석 실패: {e}")
-
-            if done % 20 == 0 or done == total:
-                logger.info(f"[screener] 진행: {done}/{total} 완료, 후보: {len(candidates)}개")
-
-    candidates.sort(key=lambda x: x[0], reverse=True)
-    result = [rec for _, rec in candidates[:MAX_RECOMMENDATIONS]]
+    excluded = len(target_universe) - len(screened)
+
+    def report(done: int, board: TopK[Recommendation]) -> None:
+        if on_progress is not None:
+            on_progress(Leaderboard(
+                recommendations=board.items(),
+                scored=excluded + done,
+                total=len(target_universe),
+            ))
+
+    run = _Run(top=TopK(MAX_RECOMMENDATIONS), report=report, deadline=deadline)
+    if scheduled is not None:
+        run.run_id = scheduled.run_id
+        run.done = load_checkpoints(scheduled.run_id)
+        if run.done:
+            logger.info(
+                f"[screener] {scheduled.run_id} 재개 — "
+                f"체크포인트 {len(run.done)}종목 건너뜀"
+            )
+
+    if SCREENER_MODE == "panel":
+        _screen_panel(target_universe, run)
+    elif SCREENER_MODE == "process":
+        _screen_processes(screened, run, panel)
+    else:
+        _screen_threaded(screened, run)
+
+    summary = ScreeningSummary(
+        mode=SCREENER_MODE,
+        universe=len(target_universe),
+        prefiltered=len(screened),
+        candidates=run.candidates,
+        reused=run.reused,
+        resumed=run.resumed,
+        scored=excluded + run.scored,
+        status="partial" if run.timed_out else "complete",
+        elapsed_s=round(time.perf_counter() - started, 1),
+    )
+    _observe(summary, time.perf_counter() - started)
+
+    result = run.top.items()
     
     # 만일 시장은 불(Bull)장이지만 BUY 조건 통과 종목이 없을 때
     if not result:
@@ -147,18 +356,388 @@ def run_screening() -> list[Recommendation]:
                 stock_name="추천 종목 없음",
                 signal=SignalType.NEUTRAL,
                 ensemble_score=0.0, price=0.0, change_pct=0.0,
-                top_reasons=[market_msg, "현재 시장 강세 요건은 충족했으나, 알고리즘 매수 기준에 도달한 주도주가 없습니다."]
+                top_reasons=[
+                    market_msg,
+                    "현재 시장 강세 요건은 충족했으나, "
+                    "알고리즘 매수 기준에 도달한 주도주가 없습니다.",
+                ],
             )
         ]
         
-    logger.info(f"[screener] 스크리닝 완료 → 추천 {len(result)}개 선정")
-    return result
+    logger.info(
+        f"[screener] 스크리닝 {'부분 완료 (마감 도달)' if run.timed_out else '완료'} → "
+        f"추천 {len(result)}개 선정 (채점 {summary.scored}/{summary.universe}, "
+        f"재사용 {run.reused}개, 이어받음 {run.resumed}개)"
+    )
+    return ScreeningResult(recommendations=result, summary=summary)
+
+
+def _prefilter(universe: dict[str, str]) -> tuple[dict[str, str], Panel | None]:
+    """
+    1차 필터 — 유니버스 패널을 한 번 로드해
+    BUY 에 도달할 수 없는 종목을 벡터 연산으로 제외.
+    (통과 종목 유니버스, 통과 종목 패널) 반환. 패널이 없으면 전 종목 통과.
+    제외 종목도 stage=prefilter 로 저장해 전체 순위 조회에 남긴다.
+    """
+    panel = get_panel(list(universe), lookback_days=required_lookback_days())
+    if not panel:
+        logger.warning("[screener] 패널 데이터 없음 → 1차 필터 생략")
+        return universe, None
 
+    result = prefilter_panel(panel)
+    survivors = {code: universe.get(code, code) for code in result.survivors}
+    logger.info(
+        f"[screener] 1차 필터: {len(universe)}종목 → {len(survivors)}개 통과 "
+        f"(선택도 {result.selectivity:.0%})"
+    )
 
-def _screen_stock(code: str, name: str) -> Recommendation | None:
-    """단일 종목 분석 (ThreadPoolExecutor에서 호출됨)"""
+    quotes = _panel_quotes(panel)
+    save_screening_results([
+        ScreenedStock(
+            stock_code=code,
+            stock_name=universe.get(code, code),
+            stage="prefilter",
+            price=quotes[code][1],
+            change_pct=quotes[code][2],
+            top_reasons=[f"1차 필터 제외 (점수 상한 {bound:.2f})"],
+            last_date=quotes[code][0],
+        )
+        for code, bound, ok in zip(result.tickers, result.upper_bound, result.passed)
+        if not ok
+    ])
+    return survivors, {f: frame[list(survivors)] for f, frame in panel.items()}
+
+
+def _previous_results(universe: dict[str, str]) -> dict[str, ScreenedStock]:
+    """
+    증분 스크리닝용 직전 결과 {종목코드: 결과}.
+    SCREENER_INCREMENTAL=false 면 빈 dict.
+    """
+    if not SCREENER_INCREMENTAL or not universe:
+        return {}
+    return {s.stock_code: s for s in load_screening_results(list(universe))}
+
+
+def _panel_quotes(panel: Panel) -> dict[str, tuple[str, float, float]]:
+    """
+    {종목코드: (마지막 봉 날짜, 종가, 전일 대비 등락률%)}.
+    현재가 조회 없이 패널 기준.
+    """
+    quotes = {}
+    for code in panel["Close"].columns:
+        close = panel["Close"][code].dropna()
+        if close.empty:
+            quotes[str(code)] = ("", 0.0, 0.0)
+            continue
+        prev = close.iloc[-2] if len(close) > 1 else close.iloc[-1]
+        quotes[str(code)] = (
+            close.index[-1].strftime("%Y-%m-%d"),
+            float(close.iloc[-1]),
+            round(float(close.iloc[-1] / prev - 1) * 100, 2) if prev else 0.0,
+        )
+    return quotes
+
+
+def _prioritize(
+    universe: dict[str, str], previous: dict[str, ScreenedStock]
+) -> dict[str, str]:
+    """
+    채점 순서 — 보유·관심 종목(MY_POSITIONS·TARGETS) 먼저, 나머지는 직전 점수 높은 순.
+    마감으로 일부만 채점돼도 보유 종목과 유력 후보는 결과에 들어간다.
+    """
+    holdings = set(MY_POSITIONS) | set(TARGETS)
+
+    def key(code: str) -> tuple[bool, float]:
+        prev = previous.get(code)
+        score = float("-inf")
+        if prev is not None and prev.ensemble_score is not None:
+            score = prev.ensemble_score
+        return code not in holdings, -score
+
+    return {code: universe[code] for code in sorted(universe, key=key)}
+
+
+def _resume(universe: dict[str, str], run: _Run) -> dict[str, ScreenedStock]:
+    """체크포인트된 종목의 저장 결과 {종목코드: 결과} — 채점 수·이어받은 수 반영"""
+    codes = [code for code in universe if code in run.done]
+    run.resumed = run.scored = len(codes)
+    return {s.stock_code: s for s in load_screening_results(codes)} if codes else {}
+
+
+def _screen_threaded(universe: dict[str, str], run: _Run) -> None:
+    """
+    종목별 병렬 스크리닝 — 우선순위대로 제출하고 완료 순서대로 top 에 넣는다.
+    마감 시각이 지나면 대기 중인 종목은 취소 (실행 중이던 종목은 끝나는 대로 반영).
+    """
+    previous = _previous_results(universe)
+    for stock in _resume(universe, run).values():
+        if stock.signal in _BUY_SIGNALS:
+            run.top.push(stock.ensemble_score, stock.to_recommendation())
+    pending = _prioritize(
+        {c: n for c, n in universe.items() if c not in run.done}, previous
+    )
+    total = len(universe)
+    collected: set[Future] = set()
+
+    def collect(future: Future) -> None:
+        code, name = futures[future]
+        collected.add(future)
+        run.scored += 1
+        try:
+            screened = future.result()
+        except Exception as e:
+            # 데이터 부족과 같이 결과 없이 체크포인트 — 재개 시 다시 채점하지 않음
+            logger.warning(f"[screener] {name}({code}) 분석 실패: {e}")
+            screened = None
+        stock, was_reused = screened if screened else (None, False)
+        if was_reused:
+            run.reused += 1
+        run.record(code, stock if stock is not None and not was_reused else None)
+        if stock is not None and stock.signal in _BUY_SIGNALS:
+            run.top.push(stock.ensemble_score, stock.to_recommendation())
+            logger.debug(
+                f"[screener] ✅ {name}({code}) 추천 후보 추가 "
+                f"(score={stock.ensemble_score:.2f})"
+            )
+
+        if run.scored % 20 == 0 or run.scored == total:
+            run.flush()
+            logger.info(
+                f"[screener] 진행: {run.scored}/{total} 완료, "
+                f"후보: {run.top.pushed}개"
+            )
+            run.report(run.scored, run.top)
+
+    with ThreadPoolExecutor(max_workers=SCREENER_WORKERS) as pool:
+        # 작업 스레드도 이 잡의 프로파일러(ContextVar)에 기록하도록 컨텍스트 복사
+        futures = {
+            pool.submit(
+                contextvars.copy_context().run,
+                _screen_stock, code, name, previous.get(code),
+            ): (code, name)
+            for code, name in pending.items()
+        }
+        try:
+            for future in as_completed(futures, timeout=run.remaining()):
+                collect(future)
+        # 3.10 이하에서는 내장 TimeoutError 와 다른 클래스
+        except concurrent.futures.TimeoutError:
+            run.timed_out = True
+            cancelled = sum(future.cancel() for future in futures)
+            logger.warning(
+                f"[screener] 마감 시각 도달 — 대기 중인 {cancelled}종목 취소"
+            )
+
+    # 마감 시점에 실행 중이던 종목 (풀 종료 시 완료됨)
+    for future in futures:
+        if future not in collected and not future.cancelled():
+            collect(future)
+    run.flush()
+    run.candidates = run.top.pushed
+
+
+def _screen_panel(universe: dict[str, str], run: _Run) -> None:
+    """
+    전 종목 패널을 한 번에 벡터 평가한 뒤,
+    상위 후보만 종목 단위 분석(현재가·매수 근거)으로 확정.
+    거래정지로 빈 날짜가 있는 종목도 자기 봉만으로 평가된다 (analyze_panel).
+    패널 점수는 종목별 워터마크 없이 저장한다 (순위 조회용, 재사용 대상 아님).
+    한 번의 벡터 연산이라 마감·체크포인트는 적용하지 않는다.
+    """
+    started = time.perf_counter()
+    panel = get_panel(list(universe), lookback_days=required_lookback_days())
+    if not panel:
+        logger.warning("[screener] 패널 데이터 없음")
+        return
+
+    # 60일 미만 종목은 종목 단위 스크리닝과 동일하게 제외
+    enough = (panel["Close"].notna().sum() >= 60).to_numpy()
+    result = generate_panel_ensemble(panel)
+
+    ranked = sorted(
+        (
+            (float(result.scores[i]), code)
+            for i, code in enumerate(result.tickers)
+            if enough[i] and SignalType(int(result.final[i])) in _BUY_SIGNALS
+        ),
+        reverse=True,
+    )
+    logger.info(
+        f"[screener] 패널 평가: {len(result.tickers)}종목, 후보 {len(ranked)}개 "
+        f"({time.perf_counter() - started:.1f}초)"
+    )
+
+    quotes = _panel_quotes(panel)
+    stocks = {
+        code: ScreenedStock(
+            stock_code=code,
+            stock_name=universe.get(code, code),
+            signal=SignalType(int(result.final[i])),
+            ensemble_score=round(float(result.scores[i]), 3),
+            price=quotes[code][1],
+            change_pct=quotes[code][2],
+            last_date=quotes[code][0],
+        )
+        for i, code in enumerate(result.tickers)
+        if enough[i]
+    }
+
+    for _, code in ranked:
+        if len(run.top) >= MAX_RECOMMENDATIONS:
+            break
+        screened = _screen_stock(code, universe[code])
+        if screened is None:
+            continue
+        stock = stocks[code] = screened[0]
+        if stock.signal in _BUY_SIGNALS:
+            run.top.push(stock.ensemble_score, stock.to_recommendation())
+    save_screening_results(list(stocks.values()))
+    run.candidates = len(ranked)
+    run.scored = len(universe)
+
+
+def _screen_processes(
+    universe: dict[str, str], run: _Run, panel: Panel | None = None
+) -> None:
+    """
+    유니버스 패널을 한 번 로드해(1차 필터를 거쳤으면 그 패널 재사용)
+    공유 메모리에 올리고 종목별 앙상블을 프로세스 풀로 평가.
+    워커는 I/O 없이 점수만 계산하고, 현재가 조회는 상위 후보에 대해서만 부모가 수행.
+    현재가를 모르므로 재사용 판단과 중간 순위표는 패널 종가 기준.
+    묶음이 끝날 때마다 체크포인트를 남기고, 마감이 지나면 남은 묶음은 취소.
+    패널에 없거나 일수가 모자라 평가하지 않은 종목도 스레드 모드와 같이
+    결과 없이 채점·체크포인트한다.
+    """
+    if not universe:
+        return
+    started = time.perf_counter()
+    if panel is None:
+        panel = get_panel(list(universe), lookback_days=required_lookback_days())
+
+    stocks = _resume(universe, run)
+    tickers = panel_tickers(panel) if panel else []
+    listed = set(tickers)
+    absent = [code for code in universe if code not in listed and code not in run.done]
+    for code in absent:
+        run.record(code)
+    run.scored += len(absent)
+    if not panel:
+        logger.warning("[screener] 패널 데이터 없음")
+        run.flush()
+        return
+
+    previous = _previous_results(universe)
+    quotes = _panel_quotes(panel)
+    watermarks: dict[str, tuple[str, str]] = {}
+    for i, code in enumerate(tickers):
+        if code in run.done:
+            continue
+        watermarks[code] = input_watermark(ticker_frame(panel, i))
+        input_hash = watermarks[code][1]
+        prev = previous.get(code)
+        if prev is not None and prev.reusable_for(
+            input_hash, quotes[code][1], SCREENER_PRICE_TOLERANCE
+        ):
+            stocks[code] = prev
+            run.reused += 1
+            run.record(code)
+    run.scored += run.reused
+
+    # 중간 순위표 — 재사용 결과부터 채우고 묶음이 끝날 때마다 갱신 (패널 종가 기준)
+    provisional: TopK[Recommendation] = TopK(MAX_RECOMMENDATIONS)
+    for stock in stocks.values():
+        if stock.signal in _BUY_SIGNALS:
+            provisional.push(stock.ensemble_score, stock.to_recommendation())
+
+    def on_chunk(part: list[TickerScore]) -> None:
+        for code, signal, score, reasons in part:
+            if signal is None:
+                run.record(code)
+                continue
+            stock = stocks[code] = ScreenedStock(
+                stock_code=code,
+                stock_name=universe.get(code, code),
+                signal=SignalType(signal),
+                ensemble_score=score,
+                price=quotes[code][1],
+                change_pct=quotes[code][2],
+                top_reasons=reasons,
+                last_date=watermarks[code][0],
+                input_hash=watermarks[code][1],
+            )
+            run.record(code, stock)
+            if stock.signal in _BUY_SIGNALS:
+                provisional.push(score, stock.to_recommendation())
+        run.scored += len(part)
+        run.flush()
+        run.report(run.scored, provisional)
+
+    stale = list(_prioritize(
+        {
+            code: universe.get(code, code)
+            for code in tickers
+            if code not in stocks and code not in run.done
+        },
+        previous,
+    ))
     try:
-        df = get_ohlcv(code)
+        if stale:
+            screen_with_processes(
+                {f: frame[stale] for f, frame in panel.items()},
+                SCREENER_PROCESSES, on_chunk, timeout=run.remaining(),
+            )
+    except concurrent.futures.TimeoutError:
+        run.timed_out = True
+        logger.warning("[screener] 마감 시각 도달 — 남은 묶음 취소")
+    run.flush()
+
+    ranked = sorted(
+        (s for s in stocks.values() if s.signal in _BUY_SIGNALS),
+        key=lambda s: (s.ensemble_score, s.stock_code),
+        reverse=True,
+    )
+    logger.info(
+        f"[screener] 프로세스 평가: {run.scored - run.reused - run.resumed}종목 "
+        f"(재사용 {run.reused}개, 이어받음 {run.resumed}개), 후보 {len(ranked)}개 "
+        f"({time.perf_counter() - started:.1f}초)"
+    )
+
+    for stock in ranked:
+        if len(run.top) >= MAX_RECOMMENDATIONS:
+            break
+        price, change_pct = get_current_price(stock.stock_code)
+        if price == 0:
+            continue
+        rec = stock.to_recommendation()
+        rec = rec.model_copy(update={"price": price, "change_pct": change_pct})
+        run.top.push(stock.ensemble_score, rec)
+    run.candidates = len(ranked)
+
+
+async def stream_screening(
+    submit: Submit | None = None, **kwargs
+) -> AsyncIterator[Leaderboard]:
+    """
+    run_screening 의 중간 순위표를 차례로, 마지막에 final 순위표를 내보내는
+    async iterator.
+    submit: 스크리닝 실행기 (스케줄 작업은 RUNTIME.run_cpu, 기본 asyncio.to_thread)
+    kwargs 는 run_screening 에 그대로 전달 (run_id, deadline).
+    """
+    run = partial(run_screening, **kwargs)
+    async for board in stream_leaderboards(run, submit):
+        yield board
+
+
+def _screen_stock(
+    code: str, name: str, previous: ScreenedStock | None = None
+) -> tuple[ScreenedStock, bool] | None:
+    """
+    단일 종목 분석 (ThreadPoolExecutor에서 호출됨) — (결과, 재사용 여부).
+    입력 워터마크가 직전 결과와 같고 현재가 변동이 허용 범위 이내면
+    앙상블을 다시 돌리지 않는다.
+    """
+    try:
+        df = get_ohlcv(code, lookback_days=required_lookback_days())
         if df.empty or len(df) < 60:
             return None
 
@@ -166,25 +745,32 @@ def _screen_stock(code: str, name: str) -> Recommendation | None:
         if price == 0:
             return None
 
-        # stock_name을 직접 전달해서 TARGETS 조회 없이도 올바른 이름 사용
-        ensemble = generate_ensemble_signal(code, df, price, change_pct, stock_name=name)
-
-        # 주요 매수 근거 추출 (BUY+ 시그널을 낸 전략들의 reason)
-        top_reasons = [
-            f"{s.strategy_name}: {s.reason}"
-            for s in ensemble.strategy_signals
-            if s.signal in _BUY_SIGNALS
-        ][:3]
+        last_date, input_hash = input_watermark(df)
+        if previous is not None and previous.reusable_for(
+            input_hash, price, SCREENER_PRICE_TOLERANCE
+        ):
+            quote = {"price": price, "change_pct": change_pct}
+            return previous.model_copy(update=quote), True
 
-        return Recommendation(
+        # stock_name을 직접 전달해서 TARGETS 조회 없이도 올바른 이름 사용
+        ensemble = evaluate_ensemble(
+            code, df, price, change_pct, stock_name=name,
+            memo=SIGNAL_MEMO, early_exit=SCREENER_EARLY_EXIT,
+        )
+        return ScreenedStock(
             stock_code=code,
             stock_name=name,
             signal=ensemble.signal,
             ensemble_score=ensemble.ensemble_score,
             price=price,
             change_pct=change_pct,
-            top_reasons=top_reasons,
-        )
+            # BUY+ 시그널을 낸 전략들의 reason (추천 후보만)
+            top_reasons=(
+                top_reasons(ensemble) if ensemble.signal in _BUY_SIGNALS else []
+            ),
+            last_date=last_date,
+            input_hash=input_hash,
+        ), False
     except Exception as e:
         logger.debug(f"[screener] {name}({code}) 내부 오류: {e}")
         return None
@@ -0,0 +1,106 @@
+"""거래일(세션) 산출물
+
+단계별 결과를 생성 시각과 함께 저장하고, 신선하면 다음 잡에서 재사용한다.
+
+    시그널 스캔(15:20) ──► SIGNALS ─┐
+    예약 스크리닝(15:10) ─► SCREENING ┼─► 일간 리포트(15:40): 조립만
+    마켓 필터 ───────────► REGIME ──┘   (없거나 오래됐으면 그때 계산)
+
+소비하는 쪽은 필요한 산출물과 허용 신선도(Artifact.max_age)를 선언하고 load() /
+reuse_or_produce() 로 받는다. 세션이 바뀌면(날짜 변경) 이전 산출물은 쓰지 않는다.
+일봉은 data.cache 가 이미 종목·날짜 단위로 재사용하므로 여기서 다루지 않는다.
+"""
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Callable, Generic, TypeVar
+
+import metrics
+from config import SESSION_REUSE
+from db.session_artifacts import load_artifact, save_artifact
+from pydantic import BaseModel
+
+from signals.models import IndexQuote, MarketRegime, ScreeningResult, SignalSnapshot
+
+logger = logging.getLogger(__name__)
+
+M = TypeVar("M", bound=BaseModel)
+
+
+@dataclass(frozen=True)
+class Artifact(Generic[M]):
+    name: str
+    model: type[M]
+    max_age: timedelta                              # 이 시간 안에 만든 결과만 재사용
+    accept: Callable[[M], bool] | None = None       # 추가 재사용 조건
+
+
+def _complete(result: ScreeningResult) -> bool:
+    """
+    마감으로 끊긴 부분 결과는 재사용하지 않음
+    (마켓 필터로 생략한 결과는 완료로 봄)
+    """
+    return result.summary is None or result.summary.status == "complete"
+
+
+SIGNALS: Artifact[SignalSnapshot] = Artifact(
+    "signals", SignalSnapshot, timedelta(minutes=30)
+)
+SCREENING: Artifact[ScreeningResult] = Artifact(
+    "screening", ScreeningResult, timedelta(minutes=45), _complete
+)
+KOSPI: Artifact[IndexQuote] = Artifact("kospi", IndexQuote, timedelta(minutes=10))
+# 120일선 기준 판정이라 장중에는 거의 바뀌지 않음
+REGIME: Artifact[MarketRegime] = Artifact("regime", MarketRegime, timedelta(hours=4))
+
+
+def session_key(now: datetime | None = None) -> str:
+    return (now or datetime.now()).date().isoformat()
+
+
+def load(
+    artifact: Artifact[M],
+    max_age: timedelta | None = None,
+    now: datetime | None = None,
+) -> M | None:
+    """현재 세션의 신선한 산출물 (없거나 오래됐거나 재사용 조건 불충족 → None)"""
+    if not SESSION_REUSE:
+        return None
+    now = now or datetime.now()
+    stored = load_artifact(session_key(now), artifact.name, artifact.model)
+    fresh = stored is not None and now - stored[0] <= (max_age or artifact.max_age)
+    if fresh and artifact.accept is not None and not artifact.accept(stored[1]):
+        fresh = False
+    metrics.cache_lookup(f"session_{artifact.name}", hit=fresh)
+    if not fresh:
+        return None
+    produced_at, value = stored
+    age = now - produced_at
+    logger.info(
+        f"[session] {artifact.name} 재사용 ({age.total_seconds() / 60:.0f}분 전 생성)"
+    )
+    return value
+
+
+def record(artifact: Artifact[M], value: M, now: datetime | None = None) -> None:
+    if not SESSION_REUSE:
+        return
+    now = now or datetime.now()
+    try:
+        save_artifact(session_key(now), artifact.name, value, now)
+    except Exception as e:
+        # 기록 실패는 재사용만 못 할 뿐 — 본 작업 결과에는 영향 없음
+        logger.warning(f"[session] {artifact.name} 기록 실패: {e}")
+
+
+def reuse_or_produce(
+    artifact: Artifact[M], produce: Callable[[], M], max_age: timedelta | None = None
+) -> M:
+    """신선한 산출물이 있으면 그대로, 없으면 produce() 결과를 기록하고 반환"""
+    value = load(artifact, max_age)
+    if value is None:
+        value = produce()
+        record(artifact, value)
+    return value
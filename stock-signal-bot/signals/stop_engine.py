@@ -0,0 +1,233 @@
+"""손절 엔진 — 보유 포지션을 종목별 손절가 정렬 인덱스로 메모리에 두고 일괄 시세로 판정
+
+    종목 ─► 손절가 오름차순 [(손절가, 포지션 id), ...]
+            시세 p 에서 발동 = 손절가 >= p 인 뒤쪽 구간 → bisect 1회 (O(log n))
+
+트레일링 스탑은 포지션별 고점(high_water)을 증분으로 갱신한다 — 종목별 고점 오름차순
+인덱스에서 새 시세보다 낮은 앞쪽 구간만 손절가를 끌어올린다.
+청산·끌어올린 손절가는 포지션 저장소(db.signal_history)에 기록하고, 저장소의
+포지션이 바뀌면(추가·외부 청산) 다음 poll 에서 인덱스를 다시 만든다.
+"""
+from __future__ import annotations
+
+import bisect
+import heapq
+import logging
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+
+from config import STOP_TRAIL_PCT
+from data.fetcher import get_current_prices
+from db.signal_history import (
+    close_position,
+    get_open_positions,
+    open_positions_version,
+    update_trailing_stops,
+)
+
+logger = logging.getLogger(__name__)
+
+QuoteSource = Callable[[list[str]], Mapping[str, tuple[float, float]]]
+
+
+@dataclass
+class StopPosition:
+    position_id: int
+    stock_code: str
+    entry_price: float
+    stop_price: float
+    trail_pct: float | None = None      # None → 고정 손절가
+    high_water: float | None = None     # 트레일링 기준 고점
+
+    @classmethod
+    def from_row(cls, row: dict, default_trail: float = 0.0) -> StopPosition:
+        trail = row.get("trail_pct") or default_trail or None
+        return cls(
+            position_id=row["id"],
+            stock_code=row["stock_code"],
+            entry_price=row["entry_price"],
+            stop_price=row["stop_loss_price"],
+            trail_pct=trail,
+            high_water=(row.get("high_water") or row["entry_price"]) if trail else None,
+        )
+
+
+@dataclass(frozen=True)
+class StopHit:
+    position: StopPosition
+    price: float
+
+    @property
+    def exit_reason(self) -> str:
+        return "TRAILING_STOP" if self.is_trailing else "STOP_LOSS"
+
+    @property
+    def is_trailing(self) -> bool:
+        """손절가가 트레일링으로 끌어올린 값(고점 × (1 - trail_pct))인 상태에서 발동"""
+        pos = self.position
+        if pos.trail_pct is None or pos.high_water is None:
+            return False
+        trailed = round(pos.high_water * (1 - pos.trail_pct), 2)
+        return abs(pos.stop_price - trailed) < 0.01
+
+    def reason(self) -> str:
+        pos = self.position
+        loss_pct = (self.price - pos.entry_price) / pos.entry_price * 100
+        if self.is_trailing:
+            return (
+                f"트레일링 스탑 도달 (고점 {pos.high_water:,.0f}원 대비 "
+                f"-{pos.trail_pct * 100:.0f}%, "
+                f"진입가 대비 {loss_pct:+.1f}%)"
+            )
+        return (
+            f"리버모어/오닐 손절선 도달 "
+            f"({loss_pct:.1f}%, 진입가:{pos.entry_price:,.0f}원)"
+        )
+
+
+class _TickerBook:
+    """한 종목의 손절가 인덱스와 트레일링 고점 인덱스"""
+
+    def __init__(self) -> None:
+        self.stops: list[tuple[float, int]] = []     # (손절가, id) 오름차순
+        self.highs: list[tuple[float, int]] = []     # (고점, id) 오름차순 — 트레일링만
+
+    def add(self, pos: StopPosition) -> None:
+        bisect.insort(self.stops, (pos.stop_price, pos.position_id))
+        if pos.trail_pct is not None:
+            bisect.insort(self.highs, (pos.high_water, pos.position_id))
+
+    def remove(self, pos: StopPosition) -> None:
+        _discard(self.stops, (pos.stop_price, pos.position_id))
+        if pos.trail_pct is not None:
+            _discard(self.highs, (pos.high_water, pos.position_id))
+
+    def __bool__(self) -> bool:
+        return bool(self.stops)
+
+
+def _discard(entries: list[tuple[float, int]], entry: tuple[float, int]) -> None:
+    i = bisect.bisect_left(entries, entry)
+    if i < len(entries) and entries[i] == entry:
+        del entries[i]
+
+
+class StopEngine:
+    def __init__(
+        self,
+        quotes: QuoteSource = get_current_prices,
+        default_trail: float = STOP_TRAIL_PCT,
+    ) -> None:
+        self._quotes = quotes
+        self._default_trail = default_trail
+        self._positions: dict[int, StopPosition] = {}
+        self._books: dict[str, _TickerBook] = {}
+        self._version: tuple[int, int] | None = None
+        self._raised: set[int] = set()      # 저장 대기 중인 트레일링 갱신
+
+    # ── 인덱스 관리 ──────────────────────────────────────────────────────
+
+    def add(self, pos: StopPosition) -> None:
+        self._positions[pos.position_id] = pos
+        self._books.setdefault(pos.stock_code, _TickerBook()).add(pos)
+
+    def remove(self, position_id: int) -> StopPosition | None:
+        pos = self._positions.pop(position_id, None)
+        if pos is not None:
+            book = self._books[pos.stock_code]
+            book.remove(pos)
+            if not book:
+                del self._books[pos.stock_code]
+        return pos
+
+    def tickers(self) -> list[str]:
+        return list(self._books)
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def sync(self) -> bool:
+        """저장소의 보유 포지션이 바뀌었으면 인덱스 재구성 — 재구성했으면 True"""
+        version = open_positions_version()
+        if version == self._version:
+            return False
+        self._flush()
+        self._positions.clear()
+        self._books.clear()
+        for row in get_open_positions():
+            self.add(StopPosition.from_row(row, self._default_trail))
+        self._version = version
+        logger.info(
+            f"[stop_engine] 보유 포지션 {len(self)}건 / {len(self._books)}종목 로드"
+        )
+        return True
+
+    # ── 시세 처리 ────────────────────────────────────────────────────────
+
+    def on_quote(self, stock_code: str, price: float) -> list[StopHit]:
+        """한 종목 시세 — 발동한 포지션을 인덱스에서 빼서 반환 (저장은 하지 않음)"""
+        book = self._books.get(stock_code)
+        if book is None or price <= 0:
+            return []
+
+        # 손절가 >= price 인 구간 전체가 발동 (오름차순 → 뒤쪽)
+        i = bisect.bisect_left(book.stops, (price, -1))
+        hits = [StopHit(self._positions[pid], price) for _, pid in book.stops[i:]]
+        for hit in hits:
+            self.remove(hit.position.position_id)
+            self._raised.discard(hit.position.position_id)
+
+        if stock_code in self._books:
+            self._trail(book, price)
+        return hits
+
+    def on_quotes(self, prices: Mapping[str, float]) -> list[StopHit]:
+        hits: list[StopHit] = []
+        for code, price in prices.items():
+            hits += self.on_quote(code, price)
+        return hits
+
+    def _trail(self, book: _TickerBook, price: float) -> None:
+        """고점 < price 인 트레일링 포지션의 고점·손절가 갱신"""
+        j = bisect.bisect_left(book.highs, (price, -1))
+        if j == 0:
+            return
+        lifted = []
+        for _, pid in book.highs[:j]:
+            pos = self._positions[pid]
+            pos.high_water = price
+            new_stop = round(price * (1 - pos.trail_pct), 2)
+            if new_stop > pos.stop_price:
+                _discard(book.stops, (pos.stop_price, pid))
+                pos.stop_price = new_stop
+                bisect.insort(book.stops, (new_stop, pid))
+            lifted.append((price, pid))
+            self._raised.add(pid)
+        book.highs[:] = list(heapq.merge(sorted(lifted), book.highs[j:]))
+
+    # ── 주기 실행 ────────────────────────────────────────────────────────
+
+    def poll(self) -> list[StopHit]:
+        """저장소 동기화 → 보유 종목 일괄 시세 → 판정 → 청산·트레일링 상태 저장"""
+        self.sync()
+        if not self._books:
+            return []
+        quotes = self._quotes(self.tickers())
+        hits = self.on_quotes({code: q[0] for code, q in quotes.items()})
+        for hit in hits:
+            close_position(hit.position.position_id, hit.price, hit.exit_reason)
+        self._flush()
+        if hits:
+            # 직접 청산한 만큼 버전이 바뀌었으므로 다음 sync 에서 불필요한 재구성 방지
+            self._version = open_positions_version()
+        return hits
+
+    def _flush(self) -> None:
+        if not self._raised:
+            return
+        update_trailing_stops([
+            (pid, pos.stop_price, pos.trail_pct, pos.high_water)
+            for pid in self._raised
+            if (pos := self._positions.get(pid)) is not None
+        ])
+        self._raised.clear()
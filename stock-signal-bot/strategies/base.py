@@ -1,15 +1,101 @@
 from __future__ import annotations
 
+import hashlib
+import math
 from abc import ABC, abstractmethod
+from typing import Callable
 
+import numpy as np
 import pandas as pd
 
-from signals.models import StrategySignal
+import metrics
+from signals.models import SignalType, StrategyResult
+from strategies.panel import (
+    Panel,
+    PanelResult,
+    aligned_groups,
+    panel_tickers,
+    single_panel,
+    tail_panel,
+)
+from strategies.profiling import active_profiler
+from strategies.streaming import StreamingIndicator
+
+# 스트리밍 지표 이름 → (입력 시리즈, 최초 생성 팩토리)
+StreamingInputs = dict[str, tuple[pd.Series, Callable[[], StreamingIndicator]]]
+
+STRATEGY_FAILURES = metrics.counter(
+    "stockbot_strategy_failures_total",
+    "전략 분석 예외 수 (NEUTRAL 로 대체)",
+    ["strategy"],
+)
+
+# lookback 단위(timeframe)별 일봉 수
+_DAILY_BARS = {"D": 1, "W": 5}
+
+# 재귀 지표(EMA·Wilder RSI) 워밍업 기준 — 시작값의 잔여 가중치가 이 값 이하가 될 때까지
+EMA_RESIDUAL = 1e-3
+
+
+def calendar_days(bars: int, timeframe: str = "D") -> int:
+    """일봉 bars 개를 확보하는 데 필요한 달력일 수 (주말 + 공휴일 여유 10%)"""
+    if timeframe == "W":
+        return bars // _DAILY_BARS["W"] * 7 + 7  # 진행 중인 주 포함
+    return math.ceil(bars * 7 / 5 * 1.1)
+
+
+def ema_warmup(
+    span: int | None = None, alpha: float | None = None, residual: float = EMA_RESIDUAL
+) -> int:
+    """
+    EMA 가 시작값의 영향(잔여 가중치 (1-alpha)^n)을 residual 이하로 잊는 봉 수.
+    꼬리 구간만 받는 재귀 지표가 전체 이력으로 계산한 값과 사실상 같아지는 길이.
+    """
+    if alpha is None:
+        alpha = 2.0 / (span + 1.0)
+    return math.ceil(math.log(residual) / math.log(1.0 - alpha))
+
+
+def frame_digest(df: pd.DataFrame, salt: str = "") -> tuple[str, str]:
+    """(마지막 봉 날짜, 컬럼·인덱스·값 해시) — 입력 구간 변경 감지용"""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(salt.encode())
+    digest.update(",".join(map(str, df.columns)).encode())
+    digest.update(df.index.asi8.tobytes())
+    digest.update(df.to_numpy(dtype=float).tobytes())
+    last_date = df.index[-1].strftime("%Y-%m-%d") if len(df) else ""
+    return last_date, digest.hexdigest()
 
 
 class BaseStrategy(ABC):
     """모든 전략이 상속받는 추상 클래스"""
 
+    # analyze_panel 결과에 포함할 evaluate_panel 프레임 이름
+    panel_indicators: tuple[str, ...] = ()
+
+    # ── 데이터 요구량 ──
+    # timeframe: lookback 단위 (D=일봉, W=주봉)
+    # lookback: 마지막 봉 시그널을 계산하는 데 필요한 봉 수 (0 → 전체 이력)
+    # warmup: lookback 앞에 더 받을 봉 수 — EMA 처럼 시작값이 남는 지표가 수렴하도록
+    #         (ema_warmup 참고. 이동 윈도우만 쓰는 전략은 0)
+    # min_bars: 이보다 일봉이 적으면 실행하지 않고 NEUTRAL
+    timeframe: str = "D"
+    lookback: int = 0
+    warmup: int = 0
+    min_bars: int = 1
+    required_columns: tuple[str, ...] = ("Close",)
+
+    # 1회 실행 비용 추정치 (ms, 300봉)
+    # — 조기 종료 앙상블의 평가 순서(비용/가중치)에 사용
+    cost: float = 1.0
+    # 낼 수 있는 시그널의 (최소, 최대) — 조기 종료 앙상블의 점수 범위 계산에 사용
+    signal_range: tuple[SignalType, SignalType] = (
+        SignalType.STRONG_SELL, SignalType.STRONG_BUY
+    )
+
+    # 시그널 로직이 바뀌면 올려서 저장된 메모(db.signal_memo)를 무효화
+    version: str = "1"
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -20,9 +106,41 @@ class BaseStrategy(ABC):
     def weight(self) -> float:
         """앙상블 가중치 (합계 1.0)"""
 
-    @abstractmethod
-    def analyze(self, df: pd.DataFrame, stock_code: str) -> StrategySignal:
+    @property
+    def lookback_bars(self) -> int:
+        """필요한 일봉 수 — 워밍업 포함 (0 → 전체 이력)"""
+        if not self.lookback:
+            return 0
+        return (self.lookback + self.warmup) * _DAILY_BARS[self.timeframe]
+
+    @property
+    def lookback_days(self) -> int:
+        """lookback_bars 를 확보하기 위한 조회 기간 (달력일)"""
+        return calendar_days(self.lookback_bars, self.timeframe)
+
+    def data_shortfall(self, df: pd.DataFrame) -> str | None:
+        """실행 불가 사유 (필수 컬럼 누락 / 봉 수 부족). 충분하면 None."""
+        missing = [c for c in self.required_columns if c not in df.columns]
+        if missing:
+            return f"필수 컬럼 없음: {', '.join(missing)}"
+        if len(df) < self.min_bars:
+            return f"데이터 부족 ({len(df)}/{self.min_bars}봉)"
+        return None
+
+    def window(self, df: pd.DataFrame) -> pd.DataFrame:
+        """lookback_bars 만큼의 꼬리 구간 (iloc 슬라이스 — 복사 없음)"""
+        if self.lookback_bars and len(df) > self.lookback_bars:
+            return df.iloc[-self.lookback_bars:]
+        return df
+
+    def memo_key(self, df: pd.DataFrame) -> tuple[str, str, str]:
+        """(전략 버전, 마지막 봉 날짜, 입력 꼬리 구간 해시) — 같으면 결과도 같다"""
+        return (self.version, *frame_digest(self.window(df)))
+
+    def analyze(self, df: pd.DataFrame, stock_code: str) -> StrategyResult:
         """
+        마지막 날짜의 시그널 (analyze_series 의 마지막 행).
+
         Args:
             df: OHLCV + 수급 컬럼을 가진 DataFrame
                 필수 컬럼: Open, High, Low, Close, Volume
@@ -30,19 +148,150 @@ class BaseStrategy(ABC):
             stock_code: 종목코드
 
         Returns:
-            StrategySignal
+            StrategyResult
+        """
+        return self.signal_at(self.analyze_series(df).iloc[-1])
+
+    def analyze_series(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        모든 날짜의 시그널을 한 번에 계산 (백테스트·이전 상태 비교용).
+
+        Returns:
+            날짜 인덱스 DataFrame — signal(-2~+2), confidence, case 및 지표 컬럼
         """
+        frames = self.evaluate_panel(single_panel(df))
+        return pd.DataFrame(
+            {key: frame.iloc[:, 0] for key, frame in frames.items()},
+            index=df.index,
+        )
 
-    def _safe_analyze(self, df: pd.DataFrame, stock_code: str) -> StrategySignal:
-        """에러 발생 시 NEUTRAL 반환"""
-        from signals.models import SignalType
+    def signal_at(self, row: pd.Series) -> StrategyResult:
+        """analyze_series 의 한 행 → StrategyResult"""
+        case = int(row["case"])
+        return StrategyResult(
+            strategy_name=self.name,
+            signal=SignalType(int(row["signal"])),
+            confidence=float(row["confidence"]),
+            reason=self._reason(case, row),
+            indicators=self._indicators(case, row),
+        )
+
+    @abstractmethod
+    def _reason(self, case: int, row: pd.Series) -> str:
+        """evaluate_panel 분기 번호(case)별 사유 문구"""
+
+    @abstractmethod
+    def _indicators(self, case: int, row: pd.Series) -> dict:
+        """StrategyResult.indicators 로 노출할 지표 (반올림된 float)"""
+
+    @abstractmethod
+    def evaluate_panel(self, panel: Panel) -> dict[str, pd.DataFrame]:
+        """
+        전 날짜 × 전 종목 벡터 평가.
+
+        Args:
+            panel: 필드명 → (날짜 × 종목) DataFrame
+
+        Returns:
+            signal, confidence, case 및 지표 프레임 (모두 날짜 × 종목)
+        """
+
+    def analyze_panel(self, panel: Panel) -> PanelResult:
+        """
+        마지막 날짜 기준 전 종목 시그널·신뢰도·주요 지표.
+        _safe_analyze 와 같이 종목마다 종가가 있는 봉만으로(aligned_groups)
+        lookback 꼬리 구간을 평가하고, 봉 수가 min_bars 미만인 종목은
+        NEUTRAL(신뢰도 0)로 둔다.
+        """
+        tickers = panel_tickers(panel)
+        signal = np.full(len(tickers), SignalType.NEUTRAL.value, dtype=np.int8)
+        confidence = np.zeros(len(tickers))
+        indicators = {
+            key: np.full(len(tickers), np.nan) for key in self.panel_indicators
+        }
+        for cols, group in aligned_groups(panel):
+            if len(group["Close"]) < self.min_bars:
+                continue
+            frames = self.evaluate_panel(tail_panel(group, self.lookback_bars))
+            signal[cols] = frames["signal"].to_numpy()[-1]
+            confidence[cols] = frames["confidence"].to_numpy()[-1]
+            for key in self.panel_indicators:
+                indicators[key][cols] = frames[key].to_numpy()[-1]
+        return PanelResult(
+            tickers=tickers, signal=signal, confidence=confidence, indicators=indicators
+        )
+
+    # ── 장중 재스캔 (스트리밍 지표) ──
+
+    def streaming_inputs(self, df: pd.DataFrame) -> StreamingInputs:
+        """
+        스캔 간에 저장해 두고 새 봉만큼만 갱신할 지표 (db.indicator_state 참고).
+        비어 있으면 (기본) 장중 재스캔도 analyze 로 꼬리 구간 전체를 다시 계산.
+        """
+        return {}
+
+    def analyze_streaming(
+        self, df: pd.DataFrame, indicators: dict[str, StreamingIndicator]
+    ) -> StrategyResult:
+        """
+        마지막 봉까지 맞춘 streaming_inputs 지표로 마지막 날짜 시그널 계산.
+        재귀 지표는 저장된 상태 덕에 꼬리 구간이 아닌 누적 이력 기준 값이 된다.
+        """
+        raise NotImplementedError
+
+    def buy_setup(self, panel: Panel) -> pd.DataFrame | None:
+        """
+        BUY 이상 시그널의 필요조건 (날짜 × 종목 bool) — 2단계 스크리닝의 1차 필터용.
+        evaluate_panel 의 BUY 분기들이 공통으로 요구하는 조건 중 저렴한 것만 계산한다.
+        False 인 종목은 이 전략이 NEUTRAL 이하만 낼 수 있어야 한다. None → 항상 가능.
+        """
+        return None
+
+    def can_buy(self, panel: Panel) -> np.ndarray:
+        """
+        마지막 날짜 기준 종목별 BUY 이상 가능 여부.
+        analyze_panel 과 같이 종목마다 자기 봉만으로 꼬리 구간을 만든다 — 합집합
+        패널에서 빈 날짜가 rolling 조건을 NaN(거짓)으로 만들어 후보를 잃지 않도록.
+        """
+        possible = np.zeros(len(panel["Close"].columns), dtype=bool)
+        for cols, group in aligned_groups(panel):
+            if len(group["Close"]) < self.min_bars:
+                continue
+            setup = self.buy_setup(tail_panel(group, self.lookback_bars))
+            possible[cols] = True if setup is None else setup.to_numpy()[-1]
+        return possible
+
+    def _safe_analyze(self, df: pd.DataFrame, stock_code: str) -> StrategyResult:
+        """
+        데이터가 부족하거나 에러 발생 시 NEUTRAL 반환 (필요한 꼬리 구간만 분석).
+        profile_scan() 활성 중이면 호출별 시간·실패·입력 크기를 기록한다.
+        """
+        profiler = active_profiler()
+        shortfall = self.data_shortfall(df)
+        if shortfall:
+            if profiler is not None:
+                profiler.skip(self.name)
+            return StrategyResult(
+                strategy_name=self.name,
+                signal=SignalType.NEUTRAL,
+                confidence=0.0,
+                reason=shortfall,
+            )
 
+        window = self.window(df)
+        started = profiler.start() if profiler is not None else None
+        error: Exception | None = None
         try:
-            return self.analyze(df, stock_code)
+            result = self.analyze(window, stock_code)
         except Exception as exc:
-            return StrategySignal(
+            error = exc
+            STRATEGY_FAILURES.inc(strategy=self.name)
+            result = StrategyResult(
                 strategy_name=self.name,
                 signal=SignalType.NEUTRAL,
                 confidence=0.0,
                 reason=f"분석 실패: {exc}",
             )
+        if profiler is not None:
+            profiler.record(self.name, started, len(window), error)
+        return result
@@ -1,28 +1,90 @@
 """알렉산더 엘더 Triple Screen 전략 — 3개 시간 프레임 다중 필터"""
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
-from ta.momentum import StochasticOscillator
-from ta.trend import MACD
 
-from signals.models import SignalType, StrategySignal
-from strategies.base import BaseStrategy
+from config import WEEKLY_LOOKBACK_WEEKS
+from signals.models import SignalType, StrategyResult
+from strategies.base import BaseStrategy, StreamingInputs, ema_warmup
+from strategies.panel import Panel, classify, rounded, single_panel, stochastic_k
+from strategies.streaming import EMA, MACD, StreamingIndicator
 
+_MIN_WEEKS = 30
+_MACD_FAST, _MACD_SLOW, _MACD_SIGN = 12, 26, 9
+_HIST_WEEKS = _MACD_SLOW + _MACD_SIGN  # 주봉 MACD 히스토그램이 정의되는 주 수
 
-def _resample_weekly(df: pd.DataFrame) -> pd.DataFrame:
-    """일봉 데이터를 주봉으로 리샘플링"""
-    df2 = df.copy()
-    df2.index = pd.to_datetime(df2.index)
-    return df2.resample("W-FRI").agg({
-        "Open": "first",
-        "High": "max",
-        "Low": "min",
-        "Close": "last",
-        "Volume": "sum",
-    }).dropna()
+
+def _running_weekly_macd(close: pd.DataFrame) -> dict[str, pd.DataFrame]:
+    """
+    각 일자 기준 주봉 MACD 히스토그램 (진행 중인 주는 당일 종가를 주봉 종가로 사용).
+
+    종목 단위 분석이 매일 주봉을 다시 리샘플링하는 것과 같은 값을,
+    확정된 주의 EMA 값에 당일 종가 한 스텝만 더해 벡터로 계산한다.
+
+    Returns:
+        hist(당일 기준), prev_hist(직전 주 확정값), weeks(데이터가 있는 주 수)
+    """
+    weekly = close.resample("W-FRI").last()
+    has_data = weekly.notna()
+    weeks_done = has_data.cumsum()
+
+    def ema(frame: pd.DataFrame, span: int) -> pd.DataFrame:
+        return frame.ewm(span=span, adjust=False, ignore_na=True).mean()
+
+    fast_w = ema(weekly, _MACD_FAST)
+    slow_w = ema(weekly, _MACD_SLOW)
+    macd_w = (fast_w - slow_w).where(has_data & (weeks_done >= _MACD_SLOW))
+    signal_w = ema(macd_w, _MACD_SIGN)
+    hist_w = (macd_w - signal_w).where(weeks_done >= _MACD_SLOW + _MACD_SIGN - 1)
+
+    # 일자 → 해당 주(W-FRI 라벨) 위치, 직전 주 확정값은 shift(1)
+    pos = weekly.index.searchsorted(close.index)
+
+    def prev_week(frame: pd.DataFrame) -> np.ndarray:
+        return frame.ffill().shift(1).to_numpy()[pos]
+
+    x = close.to_numpy()
+    prev_count = np.nan_to_num(prev_week(weeks_done.astype(float)))
+    weeks = prev_count + 1
+
+    def step(
+        prev: np.ndarray, span: int, value: np.ndarray, first: np.ndarray
+    ) -> np.ndarray:
+        alpha = 2.0 / (span + 1.0)
+        return np.where(first, value, (1 - alpha) * prev + alpha * value)
+
+    fast = step(prev_week(fast_w), _MACD_FAST, x, prev_count == 0)
+    slow = step(prev_week(slow_w), _MACD_SLOW, x, prev_count == 0)
+    macd = np.where(weeks >= _MACD_SLOW, fast - slow, np.nan)
+    signal = step(prev_week(signal_w), _MACD_SIGN, macd, weeks == _MACD_SLOW)
+    hist = np.where(weeks >= _MACD_SLOW + _MACD_SIGN - 1, macd - signal, np.nan)
+
+    def frame(values: np.ndarray) -> pd.DataFrame:
+        return pd.DataFrame(values, index=close.index, columns=close.columns)
+
+    return {
+        "hist": frame(np.where(np.isnan(x), np.nan, hist)),
+        "prev_hist": frame(prev_week(hist_w)),
+        "weeks": frame(np.where(np.isnan(x), 0, weeks)),
+    }
 
 
 class ElderStrategy(BaseStrategy):
+    panel_indicators = (
+        "weekly_macd_hist", "weekly_bullish", "force_index_2", "stoch_k"
+    )
+    timeframe = "W"
+    lookback = _HIST_WEEKS
+    # 주봉 MACD 는 EMA — 꼬리 구간만 받으면 시작값이 남아 히스토그램 부호가 바뀔 수 있다
+    # 워밍업은 WEEKLY_LOOKBACK_WEEKS 안에서만 잡아 앙상블 조회 기간을 늘리지 않음
+    warmup = max(
+        0, min(ema_warmup(_MACD_SLOW), WEEKLY_LOOKBACK_WEEKS - _HIST_WEEKS)
+    )
+    min_bars = _MIN_WEEKS  # 주당 1봉 이상 — 이보다 적으면 30주가 될 수 없음
+    cost = 7.4
+    required_columns = ("High", "Low", "Close", "Volume")
+
     @property
     def name(self) -> str:
         return "엘더 Triple Screen"
@@ -31,93 +93,114 @@ class ElderStrategy(BaseStrategy):
     def weight(self) -> float:
         return 0.15
 
-    def analyze(self, df: pd.DataFrame, stock_code: str) -> StrategySignal:
+    def _reason(self, case: int, row: pd.Series) -> str:
+        fi = row["force_index_2"]
+        return {
+            0: "주봉 데이터 부족",
+            1: f"Triple Screen 매수 완성 (주봉↑, FI:{fi:.0f}, 전고돌파)",
+            2: f"Screen 1,2 통과 — 전고가({row['prev_high']:.0f}) 돌파 대기",
+            3: f"Triple Screen 매도 완성 (주봉↓, FI:{fi:.0f}, 전저이탈)",
+            4: "Screen 1,2 매도 통과",
+        }.get(case, "Triple Screen 조건 미충족")
+
+    def _indicators(self, case: int, row: pd.Series) -> dict:
+        if case == 0:
+            return {}
+        return {
+            "weekly_macd_hist": rounded(row["weekly_macd_hist"], 2),
+            "weekly_bullish": bool(row["weekly_bullish"]),
+            "force_index_2": rounded(row["force_index_2"], 0),
+            "stoch_k": rounded(row["stoch_k"], 1),
+        }
+
+    def evaluate_panel(self, panel: Panel) -> dict[str, pd.DataFrame]:
+        close = panel["Close"]
+        raw_fi = close.diff() * panel["Volume"]
+        return self._screens(
+            panel,
+            _running_weekly_macd(close),
+            raw_fi.ewm(span=2, adjust=False).mean(),
+        )
+
+    def _screens(
+        self,
+        panel: Panel,
+        weekly: dict[str, pd.DataFrame],
+        force_index_2: pd.DataFrame,
+    ) -> dict[str, pd.DataFrame]:
+        """주봉 MACD·Force Index(2) 가 주어졌을 때의 Triple Screen 분류"""
+        close, high, low = panel["Close"], panel["High"], panel["Low"]
+
         # ── Screen 1: 주봉 MACD 히스토그램 방향 ─────────
-        weekly = _resample_weekly(df)
-        if len(weekly) < 30:
-            return StrategySignal(
-                strategy_name=self.name,
-                signal=SignalType.NEUTRAL,
-                confidence=0.0,
-                reason="주봉 데이터 부족",
-            )
-
-        w_macd_ind = MACD(close=weekly["Close"], window_slow=26, window_fast=12, window_sign=9)
-        w_hist = w_macd_ind.macd_diff()
-
-        cur_w_hist = w_hist.iloc[-1]
-        prev_w_hist = w_hist.iloc[-2]
-        weekly_bullish = cur_w_hist > prev_w_hist
-
-        # ── Screen 2: 일봉 Force Index(2) ───────────────
-        raw_fi = df["Close"].diff() * df["Volume"]
-        force_index_2 = raw_fi.ewm(span=2, adjust=False).mean()
-
-        # Stochastic(5,3)
-        stoch_ind = StochasticOscillator(
-            high=df["High"], low=df["Low"], close=df["Close"], window=5, smooth_window=3
+        weekly_bullish = weekly["hist"] > weekly["prev_hist"]
+        enough_weeks = weekly["weeks"] >= _MIN_WEEKS
+
+        # ── Screen 2: 일봉 Force Index(2), Stochastic(5,3) ──
+        stoch_k = stochastic_k(high, low, close, window=5)
+
+        prev_high = high.shift(1)
+        prev_low = low.shift(1)
+
+        # Screen 3: 주봉↑ + FI<0 에서 전일 고가 돌파 / 주봉↓ + FI>0 에서 전일 저가 이탈
+        buy_side = enough_weeks & weekly_bullish & (force_index_2 < 0)
+        sell_side = enough_weeks & ~weekly_bullish & (force_index_2 > 0)
+
+        frames = classify(
+            [
+                (~enough_weeks, SignalType.NEUTRAL, 0.0),
+                (buy_side & (close > prev_high), SignalType.STRONG_BUY, 0.85),
+                (buy_side, SignalType.BUY, 0.60),
+                (sell_side & (close < prev_low), SignalType.STRONG_SELL, 0.85),
+                (sell_side, SignalType.SELL, 0.55),
+            ],
+            default=(SignalType.NEUTRAL, 0.3),
+            like=close,
+        )
+        frames.update(
+            weekly_macd_hist=weekly["hist"],
+            weekly_bullish=weekly_bullish,
+            force_index_2=force_index_2,
+            stoch_k=stoch_k,
+            prev_high=prev_high,
         )
-        stoch_k = stoch_ind.stoch().iloc[-1]
-
-        cur_fi = force_index_2.iloc[-1]
-        prev_high = df["High"].iloc[-2]
-        prev_low = df["Low"].iloc[-2]
-        cur_close = df["Close"].iloc[-1]
-
-        indicators = {
-            "weekly_macd_hist": round(cur_w_hist, 2),
-            "weekly_bullish": weekly_bullish,
-            "force_index_2": round(cur_fi, 0),
-            "stoch_k": round(stoch_k, 1),
+        return frames
+
+    # ── 장중 재스캔 ──
+
+    def streaming_inputs(self, df: pd.DataFrame) -> StreamingInputs:
+        # 주봉 MACD: 진행 중인 주는 revise, 새 주는 직전 주 확정 후 update
+        close = df["Close"]
+        return {
+            "weekly_macd": (
+                close.resample("W-FRI").last(),
+                lambda: MACD(_MACD_FAST, _MACD_SLOW, _MACD_SIGN),
+            ),
+            "force_index_2": (close.diff() * df["Volume"], lambda: EMA(span=2)),
         }
 
-        if weekly_bullish:
-            screen2_buy = cur_fi < 0
-            screen3_buy = cur_close > prev_high
-
-            if screen2_buy and screen3_buy:
-                return StrategySignal(
-                    strategy_name=self.name,
-                    signal=SignalType.STRONG_BUY,
-                    confidence=0.85,
-                    reason=f"Triple Screen 매수 완성 (주봉↑, FI:{cur_fi:.0f}, 전고돌파)",
-                    indicators=indicators,
-                )
-
-            if screen2_buy:
-                return StrategySignal(
-                    strategy_name=self.name,
-                    signal=SignalType.BUY,
-                    confidence=0.60,
-                    reason=f"Screen 1,2 통과 — 전고가({prev_high:.0f}) 돌파 대기",
-                    indicators=indicators,
-                )
-        else:
-            screen2_sell = cur_fi > 0
-            screen3_sell = cur_close < prev_low
-
-            if screen2_sell and screen3_sell:
-                return StrategySignal(
-                    strategy_name=self.name,
-                    signal=SignalType.STRONG_SELL,
-                    confidence=0.85,
-                    reason=f"Triple Screen 매도 완성 (주봉↓, FI:{cur_fi:.0f}, 전저이탈)",
-                    indicators=indicators,
-                )
-
-            if screen2_sell:
-                return StrategySignal(
-                    strategy_name=self.name,
-                    signal=SignalType.SELL,
-                    confidence=0.55,
-                    reason="Screen 1,2 매도 통과",
-                    indicators=indicators,
-                )
-
-        return StrategySignal(
-            strategy_name=self.name,
-            signal=SignalType.NEUTRAL,
-            confidence=0.3,
-            reason="Triple Screen 조건 미충족",
-            indicators=indicators,
+    def analyze_streaming(
+        self, df: pd.DataFrame, indicators: dict[str, StreamingIndicator]
+    ) -> StrategyResult:
+        macd = indicators["weekly_macd"]
+        tail = single_panel(df.iloc[-5:])  # Stochastic(5)·전일 고저가
+
+        def last(value) -> pd.DataFrame:
+            # 마지막 봉에만 값을 둔 1열 프레임 (_screens 는 마지막 행만 사용)
+            values = np.full(len(tail["Close"]), np.nan)
+            values[-1] = np.nan if value is None else value
+            return pd.DataFrame(values, index=tail["Close"].index, columns=["_"])
+
+        weekly = {
+            "hist": last(macd.value),
+            "prev_hist": last(macd.previous),
+            "weeks": last(macd.count),
+        }
+        frames = self._screens(tail, weekly, last(indicators["force_index_2"].value))
+        return self.signal_at(
+            pd.Series({key: frame.iloc[-1, 0] for key, frame in frames.items()})
         )
+
+    def buy_setup(self, panel: Panel) -> pd.DataFrame:
+        # 매수 측은 Force Index(2) < 0 필요 — 주봉 MACD(Screen 1) 계산 생략
+        raw_fi = panel["Close"].diff() * panel["Volume"]
+        return raw_fi.ewm(span=2, adjust=False).mean() < 0
@@ -1,8 +1,13 @@
 """앙상블 시그널 — 7개 전략 가중 합산"""
 from __future__ import annotations
 
+import logging
+from typing import Callable
+
+import numpy as np
 import pandas as pd
 
+import metrics
 from config import (
     ENSEMBLE_BUY_THRESHOLD,
     ENSEMBLE_SELL_THRESHOLD,
@@ -10,16 +15,21 @@ from config import (
     ENSEMBLE_STRONG_SELL_THRESHOLD,
     TARGETS,
 )
-from signals.models import EnsembleSignal, SignalType, StrategySignal
-from strategies.base import BaseStrategy
+from db.indicator_state import sync_indicator
+from db.signal_memo import load_signal_memo, save_signal_memo
+from signals.models import EnsembleResult, EnsembleSignal, SignalType, StrategyResult
+from strategies.base import BaseStrategy, frame_digest
 from strategies.bollinger import BollingerStrategy
 from strategies.elder import ElderStrategy
 from strategies.ichimoku import IchimokuStrategy
 from strategies.livermore import LivermoreStrategy
 from strategies.oneil import OneilStrategy
+from strategies.panel import Panel, PanelEnsemble, panel_tickers
 from strategies.weinstein import WeinsteinStrategy
 from strategies.williams import WilliamsStrategy
 
+logger = logging.getLogger(__name__)
+
 _STRATEGIES: list[BaseStrategy] = [
     IchimokuStrategy(),
     OneilStrategy(),
@@ -31,23 +41,63 @@ _STRATEGIES: list[BaseStrategy] = [
 ]
 
 
+def required_lookback_days(strategies: list[BaseStrategy] | None = None) -> int:
+    """전략들이 필요로 하는 최소 조회 기간 (달력일) — 가장 긴 lookback 기준"""
+    return max(s.lookback_days for s in (strategies or _STRATEGIES))
+
+
+def input_watermark(df: pd.DataFrame) -> tuple[str, str]:
+    """
+    (마지막 봉 날짜, 앙상블 입력 해시) — 가장 긴 lookback 꼬리 구간 + 전략 버전 기준.
+    같으면 evaluate_ensemble 결과도 같다 (스크리닝 결과 재사용 판단용).
+    """
+    bars = max(s.lookback_bars for s in _STRATEGIES)
+    window = df.iloc[-bars:] if len(df) > bars else df
+    versions = ",".join(f"{s.name}={s.version}" for s in _STRATEGIES)
+    return frame_digest(window, salt=versions)
+
+
 def generate_ensemble_signal(
     stock_code: str,
     df: pd.DataFrame,
     price: float,
     change_pct: float,
+    stock_name: str | None = None,
+    memo: bool = False,
+    streaming: bool = False,
 ) -> EnsembleSignal:
+    """evaluate_ensemble 결과를 알림·저장용 EnsembleSignal 로 변환"""
+    result = evaluate_ensemble(
+        stock_code, df, price, change_pct, stock_name, memo, streaming=streaming
+    )
+    return result.to_model()
+
+
+def evaluate_ensemble(
+    stock_code: str,
+    df: pd.DataFrame,
+    price: float,
+    change_pct: float,
+    stock_name: str | None = None,
+    memo: bool = False,
+    early_exit: bool = False,
+    streaming: bool = False,
+) -> EnsembleResult:
     """
-    1. 각 전략 시그널(-2 ~ +2) 수집
+    1. 각 전략 시그널(-2 ~ +2) 수집 — 전략별 lookback 꼬리 구간만 전달,
+       데이터가 부족한 전략은 실행하지 않고 NEUTRAL
     2. 가중 합산
     3. 컨센서스 필터 적용
-    4. 최종 EnsembleSignal 반환
-    """
-    strategy_signals: list[StrategySignal] = []
+    4. 최종 EnsembleResult 반환 (pydantic 검증 없음 — 대량 스캔용)
 
-    for strategy in _STRATEGIES:
-        sig = strategy._safe_analyze(df, stock_code)
-        strategy_signals.append(sig)
+    memo=True 이면 입력 구간이 직전 분석과 같은 전략은 저장된 시그널을 재사용한다.
+    streaming=True 이면 스트리밍 지표를 지원하는 전략은 저장된 지표 상태를
+    새 봉·장중 당일 봉만큼만 갱신해 평가한다 (장중 재스캔용 — 메모보다 우선).
+    early_exit=True 이면 남은 전략과 무관하게 BUY 계열이 아닌 결과로 확정되는 즉시
+    멈춘다 (스크리닝용). 평가하지 않은 전략은 "미평가" NEUTRAL 로 채운다.
+    현재가·등락률은 항상 새 값으로 채운다.
+    """
+    strategy_signals = _collect_signals(stock_code, df, memo, early_exit, streaming)
 
     # 가중 합산
     weighted_score = sum(
@@ -58,9 +108,10 @@ def generate_ensemble_signal(
     # 컨센서스 필터
     final_signal = _apply_consensus_filter(weighted_score, strategy_signals)
 
-    stock_name = TARGETS.get(stock_code, {}).get("name", stock_code)
+    if stock_name is None:
+        stock_name = TARGETS.get(stock_code, {}).get("name", stock_code)
 
-    return EnsembleSignal(
+    return EnsembleResult(
         stock_code=stock_code,
         stock_name=stock_name,
         signal=final_signal,
@@ -71,8 +122,174 @@ def generate_ensemble_signal(
     )
 
 
+def _collect_signals(
+    stock_code: str,
+    df: pd.DataFrame,
+    memo: bool,
+    early_exit: bool,
+    streaming: bool = False,
+) -> list[StrategyResult]:
+    """
+    _STRATEGIES 순서의 전략별 시그널
+    (memo: 저장값 재사용, early_exit: 확정 시 중단, streaming: 저장된 지표 갱신)
+    """
+    saved = load_signal_memo(stock_code) if memo else None
+    fresh = {}
+
+    def run(strategy: BaseStrategy) -> StrategyResult:
+        if streaming:
+            sig = _streaming_signal(strategy, df, stock_code)
+            if sig is not None:
+                return sig
+        if saved is None:
+            return strategy._safe_analyze(df, stock_code)
+        # 메모 키가 저장된 값과 같으면 재사용, 다르면 분석 후 저장
+        key = strategy.memo_key(df)
+        hit = saved.get(strategy.name)
+        if hit is not None and hit[0] == key:
+            metrics.cache_lookup("signal_memo", hit=True)
+            return hit[1]
+        metrics.cache_lookup("signal_memo", hit=False)
+        sig = strategy._safe_analyze(df, stock_code)
+        fresh[strategy.name] = (key, sig)
+        return sig
+
+    if early_exit:
+        evaluated = _evaluate_until_fixed(run)
+        signals = [
+            evaluated.get(s.name)
+            or StrategyResult(s.name, SignalType.NEUTRAL, 0.0, _NOT_EVALUATED)
+            for s in _STRATEGIES
+        ]
+    else:
+        signals = [run(strategy) for strategy in _STRATEGIES]
+
+    if fresh:
+        save_signal_memo(stock_code, fresh)
+    return signals
+
+
+def _streaming_signal(
+    strategy: BaseStrategy, df: pd.DataFrame, stock_code: str
+) -> StrategyResult | None:
+    """
+    저장된 스트리밍 지표를 마지막 봉까지 맞춰(봉 1개당 O(1)) 시그널 계산.
+    지원하지 않는 전략·데이터 부족·오류는 None → 꼬리 구간 전체 계산으로 대체
+    """
+    if strategy.data_shortfall(df) is not None:
+        return None
+    try:
+        inputs = strategy.streaming_inputs(df)
+        if not inputs:
+            return None
+        indicators = {
+            name: sync_indicator(stock_code, f"{strategy.name}/{name}", series, factory)
+            for name, (series, factory) in inputs.items()
+        }
+        return strategy.analyze_streaming(df, indicators)
+    except Exception as e:
+        logger.warning(
+            f"[ensemble] {stock_code} {strategy.name} 스트리밍 지표 실패: {e}"
+        )
+        return None
+
+
+# ── 조기 종료 ──────────────────────────────────────────────────────────────
+
+_NOT_EVALUATED = "미평가 (결과 확정 후 생략)"
+
+def _cost_per_swing(s: BaseStrategy) -> float:
+    low, high = s.signal_range
+    return s.cost / (s.weight * (high.value - low.value))
+
+
+# 가중치 × 시그널 폭 대비 비용이 낮은 전략부터 평가
+_EARLY_EXIT_ORDER: list[BaseStrategy] = sorted(_STRATEGIES, key=_cost_per_swing)
+
+# 평가 순서가 달라 생기는 부동소수점 합산 오차 여유
+_EPS = 1e-9
+
+
+def _evaluate_until_fixed(
+    run: Callable[[BaseStrategy], StrategyResult]
+) -> dict[str, StrategyResult]:
+    """
+    {전략명: 시그널} — 결과가 BUY 계열이 아닌 값으로 확정되면 나머지는 평가하지 않음
+    """
+    evaluated: dict[str, StrategyResult] = {}
+    score = 0.0
+    strong_buys = 0
+
+    for i, strategy in enumerate(_EARLY_EXIT_ORDER):
+        sig = run(strategy)
+        evaluated[strategy.name] = sig
+        score += sig.signal.value * strategy.weight
+        strong_buys += sig.signal == SignalType.STRONG_BUY
+
+        rest = _EARLY_EXIT_ORDER[i + 1:]
+        if not rest:
+            break
+        # 남은 전략이 낼 수 있는 시그널 범위로 최종 점수의 하한/상한 계산
+        lo = score + sum(s.signal_range[0].value * s.weight for s in rest) - _EPS
+        hi = score + sum(s.signal_range[1].value * s.weight for s in rest) + _EPS
+        more_strong_buys = sum(s.signal_range[1] == SignalType.STRONG_BUY for s in rest)
+        if _fixed_outcome(lo, hi, strong_buys, more_strong_buys) is not None:
+            break
+    return evaluated
+
+
+def _fixed_outcome(
+    lo: float, hi: float, strong_buys: int, more_strong_buys: int
+) -> SignalType | None:
+    """
+    최종 점수가 [lo, hi] 어디에 있어도 _apply_consensus_filter 결과가 같고
+    BUY 계열이 아니면 그 결과, 아니면 None.
+    (BUY 후보는 끝까지 평가해 순위용 점수를 정확히 유지)
+    """
+    if ENSEMBLE_SELL_THRESHOLD < lo and hi < ENSEMBLE_BUY_THRESHOLD:
+        return SignalType.NEUTRAL
+    if ENSEMBLE_STRONG_SELL_THRESHOLD < lo and hi <= ENSEMBLE_SELL_THRESHOLD:
+        return SignalType.SELL
+    if hi <= ENSEMBLE_STRONG_SELL_THRESHOLD:
+        # STRONG_BUY 2개 이상이면 관망 강등 — 남은 전략의 STRONG_BUY 가능성까지 고려
+        if strong_buys >= 2:
+            return SignalType.NEUTRAL
+        if strong_buys + more_strong_buys < 2:
+            return SignalType.STRONG_SELL
+    return None
+
+
+def generate_panel_ensemble(panel: Panel) -> PanelEnsemble:
+    """
+    패널(날짜 × 종목) 전체를 한 번에 평가 — 마지막 날짜 기준.
+
+    각 전략의 analyze_panel 결과를 (종목 × 전략) 행렬로 모아
+    가중 합산과 컨센서스 필터를 벡터로 적용한다.
+    """
+    results = [strategy.analyze_panel(panel) for strategy in _STRATEGIES]
+    signals = np.column_stack([r.signal for r in results]).astype(np.int8)
+    confidence = np.column_stack([r.confidence for r in results])
+    weights = np.array([s.weight for s in _STRATEGIES])
+
+    # 종목 단위 sum()과 같은 순서로 누적해 임계값 경계에서도 결과가 일치하도록 함
+    scores = np.zeros(len(signals))
+    for j, w in enumerate(weights):
+        scores = scores + signals[:, j] * w
+
+    return PanelEnsemble(
+        tickers=panel_tickers(panel),
+        strategy_names=[s.name for s in _STRATEGIES],
+        signals=signals,
+        confidence=confidence,
+        weights=weights,
+        scores=scores,
+        final=_apply_consensus_filter_array(scores, signals),
+        indicators=[r.indicators for r in results],
+    )
+
+
 def _apply_consensus_filter(
-    score: float, signals: list[StrategySignal]
+    score: float, signals: list[StrategyResult]
 ) -> SignalType:
     strong_buys = sum(1 for s in signals if s.signal == SignalType.STRONG_BUY)
     strong_sells = sum(1 for s in signals if s.signal == SignalType.STRONG_SELL)
@@ -95,3 +312,43 @@ def _apply_consensus_filter(
         return SignalType.SELL
 
     return SignalType.NEUTRAL
+
+
+def _apply_consensus_filter_array(
+    scores: np.ndarray,
+    signals: np.ndarray,
+    buy: float = ENSEMBLE_BUY_THRESHOLD,
+    strong_buy: float = ENSEMBLE_STRONG_BUY_THRESHOLD,
+    sell: float = ENSEMBLE_SELL_THRESHOLD,
+    strong_sell: float = ENSEMBLE_STRONG_SELL_THRESHOLD,
+) -> np.ndarray:
+    """
+    _apply_consensus_filter 의 벡터 버전.
+
+    Args:
+        scores: 가중 점수 (..., )
+        signals: 전략별 시그널 값 (..., 전략)
+        buy ~ strong_sell: 임계값 (기본값은 config, 파라미터 스윕에서 교체)
+    """
+    strong_buys = (signals == SignalType.STRONG_BUY.value).sum(axis=-1)
+    strong_sells = (signals == SignalType.STRONG_SELL.value).sum(axis=-1)
+
+    return np.select(
+        [
+            (scores >= strong_buy) & (strong_sells >= 2),
+            scores >= strong_buy,
+            scores >= buy,
+            (scores <= strong_sell) & (strong_buys >= 2),
+            scores <= strong_sell,
+            scores <= sell,
+        ],
+        [
+            SignalType.NEUTRAL.value,
+            SignalType.STRONG_BUY.value,
+            SignalType.BUY.value,
+            SignalType.NEUTRAL.value,
+            SignalType.STRONG_SELL.value,
+            SignalType.SELL.value,
+        ],
+        default=SignalType.NEUTRAL.value,
+    ).astype(np.int8)
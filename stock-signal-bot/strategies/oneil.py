@@ -2,13 +2,20 @@
 from __future__ import annotations
 
 import pandas as pd
-from ta.momentum import RSIIndicator
 
-from signals.models import SignalType, StrategySignal
+from signals.models import SignalType
 from strategies.base import BaseStrategy
+from strategies.panel import Panel, classify, rounded, row_number, rsi
 
 
 class OneilStrategy(BaseStrategy):
+    panel_indicators = ("canslim_score", "52w_high", "vol_ratio_50d", "rsi_14")
+    lookback = 252  # 52주 고점
+    min_bars = 62
+    cost = 6.5
+    signal_range = (SignalType.SELL, SignalType.STRONG_BUY)
+    required_columns = ("Close", "Volume")
+
     @property
     def name(self) -> str:
         return "CAN SLIM"
@@ -17,95 +24,104 @@ class OneilStrategy(BaseStrategy):
     def weight(self) -> float:
         return 0.18
 
-    def analyze(self, df: pd.DataFrame, stock_code: str) -> StrategySignal:
-        close = df["Close"]
-        volume = df["Volume"]
-
-        score = 0
-        details: list[str] = []
-
-        # N — New High: 52주 고점 5% 이내 또는 돌파 (15점)
-        high_52w = close.rolling(252).max().iloc[-1]
-        cur_close = close.iloc[-1]
-        if high_52w and cur_close >= high_52w * 0.95:
-            score += 15
-            details.append("N:52주 고점 근접")
-
-        # S — Supply/Demand: 50일 평균 거래량 대비 1.5배 이상 (10점)
-        vol_ratio_50d = volume.iloc[-1] / volume.rolling(50).mean().iloc[-1]
-        if vol_ratio_50d >= 1.5:
-            score += 10
-            details.append(f"S:거래량 {vol_ratio_50d:.1f}배")
-
-        # L — Leader: 60일 수익률 양호 (15점)
-        ret_60d = (cur_close / close.iloc[-61] - 1) if len(close) >= 62 else 0
-        if ret_60d > 0.05:
-            score += 15
-            details.append(f"L:60일 수익률 {ret_60d*100:.1f}%")
-
-        # M — Market Direction: 200일 MA 위 (15점)
-        ma200 = close.rolling(200).mean().iloc[-1]
-        if ma200 and cur_close > ma200:
-            score += 15
-            details.append("M:200일 MA 위")
-
-        # I — Institutional: 외국인/기관 순매수 (15점)
-        if "ForeignNetBuy" in df.columns:
-            foreign_5d = df["ForeignNetBuy"].iloc[-5:]
-            if (foreign_5d > 0).all():
-                score += 15
-                details.append("I:외국인 5일 연속 순매수")
-
-        if "InstitutionNetBuy" in df.columns:
-            inst_5d = df["InstitutionNetBuy"].iloc[-5:]
-            if (inst_5d > 0).all():
-                score += 5
-                details.append("I:기관 5일 연속 순매수")
-
-        # C, A 대체: RSI 모멘텀 보정
-        rsi = RSIIndicator(close=close, window=14).rsi().iloc[-1]
-        if rsi > 60:
-            score += 10
-            details.append(f"모멘텀 보정(RSI:{rsi:.1f})")
-
-        indicators = {
-            "canslim_score": score,
-            "52w_high": round(high_52w, 0) if high_52w else None,
-            "vol_ratio_50d": round(vol_ratio_50d, 2),
-            "rsi_14": round(rsi, 1),
+    def _reason(self, case: int, row: pd.Series) -> str:
+        score = int(row["canslim_score"])
+        if case == 0:
+            return f"CAN SLIM {score}점 ({', '.join(_details(row))})"
+        if case == 2:
+            return f"CAN SLIM {score}점 — 조건 미달"
+        return f"CAN SLIM {score}점"
+
+    def _indicators(self, case: int, row: pd.Series) -> dict:
+        high_52w = row["52w_high"]
+        return {
+            "canslim_score": int(row["canslim_score"]),
+            "52w_high": rounded(high_52w, 0) if high_52w else None,
+            "vol_ratio_50d": rounded(row["vol_ratio_50d"], 2),
+            "rsi_14": rounded(row["rsi_14"], 1),
         }
 
-        if score >= 70:
-            return StrategySignal(
-                strategy_name=self.name,
-                signal=SignalType.STRONG_BUY,
-                confidence=min(score / 100, 0.9),
-                reason=f"CAN SLIM {score}점 ({', '.join(details)})",
-                indicators=indicators,
-            )
-
-        if score >= 50:
-            return StrategySignal(
-                strategy_name=self.name,
-                signal=SignalType.BUY,
-                confidence=score / 100,
-                reason=f"CAN SLIM {score}점",
-                indicators=indicators,
-            )
-
-        if score <= 30:
-            return StrategySignal(
-                strategy_name=self.name,
-                signal=SignalType.SELL,
-                confidence=0.6,
-                reason=f"CAN SLIM {score}점 — 조건 미달",
-                indicators=indicators,
-            )
-
-        return StrategySignal(
-            strategy_name=self.name,
-            signal=SignalType.NEUTRAL,
-            confidence=0.4,
-            reason=f"CAN SLIM {score}점",
-            indicators=indicators,
+    def evaluate_panel(self, panel: Panel) -> dict[str, pd.DataFrame]:
+        close = panel["Close"]
+        volume = panel["Volume"]
+
+        high_52w = close.rolling(252).max()
+        vol_ratio_50d = volume / volume.rolling(50).mean()
+        # 종목 단위 분석과 동일하게 62일 미만 구간은 수익률 0
+        ret_60d = (close / close.shift(60) - 1).where(row_number(close) >= 61, 0.0)
+        ma200 = close.rolling(200).mean()
+        rsi_14 = rsi(close, 14)
+
+        # N(52주 고점 5% 이내) S(50일 거래량 1.5배) L(60일 수익률)
+        # M(200일 MA 위) I(외국인/기관 5일 연속 순매수), C·A 대체: RSI 모멘텀
+        flags = {
+            "n_ok": close >= high_52w * 0.95,
+            "s_ok": vol_ratio_50d >= 1.5,
+            "l_ok": ret_60d > 0.05,
+            "m_ok": close > ma200,
+            "f_ok": _net_buy_streak(panel, "ForeignNetBuy", close),
+            "i_ok": _net_buy_streak(panel, "InstitutionNetBuy", close),
+            "r_ok": rsi_14 > 60,
+        }
+        points = {"n_ok": 15, "s_ok": 10, "l_ok": 15, "m_ok": 15,
+                  "f_ok": 15, "i_ok": 5, "r_ok": 10}
+        score = sum(flags[k].astype(int) * pts for k, pts in points.items())
+
+        frames = classify(
+            [
+                (score >= 70, SignalType.STRONG_BUY, (score / 100).clip(upper=0.9)),
+                (score >= 50, SignalType.BUY, score / 100),
+                (score <= 30, SignalType.SELL, 0.6),
+            ],
+            default=(SignalType.NEUTRAL, 0.4),
+            like=close,
+        )
+        frames.update(flags)
+        frames.update({
+            "canslim_score": score,
+            "52w_high": high_52w,
+            "vol_ratio_50d": vol_ratio_50d,
+            "ret_60d": ret_60d,
+            "rsi_14": rsi_14,
+        })
+        return frames
+
+    def buy_setup(self, panel: Panel) -> pd.DataFrame:
+        close, volume = panel["Close"], panel["Volume"]
+        ret_60d = (close / close.shift(60) - 1).where(row_number(close) >= 61, 0.0)
+        # N·S·L·M 점수만 계산 — 수급(F·I)·RSI 최대 30점을 더해도 50점 미만이면 BUY 불가
+        partial = (
+            (close >= close.rolling(252).max() * 0.95).astype(int) * 15
+            + (volume / volume.rolling(50).mean() >= 1.5).astype(int) * 10
+            + (ret_60d > 0.05).astype(int) * 15
+            + (close > close.rolling(200).mean()).astype(int) * 15
         )
+        return partial + 30 >= 50
+
+
+def _details(row: pd.Series) -> list[str]:
+    """충족된 CAN SLIM 항목 설명"""
+    details = []
+    if row["n_ok"]:
+        details.append("N:52주 고점 근접")
+    if row["s_ok"]:
+        details.append(f"S:거래량 {row['vol_ratio_50d']:.1f}배")
+    if row["l_ok"]:
+        details.append(f"L:60일 수익률 {row['ret_60d']*100:.1f}%")
+    if row["m_ok"]:
+        details.append("M:200일 MA 위")
+    if row["f_ok"]:
+        details.append("I:외국인 5일 연속 순매수")
+    if row["i_ok"]:
+        details.append("I:기관 5일 연속 순매수")
+    if row["r_ok"]:
+        details.append(f"모멘텀 보정(RSI:{row['rsi_14']:.1f})")
+    return details
+
+
+def _net_buy_streak(panel: Panel, field: str, like: pd.DataFrame) -> pd.DataFrame:
+    """최근 5일 연속 순매수 여부 (컬럼이 없으면 전부 False)"""
+    if field not in panel:
+        return pd.DataFrame(False, index=like.index, columns=like.columns)
+    positive = (panel[field] > 0).astype(float)
+    return positive.rolling(5, min_periods=1).min() == 1
@@ -0,0 +1,209 @@
+"""패널(날짜 × 종목) 벡터 연산 — 전 종목 전략 평가를 한 번에 수행
+
+Panel 은 필드명(Open, High, Low, Close, Volume, ForeignNetBuy,
+InstitutionNetBuy) → (날짜 × 종목) DataFrame 매핑이다.
+지표 계산식은 ta 라이브러리와 동일하게 맞춘다.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+import numpy as np
+import pandas as pd
+from signals.models import SignalType
+
+Panel = dict[str, pd.DataFrame]
+
+OHLCV_FIELDS = ("Open", "High", "Low", "Close", "Volume")
+FLOW_FIELDS = ("ForeignNetBuy", "InstitutionNetBuy")
+
+
+@dataclass
+class PanelResult:
+    """전략 1개의 마지막 날짜 기준 전 종목 결과"""
+    tickers: list[str]
+    signal: np.ndarray                 # (종목,) int8, -2 ~ +2
+    confidence: np.ndarray             # (종목,) float
+    indicators: dict[str, np.ndarray] = field(default_factory=dict)
+
+
+@dataclass
+class PanelEnsemble:
+    """앙상블 결과 — (종목 × 전략) 행렬"""
+    tickers: list[str]
+    strategy_names: list[str]
+    signals: np.ndarray                # (종목, 전략) int8
+    confidence: np.ndarray             # (종목, 전략) float
+    weights: np.ndarray                # (전략,)
+    scores: np.ndarray                 # (종목,) 가중 합산
+    final: np.ndarray                  # (종목,) 컨센서스 필터 후 시그널
+    indicators: list[dict[str, np.ndarray]] = field(default_factory=list)
+
+    def signal_of(self, stock_code: str) -> SignalType:
+        return SignalType(int(self.final[self.tickers.index(stock_code)]))
+
+
+# ── 패널 구성 ──────────────────────────────────────────────────────────────
+
+def panel_from_frames(frames: dict[str, pd.DataFrame]) -> Panel:
+    """{종목코드: 종목별 OHLCV DataFrame} → Panel (날짜 합집합 기준 정렬)"""
+    frames = {code: df for code, df in frames.items() if not df.empty}
+    if not frames:
+        return {}
+
+    fields = [f for f in OHLCV_FIELDS + FLOW_FIELDS
+              if any(f in df.columns for df in frames.values())]
+    panel: Panel = {}
+    for f in fields:
+        cols = {
+            code: pd.to_numeric(df[f], errors="coerce") if f in df.columns
+            else pd.Series(np.nan, index=df.index)
+            for code, df in frames.items()
+        }
+        panel[f] = pd.concat(cols, axis=1).sort_index().astype(float)
+    return panel
+
+
+def single_panel(df: pd.DataFrame, column: str = "_") -> Panel:
+    """종목 1개 DataFrame → 1열짜리 Panel"""
+    return {
+        f: pd.to_numeric(df[f], errors="coerce").astype(float).to_frame(column)
+        for f in OHLCV_FIELDS + FLOW_FIELDS
+        if f in df.columns
+    }
+
+
+def panel_tickers(panel: Panel) -> list[str]:
+    return [str(c) for c in panel["Close"].columns]
+
+
+def ticker_frame(panel: Panel, i: int) -> pd.DataFrame:
+    """i번째 종목의 종목 단위 DataFrame (종가가 없는 날짜 제외) — single_panel 의 역"""
+    df = pd.DataFrame({f: frame.iloc[:, i] for f, frame in panel.items()})
+    return df[df["Close"].notna()]
+
+
+def aligned_groups(panel: Panel) -> list[tuple[np.ndarray, Panel]]:
+    """
+    종가가 있는 날짜 패턴이 같은 종목끼리 묶은 (열 번호, 그 날짜만 남긴 Panel).
+
+    날짜 합집합 패널에서는 거래정지·신규상장 종목의 빈 날짜가 rolling 창을
+    NaN 으로 만들지만, 종목 단위 경로(get_ohlcv / ticker_frame)는 그 행을 빼고
+    계산한다. 묶음마다 빈 날짜를 뺀 패널로 평가하면 두 경로의 입력이 같아진다.
+    결측이 없으면 원본 패널 하나만 반환하고, 종가가 전혀 없는 종목은 제외한다.
+    """
+    valid = panel["Close"].notna().to_numpy()
+    if valid.all():
+        return [(np.arange(valid.shape[1]), panel)]
+    groups: dict[bytes, list[int]] = {}
+    for j in range(valid.shape[1]):
+        if valid[:, j].any():
+            groups.setdefault(valid[:, j].tobytes(), []).append(j)
+    result = []
+    for cols in groups.values():
+        rows = valid[:, cols[0]]
+        result.append((
+            np.array(cols),
+            {f: frame.iloc[rows, cols] for f, frame in panel.items()},
+        ))
+    return result
+
+
+def tail_panel(panel: Panel, bars: int) -> Panel:
+    """마지막 bars 개 날짜만 남긴 Panel (iloc 슬라이스 — 복사 없음, 0 → 그대로)"""
+    if not bars or len(panel["Close"]) <= bars:
+        return panel
+    return {f: frame.iloc[-bars:] for f, frame in panel.items()}
+
+
+# ── 시그널 분기 ────────────────────────────────────────────────────────────
+
+def classify(
+    branches: list[tuple[pd.DataFrame, SignalType, float | pd.DataFrame]],
+    default: tuple[SignalType, float],
+    like: pd.DataFrame,
+) -> dict[str, pd.DataFrame]:
+    """
+    if/elif 체인을 벡터화. 앞선 분기가 우선한다.
+
+    Returns:
+        signal(int), confidence(float), case(분기 번호, 기본값=len(branches))
+    """
+    shape = like.shape
+    conds = [np.asarray(cond, dtype=bool) for cond, _, _ in branches]
+    signals = [np.full(shape, sig.value, dtype=np.int8) for _, sig, _ in branches]
+    confs = [
+        np.broadcast_to(np.asarray(conf, dtype=float), shape)
+        for _, _, conf in branches
+    ]
+    cases = [np.full(shape, i, dtype=np.int8) for i in range(len(branches))]
+
+    def frame(values: np.ndarray) -> pd.DataFrame:
+        return pd.DataFrame(values, index=like.index, columns=like.columns)
+
+    signal = np.select(conds, signals, default=np.int8(default[0].value))
+    confidence = np.select(conds, confs, default=default[1])
+    case = np.select(conds, cases, default=np.int8(len(branches)))
+    return {
+        "signal": frame(signal.astype(np.int8)),
+        "confidence": frame(confidence.astype(float)),
+        "case": frame(case.astype(np.int8)),
+    }
+
+
+def row_number(like: pd.DataFrame) -> pd.DataFrame:
+    """행 번호(0부터) 프레임 — len(df) 조건 벡터화용"""
+    rows = np.arange(len(like), dtype=float)[:, None]
+    return pd.DataFrame(
+        np.broadcast_to(rows, like.shape), index=like.index, columns=like.columns
+    )
+
+
+# ── 지표 (ta 와 동일 수식) ─────────────────────────────────────────────────
+
+def rsi(close: pd.DataFrame, window: int = 14) -> pd.DataFrame:
+    diff = close.diff(1)
+    up = diff.where(diff > 0, 0.0)
+    down = -diff.where(diff < 0, 0.0)
+    emaup = up.ewm(alpha=1 / window, min_periods=window, adjust=False).mean()
+    emadn = down.ewm(alpha=1 / window, min_periods=window, adjust=False).mean()
+    values = np.where(emadn == 0, 100, 100 - (100 / (1 + emaup / emadn)))
+    return pd.DataFrame(values, index=close.index, columns=close.columns)
+
+
+def williams_r(
+    high: pd.DataFrame, low: pd.DataFrame, close: pd.DataFrame, lbp: int = 14
+) -> pd.DataFrame:
+    highest_high = high.rolling(lbp, min_periods=lbp).max()
+    lowest_low = low.rolling(lbp, min_periods=lbp).min()
+    return -100 * (highest_high - close) / (highest_high - lowest_low)
+
+
+def stochastic_k(
+    high: pd.DataFrame, low: pd.DataFrame, close: pd.DataFrame, window: int = 5
+) -> pd.DataFrame:
+    smin = low.rolling(window, min_periods=window).min()
+    smax = high.rolling(window, min_periods=window).max()
+    return 100 * (close - smin) / (smax - smin)
+
+
+def bollinger(
+    close: pd.DataFrame, window: int = 20, window_dev: float = 2
+) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    """(upper, lower, mid)"""
+    mavg = close.rolling(window, min_periods=window).mean()
+    mstd = close.rolling(window, min_periods=window).std(ddof=0)
+    return mavg + window_dev * mstd, mavg - window_dev * mstd, mavg
+
+
+def consecutive_true(cond: pd.DataFrame, cap: int) -> pd.DataFrame:
+    """조건이 연속으로 참인 일수 (최대 cap)"""
+    ones = cond.astype(int)
+    total = ones.cumsum()
+    reset = total.where(~cond).ffill().fillna(0)
+    return (total - reset).clip(upper=cap).astype(int)
+
+
+def rounded(value, ndigits: int) -> float:
+    """numpy 스칼라 → 반올림된 파이썬 float (indicators 직렬화용)"""
+    return round(float(value), ndigits)
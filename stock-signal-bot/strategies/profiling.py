@@ -0,0 +1,283 @@
+"""전략 호출 프로파일링 — _safe_analyze 단위 시간·실패·입력 크기 집계
+
+profile_scan() 블록 안에서만 수집하고, 블록 밖(비활성)에서는
+_safe_analyze 가 active_profiler() 한 번만 확인하고 지나간다.
+
+    with profile_scan("signal_scan") as profiler:
+        run_signal_scan()
+    profiler.to_frame()
+
+활성 프로파일러는 ContextVar 로 잡아 두므로, 동시에 도는 잡(스레드)마다
+자기 프로파일러에만 기록된다. 작업 스레드로 넘길 때는
+contextvars.copy_context().run 으로 컨텍스트를 함께 넘겨야 하며,
+프로세스 풀(screen_with_processes) 안의 호출은 집계되지 않는다.
+"""
+from __future__ import annotations
+
+import bisect
+import contextvars
+import json
+import logging
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from functools import wraps
+from pathlib import Path
+from typing import Callable, Generator, TypeVar
+
+import pandas as pd
+from config import PROFILE_DIR, PROFILE_STRATEGIES, PROFILE_TRACEMALLOC
+
+logger = logging.getLogger(__name__)
+
+F = TypeVar("F", bound=Callable)
+
+# tracemalloc 은 프로세스 전역 — 피크 초기화·추적 시작/종료를 잡 사이에서 조율
+_TRACE_LOCK = threading.Lock()
+_trace = {"inflight": 0, "starts": 0, "users": 0, "owned": False}
+
+# 히스토그램 버킷 상한 (ms) — 마지막 버킷은 +Inf
+BUCKETS_MS: tuple[float, ...] = (0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000)
+
+
+@dataclass
+class Histogram:
+    """고정 버킷 히스토그램 (버킷별 개수, 누적 아님)"""
+    counts: list[int] = field(default_factory=lambda: [0] * (len(BUCKETS_MS) + 1))
+    total: float = 0.0
+
+    def observe(self, ms: float) -> None:
+        self.counts[bisect.bisect_left(BUCKETS_MS, ms)] += 1
+        self.total += ms
+
+    def to_dict(self) -> dict:
+        labels = [str(b) for b in BUCKETS_MS] + ["+Inf"]
+        return {
+            "buckets": dict(zip(labels, self.counts)),
+            "total_ms": round(self.total, 3),
+        }
+
+
+@dataclass
+class StrategyStats:
+    calls: int = 0
+    skipped: int = 0                       # 데이터 부족으로 실행하지 않음
+    rows: int = 0                          # 입력 봉 수 합계
+    max_rows: int = 0
+    wall: Histogram = field(default_factory=Histogram)
+    cpu: Histogram = field(default_factory=Histogram)
+    alloc_peak_bytes: int = 0              # tracemalloc 사용 시 호출당 최대 피크 증가량
+    alloc_total_bytes: int = 0
+    alloc_overlapped: int = 0              # 다른 호출과 겹쳐 할당량을 재지 못한 호출 수
+    failures: dict[str, int] = field(default_factory=dict)  # 예외 타입 → 횟수
+
+    def to_dict(self) -> dict:
+        return {
+            "calls": self.calls,
+            "skipped": self.skipped,
+            "failures": dict(self.failures),
+            "rows": self.rows,
+            "max_rows": self.max_rows,
+            "wall": self.wall.to_dict(),
+            "cpu": self.cpu.to_dict(),
+            "alloc_peak_bytes": self.alloc_peak_bytes,
+            "alloc_total_bytes": self.alloc_total_bytes,
+            "alloc_overlapped": self.alloc_overlapped,
+        }
+
+
+class StrategyProfiler:
+    """스캔 1회 동안의 전략별 집계 (스크리닝 스레드에서 동시에 호출됨)"""
+
+    def __init__(self, scan: str, allocations: bool = False) -> None:
+        self.scan = scan
+        self.allocations = allocations
+        self.started_at = datetime.now()
+        self.elapsed = 0.0
+        self.stats: dict[str, StrategyStats] = {}
+        self._lock = threading.Lock()
+
+    def _stats(self, strategy: str) -> StrategyStats:
+        stats = self.stats.get(strategy)
+        if stats is None:
+            stats = self.stats[strategy] = StrategyStats()
+        return stats
+
+    def start(self) -> tuple[float, float, int, int]:
+        """
+        호출 직전 측정 시작값 (wall, 스레드 CPU, tracemalloc 바이트, 측정 번호).
+        피크는 전역이라 진행 중인 다른 측정이 없을 때만 초기화하고
+        번호를 받는다 (-1 = 할당량 측정 안 함).
+        """
+        mem, token = 0, -1
+        if self.allocations:
+            with _TRACE_LOCK:
+                _trace["starts"] += 1
+                if _trace["inflight"] == 0:
+                    tracemalloc.reset_peak()
+                    mem = tracemalloc.get_traced_memory()[0]
+                    token = _trace["starts"]
+                _trace["inflight"] += 1
+        return time.perf_counter(), time.thread_time(), mem, token
+
+    def record(
+        self,
+        strategy: str,
+        started: tuple[float, float, int, int],
+        rows: int,
+        error: BaseException | None = None,
+    ) -> None:
+        wall_ms = (time.perf_counter() - started[0]) * 1000
+        cpu_ms = (time.thread_time() - started[1]) * 1000
+        alloc, overlapped = 0, False
+        if self.allocations:
+            with _TRACE_LOCK:
+                _trace["inflight"] -= 1
+                # 측정 도중 다른 호출이 시작됐으면 피크에 그 할당이 섞인다 — 버림
+                overlapped = started[3] != _trace["starts"]
+                if not overlapped:
+                    alloc = max(tracemalloc.get_traced_memory()[1] - started[2], 0)
+
+        with self._lock:
+            stats = self._stats(strategy)
+            stats.calls += 1
+            stats.rows += rows
+            stats.max_rows = max(stats.max_rows, rows)
+            stats.wall.observe(wall_ms)
+            stats.cpu.observe(cpu_ms)
+            stats.alloc_total_bytes += alloc
+            stats.alloc_peak_bytes = max(stats.alloc_peak_bytes, alloc)
+            stats.alloc_overlapped += overlapped
+            if error is not None:
+                name = type(error).__name__
+                stats.failures[name] = stats.failures.get(name, 0) + 1
+
+    def skip(self, strategy: str) -> None:
+        with self._lock:
+            self._stats(strategy).skipped += 1
+
+    def to_dict(self) -> dict:
+        return {
+            "scan": self.scan,
+            "started_at": self.started_at.isoformat(timespec="seconds"),
+            "elapsed_s": round(self.elapsed, 3),
+            "strategies": {name: s.to_dict() for name, s in self.stats.items()},
+        }
+
+    def to_frame(self) -> pd.DataFrame:
+        """전략별 요약 — 총 wall 시간 내림차순"""
+        rows = [
+            {
+                "strategy": name,
+                "calls": s.calls,
+                "skipped": s.skipped,
+                "failures": sum(s.failures.values()),
+                "wall_ms": s.wall.total,
+                "cpu_ms": s.cpu.total,
+                "mean_wall_ms": s.wall.total / s.calls if s.calls else 0.0,
+                "mean_rows": s.rows / s.calls if s.calls else 0.0,
+                "alloc_peak_bytes": s.alloc_peak_bytes,
+            }
+            for name, s in self.stats.items()
+        ]
+        if not rows:
+            return pd.DataFrame()
+        table = pd.DataFrame(rows).set_index("strategy")
+        return table.sort_values("wall_ms", ascending=False)
+
+    def export_json(self, directory: str | Path) -> Path:
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        path = directory / f"{self.scan}_{self.started_at:%Y%m%d_%H%M%S}.json"
+        path.write_text(json.dumps(self.to_dict(), ensure_ascii=False, indent=2))
+        return path
+
+
+_ACTIVE: contextvars.ContextVar[StrategyProfiler | None] = contextvars.ContextVar(
+    "strategy_profiler", default=None
+)
+
+
+def active_profiler() -> StrategyProfiler | None:
+    """현재 컨텍스트(잡)의 프로파일러"""
+    return _ACTIVE.get()
+
+
+def _acquire_tracing() -> None:
+    with _TRACE_LOCK:
+        if _trace["users"] == 0 and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            _trace["owned"] = True
+        _trace["users"] += 1
+
+
+def _release_tracing() -> None:
+    # 마지막 사용자가 빠질 때, 직접 시작한 추적만 멈춘다
+    with _TRACE_LOCK:
+        _trace["users"] -= 1
+        if _trace["users"] == 0 and _trace["owned"]:
+            tracemalloc.stop()
+            _trace["owned"] = False
+
+
+@contextmanager
+def profile_scan(
+    scan: str,
+    enabled: bool = True,
+    allocations: bool = False,
+    export_dir: str | None = None,
+) -> Generator[StrategyProfiler | None, None, None]:
+    """
+    블록 안의 모든 전략 호출을 집계. enabled=False 면 아무것도 하지 않고 None.
+    종료 시 전략별 요약을 로그로 남기고, export_dir 가 있으면 JSON 저장.
+    같은 컨텍스트에서 중첩되면 바깥 프로파일러를 그대로 사용한다.
+    """
+    outer = _ACTIVE.get()
+    if not enabled or outer is not None:
+        yield outer if enabled else None
+        return
+
+    profiler = StrategyProfiler(scan, allocations=allocations)
+    if allocations:
+        _acquire_tracing()
+    started = time.perf_counter()
+    token = _ACTIVE.set(profiler)
+    try:
+        yield profiler
+    finally:
+        _ACTIVE.reset(token)
+        profiler.elapsed = time.perf_counter() - started
+        if allocations:
+            _release_tracing()
+        _log_summary(profiler)
+        if export_dir:
+            logger.info(f"[profiling] 저장: {profiler.export_json(export_dir)}")
+
+
+def profiled(scan: str) -> Callable[[F], F]:
+    """함수 호출 전체를 profile_scan 으로 감싸는 데코레이터 (config.PROFILE_* 적용)"""
+    def decorator(func: F) -> F:
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with profile_scan(
+                scan,
+                enabled=PROFILE_STRATEGIES,
+                allocations=PROFILE_TRACEMALLOC,
+                export_dir=PROFILE_DIR or None,
+            ):
+                return func(*args, **kwargs)
+        return wrapper  # type: ignore[return-value]
+    return decorator
+
+
+def _log_summary(profiler: StrategyProfiler) -> None:
+    for name, s in sorted(profiler.stats.items(), key=lambda kv: -kv[1].wall.total):
+        failures = sum(s.failures.values())
+        logger.info(
+            f"[profiling] {profiler.scan} {name}: {s.calls}회 "
+            f"wall {s.wall.total:.0f}ms cpu {s.cpu.total:.0f}ms "
+            f"건너뜀 {s.skipped} 실패 {failures}"
+        )
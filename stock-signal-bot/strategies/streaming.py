@@ -0,0 +1,414 @@
+"""스트리밍 지표 — 새 봉 1개당 O(1) 갱신되는 상태형 지표
+
+전체 윈도우를 매번 다시 계산하는 대신, 직전 상태에 봉 하나만 반영한다.
+
+- update(x): 새 봉 추가
+- revise(x): 마지막 봉(장중 진행 중인 당일 봉) 값 교체
+- to_state() / indicator_from_state(): JSON 직렬화 (스캔 간 상태 유지)
+
+계산식은 ta / pandas 와 동일하다 (ewm(adjust=False), min_periods=window).
+"""
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Optional
+
+
+class StreamingIndicator(ABC):
+    """모든 스트리밍 지표의 공통 인터페이스"""
+
+    kind: str = ""
+
+    @abstractmethod
+    def update(self, x: float) -> Optional[float]:
+        """새 봉 추가 후 현재 값 반환 (워밍업 중이면 None)"""
+
+    @abstractmethod
+    def revise(self, x: float) -> Optional[float]:
+        """마지막 봉 값을 교체 후 현재 값 반환"""
+
+    @property
+    @abstractmethod
+    def value(self) -> Optional[float]:
+        """현재 값 (워밍업 중이면 None)"""
+
+    @abstractmethod
+    def to_state(self) -> dict:
+        """JSON 직렬화 가능한 상태 dict"""
+
+    @classmethod
+    @abstractmethod
+    def from_state(cls, state: dict) -> "StreamingIndicator":
+        """to_state() 결과로부터 복원"""
+
+
+class EMA(StreamingIndicator):
+    """지수이동평균 — pandas ewm(adjust=False) 와 동일"""
+
+    kind = "ema"
+
+    def __init__(
+        self,
+        span: int | None = None,
+        alpha: float | None = None,
+        min_periods: int = 0,
+    ) -> None:
+        if alpha is None:
+            if span is None:
+                raise ValueError("span 또는 alpha 중 하나는 필요")
+            alpha = 2.0 / (span + 1.0)
+        self.alpha = alpha
+        self.min_periods = min_periods
+        self.count = 0
+        self._ema: float | None = None
+        self._base: float | None = None  # 마지막 봉 반영 전 값 (revise용)
+
+    def update(self, x: float) -> Optional[float]:
+        self._base = self._ema
+        self.count += 1
+        self._ema = self._step(self._base, x)
+        return self.value
+
+    def revise(self, x: float) -> Optional[float]:
+        if self.count == 0:
+            return self.update(x)
+        self._ema = self._step(self._base, x)
+        return self.value
+
+    def _step(self, base: float | None, x: float) -> float:
+        if base is None:
+            return float(x)
+        return (1.0 - self.alpha) * base + self.alpha * x
+
+    @property
+    def raw(self) -> Optional[float]:
+        """min_periods 와 무관한 내부 EMA 값"""
+        return self._ema
+
+    @property
+    def value(self) -> Optional[float]:
+        if self.count < max(self.min_periods, 1):
+            return None
+        return self._ema
+
+    @property
+    def previous(self) -> Optional[float]:
+        """마지막 봉 반영 전 값 (워밍업 중이었으면 None)"""
+        if self.count - 1 < max(self.min_periods, 1):
+            return None
+        return self._base
+
+    def to_state(self) -> dict:
+        return {
+            "kind": self.kind,
+            "alpha": self.alpha,
+            "min_periods": self.min_periods,
+            "count": self.count,
+            "ema": self._ema,
+            "base": self._base,
+        }
+
+    @classmethod
+    def from_state(cls, state: dict) -> "EMA":
+        obj = cls(alpha=state["alpha"], min_periods=state["min_periods"])
+        obj.count = state["count"]
+        obj._ema = state["ema"]
+        obj._base = state["base"]
+        return obj
+
+
+class RollingSum(StreamingIndicator):
+    """고정 윈도우 합계 (mean 속성으로 이동평균)"""
+
+    kind = "rolling_sum"
+
+    def __init__(self, window: int) -> None:
+        self.window = window
+        self._buf: deque[float] = deque()
+        self._sum = 0.0
+        self._since_resync = 0
+
+    def update(self, x: float) -> Optional[float]:
+        x = float(x)
+        self._buf.append(x)
+        self._sum += x
+        if len(self._buf) > self.window:
+            self._sum -= self._buf.popleft()
+        # 부동소수점 누적오차 방지 — window 봉마다 한 번 재합산 (분할상환 O(1))
+        self._since_resync += 1
+        if self._since_resync >= self.window:
+            self._sum = sum(self._buf)
+            self._since_resync = 0
+        return self.value
+
+    def revise(self, x: float) -> Optional[float]:
+        if not self._buf:
+            return self.update(x)
+        x = float(x)
+        self._sum += x - self._buf[-1]
+        self._buf[-1] = x
+        return self.value
+
+    @property
+    def value(self) -> Optional[float]:
+        if len(self._buf) < self.window:
+            return None
+        return self._sum
+
+    @property
+    def mean(self) -> Optional[float]:
+        total = self.value
+        return None if total is None else total / self.window
+
+    def to_state(self) -> dict:
+        return {"kind": self.kind, "window": self.window, "buf": list(self._buf)}
+
+    @classmethod
+    def from_state(cls, state: dict) -> "RollingSum":
+        obj = cls(state["window"])
+        obj._buf = deque(state["buf"])
+        obj._sum = sum(obj._buf)
+        return obj
+
+
+class RollingMax(StreamingIndicator):
+    """단조 deque 기반 롤링 최고값 — update 분할상환 O(1)"""
+
+    kind = "rolling_max"
+
+    def __init__(self, window: int) -> None:
+        self.window = window
+        self.count = 0
+        self._dq: deque[tuple[int, float]] = deque()  # (봉 번호, 값), 값 단조 감소
+        # 마지막 update 되돌리기용 기록
+        self._popped: list[tuple[int, float]] = []
+        self._expired: tuple[int, float] | None = None
+
+    def _dominates(self, new: float, old: float) -> bool:
+        return new >= old
+
+    def update(self, x: float) -> Optional[float]:
+        x = float(x)
+        idx = self.count
+        self.count += 1
+
+        popped: list[tuple[int, float]] = []
+        while self._dq and self._dominates(x, self._dq[-1][1]):
+            popped.append(self._dq.pop())
+        self._dq.append((idx, x))
+
+        expired = None
+        if self._dq[0][0] <= idx - self.window:
+            expired = self._dq.popleft()
+
+        self._popped = popped
+        self._expired = expired
+        return self.value
+
+    def revise(self, x: float) -> Optional[float]:
+        if self.count == 0:
+            return self.update(x)
+        # 마지막 update 되돌린 뒤 새 값으로 다시 적용
+        self._dq.pop()
+        self._dq.extend(reversed(self._popped))
+        if self._expired is not None:
+            self._dq.appendleft(self._expired)
+        self.count -= 1
+        return self.update(x)
+
+    @property
+    def value(self) -> Optional[float]:
+        if self.count < self.window or not self._dq:
+            return None
+        return self._dq[0][1]
+
+    def to_state(self) -> dict:
+        return {
+            "kind": self.kind,
+            "window": self.window,
+            "count": self.count,
+            "dq": [list(e) for e in self._dq],
+            "popped": [list(e) for e in self._popped],
+            "expired": list(self._expired) if self._expired else None,
+        }
+
+    @classmethod
+    def from_state(cls, state: dict) -> "RollingMax":
+        obj = cls(state["window"])
+        obj.count = state["count"]
+        obj._dq = deque((int(i), float(v)) for i, v in state["dq"])
+        obj._popped = [(int(i), float(v)) for i, v in state["popped"]]
+        exp = state["expired"]
+        obj._expired = (int(exp[0]), float(exp[1])) if exp else None
+        return obj
+
+
+class RollingMin(RollingMax):
+    """단조 deque 기반 롤링 최저값"""
+
+    kind = "rolling_min"
+
+    def _dominates(self, new: float, old: float) -> bool:
+        return new <= old
+
+
+class RSI(StreamingIndicator):
+    """Wilder RSI — ta.momentum.RSIIndicator 와 동일"""
+
+    kind = "rsi"
+
+    def __init__(self, window: int = 14) -> None:
+        self.window = window
+        self._up = EMA(alpha=1.0 / window, min_periods=window)
+        self._dn = EMA(alpha=1.0 / window, min_periods=window)
+        self._prev_close: float | None = None
+        self._base_close: float | None = None  # 마지막 봉의 직전 종가
+
+    def _moves(self, x: float) -> tuple[float, float]:
+        # ta 와 동일: 첫 봉의 diff(NaN)는 상승/하락 0으로 취급
+        if self._base_close is None:
+            return 0.0, 0.0
+        diff = x - self._base_close
+        return max(diff, 0.0), max(-diff, 0.0)
+
+    def update(self, x: float) -> Optional[float]:
+        x = float(x)
+        self._base_close = self._prev_close
+        up, dn = self._moves(x)
+        self._up.update(up)
+        self._dn.update(dn)
+        self._prev_close = x
+        return self.value
+
+    def revise(self, x: float) -> Optional[float]:
+        if self._prev_close is None:
+            return self.update(x)
+        x = float(x)
+        up, dn = self._moves(x)
+        self._up.revise(up)
+        self._dn.revise(dn)
+        self._prev_close = x
+        return self.value
+
+    @property
+    def value(self) -> Optional[float]:
+        up, dn = self._up.value, self._dn.value
+        if up is None or dn is None:
+            return None
+        if dn == 0:
+            return 100.0
+        return 100.0 - 100.0 / (1.0 + up / dn)
+
+    def to_state(self) -> dict:
+        return {
+            "kind": self.kind,
+            "window": self.window,
+            "up": self._up.to_state(),
+            "dn": self._dn.to_state(),
+            "prev_close": self._prev_close,
+            "base_close": self._base_close,
+        }
+
+    @classmethod
+    def from_state(cls, state: dict) -> "RSI":
+        obj = cls(state["window"])
+        obj._up = EMA.from_state(state["up"])
+        obj._dn = EMA.from_state(state["dn"])
+        obj._prev_close = state["prev_close"]
+        obj._base_close = state["base_close"]
+        return obj
+
+
+class MACD(StreamingIndicator):
+    """MACD — ta.trend.MACD 와 동일 (value 는 히스토그램)"""
+
+    kind = "macd"
+
+    def __init__(self, fast: int = 12, slow: int = 26, signal: int = 9) -> None:
+        self.fast, self.slow, self.signal_span = fast, slow, signal
+        self._fast = EMA(span=fast, min_periods=fast)
+        self._slow = EMA(span=slow, min_periods=slow)
+        self._signal = EMA(span=signal, min_periods=signal)
+        self._fed_signal = False  # 마지막 봉이 시그널 EMA에 반영됐는지
+
+    def update(self, x: float) -> Optional[float]:
+        self._fast.update(x)
+        self._slow.update(x)
+        macd = self.macd
+        self._fed_signal = macd is not None
+        if macd is not None:
+            self._signal.update(macd)
+        return self.value
+
+    def revise(self, x: float) -> Optional[float]:
+        if self._fast.count == 0:
+            return self.update(x)
+        self._fast.revise(x)
+        self._slow.revise(x)
+        if self._fed_signal:
+            self._signal.revise(self.macd)
+        return self.value
+
+    @property
+    def macd(self) -> Optional[float]:
+        fast, slow = self._fast.value, self._slow.value
+        if fast is None or slow is None:
+            return None
+        return fast - slow
+
+    @property
+    def signal(self) -> Optional[float]:
+        return self._signal.value
+
+    @property
+    def value(self) -> Optional[float]:
+        macd, signal = self.macd, self.signal
+        if macd is None or signal is None:
+            return None
+        return macd - signal
+
+    @property
+    def previous(self) -> Optional[float]:
+        """마지막 봉 반영 전 히스토그램 (장중이면 직전 확정 봉 기준)"""
+        fast, slow = self._fast.previous, self._slow.previous
+        if fast is None or slow is None:
+            return None
+        signal = self._signal.previous if self._fed_signal else self._signal.value
+        if signal is None:
+            return None
+        return fast - slow - signal
+
+    @property
+    def count(self) -> int:
+        """반영된 봉 수"""
+        return self._fast.count
+
+    def to_state(self) -> dict:
+        return {
+            "kind": self.kind,
+            "spans": [self.fast, self.slow, self.signal_span],
+            "fast": self._fast.to_state(),
+            "slow": self._slow.to_state(),
+            "signal": self._signal.to_state(),
+            "fed_signal": self._fed_signal,
+        }
+
+    @classmethod
+    def from_state(cls, state: dict) -> "MACD":
+        obj = cls(*state["spans"])
+        obj._fast = EMA.from_state(state["fast"])
+        obj._slow = EMA.from_state(state["slow"])
+        obj._signal = EMA.from_state(state["signal"])
+        obj._fed_signal = state["fed_signal"]
+        return obj
+
+
+_KINDS: dict[str, type[StreamingIndicator]] = {
+    cls.kind: cls for cls in (EMA, RollingSum, RollingMax, RollingMin, RSI, MACD)
+}
+
+
+def indicator_from_state(state: dict) -> StreamingIndicator:
+    """to_state() 로 저장된 dict 에서 지표 객체 복원"""
+    return _KINDS[state["kind"]].from_state(state)
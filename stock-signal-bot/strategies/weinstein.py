@@ -3,10 +3,12 @@ from __future__ import annotations
 
 from enum import Enum
 
+import numpy as np
 import pandas as pd
 
-from signals.models import SignalType, StrategySignal
+from signals.models import SignalType
 from strategies.base import BaseStrategy
+from strategies.panel import Panel, classify, rounded, row_number
 
 
 class Stage(Enum):
@@ -17,34 +19,42 @@ class Stage(Enum):
     UNKNOWN = 0
 
 
-def _classify_stage(df: pd.DataFrame) -> tuple[Stage, float]:
-    """30주(150일) 이동평균 기반 Stage 분류. slope 반환."""
-    close = df["Close"]
+def _stage_frames(
+    close: pd.DataFrame,
+) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    """30주(150일) 이동평균 기반 Stage 분류 — (stage 값, slope, ma150)"""
     ma150 = close.rolling(150).mean()
-
-    if ma150.isna().iloc[-1]:
-        return Stage.UNKNOWN, 0.0
-
-    cur_ma = ma150.iloc[-1]
-    prev_ma = ma150.iloc[-10]  # 10거래일 전과 비교로 기울기 계산
-    slope = (cur_ma - prev_ma) / prev_ma * 100
-
-    cur_close = close.iloc[-1]
-    vol = df["Volume"]
-    vol_ratio_4w = vol.iloc[-1] / vol.rolling(20).mean().iloc[-1]
-
-    above_ma = cur_close > cur_ma
-
-    if above_ma and slope > 0.1:
-        return Stage.STAGE_2, slope
-    if above_ma and abs(slope) <= 0.1:
-        return Stage.STAGE_1, slope
-    if not above_ma and slope > -0.1:
-        return Stage.STAGE_3, slope
-    return Stage.STAGE_4, slope
+    prev_ma = ma150.shift(9)  # 10거래일 전(iloc[-10])과 비교
+    slope = (ma150 - prev_ma) / prev_ma * 100
+    above_ma = close > ma150
+    unknown = ma150.isna()
+
+    stage = np.select(
+        [
+            unknown.to_numpy(),
+            (above_ma & (slope > 0.1)).to_numpy(),
+            (above_ma & (slope.abs() <= 0.1)).to_numpy(),
+            (~above_ma & (slope > -0.1)).to_numpy(),
+        ],
+        [
+            Stage.UNKNOWN.value,
+            Stage.STAGE_2.value,
+            Stage.STAGE_1.value,
+            Stage.STAGE_3.value,
+        ],
+        default=Stage.STAGE_4.value,
+    )
+    stage = pd.DataFrame(stage, index=close.index, columns=close.columns)
+    return stage, slope.mask(unknown, 0.0), ma150
 
 
 class WeinsteinStrategy(BaseStrategy):
+    panel_indicators = ("stage", "ma150", "slope_pct", "vol_ratio_4w")
+    lookback = 164  # MA150 + 기울기(9일) + 5일 전 Stage
+    min_bars = 150
+    cost = 5.1
+    required_columns = ("Close", "Volume")
+
     @property
     def name(self) -> str:
         return "와인스타인 Stage"
@@ -53,89 +63,66 @@ class WeinsteinStrategy(BaseStrategy):
     def weight(self) -> float:
         return 0.15
 
-    def analyze(self, df: pd.DataFrame, stock_code: str) -> StrategySignal:
-        close = df["Close"]
-        ma150 = close.rolling(150).mean()
-        volume = df["Volume"]
-
-        stage, slope = _classify_stage(df)
-
-        # 이전 Stage (5일 전)
-        if len(df) >= 155:
-            prev_stage, prev_slope = _classify_stage(df.iloc[:-5])
-        else:
-            prev_stage = Stage.UNKNOWN
-            prev_slope = 0.0
-
-        cur_close = close.iloc[-1]
-        cur_ma = ma150.iloc[-1]
-        vol_ratio_4w = volume.iloc[-1] / volume.rolling(20).mean().iloc[-1]
-
-        indicators = {
-            "stage": stage.name,
-            "ma150": round(cur_ma, 0) if not pd.isna(cur_ma) else None,
-            "slope_pct": round(slope, 3),
-            "vol_ratio_4w": round(vol_ratio_4w, 2),
+    def _reason(self, case: int, row: pd.Series) -> str:
+        return {
+            0: f"Stage 2 진입 + 거래량 {row['vol_ratio_4w']:.1f}배",
+            1: f"Stage 2 진입 (기울기:{row['slope_pct']:.3f}%)",
+            2: "Stage 2 유지 (보유 중)",
+            3: "Stage 3 진입 (천장 형성)",
+            4: "Stage 4 진입 (하락 국면)",
+        }.get(case, "Stage 1 관망 (바닥 다지기)")
+
+    def _indicators(self, case: int, row: pd.Series) -> dict:
+        ma150 = row["ma150"]
+        return {
+            "stage": Stage(int(row["stage"])).name,
+            "ma150": rounded(ma150, 0) if not pd.isna(ma150) else None,
+            "slope_pct": rounded(row["slope_pct"], 3),
+            "vol_ratio_4w": rounded(row["vol_ratio_4w"], 2),
         }
 
-        # ── 매수: Stage 1→2 전환 ─────────────────────────
-        entering_stage2 = (
-            prev_stage in (Stage.STAGE_1, Stage.UNKNOWN)
-            and stage == Stage.STAGE_2
+    def evaluate_panel(self, panel: Panel) -> dict[str, pd.DataFrame]:
+        close = panel["Close"]
+        volume = panel["Volume"]
+
+        stage, slope, ma150 = _stage_frames(close)
+
+        # 이전 Stage (5일 전) — 같은 시리즈를 shift 해 재계산 없이 사용,
+        # 155일 미만이면 UNKNOWN
+        has_prev = row_number(close) >= 154
+        prev_stage = stage.shift(5).where(has_prev, Stage.UNKNOWN.value)
+        prev_slope = slope.shift(5).where(has_prev, 0.0)
+
+        vol_ratio_4w = volume / volume.rolling(20).mean()
+
+        stage2 = stage == Stage.STAGE_2.value
+        before_stage2 = prev_stage.isin([Stage.STAGE_1.value, Stage.UNKNOWN.value])
+        entering_stage2 = before_stage2 & stage2
+        slope_turned_positive = (prev_slope <= 0) & (slope > 0)
+        triggered = entering_stage2 | (stage2 & slope_turned_positive)
+
+        # 매수: Stage 1→2 전환 / Stage 2 유지(관망) / 매도: Stage 3, 4
+        frames = classify(
+            [
+                (triggered & (vol_ratio_4w >= 2.0), SignalType.STRONG_BUY, 0.85),
+                (triggered & (vol_ratio_4w >= 1.0), SignalType.BUY, 0.65),
+                (stage2, SignalType.NEUTRAL, 0.5),
+                (stage == Stage.STAGE_3.value, SignalType.SELL, 0.65),
+                (stage == Stage.STAGE_4.value, SignalType.STRONG_SELL, 0.80),
+            ],
+            default=(SignalType.NEUTRAL, 0.3),
+            like=close,
         )
-        slope_turned_positive = prev_slope <= 0 and slope > 0
-
-        if entering_stage2 or (stage == Stage.STAGE_2 and slope_turned_positive):
-            if vol_ratio_4w >= 2.0:
-                return StrategySignal(
-                    strategy_name=self.name,
-                    signal=SignalType.STRONG_BUY,
-                    confidence=0.85,
-                    reason=f"Stage 2 진입 + 거래량 {vol_ratio_4w:.1f}배",
-                    indicators=indicators,
-                )
-            if vol_ratio_4w >= 1.0:
-                return StrategySignal(
-                    strategy_name=self.name,
-                    signal=SignalType.BUY,
-                    confidence=0.65,
-                    reason=f"Stage 2 진입 (기울기:{slope:.3f}%)",
-                    indicators=indicators,
-                )
-
-        # Stage 2 유지 중 (추가 매수 필요 없음 → 관망)
-        if stage == Stage.STAGE_2:
-            return StrategySignal(
-                strategy_name=self.name,
-                signal=SignalType.NEUTRAL,
-                confidence=0.5,
-                reason=f"Stage 2 유지 (보유 중)",
-                indicators=indicators,
-            )
-
-        # ── 매도: Stage 2→3, 3→4 전환 ──────────────────
-        if stage == Stage.STAGE_3:
-            return StrategySignal(
-                strategy_name=self.name,
-                signal=SignalType.SELL,
-                confidence=0.65,
-                reason=f"Stage 3 진입 (천장 형성)",
-                indicators=indicators,
-            )
-
-        if stage == Stage.STAGE_4:
-            return StrategySignal(
-                strategy_name=self.name,
-                signal=SignalType.STRONG_SELL,
-                confidence=0.80,
-                reason=f"Stage 4 진입 (하락 국면)",
-                indicators=indicators,
-            )
-
-        return StrategySignal(
-            strategy_name=self.name,
-            signal=SignalType.NEUTRAL,
-            confidence=0.3,
-            reason=f"Stage 1 관망 (바닥 다지기)",
-            indicators=indicators,
+        frames.update(
+            stage=stage,
+            ma150=ma150,
+            slope_pct=slope,
+            vol_ratio_4w=vol_ratio_4w,
         )
+        return frames
+
+    def buy_setup(self, panel: Panel) -> pd.DataFrame:
+        # Stage 2(종가 > MA150) + 4주 평균 이상 거래량 — 기울기·Stage 전환 판정 생략
+        close, volume = panel["Close"], panel["Volume"]
+        above_ma = close > close.rolling(150).mean()
+        return above_ma & (volume / volume.rolling(20).mean() >= 1.0)
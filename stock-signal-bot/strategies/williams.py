@@ -2,13 +2,20 @@
 from __future__ import annotations
 
 import pandas as pd
-from ta.momentum import WilliamsRIndicator
 
-from signals.models import SignalType, StrategySignal
+from signals.models import SignalType
 from strategies.base import BaseStrategy
+from strategies.panel import Panel, classify, rounded, williams_r
 
 
 class WilliamsStrategy(BaseStrategy):
+    panel_indicators = ("williams_r", "volume_ratio")
+    lookback = 20  # 거래량 20일 평균, %R(14) + 전일
+    min_bars = 15
+    cost = 3.0
+    signal_range = (SignalType.SELL, SignalType.STRONG_BUY)
+    required_columns = ("High", "Low", "Close", "Volume")
+
     @property
     def name(self) -> str:
         return "윌리엄스 %R"
@@ -17,74 +24,48 @@ class WilliamsStrategy(BaseStrategy):
     def weight(self) -> float:
         return 0.10
 
-    def analyze(self, df: pd.DataFrame, stock_code: str) -> StrategySignal:
-        indicator = WilliamsRIndicator(
-            high=df["High"], low=df["Low"], close=df["Close"], lbp=14
-        )
-        willr = indicator.williams_r()
-        vol_ratio = df["Volume"] / df["Volume"].rolling(20).mean()
-
-        cur_wr = willr.iloc[-1]
-        prev_wr = willr.iloc[-2]
-        cur_vol = vol_ratio.iloc[-1]
+    def _reason(self, case: int, row: pd.Series) -> str:
+        wr, vol = row["williams_r"], row["volume_ratio"]
+        return {
+            0: f"%R 과매도 반등 + 거래량 {vol:.1f}배",
+            1: f"%R 과매도 반등 (거래량 부족: {vol:.1f}배)",
+            2: "%R 과매수 하락 전환",
+            3: f"%R 과매수 구간 유지 ({wr:.1f})",
+            4: f"%R 과매도 대기 중 ({wr:.1f})",
+        }.get(case, f"%R 중립 ({wr:.1f})")
 
-        indicators = {
-            "williams_r": round(cur_wr, 2),
-            "volume_ratio": round(cur_vol, 2),
+    def _indicators(self, case: int, row: pd.Series) -> dict:
+        return {
+            "williams_r": rounded(row["williams_r"], 2),
+            "volume_ratio": rounded(row["volume_ratio"], 2),
         }
 
-        # 매수: -80 아래에서 위로 크로스업 + 거래량 확인
-        if prev_wr < -80 and cur_wr >= -80:
-            if cur_vol >= 1.5:
-                return StrategySignal(
-                    strategy_name=self.name,
-                    signal=SignalType.STRONG_BUY,
-                    confidence=0.8,
-                    reason=f"%R 과매도 반등 + 거래량 {cur_vol:.1f}배",
-                    indicators=indicators,
-                )
-            return StrategySignal(
-                strategy_name=self.name,
-                signal=SignalType.BUY,
-                confidence=0.6,
-                reason=f"%R 과매도 반등 (거래량 부족: {cur_vol:.1f}배)",
-                indicators=indicators,
-            )
+    def evaluate_panel(self, panel: Panel) -> dict[str, pd.DataFrame]:
+        close = panel["Close"]
+        willr = williams_r(panel["High"], panel["Low"], close, lbp=14)
+        volume = panel["Volume"]
+        vol_ratio = volume / volume.rolling(20).mean()
 
-        # 매도: -20 위에서 아래로 크로스다운
-        if prev_wr > -20 and cur_wr <= -20:
-            return StrategySignal(
-                strategy_name=self.name,
-                signal=SignalType.SELL,
-                confidence=0.7,
-                reason="%R 과매수 하락 전환",
-                indicators=indicators,
-            )
+        prev_wr = willr.shift(1)
+        oversold_crossup = (prev_wr < -80) & (willr >= -80)
 
-        # 과매수 구간 지속
-        if cur_wr > -20:
-            return StrategySignal(
-                strategy_name=self.name,
-                signal=SignalType.NEUTRAL,
-                confidence=0.4,
-                reason=f"%R 과매수 구간 유지 ({cur_wr:.1f})",
-                indicators=indicators,
-            )
-
-        # 과매도 구간 지속
-        if cur_wr < -80:
-            return StrategySignal(
-                strategy_name=self.name,
-                signal=SignalType.NEUTRAL,
-                confidence=0.3,
-                reason=f"%R 과매도 대기 중 ({cur_wr:.1f})",
-                indicators=indicators,
-            )
-
-        return StrategySignal(
-            strategy_name=self.name,
-            signal=SignalType.NEUTRAL,
-            confidence=0.3,
-            reason=f"%R 중립 ({cur_wr:.1f})",
-            indicators=indicators,
+        # 매수: -80 아래에서 위로 크로스업 (+ 거래량 확인)
+        # 매도: -20 위에서 아래로 크로스다운, 그 외 구간별 관망
+        frames = classify(
+            [
+                (oversold_crossup & (vol_ratio >= 1.5), SignalType.STRONG_BUY, 0.8),
+                (oversold_crossup, SignalType.BUY, 0.6),
+                ((prev_wr > -20) & (willr <= -20), SignalType.SELL, 0.7),
+                (willr > -20, SignalType.NEUTRAL, 0.4),
+                (willr < -80, SignalType.NEUTRAL, 0.3),
+            ],
+            default=(SignalType.NEUTRAL, 0.3),
+            like=close,
         )
+        frames.update(williams_r=willr, volume_ratio=vol_ratio)
+        return frames
+
+    def buy_setup(self, panel: Panel) -> pd.DataFrame:
+        # 과매도 크로스업 (거래량 조건 생략)
+        willr = williams_r(panel["High"], panel["Low"], panel["Close"], lbp=14)
+        return (willr.shift(1) < -80) & (willr >= -80)
@@ -7,3 +7,15 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 # 테스트용 더미 환경변수 설정
 os.environ.setdefault("TELEGRAM_BOT_TOKEN", "test_token")
 os.environ.setdefault("TELEGRAM_CHAT_ID", "test_chat_id")
+
+import pytest
+
+
+@pytest.fixture
+def tmp_db(tmp_path, monkeypatch):
+    """DB_PATH(상대경로 signals.db)를 임시 디렉터리로 격리"""
+    from db.database import init_db
+
+    monkeypatch.chdir(tmp_path)
+    init_db()
+    return tmp_path / "signals.db"
@@ -0,0 +1,23 @@
+"""패널 벡터화 이전의 종목 단위 전략 구현 — 행 단위 if/elif + ta 지표
+
+strategies/ 의 evaluate_panel 결과가 원래 동작과 같은지 검증하는 기준으로만 쓴다.
+원본을 그대로 보존하므로 수정하지 않는다 (임포트 경로만 패키지 내부로 바꿈).
+"""
+from .bollinger import BollingerStrategy
+from .elder import ElderStrategy
+from .ichimoku import IchimokuStrategy
+from .livermore import LivermoreStrategy
+from .oneil import OneilStrategy
+from .weinstein import WeinsteinStrategy
+from .williams import WilliamsStrategy
+
+# strategies.ensemble._STRATEGIES 와 같은 순서
+REFERENCE_STRATEGIES = [
+    IchimokuStrategy(),
+    OneilStrategy(),
+    WeinsteinStrategy(),
+    ElderStrategy(),
+    BollingerStrategy(),
+    LivermoreStrategy(),
+    WilliamsStrategy(),
+]
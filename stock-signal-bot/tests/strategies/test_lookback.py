@@ -0,0 +1,94 @@
+"""전략별 데이터 요구량(lookback / min_bars) 테스트"""
+import numpy as np
+import pandas as pd
+import pytest
+from config import WEEKLY_LOOKBACK_WEEKS
+from signals.models import SignalType
+from strategies.base import calendar_days, ema_warmup
+from strategies.elder import ElderStrategy
+from strategies.ensemble import _STRATEGIES, required_lookback_days
+from strategies.ichimoku import IchimokuStrategy
+from strategies.weinstein import WeinsteinStrategy
+from strategies.williams import WilliamsStrategy
+
+
+def _make_df(n: int, seed: int = 7) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 60000 * np.exp(np.cumsum(rng.normal(0, 0.02, n)))
+    open_ = close * (1 + rng.normal(0, 0.01, n))
+    return pd.DataFrame(
+        {
+            "Open": open_,
+            "High": np.maximum(close, open_) * 1.01,
+            "Low": np.minimum(close, open_) * 0.99,
+            "Close": close,
+            "Volume": rng.lognormal(15, 0.5, n),
+        },
+        index=pd.bdate_range("2023-01-02", periods=n),
+    )
+
+
+@pytest.mark.parametrize(
+    "strategy", [IchimokuStrategy(), WeinsteinStrategy(), WilliamsStrategy()],
+    ids=lambda s: type(s).__name__,
+)
+def test_tail_window_matches_full_history(strategy):
+    """이동 윈도우 지표만 쓰는 전략은 꼬리 구간 결과가 전체 이력과 동일"""
+    for seed in range(5):
+        df = _make_df(400, seed)
+        full = strategy.analyze(df, "005930")
+        tail = strategy._safe_analyze(df, "005930")
+        assert (tail.signal, tail.reason, tail.indicators) == (
+            full.signal, full.reason, full.indicators
+        )
+
+
+@pytest.mark.parametrize("strategy", _STRATEGIES, ids=lambda s: type(s).__name__)
+def test_warmup_keeps_recursive_indicators_on_full_history(strategy):
+    """EMA·Wilder RSI 를 쓰는 전략도 워밍업 포함 꼬리 구간이면 긴 이력과 같음"""
+    for seed in range(3):
+        df = _make_df(strategy.lookback_bars + 400, seed)
+        for end in range(len(df) - 40, len(df) + 1, 8):
+            full = strategy.analyze(df.iloc[:end], "005930")
+            tail = strategy._safe_analyze(df.iloc[:end], "005930")
+            assert tail.signal == full.signal
+            assert tail.confidence == pytest.approx(full.confidence)
+
+
+def test_window_is_a_view():
+    df = _make_df(400)
+    window = WilliamsStrategy().window(df)
+    assert len(window) == 20
+    assert np.shares_memory(window["Close"].to_numpy(), df["Close"].to_numpy())
+
+
+def test_insufficient_data_skips_analyze(monkeypatch):
+    strategy = WeinsteinStrategy()
+    monkeypatch.setattr(strategy, "analyze", lambda *a: pytest.fail("실행되면 안 됨"))
+
+    sig = strategy._safe_analyze(_make_df(100), "005930")
+    assert sig.signal == SignalType.NEUTRAL
+    assert sig.confidence == 0.0
+    assert "데이터 부족" in sig.reason
+
+
+def test_missing_required_column():
+    df = _make_df(100).drop(columns="Volume")
+    sig = WilliamsStrategy()._safe_analyze(df, "005930")
+    assert sig.signal == SignalType.NEUTRAL
+    assert "Volume" in sig.reason
+
+
+def test_load_window_is_longest_strategy():
+    elder = ElderStrategy()
+    assert 0 < elder.warmup <= ema_warmup(26)
+    assert elder.lookback_bars == WEEKLY_LOOKBACK_WEEKS * 5
+    assert required_lookback_days() == max(s.lookback_days for s in _STRATEGIES)
+    assert required_lookback_days([WilliamsStrategy()]) < 60
+
+
+def test_warmup_does_not_grow_load_window():
+    """엘더 워밍업은 주봉 분석 구간 안에서 — 앙상블 조회 기간은 60주(427일) 그대로"""
+    weekly_days = calendar_days(WEEKLY_LOOKBACK_WEEKS * 5, "W")
+    assert ElderStrategy().lookback_days == weekly_days
+    assert required_lookback_days() <= max(weekly_days, 427)
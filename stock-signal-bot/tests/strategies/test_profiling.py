@@ -0,0 +1,127 @@
+"""전략 호출 프로파일링 테스트"""
+import contextvars
+import json
+import threading
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+from strategies.ensemble import _STRATEGIES, evaluate_ensemble
+from strategies.profiling import BUCKETS_MS, Histogram, active_profiler, profile_scan
+from strategies.williams import WilliamsStrategy
+
+
+def _make_df(n: int = 300) -> pd.DataFrame:
+    rng = np.random.default_rng(3)
+    close = 60000 * np.exp(np.cumsum(rng.normal(0, 0.02, n)))
+    return pd.DataFrame(
+        {"Open": close, "High": close * 1.01, "Low": close * 0.99, "Close": close,
+         "Volume": rng.lognormal(15, 0.5, n)},
+        index=pd.bdate_range("2023-01-02", periods=n),
+    )
+
+
+def test_records_every_strategy_call():
+    df = _make_df()
+    with profile_scan("test") as profiler:
+        evaluate_ensemble("005930", df, 75000.0, 0.0)
+        evaluate_ensemble("000660", df, 75000.0, 0.0)
+
+    assert active_profiler() is None
+    assert set(profiler.stats) == {s.name for s in _STRATEGIES}
+    williams = profiler.stats[WilliamsStrategy().name]
+    assert williams.calls == 2
+    assert williams.max_rows == 20  # lookback 꼬리 구간 크기
+    assert sum(williams.wall.counts) == 2
+    assert list(profiler.to_frame().columns[:3]) == ["calls", "skipped", "failures"]
+
+
+def test_failures_by_exception_type_and_skips(monkeypatch):
+    strategy = WilliamsStrategy()
+
+    def boom(df, stock_code):
+        raise ZeroDivisionError("x")
+
+    monkeypatch.setattr(strategy, "analyze", boom)
+    with profile_scan("test") as profiler:
+        result = strategy._safe_analyze(_make_df(), "005930")
+        strategy._safe_analyze(_make_df(5), "005930")
+
+    stats = profiler.stats[strategy.name]
+    assert result.reason.startswith("분석 실패")
+    assert stats.failures == {"ZeroDivisionError": 1}
+    assert (stats.calls, stats.skipped) == (1, 1)
+
+
+def test_disabled_records_nothing():
+    with profile_scan("test", enabled=False) as profiler:
+        assert profiler is None
+        assert active_profiler() is None
+        WilliamsStrategy()._safe_analyze(_make_df(), "005930")
+
+
+def test_allocations_and_export(tmp_path):
+    with profile_scan("test", allocations=True, export_dir=str(tmp_path)) as profiler:
+        WilliamsStrategy()._safe_analyze(_make_df(), "005930")
+
+    assert profiler.stats[WilliamsStrategy().name].alloc_peak_bytes > 0
+    exported = json.loads(next(tmp_path.glob("test_*.json")).read_text())
+    assert exported["strategies"][WilliamsStrategy().name]["calls"] == 1
+
+
+def test_histogram_buckets():
+    hist = Histogram()
+    for ms in (0.1, 3.0, 5000.0):
+        hist.observe(ms)
+    assert hist.counts[0] == 1
+    assert hist.counts[BUCKETS_MS.index(5)] == 1
+    assert hist.counts[-1] == 1
+
+
+def test_concurrent_scans_keep_separate_profiles():
+    started = threading.Barrier(2)
+    profiles: dict[str, object] = {}
+
+    def job(scan: str, n_calls: int) -> None:
+        with profile_scan(scan) as profiler:
+            started.wait()
+            for _ in range(n_calls):
+                WilliamsStrategy()._safe_analyze(_make_df(), "005930")
+            started.wait()
+        profiles[scan] = profiler
+
+    threads = [threading.Thread(target=job, args=(f"job{n}", n)) for n in (1, 3)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    name = WilliamsStrategy().name
+    assert profiles["job1"].stats[name].calls == 1
+    assert profiles["job3"].stats[name].calls == 3
+    assert active_profiler() is None
+
+
+def test_worker_threads_need_copied_context():
+    def call() -> None:
+        WilliamsStrategy()._safe_analyze(_make_df(), "005930")
+
+    with profile_scan("test") as profiler, ThreadPoolExecutor(1) as pool:
+        pool.submit(call).result()
+        pool.submit(contextvars.copy_context().run, call).result()
+
+    assert profiler.stats[WilliamsStrategy().name].calls == 1
+
+
+def test_overlapping_allocation_measurements_are_discarded():
+    with profile_scan("test", allocations=True) as profiler:
+        first = profiler.start()
+        second = profiler.start()
+        profiler.record("a", second, 1)
+        profiler.record("a", first, 1)
+        profiler.record("b", profiler.start(), 1)
+
+    assert profiler.stats["a"].alloc_overlapped == 2
+    assert profiler.stats["b"].alloc_overlapped == 0
+    assert not tracemalloc.is_tracing()
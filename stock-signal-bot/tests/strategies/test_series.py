@@ -0,0 +1,43 @@
+"""analyze_series (전 날짜 시그널) 테스트"""
+import numpy as np
+import pandas as pd
+import pytest
+from strategies.ensemble import _STRATEGIES
+from strategies.weinstein import WeinsteinStrategy
+
+
+def _make_df(n: int = 260) -> pd.DataFrame:
+    rng = np.random.default_rng(5)
+    close = 60000 * np.exp(np.cumsum(rng.normal(0.001, 0.02, n)))
+    open_ = close * (1 + rng.normal(0, 0.01, n))
+    high = np.maximum(close, open_) * 1.01
+    low = np.minimum(close, open_) * 0.99
+    volume = rng.lognormal(15, 0.5, n)
+    idx = pd.bdate_range("2023-01-02", periods=n)
+    return pd.DataFrame(
+        {"Open": open_, "High": high, "Low": low, "Close": close, "Volume": volume},
+        index=idx,
+    )
+
+
+@pytest.mark.parametrize("strategy", _STRATEGIES, ids=lambda s: type(s).__name__)
+def test_analyze_is_last_row_of_series(strategy):
+    df = _make_df()
+    series = strategy.analyze_series(df)
+
+    assert series.index.equals(df.index)
+    assert series["signal"].between(-2, 2).all()
+
+    result = strategy.analyze(df, "005930")
+    assert result.signal.value == series["signal"].iloc[-1]
+    assert result.confidence == pytest.approx(series["confidence"].iloc[-1])
+    assert result.reason
+    assert all(not isinstance(v, np.generic) for v in result.indicators.values())
+
+
+def test_weinstein_prior_stage_from_series():
+    """5일 전 Stage는 같은 시리즈의 5행 전 값"""
+    df = _make_df(300)
+    series = WeinsteinStrategy().analyze_series(df)
+    prefix = WeinsteinStrategy().analyze_series(df.iloc[:-5])
+    assert series["stage"].iloc[-6] == prefix["stage"].iloc[-1]
@@ -0,0 +1,164 @@
+"""스트리밍 지표 단위 테스트 — strategies/panel.py 배치 지표와 동일한지"""
+import numpy as np
+import pandas as pd
+import pytest
+from db.indicator_state import load_indicator_state, sync_indicator
+from strategies.elder import ElderStrategy
+from strategies.ensemble import _streaming_signal
+from strategies.panel import rsi, stochastic_k, williams_r
+from strategies.streaming import (
+    EMA,
+    MACD,
+    RSI,
+    RollingMax,
+    RollingMin,
+    RollingSum,
+    indicator_from_state,
+)
+
+
+def _close(n: int = 200) -> pd.Series:
+    rng = np.random.default_rng(3)
+    close = 70000 + rng.normal(0, 800, size=n).cumsum()
+    return pd.Series(close, index=pd.date_range("2024-01-01", periods=n, freq="B"))
+
+
+def _ohlcv(n: int, seed: int = 11) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 60000 * np.exp(np.cumsum(rng.normal(0, 0.02, n)))
+    open_ = close * (1 + rng.normal(0, 0.01, n))
+    return pd.DataFrame(
+        {
+            "Open": open_,
+            "High": np.maximum(close, open_) * 1.01,
+            "Low": np.minimum(close, open_) * 0.99,
+            "Close": close,
+            "Volume": rng.lognormal(15, 0.5, n),
+        },
+        index=pd.bdate_range("2022-01-03", periods=n),
+    )
+
+
+def _run(indicator, values):
+    return [indicator.update(x) for x in values]
+
+
+def _as_float(values):
+    return np.array([np.nan if v is None else v for v in values])
+
+
+def test_ema_matches_pandas():
+    close = _close()
+    expected = close.ewm(span=10, min_periods=10, adjust=False).mean()
+    got = _as_float(_run(EMA(span=10, min_periods=10), close))
+    np.testing.assert_allclose(got, expected.to_numpy(), rtol=1e-10)
+
+
+def test_rolling_windows_match_panel():
+    df = _ohlcv(200)
+    high, low, close = (df[c].to_frame("_") for c in ("High", "Low", "Close"))
+
+    hh, ll = RollingMax(14), RollingMin(14)
+    got = _as_float([
+        None if h is None or lo is None else -100 * (h - c) / (h - lo)
+        for h, lo, c in zip(_run(hh, df["High"]), _run(ll, df["Low"]), df["Close"])
+    ])
+    expected = williams_r(high, low, close, lbp=14).iloc[:, 0]
+    np.testing.assert_allclose(got, expected.to_numpy(), rtol=1e-10)
+
+    smax, smin = RollingMax(5), RollingMin(5)
+    got = _as_float([
+        None if h is None or lo is None else 100 * (c - lo) / (h - lo)
+        for h, lo, c in zip(_run(smax, df["High"]), _run(smin, df["Low"]), df["Close"])
+    ])
+    expected = stochastic_k(high, low, close, window=5).iloc[:, 0]
+    np.testing.assert_allclose(got, expected.to_numpy(), rtol=1e-10)
+
+    total = _as_float(_run(RollingSum(20), df["Volume"]))
+    expected = df["Volume"].rolling(20).sum()
+    np.testing.assert_allclose(total, expected.to_numpy(), rtol=1e-10)
+
+
+def test_rsi_and_macd_match_panel():
+    close = _close()
+    got = _as_float(_run(RSI(14), close))
+    np.testing.assert_allclose(
+        got, rsi(close.to_frame(), 14).iloc[:, 0].to_numpy(), rtol=1e-8
+    )
+
+    # 엘더 주봉 MACD 와 같은 식 — EMA(adjust=False), MACD 정의 후 시그널 EMA
+    fast = close.ewm(span=12, min_periods=12, adjust=False).mean()
+    slow = close.ewm(span=26, min_periods=26, adjust=False).mean()
+    line = fast - slow
+    signal = line.ewm(span=9, min_periods=9, adjust=False).mean()
+    got = _as_float(_run(MACD(12, 26, 9), close))
+    np.testing.assert_allclose(got, (line - signal).to_numpy(), rtol=1e-8, atol=1e-8)
+
+
+@pytest.mark.parametrize(
+    "factory", [lambda: EMA(span=5), lambda: RollingSum(5), lambda: RollingMax(5),
+                lambda: RollingMin(5), lambda: RSI(5), lambda: MACD(3, 6, 2)]
+)
+def test_revise_equals_fresh_update(factory):
+    """장중 여러 번 revise 한 결과 == 확정값으로 한 번 update 한 결과"""
+    close = _close(40).to_numpy()
+    revised, fresh = factory(), factory()
+    _run(revised, close[:-1])
+    _run(fresh, close)
+
+    revised.update(close[-1] * 1.05)
+    revised.revise(close[-1] * 0.9)
+    revised.revise(close[-1])
+    assert revised.value == pytest.approx(fresh.value)
+
+    restored = indicator_from_state(revised.to_state())
+    assert restored.update(close[0]) == pytest.approx(fresh.update(close[0]))
+
+
+def test_macd_previous_is_last_confirmed_bar():
+    close = _close(60).to_numpy()
+    macd, confirmed = MACD(3, 6, 2), MACD(3, 6, 2)
+    _run(macd, close[:-1])
+    _run(confirmed, close[:-1])
+
+    macd.update(close[-1] * 1.1)
+    macd.revise(close[-1])
+    assert macd.previous == pytest.approx(confirmed.value)
+
+
+def test_sync_indicator_persists_between_scans(tmp_db):
+    close = _close(60)
+    first = sync_indicator("005930", "rsi14", close.iloc[:-1], lambda: RSI(14))
+    assert first.value == pytest.approx(rsi(close.iloc[:-1].to_frame(), 14).iat[-1, 0])
+
+    # 다음 스캔: 새 봉 1개만 반영 (재계산 없음)
+    second = sync_indicator("005930", "rsi14", close, lambda: pytest.fail("재계산"))
+    assert second.value == pytest.approx(rsi(close.to_frame(), 14).iat[-1, 0])
+    assert load_indicator_state("005930", "rsi14")[0] == "2024-03-22"
+
+
+def test_elder_streaming_matches_full_history(tmp_db, monkeypatch):
+    """장중 당일 봉 갱신·다음 날 확정을 거쳐도 전체 이력 analyze 와 같은 시그널"""
+    strategy = ElderStrategy()
+    df = _ohlcv(520)
+    start = len(df) - 30
+    _streaming_signal(strategy, df.iloc[:start - 1], "005930")
+
+    # 이후 스캔은 저장된 상태만 갱신 — 전체 재계산(팩토리 호출) 없음
+    inputs = strategy.streaming_inputs
+    monkeypatch.setattr(strategy, "streaming_inputs", lambda frame: {
+        name: (series, lambda: pytest.fail(f"{name} 재계산"))
+        for name, (series, _) in inputs(frame).items()
+    })
+    for end in range(start, len(df) + 1):
+        # 장중: 당일 봉이 진행 중 (종가·거래량이 확정값과 다름)
+        partial = df.iloc[:end].copy()
+        partial.iloc[-1, partial.columns.get_loc("Close")] *= 0.97
+        partial.iloc[-1, partial.columns.get_loc("Volume")] *= 0.4
+        for frame in (partial, df.iloc[:end]):
+            streamed = _streaming_signal(strategy, frame, "005930")
+            full = strategy.analyze(frame, "005930")
+            assert (streamed.signal, streamed.reason) == (full.signal, full.reason)
+            assert streamed.confidence == pytest.approx(full.confidence)
+            for key, value in full.indicators.items():
+                assert streamed.indicators[key] == pytest.approx(value, abs=0.01)
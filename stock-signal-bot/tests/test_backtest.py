@@ -0,0 +1,104 @@
+"""백테스트 엔진 테스트"""
+import numpy as np
+import pandas as pd
+import pytest
+from backtest.engine import ENSEMBLE_NAME, compute_signal_tensor, run_backtest, simulate
+from data.cache import save_to_cache
+from strategies.ensemble import _STRATEGIES, generate_panel_ensemble
+
+
+def _panel(
+    close: list[float], low: list[float] | None = None
+) -> dict[str, pd.DataFrame]:
+    idx = pd.bdate_range("2024-01-01", periods=len(close))
+    frame = lambda v: pd.DataFrame({"A": v}, index=idx, dtype=float)  # noqa: E731
+    return {
+        "Open": frame(close),
+        "High": frame(close),
+        "Low": frame(low or close),
+        "Close": frame(close),
+    }
+
+
+def test_entry_next_open_and_stop_loss_fill():
+    # 0일 BUY → 1일 시가(100) 진입, 3일 저가 90 → 손절가 93 체결
+    panel = _panel([100, 100, 105, 95], low=[100, 100, 105, 90])
+    signal = np.array([[1], [0], [0], [0]])
+    stats, returns = simulate(panel, signal, stop_pct=0.07)
+
+    assert stats.trades == 1
+    assert stats.hit_rate == 0.0
+    assert (1 + returns).prod() == pytest.approx(0.93)
+
+
+def test_sell_signal_exits_at_next_open():
+    panel = _panel([100, 100, 110, 120, 130])
+    signal = np.array([[1], [0], [-1], [0], [0]])
+    stats, returns = simulate(panel, signal, stop_pct=0.07)
+
+    assert stats.trades == 1
+    assert stats.hit_rate == 1.0
+    assert (1 + returns).prod() == pytest.approx(1.2)
+
+
+def test_exit_waits_for_next_valid_open():
+    # 2일 SELL → 3일 거래정지(시가 없음) → 4일 시가 130 청산
+    panel = _panel([100, 100, 110, 120, 130, 140])
+    panel["Open"].iloc[3] = np.nan
+    signal = np.array([[1], [0], [-1], [0], [0], [0]])
+    stats, returns = simulate(panel, signal, stop_pct=0.07)
+
+    assert stats.trades == 1
+    assert (1 + returns).prod() == pytest.approx(1.3)
+
+
+def test_tensor_rows_match_live_gating_and_halts():
+    """각 날짜의 텐서 시그널 = 그날까지 패널로 analyze_panel (min_bars·거래정지 반영)"""
+    rng = np.random.default_rng(4)
+    idx = pd.bdate_range("2022-01-03", periods=260)
+    close = pd.DataFrame(
+        50000 * np.exp(np.cumsum(rng.normal(0, 0.02, (260, 3)), axis=0)), index=idx
+    )
+    close.iloc[:120, 1] = np.nan        # 신규 상장 — 앞부분 min_bars 미만
+    close.iloc[150:160, 2] = np.nan     # 거래정지 구간
+    panel = {"Open": close, "High": close * 1.01, "Low": close * 0.99, "Close": close,
+             "Volume": close.notna() * 1e6}
+
+    tensor = compute_signal_tensor(panel)
+    for t in (140, 200, 259):
+        upto = {k: v.iloc[: t + 1] for k, v in panel.items()}
+        expected = [s.analyze_panel(upto).signal for s in _STRATEGIES]
+        np.testing.assert_array_equal(tensor.values[t], np.column_stack(expected))
+    assert (tensor.values[150:160, 2] == 0).all()
+
+
+def test_tensor_last_row_matches_panel_ensemble():
+    rng = np.random.default_rng(1)
+    idx = pd.bdate_range("2022-01-03", periods=300)
+    close = pd.DataFrame(
+        50000 * np.exp(np.cumsum(rng.normal(0, 0.02, (300, 4)), axis=0)), index=idx
+    )
+    panel = {"Open": close, "High": close * 1.01, "Low": close * 0.99, "Close": close,
+             "Volume": close * 0 + 1e6}
+
+    tensor = compute_signal_tensor(panel)
+    scores, final = tensor.ensemble()
+    expected = generate_panel_ensemble(panel)
+    np.testing.assert_array_equal(final[-1], expected.final)
+    np.testing.assert_allclose(scores[-1], expected.scores)
+
+
+def test_run_backtest_from_cache(tmp_db):
+    rng = np.random.default_rng(2)
+    idx = pd.bdate_range("2022-01-03", periods=300)
+    for code in ("005930", "000660"):
+        close = 50000 * np.exp(np.cumsum(rng.normal(0, 0.02, 300)))
+        save_to_cache(code, pd.DataFrame(
+            {"Open": close, "High": close * 1.01, "Low": close * 0.99,
+             "Close": close, "Volume": 1e6}, index=idx))
+
+    report = run_backtest()
+    frame = report.to_frame()
+    assert report.tickers == 2
+    assert list(frame.index) == [s.name for s in _STRATEGIES] + [ENSEMBLE_NAME]
+    assert (frame["max_drawdown"] <= 0).all()
@@ -0,0 +1,28 @@
+"""벤치마크 스위트 — 합성 데이터 재현성, JSON 결과, 커밋 간 비교"""
+import json
+
+from benchmarks import suite
+from benchmarks.synthetic import synthetic_frame, synthetic_panel
+
+
+def test_synthetic_data_is_seeded():
+    a, b = synthetic_frame(120, seed=7), synthetic_frame(120, seed=7)
+    assert a.equals(b)
+    assert not a.equals(synthetic_frame(120, seed=8))
+    assert synthetic_panel(3, 50)["Close"].shape == (50, 3)
+
+
+def test_run_saves_json_and_compare_flags_regressions(tmp_path):
+    report = suite.run(["ensemble"], quick=True, repeat=1)
+    path = suite.save(report, tmp_path / "new.json")
+    loaded = json.loads(path.read_text())
+
+    assert loaded["meta"]["quick"] is True
+    assert {(r["name"], r["params"]["memo"]) for r in loaded["results"]} == {
+        ("generate_ensemble_signal", False), ("generate_ensemble_signal", True),
+    }
+
+    slower = json.loads(path.read_text())
+    slower["results"][0]["seconds"] *= 2
+    rows = suite.compare(loaded, slower, threshold=0.1)
+    assert [r["regression"] for r in rows] == [True, False]
@@ -0,0 +1,34 @@
+"""시작 비용과 1회 실행 CLI — 진입점 임포트는 가볍게, --dry-run 은 토큰 없이 출력만"""
+import config
+import main
+import pytest
+from benchmarks import bench_startup
+from notifications import telegram
+from scheduling.runtime import JobRuntime
+from signals import generator, session
+from signals.models import DailyReport
+
+
+def test_entrypoint_import_defers_heavy_packages():
+    # TELEGRAM_* 없이 새 인터프리터에서 임포트
+    assert bench_startup.measure("config")["loaded"] == []
+    assert bench_startup.measure("main")["loaded"] == []
+
+
+def test_report_dry_run_prints_without_token(tmp_db, monkeypatch, capsys):
+    monkeypatch.setattr(config, "TELEGRAM_BOT_TOKEN", "")
+    monkeypatch.setattr(main, "RUNTIME", JobRuntime(io_workers=1, cpu_workers=1))
+    monkeypatch.setattr(generator, "session_signals", lambda: [])
+    monkeypatch.setattr(session, "load", lambda artifact: None)
+    monkeypatch.setattr(
+        generator, "build_daily_report",
+        lambda signals, screening=None: DailyReport(date="2026-10-19", signals=signals),
+    )
+
+    assert main.cli(["report", "--dry-run"]) == 0
+    assert "일간 리포트 (2026-10-19)" in capsys.readouterr().out
+    telegram.set_dry_run(False)
+
+    with pytest.raises(SystemExit):
+        main.cli(["report"])
+    assert "TELEGRAM_BOT_TOKEN" in capsys.readouterr().err
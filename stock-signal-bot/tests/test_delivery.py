@@ -0,0 +1,179 @@
+"""Telegram 발송 파이프라인
+
+로컬 가짜 Bot API 서버 상대로 재시도·속도 제한·동시 발송 확인.
+"""
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs
+
+import config
+import pytest
+from notifications import telegram as tg
+from notifications.delivery import TelegramDelivery
+from telegram.error import BadRequest
+
+
+class _FakeBotAPI(ThreadingHTTPServer):
+    """
+    /bot<token>/<method> 를 받아 기록하고 Message 를 돌려준다.
+    failures[chat_id] 에 (HTTP 상태, retry_after) 를 넣어 두면
+    그 채팅의 다음 요청들이 차례로 실패.
+    """
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.requests: list[tuple[float, str, dict]] = []
+        self.failures: dict[str, list[tuple[int, int | None]]] = {}
+        self.lock = threading.Lock()
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.server_port}/bot"
+
+    def delivered(self, chat_id: str) -> list[tuple[float, str]]:
+        return [(t, p["text"]) for t, _, p in self.requests if p["chat_id"] == chat_id]
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: _FakeBotAPI
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0))).decode()
+        params = {k: v[0] for k, v in parse_qs(body).items()}
+        method = self.path.rsplit("/", 1)[-1]
+        with self.server.lock:
+            failures = self.server.failures.get(params.get("chat_id"), [])
+            failure = failures.pop(0) if failures else None
+            if failure is None:
+                self.server.requests.append((time.monotonic(), method, params))
+                message_id = len(self.server.requests)
+
+        if failure is None:
+            status = 200
+            payload = {"ok": True, "result": {
+                "message_id": message_id, "date": 0,
+                "chat": {"id": 1, "type": "private"},
+                "text": params.get("text", ""),
+            }}
+        else:
+            status, retry_after = failure
+            payload = {
+                "ok": False, "error_code": status, "description": f"error {status}"
+            }
+            if retry_after is not None:
+                payload["parameters"] = {"retry_after": retry_after}
+        out = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(out)))
+        self.end_headers()
+        self.wfile.write(out)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def api():
+    server = _FakeBotAPI()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _run(api, scenario, **options):
+    async def main():
+        delivery = TelegramDelivery("123:abc", base_url=api.base_url, **options)
+        try:
+            return await scenario(delivery), delivery.stats
+        finally:
+            await delivery.close()
+
+    return asyncio.run(main())
+
+
+def test_retries_rate_limit_and_server_errors(api):
+    api.failures = {"a": [(429, 1)], "b": [(502, None), (500, None)]}
+
+    async def scenario(delivery):
+        futures = [
+            delivery.submit(chat, "send_message", text=chat) for chat in ("a", "b")
+        ]
+        return [m.message_id for m in await asyncio.gather(*futures)]
+
+    started = time.monotonic()
+    ids, stats = _run(api, scenario, chat_interval=0, retry_base=0.05)
+
+    assert sorted(ids) == [1, 2]
+    assert time.monotonic() - started >= 1.0          # 429 retry_after 준수
+    assert (stats.sent, stats.retried, stats.failed) == (2, 3, 0)
+
+
+def test_bad_request_fails_without_retry(api):
+    api.failures = {"a": [(400, None)]}
+
+    async def scenario(delivery):
+        with pytest.raises(BadRequest):
+            await delivery.submit("a", "send_message", text="x")
+        return await delivery.submit("a", "send_message", text="y")
+
+    message, stats = _run(api, scenario, chat_interval=0)
+    assert message.text == "y"
+    assert (stats.retried, stats.failed) == (0, 1)
+
+
+def test_chats_run_concurrently_with_per_chat_spacing(api):
+    async def scenario(delivery):
+        futures = [
+            delivery.submit(chat, "send_message", text=f"{chat}{i}")
+            for i in range(3) for chat in ("a", "b")
+        ]
+        await asyncio.gather(*futures)
+
+    started = time.monotonic()
+    _run(api, scenario, chat_interval=0.2)
+    elapsed = time.monotonic() - started
+
+    for chat in ("a", "b"):
+        sent = api.delivered(chat)
+        assert [text for _, text in sent] == [f"{chat}0", f"{chat}1", f"{chat}2"]
+        assert all(b - a >= 0.19 for (a, _), (b, _) in zip(sent, sent[1:]))
+    assert elapsed < 0.9            # 순차 발송이면 1.0초 이상
+
+
+def test_urgent_message_jumps_chat_queue(api):
+    async def scenario(delivery):
+        futures = [
+            delivery.submit("a", "send_message", text=f"report{i}") for i in range(3)
+        ]
+        futures.append(delivery.submit("a", "send_message", urgent=True, text="stop"))
+        await asyncio.gather(*futures)
+
+    _run(api, scenario, chat_interval=0)
+    texts = [text for _, text in api.delivered("a")]
+    assert texts == ["stop", "report0", "report1", "report2"]
+
+
+def test_notifications_share_one_pipeline_across_chats(api, monkeypatch):
+    monkeypatch.setattr(config, "TELEGRAM_API_URL", api.base_url)
+    monkeypatch.setattr(config, "TELEGRAM_CHAT_IDS", ["1", "2"])
+    monkeypatch.setattr(config, "TELEGRAM_CHAT_INTERVAL_SECONDS", 0)
+    monkeypatch.setattr(tg, "_delivery", None)
+
+    async def scenario():
+        await tg.send_error("first")
+        delivery = tg._delivery
+        await tg.send_error("second")
+        assert tg._delivery is delivery
+        await tg.close_delivery()
+
+    asyncio.run(scenario())
+    def texts(chat_id):
+        return [text for _, text in api.delivered(chat_id)]
+
+    assert texts("1") == texts("2")
+    assert len(api.delivered("1")) == 2
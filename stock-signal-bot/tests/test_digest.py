@@ -0,0 +1,89 @@
+"""시그널 다이제스트 — 4096자 분할, 같은 세션 중복 억제, 발송 지연 상한"""
+import asyncio
+from datetime import datetime, timedelta
+
+from notifications import telegram as tg
+from notifications.digest import SignalDigest, fingerprint
+from signals.models import EnsembleSignal, SignalType, StrategySignal
+
+
+def _signal(
+    code: str,
+    signal=SignalType.BUY,
+    price=10000.0,
+    votes=(SignalType.BUY, SignalType.NEUTRAL),
+):
+    strategies = [
+        StrategySignal(
+            strategy_name=f"전략{i}", signal=v, confidence=0.6,
+            reason="조건 충족 " * 10,
+        )
+        for i, v in enumerate(votes)
+    ]
+    return EnsembleSignal(
+        stock_code=code, stock_name=f"종목{code}", signal=signal, ensemble_score=0.7,
+        strategy_signals=strategies, price=price, change_pct=1.0,
+    )
+
+
+def test_pack_fills_messages_up_to_limit():
+    signals = [_signal(f"{i:06d}", votes=[SignalType.BUY] * 7) for i in range(40)]
+    entries = [tg._format_signal_entry(s) for s in signals]
+    messages = tg._pack("header", entries, "footer")
+
+    assert all(len(m) <= tg.MAX_MESSAGE_CHARS for m in messages)
+    assert len(messages) < len(entries)
+    assert len(messages) <= sum(map(len, entries)) // 3000 + 1
+    assert "".join(messages).count("<b>종목") == 40
+    assert all(m.startswith("header") and m.endswith("footer") for m in messages)
+
+
+def test_unchanged_signals_are_suppressed_within_session(tmp_db):
+    sent: list[list[str]] = []
+
+    async def send(signals):
+        sent.append([s.stock_code for s in signals])
+
+    day = datetime(2026, 10, 19, 9, 5)
+
+    async def scenario():
+        digest = SignalDigest(send, window=3600)
+
+        async def scan(signals, now):
+            await digest.add(signals)
+            await digest.flush(now)
+
+        sell, neutral = SignalType.SELL, SignalType.NEUTRAL
+        await scan([_signal("A"), _signal("B"), _signal("C", neutral)], day)
+        await scan([_signal("A", price=10500), _signal("B")], day)  # 가격만 변동
+        await scan([_signal("A", sell), _signal("B", neutral)], day)
+        await scan([_signal("A", sell), _signal("B")], day)  # 중립 → 다시 BUY
+        await scan([_signal("A", sell)], day + timedelta(days=1))  # 다음 거래일
+
+    asyncio.run(scenario())
+    assert sent == [["A", "B"], ["A"], ["B"], ["A"]]
+    assert fingerprint(_signal("A")) == fingerprint(_signal("A", price=1))
+
+
+def test_window_merges_scans_and_bounds_latency(tmp_db):
+    sent: list[tuple[float, list[float]]] = []
+
+    async def scenario():
+        loop = asyncio.get_running_loop()
+
+        async def send(signals):
+            sent.append((loop.time(), [s.price for s in signals]))
+
+        digest = SignalDigest(send, window=0.2)
+        started = loop.time()
+        await digest.add([_signal("A", price=1)])
+        await asyncio.sleep(0.05)
+        await digest.add([_signal("A", price=2), _signal("B")])
+        await asyncio.sleep(0.4)
+        return started
+
+    started = asyncio.run(scenario())
+    assert len(sent) == 1
+    at, prices = sent[0]
+    assert 0.15 <= at - started < 0.35
+    assert prices == [2, 10000.0]
@@ -0,0 +1,69 @@
+"""조기 종료 앙상블 테스트"""
+import numpy as np
+import pandas as pd
+import pytest
+from signals.models import SignalType
+from strategies.ensemble import (
+    _EARLY_EXIT_ORDER,
+    _STRATEGIES,
+    _fixed_outcome,
+    evaluate_ensemble,
+)
+
+
+def _make_df(seed: int, n: int = 300) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 60000 * np.exp(np.cumsum(rng.normal(0.0003, 0.02, n)))
+    open_ = close * (1 + rng.normal(0, 0.01, n))
+    return pd.DataFrame(
+        {"Open": open_, "High": np.maximum(open_, close) * 1.01,
+         "Low": np.minimum(open_, close) * 0.99, "Close": close,
+         "Volume": rng.lognormal(15, 0.5, n)},
+        index=pd.bdate_range("2023-01-02", periods=n),
+    )
+
+
+def test_same_final_signal_and_exact_buy_scores():
+    skipped = 0
+    for seed in range(25):
+        df = _make_df(seed)
+        full = evaluate_ensemble("005930", df, 1.0, 0.0)
+        fast = evaluate_ensemble("005930", df, 1.0, 0.0, early_exit=True)
+
+        assert fast.signal == full.signal
+        if full.signal in (SignalType.BUY, SignalType.STRONG_BUY):
+            assert fast.ensemble_score == full.ensemble_score
+        skipped += sum(s.reason.startswith("미평가") for s in fast.strategy_signals)
+    assert skipped > 0
+
+
+def test_skipped_strategies_are_neutral_and_in_ensemble_order():
+    for seed in range(25):
+        fast = evaluate_ensemble("005930", _make_df(seed), 1.0, 0.0, early_exit=True)
+        names = [s.strategy_name for s in fast.strategy_signals]
+        assert names == [s.name for s in _STRATEGIES]
+        for sig in fast.strategy_signals:
+            if sig.reason.startswith("미평가"):
+                assert sig.signal == SignalType.NEUTRAL
+
+
+def test_order_is_cost_per_weight():
+    keys = [s.cost / (s.weight * (s.signal_range[1].value - s.signal_range[0].value))
+            for s in _EARLY_EXIT_ORDER]
+    assert keys == sorted(keys)
+
+
+@pytest.mark.parametrize(
+    "lo, hi, strong_buys, more, expected",
+    [
+        (-0.3, 0.3, 0, 3, SignalType.NEUTRAL),
+        (-0.3, 0.7, 0, 3, None),              # BUY 가능 → 계속 평가
+        (-1.0, -0.7, 0, 3, SignalType.SELL),
+        (-2.0, -1.3, 0, 3, None),              # STRONG_BUY 2개가 나오면 관망 강등
+        (-2.0, -1.3, 0, 1, SignalType.STRONG_SELL),
+        (-2.0, -1.3, 2, 0, SignalType.NEUTRAL),
+        (-1.3, -0.7, 0, 0, None),              # SELL/STRONG_SELL 경계에 걸침
+    ],
+)
+def test_fixed_outcome(lo, hi, strong_buys, more, expected):
+    assert _fixed_outcome(lo, hi, strong_buys, more) == expected
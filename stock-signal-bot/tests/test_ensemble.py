@@ -54,3 +54,27 @@ def test_weights_sum_to_one():
     from strategies.ensemble import _STRATEGIES
     total = sum(s.weight for s in _STRATEGIES)
     assert total == pytest.approx(1.0, abs=0.01)
+
+
+def test_streaming_scan_uses_stored_indicators(tmp_db):
+    """streaming=True 이면 엘더는 저장된 지표로, 다음 스캔은 새 봉만 반영"""
+    from db.indicator_state import load_indicator_state
+    from strategies.elder import ElderStrategy
+
+    df = _make_df(300)
+    name = ElderStrategy().name
+    first = generate_ensemble_signal(
+        "005930", df.iloc[:-1], 75000.0, 1.2, streaming=True
+    )
+    saved = load_indicator_state("005930", f"{name}/force_index_2")
+    assert saved[0] == df.index[-2].strftime("%Y-%m-%d")
+    assert len(first.strategy_signals) == 7
+
+    second = generate_ensemble_signal("005930", df, 75000.0, 1.2, streaming=True)
+    batch = generate_ensemble_signal("005930", df, 75000.0, 1.2)
+    assert load_indicator_state("005930", f"{name}/force_index_2")[0] == (
+        df.index[-1].strftime("%Y-%m-%d")
+    )
+    assert [s.signal for s in second.strategy_signals] == [
+        s.signal for s in batch.strategy_signals
+    ]
@@ -0,0 +1,154 @@
+"""스크리닝 순위 스트리밍 — 상위 K 힙, 중간 순위표 이터레이터, 잠정 추천 메시지 수정"""
+import asyncio
+import threading
+import time
+
+import pytest
+from notifications import telegram as tg
+from scheduling import runtime as rt
+from scheduling.runtime import JobRuntime
+from signals.leaderboard import TopK, stream_leaderboards
+from signals.models import (
+    Leaderboard,
+    Recommendation,
+    ScreeningResult,
+    ScreeningSummary,
+    SignalType,
+)
+
+
+def _rec(code: str, score: float) -> Recommendation:
+    return Recommendation(
+        stock_code=code, stock_name=code, signal=SignalType.BUY,
+        ensemble_score=score, price=1000.0, change_pct=0.0, top_reasons=[],
+    )
+
+
+def test_topk_keeps_highest_scores_in_arrival_order_on_ties():
+    top: TopK[str] = TopK(3)
+    pushes = [
+        ("a", 0.7), ("b", 1.3), ("c", 0.7), ("d", 0.9), ("e", 0.7), ("f", 0.6)
+    ]
+    for item, score in pushes:
+        top.push(score, item)
+
+    assert top.items() == ["b", "d", "a"]
+    assert top.pushed == 6
+    assert len(top) == 3
+    assert TopK(0).push(1.0, "x") is False
+
+
+def test_stream_yields_interim_boards_then_final():
+    def run(on_progress):
+        for scored in (10, 20, 30):
+            on_progress(Leaderboard(
+                recommendations=[_rec("A", scored / 10)], scored=scored, total=40
+            ))
+            time.sleep(0.01)
+        return ScreeningResult(
+            recommendations=[_rec("A", 3.0)],
+            summary=ScreeningSummary(mode="thread", universe=40, prefiltered=40,
+                                     candidates=1, elapsed_s=0.1),
+        )
+
+    async def collect():
+        return [board async for board in stream_leaderboards(run)]
+
+    boards = asyncio.run(collect())
+    interim, final = boards[:-1], boards[-1]
+    assert interim and all(not b.final for b in interim)
+    assert [b.scored for b in interim] == sorted(b.scored for b in interim)
+    assert interim[-1].scored == 30
+    assert final.final and final.progress == 1.0
+    assert final.result.recommendations[0].ensemble_score == 3.0
+
+
+def test_stream_runs_through_runtime_cpu_lane():
+    runtime = JobRuntime(io_workers=1, cpu_workers=1)
+    threads = []
+
+    def run(on_progress):
+        threads.append(threading.current_thread().name)
+        on_progress(Leaderboard(recommendations=[_rec("A", 1.0)], scored=1, total=2))
+        return ScreeningResult(recommendations=[_rec("A", 1.0)])
+
+    async def collect():
+        rt._current_job.set("screening_0900")
+        return [board async for board in stream_leaderboards(run, runtime.run_cpu)]
+
+    boards = asyncio.run(collect())
+    runtime.shutdown()
+    assert boards[-1].final
+    assert threads and threads[0].startswith("job-cpu")
+    assert "screening_0900" in runtime.stats()
+
+
+def test_stream_propagates_screening_errors():
+    def run(on_progress):
+        raise RuntimeError("boom")
+
+    async def collect():
+        return [board async for board in stream_leaderboards(run)]
+
+    with pytest.raises(RuntimeError, match="boom"):
+        asyncio.run(collect())
+
+
+class _FakeBot:
+    def __init__(self):
+        self.sent, self.edited = [], []
+
+    async def send_message(self, chat_id, text, parse_mode=None):
+        self.sent.append(text)
+        return type("Message", (), {"message_id": len(self.sent)})()
+
+    async def edit_message_text(self, text, chat_id, message_id, parse_mode=None):
+        self.edited.append((message_id, text))
+
+
+def _use_bot(monkeypatch, bot):
+    """발송 파이프라인의 Bot 을 가짜로 교체 (루프 안에서 처음 쓸 때 생성)"""
+    from notifications.delivery import TelegramDelivery
+
+    holder = []
+
+    def get_delivery():
+        if not holder:
+            holder.append(TelegramDelivery("token", chat_interval=0))
+            holder[0].bot = bot
+        return holder[0]
+
+    monkeypatch.setattr(tg, "_get_delivery", get_delivery)
+
+
+async def _boards(shares):
+    for scored in shares:
+        yield Leaderboard(
+            recommendations=[_rec("000001", 0.8)], scored=scored, total=100
+        )
+    result = ScreeningResult(recommendations=[_rec("000002", 1.5)])
+    yield Leaderboard(recommendations=result.recommendations, scored=100, total=100,
+                      final=True, result=result)
+
+
+def test_provisional_message_is_edited_with_final_result(monkeypatch):
+    bot = _FakeBot()
+    _use_bot(monkeypatch, bot)
+
+    result = asyncio.run(tg.deliver_screening(_boards([20, 60, 80]), share=0.5))
+
+    assert len(bot.sent) == 1 and "잠정 추천" in bot.sent[0] and "60/100" in bot.sent[0]
+    assert len(bot.edited) == 1
+    message_id, text = bot.edited[0]
+    assert message_id == 1 and "000002" in text and "잠정" not in text
+    assert result.recommendations[0].stock_code == "000002"
+
+
+def test_final_is_sent_when_share_never_reached(monkeypatch):
+    bot = _FakeBot()
+    _use_bot(monkeypatch, bot)
+
+    asyncio.run(tg.deliver_screening(_boards([10, 30]), share=0.5))
+
+    assert len(bot.sent) == 1 and "000002" in bot.sent[0]
+    assert bot.edited == []
@@ -0,0 +1,74 @@
+"""KRX 거래일 캘린더 — 휴장일·개장 시각 변경일, 거래일 기준 스케줄 트리거"""
+from datetime import date, datetime, time, timedelta
+from zoneinfo import ZoneInfo
+
+from data import market_calendar as cal
+from scheduling.triggers import SessionIntervalTrigger, SessionTrigger
+
+KST = ZoneInfo("Asia/Seoul")
+
+
+def _kst(*args) -> datetime:
+    return datetime(*args, tzinfo=KST)
+
+
+def test_holidays_and_shifted_sessions():
+    assert not cal.is_trading_day(date(2026, 10, 17))         # 토요일
+    assert not cal.is_trading_day(date(2026, 10, 9))          # 한글날
+    assert cal.previous_trading_day(date(2026, 10, 12)) == date(2026, 10, 8)
+    assert cal.next_trading_day(date(2026, 12, 30)) == date(2027, 1, 4)
+    assert cal.last_trading_day(date(2026, 10, 18)) == date(2026, 10, 16)
+
+    assert cal.session(date(2026, 1, 2)).open == time(10, 0)  # 연초 첫 거래일
+    csat = cal.session(date(2026, 11, 19))
+    assert (csat.open, csat.close) == (time(10, 0), time(16, 30)) and not csat.regular
+    assert cal.session(date(2026, 10, 19)).regular
+
+    assert cal.is_open(_kst(2026, 11, 19, 16, 0))
+    assert not cal.is_open(_kst(2026, 10, 19, 16, 0))
+    assert not cal.is_open(_kst(2026, 10, 9, 10, 0))
+
+
+def test_session_trigger_follows_open_and_close():
+    open_job = SessionTrigger.at(9, 5, KST)
+    close_job = SessionTrigger.at(15, 20, KST)
+    lunch_job = SessionTrigger.at(12, 30, KST)
+
+    # 수능일(11/19)은 개장·마감이 1시간씩 늦음
+    exam = _kst(2026, 11, 19, 8)
+    assert open_job.get_next_fire_time(None, exam) == _kst(2026, 11, 19, 10, 5)
+    assert close_job.get_next_fire_time(None, exam) == _kst(2026, 11, 19, 16, 20)
+    assert lunch_job.get_next_fire_time(None, exam) == _kst(2026, 11, 19, 12, 30)
+
+    # 금요일 장 마감 후 → 휴일(10/9)·주말 건너뛰고 다음 거래일
+    after_close = _kst(2026, 10, 8, 16)
+    assert open_job.get_next_fire_time(None, after_close) == _kst(2026, 10, 12, 9, 5)
+    fired = _kst(2026, 10, 16, 9, 5)
+    assert open_job.get_next_fire_time(fired, fired) == _kst(2026, 10, 19, 9, 5)
+
+
+def test_interval_trigger_stays_inside_session():
+    trigger = SessionIntervalTrigger(60, KST)
+
+    before_open = _kst(2026, 10, 19, 7)
+    assert trigger.get_next_fire_time(None, before_open) == _kst(2026, 10, 19, 9)
+    fired = _kst(2026, 10, 19, 10)
+    assert trigger.get_next_fire_time(fired, fired) == fired + timedelta(seconds=60)
+
+    last = _kst(2026, 10, 19, 15, 30)
+    assert trigger.get_next_fire_time(last, last) == _kst(2026, 10, 20, 9)
+    friday = _kst(2026, 10, 8, 15, 30)
+    assert trigger.get_next_fire_time(friday, friday) == _kst(2026, 10, 12, 9)
+
+
+def test_scheduler_uses_session_triggers():
+    import main
+    from scheduling.runtime import JobRuntime
+
+    runtime = JobRuntime(io_workers=1, cpu_workers=1)
+    jobs = {job.id: job for job in main.build_scheduler(runtime).get_jobs()}
+
+    assert isinstance(jobs["stop_loss_monitor"].trigger, SessionIntervalTrigger)
+    assert jobs["closing_signal"].trigger.anchor == "close"
+    assert jobs["midday_check"].trigger.anchor is None
+    runtime.shutdown()
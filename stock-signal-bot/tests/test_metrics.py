@@ -0,0 +1,99 @@
+"""운영 지표 — 텍스트 형식, HTTP 노출, 계측 지점, 꺼졌을 때 무기록"""
+import urllib.request
+from datetime import date
+
+import metrics
+import pytest
+
+
+@pytest.fixture
+def enabled():
+    metrics.enable()
+    yield
+    metrics.enable(False)
+
+
+def _sample(text: str, line_prefix: str) -> float:
+    for line in text.splitlines():
+        if line.startswith(line_prefix + " "):
+            return float(line.rsplit(" ", 1)[1])
+    raise AssertionError(f"{line_prefix} 없음:\n{text}")
+
+
+def test_render_counter_and_histogram(enabled):
+    calls = metrics.counter("stockbot_test_calls_total", "테스트 호출", ["kind"])
+    latency = metrics.histogram(
+        "stockbot_test_seconds", "테스트 시간", ["op"], buckets=(0.1, 1.0)
+    )
+    calls.inc(kind='a"b')
+    calls.inc(2, kind='a"b')
+    latency.observe(0.05, op="read")
+    latency.observe(0.5, op="read")
+    latency.observe(5, op="read")
+
+    text = metrics.render()
+    assert "# TYPE stockbot_test_calls_total counter" in text
+    assert _sample(text, 'stockbot_test_calls_total{kind="a\\"b"}') == 3
+    assert _sample(text, 'stockbot_test_seconds_bucket{op="read",le="0.1"}') == 1
+    assert _sample(text, 'stockbot_test_seconds_bucket{op="read",le="1.0"}') == 2
+    assert _sample(text, 'stockbot_test_seconds_bucket{op="read",le="+Inf"}') == 3
+    assert _sample(text, 'stockbot_test_seconds_count{op="read"}') == 3
+    assert _sample(text, 'stockbot_test_seconds_sum{op="read"}') == pytest.approx(5.55)
+    assert metrics.counter("stockbot_test_calls_total", "", ["kind"]) is calls
+
+
+def test_serve_exposes_metrics_over_http(enabled):
+    metrics.counter("stockbot_test_http_total", "HTTP 테스트").inc()
+    server = metrics.serve("127.0.0.1", 0)
+    try:
+        url = f"http://127.0.0.1:{server.server_port}/metrics"
+        with urllib.request.urlopen(url, timeout=5) as resp:
+            assert resp.headers["Content-Type"].startswith("text/plain; version=0.0.4")
+            body = resp.read().decode()
+    finally:
+        server.shutdown()
+        server.server_close()
+    assert _sample(body, "stockbot_test_http_total") == 1
+
+
+def test_sqlite_and_cache_instrumentation(enabled, tmp_db):
+    from data.cache import missing_dates
+    from db.database import get_conn
+
+    before = metrics.render()
+    with get_conn() as conn:
+        conn.execute("SELECT 1").fetchone()
+    start, end = date(2025, 6, 2), date(2025, 6, 5)
+    assert missing_dates("005930", start, end) == (start, end)
+
+    after = metrics.render()
+    key = 'stockbot_sqlite_query_seconds_count{op="SELECT"}'
+    assert _sample(after, key) > (_sample(before, key) if key in before else 0)
+    miss = 'stockbot_cache_requests_total{cache="ohlcv",result="miss"}'
+    assert _sample(after, miss) == (_sample(before, miss) if miss in before else 0) + 1
+
+
+def test_nothing_recorded_when_disabled():
+    assert not metrics.enabled()
+    calls = metrics.counter("stockbot_test_disabled_total", "꺼짐 테스트")
+    calls.inc()
+    with metrics.external_call("test", "noop"):
+        pass
+    text = metrics.render()
+    lines = text.splitlines()
+    assert not any(line.startswith("stockbot_test_disabled_total") for line in lines)
+    assert 'api="test"' not in text
+
+
+def test_runtime_collector_families():
+    from scheduling.runtime import JobRuntime
+
+    runtime = JobRuntime(1, 1)
+    try:
+        runtime._update("scan", runs=1, last_duration_s=2.5)
+        families = {f.name: f for f in runtime.metric_families()}
+    finally:
+        runtime.shutdown()
+    runs = families["stockbot_job_runs_total"].samples
+    assert runs == [("stockbot_job_runs_total", {"job": "scan"}, 1)]
+    assert families["stockbot_job_last_duration_seconds"].samples[0][2] == 2.5
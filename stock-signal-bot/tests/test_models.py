@@ -0,0 +1,32 @@
+"""내부 결과 타입(StrategyResult / EnsembleResult) 테스트"""
+import pytest
+from pydantic import ValidationError
+from signals.models import EnsembleResult, SignalType, StrategyResult, StrategySignal
+
+
+def test_strategy_result_round_trip():
+    result = StrategyResult(
+        "일목균형표", SignalType.BUY, 0.75, "삼역호전", {"tenkan": 70000.0}
+    )
+    assert StrategyResult.from_dict(result.as_dict()) == result
+
+    model = result.to_model()
+    assert isinstance(model, StrategySignal)
+    assert model.signal == SignalType.BUY
+    assert model.indicators == {"tenkan": 70000.0}
+
+
+def test_validation_happens_at_boundary():
+    result = StrategyResult("A", SignalType.BUY, confidence=1.5)
+    with pytest.raises(ValidationError):
+        result.to_model()
+
+
+def test_ensemble_result_to_model():
+    result = EnsembleResult(
+        "005930", "삼성전자", SignalType.NEUTRAL, 0.1,
+        [StrategyResult("A", SignalType.NEUTRAL)], 75000.0, 0.5,
+    )
+    model = result.to_model()
+    assert model.timestamp == result.timestamp
+    assert isinstance(model.strategy_signals[0], StrategySignal)
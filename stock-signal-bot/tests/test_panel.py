@@ -0,0 +1,92 @@
+"""패널(날짜 × 종목) 벡터 평가 테스트"""
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import pytest
+from data.cache import load_panel, save_to_cache
+from strategies.ensemble import (
+    _STRATEGIES,
+    evaluate_ensemble,
+    generate_ensemble_signal,
+    generate_panel_ensemble,
+)
+from strategies.panel import panel_from_frames, single_panel, ticker_frame
+
+from tests.strategies.reference import REFERENCE_STRATEGIES
+
+
+def _make_df(n: int, seed: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 50000 * np.exp(np.cumsum(rng.normal(0.0005, 0.02, n)))
+    open_ = close * (1 + rng.normal(0, 0.01, n))
+    high = np.maximum(close, open_) * (1 + abs(rng.normal(0, 0.01, n)))
+    low = np.minimum(close, open_) * (1 - abs(rng.normal(0, 0.01, n)))
+    volume = rng.lognormal(15, 0.6, n)
+    idx = pd.bdate_range("2022-01-03", periods=n)
+    return pd.DataFrame(
+        {"Open": open_, "High": high, "Low": low, "Close": close, "Volume": volume},
+        index=idx,
+    )
+
+
+@pytest.mark.parametrize(
+    "strategy, reference", list(zip(_STRATEGIES, REFERENCE_STRATEGIES)),
+    ids=[type(s).__name__ for s in _STRATEGIES],
+)
+def test_panel_matches_reference_per_row(strategy, reference):
+    """패널 평가의 각 날짜 결과 == 그 날짜까지 잘라 원래 종목 단위 구현으로 분석"""
+    df = _make_df(320, seed=11)
+    frames = strategy.evaluate_panel(single_panel(df))
+    for t in range(60, len(df), 13):
+        expected = reference.analyze(df.iloc[: t + 1], "X")
+        assert frames["signal"].iloc[t, 0] == expected.signal.value
+        assert frames["confidence"].iloc[t, 0] == pytest.approx(expected.confidence)
+
+
+def test_panel_ensemble_matches_per_stock():
+    frames = {f"{i:06d}": _make_df(300, seed=i) for i in range(6)}
+    result = generate_panel_ensemble(panel_from_frames(frames))
+
+    assert result.signals.shape == (6, len(_STRATEGIES))
+    for i, (code, df) in enumerate(frames.items()):
+        expected = generate_ensemble_signal(code, df, 0.0, 0.0)
+        assert result.scores[i] == pytest.approx(expected.ensemble_score, abs=1e-3)
+        assert result.signal_of(code) == expected.signal
+        assert result.signals[i].tolist() == [
+            s.signal.value for s in expected.strategy_signals
+        ]
+
+
+def test_panel_ensemble_aligns_gapped_tickers():
+    """거래정지로 빠진 날짜가 있는 종목도 종목 단위(빈 날짜 제외) 평가와 같은 결과"""
+    rng = np.random.default_rng(3)
+    frames = {}
+    for i in range(12):
+        df = _make_df(300, seed=100 + i)
+        if i % 2:
+            df = df.drop(df.index[-int(rng.integers(2, 30))])   # 최근 30일 중 하루 정지
+        if i == 11:
+            df = df.iloc[200:]                                  # 신규 상장 — 100봉
+        frames[f"{i:06d}"] = df
+    panel = panel_from_frames(frames)
+    result = generate_panel_ensemble(panel)
+
+    for i, code in enumerate(result.tickers):
+        expected = evaluate_ensemble(code, ticker_frame(panel, i), 0.0, 0.0)
+        assert result.signals[i].tolist() == [
+            s.signal.value for s in expected.strategy_signals
+        ], code
+        assert result.scores[i] == pytest.approx(expected.ensemble_score, abs=1e-9)
+        assert result.final[i] == expected.signal.value
+
+
+def test_load_panel_pivots_cached_rows(tmp_db):
+    for seed, code in enumerate(("005930", "000660")):
+        save_to_cache(code, _make_df(30, seed))
+
+    panel = load_panel(
+        ["005930", "000660", "999999"], date(2022, 1, 1), date(2022, 12, 31)
+    )
+    assert list(panel["Close"].columns) == ["005930", "000660"]
+    assert panel["Close"].shape == (30, 2)
@@ -0,0 +1,93 @@
+"""2단계 스크리닝 1차 필터 테스트 — 걸러낸 종목은 BUY 이상이 될 수 없어야 함"""
+import numpy as np
+import pandas as pd
+import pytest
+from signals.models import SignalType
+from signals.prefilter import prefilter_panel
+from strategies.ensemble import (
+    _STRATEGIES,
+    evaluate_ensemble,
+    generate_panel_ensemble,
+)
+from strategies.panel import ticker_frame
+
+
+def _panel(
+    seed: int, n_tickers: int = 120, n_days: int = 320
+) -> dict[str, pd.DataFrame]:
+    rng = np.random.default_rng(seed)
+    idx = pd.bdate_range("2023-01-02", periods=n_days)
+    cols = [f"{i:06d}" for i in range(n_tickers)]
+    returns = rng.normal(0.0005, 0.02, (n_days, n_tickers))
+    close = pd.DataFrame(
+        50000 * np.exp(np.cumsum(returns, axis=0)), index=idx, columns=cols
+    )
+    open_ = close * (1 + rng.normal(0, 0.01, close.shape))
+    volume = pd.DataFrame(rng.lognormal(15, 0.6, close.shape), index=idx, columns=cols)
+    close.iloc[:270, -1] = np.nan  # 상장 50일 — 최소 일수 미달
+    return {
+        "Open": open_,
+        "High": np.maximum(open_, close) * 1.01,
+        "Low": np.minimum(open_, close) * 0.99,
+        "Close": close,
+        "Volume": volume,
+    }
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_filtered_out_tickers_cannot_buy(seed):
+    panel = _panel(seed)
+    result = prefilter_panel(panel)
+    ensemble = generate_panel_ensemble(panel)
+
+    # 전략 단위: 필요조건이 거짓이면 해당 전략은 BUY 미만
+    for j, strategy in enumerate(_STRATEGIES):
+        emitted_buy = ensemble.signals[:, j] >= SignalType.BUY.value
+        assert not (emitted_buy & ~result.possible[:, j]).any(), strategy.name
+
+    # 앙상블 단위: 최종 BUY 이상 종목은 모두 통과
+    buys = ensemble.final >= SignalType.BUY.value
+    assert not (buys & ~result.passed).any()
+    passed = result.passed
+    assert (ensemble.scores[passed] <= result.upper_bound[passed] + 1e-9).all()
+
+
+def test_prefilter_drops_short_history_and_reports_selectivity():
+    result = prefilter_panel(_panel(0))
+
+    assert "000119" not in result.survivors
+    assert 0 < result.selectivity < 1
+    assert len(result.survivors) == int(result.passed.sum())
+
+
+def _with_halts(panel: dict[str, pd.DataFrame], seed: int) -> dict[str, pd.DataFrame]:
+    """짝수 번째 종목마다 최근 30일 중 하루 거래정지 (모든 필드 NaN)"""
+    rng = np.random.default_rng(seed)
+    panel = {f: frame.copy() for f, frame in panel.items()}
+    n_days, n_tickers = panel["Close"].shape
+    for j in range(0, n_tickers - 1, 2):
+        day = n_days - int(rng.integers(2, 30))
+        for frame in panel.values():
+            frame.iloc[day, j] = np.nan
+    return panel
+
+
+@pytest.mark.parametrize("seed", range(2))
+def test_halted_tickers_match_per_stock_ensemble(seed):
+    """거래정지 종목도 종목 단위 앙상블(빈 날짜 제외)이 BUY 를 내면 1차 필터를 통과"""
+    panel = _with_halts(_panel(seed, n_tickers=40), seed)
+    result = prefilter_panel(panel)
+
+    buys = 0
+    for i, code in enumerate(result.tickers):
+        df = ticker_frame(panel, i)
+        if len(df) < 60:
+            continue
+        expected = evaluate_ensemble(code, df, 0.0, 0.0)
+        for j, sig in enumerate(expected.strategy_signals):
+            if sig.signal.value >= SignalType.BUY.value:
+                assert result.possible[i, j], (code, sig.strategy_name)
+        if expected.signal.value >= SignalType.BUY.value:
+            buys += 1
+            assert result.passed[i], code
+    assert buys > 0
@@ -0,0 +1,58 @@
+"""공유 메모리 패널 + 프로세스 풀 스크리닝 테스트"""
+import numpy as np
+import pandas as pd
+from data.shared_panel import SharedPanel, attach_panel
+from signals.process_pool import screen_with_processes, screen_with_threads
+from strategies.ensemble import evaluate_ensemble
+from strategies.panel import ticker_frame
+
+
+def _panel(n_tickers: int = 4, n_days: int = 300) -> dict[str, pd.DataFrame]:
+    rng = np.random.default_rng(8)
+    idx = pd.bdate_range("2023-01-02", periods=n_days)
+    cols = [f"{i:06d}" for i in range(n_tickers)]
+    close = pd.DataFrame(
+        60000 * np.exp(np.cumsum(rng.normal(0, 0.02, (n_days, n_tickers)), axis=0)),
+        index=idx, columns=cols,
+    )
+    close.iloc[:250, -1] = np.nan  # 상장 50일 — 최소 일수 미달
+    return {"Open": close, "High": close * 1.01, "Low": close * 0.99, "Close": close,
+            "Volume": close * 0 + 1e6}
+
+
+def test_attach_shares_memory_without_copy():
+    panel = _panel()
+    with SharedPanel.create(panel) as shared:
+        shm, attached = attach_panel(shared.spec)
+        try:
+            pd.testing.assert_frame_equal(
+                attached["Close"], panel["Close"], check_freq=False
+            )
+            # 공유 블록을 직접 바꾸면 붙은 쪽 DataFrame 에 그대로 보임
+            block = np.ndarray(
+                shared.spec.shape, dtype=np.float64, buffer=shared.shm.buf
+            )
+            block[0, 0, 0] = -1.0
+            assert attached[shared.spec.fields[0]].iat[0, 0] == -1.0
+        finally:
+            del attached
+            shm.close()
+
+
+def test_processes_match_per_ticker_evaluation():
+    panel = _panel()
+    results = screen_with_processes(panel, workers=2)
+
+    assert sorted(code for code, *_ in results) == [
+        "000000", "000001", "000002", "000003"
+    ]
+    # 상장 50일 종목은 평가하지 않았다고 명시해 돌려줌
+    assert [r for r in results if r[0] == "000003"] == [("000003", None, 0.0, [])]
+    for code, signal, score, _ in results:
+        if signal is None:
+            continue
+        df = ticker_frame(panel, list(panel["Close"].columns).index(code))
+        expected = evaluate_ensemble(code, df, 0.0, 0.0)
+        assert (signal, score) == (expected.signal.value, expected.ensemble_score)
+
+    assert sorted(results) == sorted(screen_with_threads(panel, workers=2))
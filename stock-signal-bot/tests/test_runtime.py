@@ -0,0 +1,94 @@
+"""스케줄 작업 실행 환경 — 우선 레인 격리, 대기 지연 집계, 작업별 정책"""
+import asyncio
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+from apscheduler.events import (
+    EVENT_JOB_MAX_INSTANCES,
+    EVENT_JOB_MISSED,
+    EVENT_JOB_SUBMITTED,
+    JobEvent,
+    JobExecutionEvent,
+    JobSubmissionEvent,
+)
+from scheduling import runtime as rt
+from scheduling.runtime import JobRuntime
+
+
+def test_priority_lane_runs_while_cpu_lane_is_busy():
+    runtime = JobRuntime(io_workers=1, cpu_workers=1)
+    release = threading.Event()
+
+    async def scenario():
+        busy = asyncio.ensure_future(runtime.run_cpu(release.wait, 5))
+        queued = asyncio.ensure_future(runtime.run_cpu(lambda: "late"))
+        await asyncio.sleep(0.05)
+        started = time.perf_counter()
+        assert await runtime.run_priority(lambda: "stop") == "stop"
+        elapsed = time.perf_counter() - started
+        release.set()
+        await asyncio.gather(busy, queued)
+        return elapsed
+
+    assert asyncio.run(scenario()) < 0.5
+    runtime.shutdown()
+
+
+def test_lane_wait_is_attributed_to_calling_job():
+    runtime = JobRuntime(io_workers=1, cpu_workers=1)
+
+    async def job(job_id, fn):
+        rt._current_job.set(job_id)
+        return await runtime.run_io(fn)
+
+    async def scenario():
+        await asyncio.gather(
+            job("slow", lambda: time.sleep(0.2)), job("fast", lambda: None)
+        )
+
+    asyncio.run(scenario())
+    stats = runtime.stats()
+    assert stats["fast"].last_lane_wait_s >= 0.15
+    assert stats["slow"].last_lane_wait_s < 0.1
+    assert stats["fast"].max_queue_delay_s == stats["fast"].last_queue_delay_s
+    runtime.shutdown()
+
+
+def test_scheduler_events_update_stats():
+    runtime = JobRuntime(io_workers=1, cpu_workers=1)
+    scheduled = datetime.now(timezone.utc) - timedelta(seconds=42)
+
+    runtime._on_event(JobSubmissionEvent(
+        EVENT_JOB_SUBMITTED, "daily_report", "default", [scheduled]
+    ))
+    runtime._on_event(JobExecutionEvent(
+        EVENT_JOB_MISSED, "stop_loss_monitor", "default", scheduled
+    ))
+    runtime._on_event(JobEvent(
+        EVENT_JOB_MAX_INSTANCES, "kospi200_screening_1510", "default"
+    ))
+
+    stats = runtime.stats()
+    report = stats["daily_report"]
+    assert 41 <= report.last_scheduler_lag_s < 45
+    assert report.total_queue_delay_s == report.last_scheduler_lag_s
+    assert stats["stop_loss_monitor"].missed == 1
+    assert stats["kospi200_screening_1510"].skipped == 1
+    runtime.shutdown()
+
+
+def test_build_scheduler_applies_job_policies():
+    import main
+
+    runtime = JobRuntime(io_workers=1, cpu_workers=1)
+    jobs = {job.id: job for job in main.build_scheduler(runtime).get_jobs()}
+
+    assert {
+        "kospi200_screening_0900", "kospi200_screening_1510", "stop_loss_monitor"
+    } <= set(jobs)
+    assert all(job.max_instances == 1 and job.coalesce for job in jobs.values())
+    assert jobs["stop_loss_monitor"].misfire_grace_time == 30
+    assert jobs["daily_report"].misfire_grace_time == 1800
+    assert jobs["closing_signal"].func.__name__ == "job_signal_scan"
+    runtime.shutdown()
@@ -0,0 +1,107 @@
+"""증분 스크리닝 — 입력 워터마크와 종목별 결과 저장/순위 조회 테스트"""
+import numpy as np
+import pandas as pd
+from db.screening_results import load_screening_results, save_screening_results
+from signals.models import ScreenedStock, SignalType
+from strategies.ensemble import input_watermark
+
+
+def _make_df(n: int = 360) -> pd.DataFrame:
+    rng = np.random.default_rng(5)
+    close = 60000 * np.exp(np.cumsum(rng.normal(0, 0.02, n)))
+    return pd.DataFrame(
+        {"Open": close, "High": close * 1.01, "Low": close * 0.99, "Close": close,
+         "Volume": rng.lognormal(15, 0.5, n), "ForeignNetBuy": rng.normal(0, 1e6, n)},
+        index=pd.bdate_range("2023-01-02", periods=n),
+    )
+
+
+def test_watermark_tracks_bars_and_flows():
+    df = _make_df()
+    last_date, key = input_watermark(df)
+    assert last_date == df.index[-1].strftime("%Y-%m-%d")
+
+    # lookback 밖의 오래된 봉은 결과에 영향 없음 → 같은 워터마크
+    older = df.copy()
+    older.iloc[0, 3] *= 1.1
+    assert input_watermark(older)[1] == key
+
+    flows = df.copy()
+    flows.iloc[-1, flows.columns.get_loc("ForeignNetBuy")] += 1
+    assert input_watermark(flows)[1] != key
+    assert input_watermark(df.iloc[:-1])[0] != last_date
+
+
+def test_reusable_only_within_price_tolerance():
+    stock = ScreenedStock(
+        stock_code="005930", stock_name="삼성전자", signal=SignalType.BUY,
+        ensemble_score=0.8, price=70000.0, input_hash="abc",
+    )
+
+    assert stock.reusable_for("abc", 70300.0, 0.005)
+    assert not stock.reusable_for("abc", 70400.0, 0.005)
+    assert not stock.reusable_for("xyz", 70000.0, 0.005)
+    prefiltered = stock.model_copy(update={"stage": "prefilter"})
+    assert not prefiltered.reusable_for("abc", 70000.0, 0.005)
+
+
+def test_ranked_list_is_queryable(tmp_db):
+    save_screening_results([
+        ScreenedStock(stock_code="A", stock_name="a", signal=SignalType.NEUTRAL,
+                      ensemble_score=0.1, price=1.0),
+        ScreenedStock(stock_code="B", stock_name="b", signal=SignalType.STRONG_BUY,
+                      ensemble_score=1.4, price=1.0, top_reasons=["근거"]),
+        ScreenedStock(stock_code="C", stock_name="c", stage="prefilter", price=1.0),
+        ScreenedStock(stock_code="D", stock_name="d", signal=SignalType.BUY,
+                      ensemble_score=0.7, price=1.0),
+    ])
+
+    ranked = load_screening_results()
+    assert [s.stock_code for s in ranked] == ["B", "D", "A", "C"]
+    assert ranked[0].top_reasons == ["근거"]
+    assert ranked[-1].signal is None
+
+    buys = load_screening_results(min_signal=SignalType.BUY, limit=1)
+    assert [s.stock_code for s in buys] == ["B"]
+    assert [s.stock_code for s in load_screening_results(["A", "C"])] == ["A", "C"]
+
+    # 종목당 최신 1건만 유지
+    save_screening_results([ScreenedStock(
+        stock_code="A", stock_name="a", signal=SignalType.BUY,
+        ensemble_score=2.0, price=1.0,
+    )])
+    assert load_screening_results()[0].stock_code == "A"
+    assert len(load_screening_results()) == 4
+
+
+def test_chunked_load_keeps_order_and_limit(tmp_db, monkeypatch):
+    """IN 목록을 나눠 조회해도 순위·limit 은 한 번에 조회한 것과 같음"""
+    from db import screening_results
+
+    save_screening_results([
+        ScreenedStock(stock_code=f"{i:06d}", stock_name=str(i), signal=SignalType.BUY,
+                      ensemble_score=(i * 7 % 11) / 10, price=1.0)
+        for i in range(25)
+    ] + [
+        ScreenedStock(stock_code="999999", stock_name="x", stage="prefilter", price=1.0)
+    ])
+    codes = [f"{i:06d}" for i in range(25)] + ["999999", "777777"]
+    expected = [s.stock_code for s in load_screening_results(codes, limit=8)]
+
+    monkeypatch.setattr(screening_results, "_CHUNK", 4)
+    assert [s.stock_code for s in load_screening_results(codes, limit=8)] == expected
+    everything = load_screening_results(codes)
+    assert len(everything) == 26 and everything[-1].stock_code == "999999"
+
+
+def test_prune_removes_tickers_outside_universe(tmp_db, monkeypatch):
+    from db import screening_results
+
+    monkeypatch.setattr(screening_results, "_CHUNK", 2)
+    save_screening_results([
+        ScreenedStock(stock_code=code, stock_name=code, price=1.0, stage="prefilter")
+        for code in ("A", "B", "C", "D", "E")
+    ])
+
+    assert screening_results.prune_screening_results(["B", "D", "Z"]) == 3
+    assert sorted(s.stock_code for s in load_screening_results()) == ["B", "D"]
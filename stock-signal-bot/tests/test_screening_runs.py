@@ -0,0 +1,185 @@
+"""예약 스크리닝 회차 — 체크포인트 저장/재개, 마감 시 부분 결과, 보유 종목 우선 순서"""
+import concurrent.futures
+import time
+from datetime import datetime, timedelta
+
+from db.screening_results import load_screening_results
+from db.screening_runs import (
+    finish_run,
+    load_checkpoints,
+    load_run,
+    save_checkpoints,
+    start_run,
+    unfinished_runs,
+)
+from signals import screener as sc
+from signals.leaderboard import TopK
+from signals.models import ScreenedStock, SignalType
+
+
+def _stock(code: str, score: float) -> ScreenedStock:
+    return ScreenedStock(stock_code=code, stock_name=code, signal=SignalType.BUY,
+                         ensemble_score=score, price=1000.0, input_hash=f"h{code}")
+
+
+def _run(**kwargs) -> "sc._Run":
+    return sc._Run(top=TopK(5), report=lambda done, board: None, **kwargs)
+
+
+def test_restarted_run_keeps_deadline_and_checkpoints(tmp_db):
+    deadline = datetime.now() + timedelta(minutes=10)
+    start_run("KOSPI200@2024-05-02T0900", "KOSPI200", deadline.replace(microsecond=0))
+    save_checkpoints("KOSPI200@2024-05-02T0900", ["000001", "000002"])
+
+    # 재시작 — 새 마감이 와도 처음 마감 유지
+    again = start_run(
+        "KOSPI200@2024-05-02T0900", "KOSPI200", deadline + timedelta(hours=1)
+    )
+    assert again.deadline == deadline.replace(microsecond=0)
+    assert load_checkpoints(again.run_id) == {"000001", "000002"}
+    assert [r.run_id for r in unfinished_runs()] == [again.run_id]
+    assert unfinished_runs(deadline + timedelta(seconds=1)) == []
+
+    finish_run(again.run_id, "partial", 200, 120)
+    run = load_run(again.run_id)
+    assert (run.status, run.total, run.scored) == ("partial", 200, 120)
+    assert load_checkpoints(run.run_id) == set()
+    assert unfinished_runs() == []
+
+
+def test_failed_run_keeps_checkpoints_for_retry(tmp_db):
+    start_run("r", "KOSPI200")
+    save_checkpoints("r", ["000001"])
+    finish_run("r", "failed", 0, 0)
+    assert load_checkpoints("r") == {"000001"}
+
+
+def test_holdings_first_then_previous_score(monkeypatch):
+    monkeypatch.setattr(sc, "MY_POSITIONS", {"000009": 1000.0})
+    monkeypatch.setattr(sc, "TARGETS", {})
+    universe = {c: c for c in ["000001", "000002", "000003", "000009"]}
+    previous = {"000002": _stock("000002", 0.3), "000003": _stock("000003", 1.1)}
+
+    order = list(sc._prioritize(universe, previous))
+    assert order == ["000009", "000003", "000002", "000001"]
+
+
+def test_threaded_stops_at_deadline_and_resumes_from_checkpoints(tmp_db, monkeypatch):
+    monkeypatch.setattr(sc, "SCREENER_WORKERS", 1)
+    monkeypatch.setattr(sc, "SCREENER_INCREMENTAL", False)
+    monkeypatch.setattr(sc, "MY_POSITIONS", {})
+    monkeypatch.setattr(sc, "TARGETS", {"000005": {}})
+    universe = {f"00000{i}": f"종목{i}" for i in range(1, 7)}
+    calls: list[str] = []
+
+    def slow_screen(code, name, previous=None):
+        calls.append(code)
+        time.sleep(0.15)
+        return _stock(code, int(code) / 10), False
+
+    monkeypatch.setattr(sc, "_screen_stock", slow_screen)
+    start_run("r", "KOSPI200")
+
+    first = _run(run_id="r", deadline=datetime.now() + timedelta(seconds=0.4))
+    sc._screen_threaded(universe, first)
+    assert first.timed_out
+    assert calls[0] == "000005"                     # 보유 종목 먼저
+    assert 0 < first.scored < len(universe)
+    checkpointed = load_checkpoints("r")
+    assert checkpointed == set(calls)
+    assert {s.stock_code for s in load_screening_results()} == checkpointed
+
+    # 같은 회차 재시작 — 체크포인트 종목은 다시 채점하지 않고 저장 결과로 순위에 포함
+    calls.clear()
+    second = _run(run_id="r", done=load_checkpoints("r"))
+    sc._screen_threaded(universe, second)
+    assert not second.timed_out
+    assert set(calls) == set(universe) - checkpointed
+    assert second.resumed == len(checkpointed)
+    assert second.scored == len(universe)
+    top = [r.stock_code for r in second.top.items()]
+    assert top == ["000006", "000005", "000004", "000003", "000002"]
+
+
+def test_deadline_timeouts_mark_runs_partial(tmp_db, monkeypatch):
+    """마감 시 풀이 내는 concurrent.futures.TimeoutError 를 부분 결과로 처리"""
+    from benchmarks.synthetic import synthetic_panel
+
+    monkeypatch.setattr(sc, "SCREENER_INCREMENTAL", False)
+    monkeypatch.setattr(sc, "MY_POSITIONS", {})
+    monkeypatch.setattr(sc, "TARGETS", {})
+    monkeypatch.setattr(sc, "get_current_price", lambda code: (1000.0, 0.0))
+
+    # 스레드 모드 — as_completed 가 마감에 걸림
+    def expired(futures, timeout=None):
+        raise concurrent.futures.TimeoutError
+
+    monkeypatch.setattr(sc, "as_completed", expired)
+    monkeypatch.setattr(sc, "_screen_stock", lambda code, name, previous=None: None)
+    threaded = _run(deadline=datetime.now())
+    sc._screen_threaded({"000001": "a", "000002": "b"}, threaded)
+    assert threaded.timed_out
+
+    # 프로세스 모드 — 첫 묶음 결과를 넘긴 뒤 pool.map 이 마감에 걸림
+    def first_chunk_then_expire(panel, workers, on_chunk, timeout=None):
+        on_chunk([("000000", SignalType.BUY.value, 0.9, ["근거"])])
+        raise concurrent.futures.TimeoutError
+
+    monkeypatch.setattr(sc, "screen_with_processes", first_chunk_then_expire)
+    panel = synthetic_panel(3, 80)
+    processes = _run(deadline=datetime.now())
+    universe = {code: code for code in panel["Close"].columns}
+    sc._screen_processes(universe, processes, panel)
+    assert processes.timed_out
+    assert processes.scored == 1
+    assert [r.stock_code for r in processes.top.items()] == ["000000"]
+
+
+def test_threaded_failures_are_checkpointed(tmp_db, monkeypatch):
+    monkeypatch.setattr(sc, "SCREENER_INCREMENTAL", False)
+    monkeypatch.setattr(sc, "MY_POSITIONS", {})
+    monkeypatch.setattr(sc, "TARGETS", {})
+    universe = {f"00000{i}": f"종목{i}" for i in range(1, 4)}
+
+    def flaky_screen(code, name, previous=None):
+        if code == "000003":
+            raise RuntimeError("boom")
+        return _stock(code, int(code) / 10), False
+
+    monkeypatch.setattr(sc, "_screen_stock", flaky_screen)
+    start_run("r", "KOSPI200")
+    run = _run(run_id="r")
+    sc._screen_threaded(universe, run)
+
+    assert run.scored == len(universe)
+    assert load_checkpoints("r") == set(universe)
+    assert {s.stock_code for s in load_screening_results()} == {"000001", "000002"}
+
+
+def test_process_mode_checkpoints_skipped_tickers(tmp_db, monkeypatch):
+    """일수 미달·패널 누락 종목도 스레드 모드처럼 채점·체크포인트"""
+    import numpy as np
+    from benchmarks.synthetic import synthetic_panel
+    from signals import process_pool
+    from strategies.panel import panel_tickers
+
+    monkeypatch.setattr(sc, "SCREENER_INCREMENTAL", False)
+    monkeypatch.setattr(sc, "MY_POSITIONS", {})
+    monkeypatch.setattr(sc, "TARGETS", {})
+    monkeypatch.setattr(sc, "get_current_price", lambda code: (1000.0, 0.0))
+
+    def in_process(panel, workers, on_chunk, timeout=None):
+        tickers = panel_tickers(panel)
+        on_chunk(process_pool._evaluate(panel, tickers, np.arange(len(tickers))))
+
+    monkeypatch.setattr(sc, "screen_with_processes", in_process)
+    panel = synthetic_panel(3, 80)
+    panel["Close"].iloc[:40, -1] = np.nan      # 40일 — 최소 일수 미달
+    universe = {code: code for code in panel["Close"].columns} | {"999999": "없음"}
+    start_run("r", "KOSPI200")
+
+    run = _run(run_id="r")
+    sc._screen_processes(universe, run, panel)
+    assert run.scored == len(universe)
+    assert load_checkpoints("r") == set(universe)
+    assert {s.stock_code for s in load_screening_results()} == {"000000", "000001"}
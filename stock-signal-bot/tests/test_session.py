@@ -0,0 +1,124 @@
+"""세션 산출물 — 신선도·세션 경계, 재사용 조건, 일간 리포트의 재사용"""
+from datetime import datetime, timedelta
+
+import numpy as np
+from signals import generator, session
+from signals.models import (
+    EnsembleSignal,
+    IndexQuote,
+    MarketRegime,
+    Recommendation,
+    ScreeningResult,
+    ScreeningSummary,
+    SignalSnapshot,
+    SignalType,
+    StrategySignal,
+)
+
+
+def _screening(status: str) -> ScreeningResult:
+    return ScreeningResult(
+        recommendations=[Recommendation(
+            stock_code="000001", stock_name="A", signal=SignalType.BUY,
+            ensemble_score=0.9, price=1000.0, change_pct=1.0, top_reasons=["r"],
+        )],
+        summary=ScreeningSummary(
+            mode="thread", universe=10, prefiltered=5, candidates=1,
+            scored=10 if status == "complete" else 4, status=status, elapsed_s=1.0,
+        ),
+    )
+
+
+def test_artifact_is_fresh_within_max_age_and_session(tmp_db):
+    produced = datetime(2024, 5, 2, 15, 20)
+    quote = IndexQuote(price=2700.0, change_pct=0.5)
+    session.record(session.KOSPI, quote, now=produced)
+    later = produced + timedelta(minutes=11)
+
+    assert session.load(session.KOSPI, now=produced + timedelta(minutes=5)) == quote
+    assert session.load(session.KOSPI, now=later) is None
+    assert session.load(session.KOSPI, max_age=timedelta(hours=1), now=later)
+    # 다음 날은 같은 이름이라도 다른 세션
+    next_day = produced + timedelta(days=1)
+    assert session.load(session.KOSPI, max_age=timedelta(days=2), now=next_day) is None
+
+
+def test_partial_screening_is_not_reused(tmp_db):
+    session.record(session.SCREENING, _screening("partial"))
+    assert session.load(session.SCREENING) is None
+
+    session.record(session.SCREENING, _screening("complete"))
+    assert session.load(session.SCREENING).recommendations[0].stock_code == "000001"
+
+
+def test_signals_round_trip_numpy_indicators(tmp_db):
+    signal = EnsembleSignal(
+        stock_code="000001", stock_name="A", signal=SignalType.BUY,
+        ensemble_score=0.8,
+        strategy_signals=[StrategySignal(
+            strategy_name="s", signal=SignalType.BUY, reason="r",
+            indicators={
+                "above": np.bool_(True), "n": np.int64(3), "x": np.float64(1.5)
+            },
+        )],
+        price=1000.0, change_pct=1.0,
+    )
+    session.record(session.SIGNALS, SignalSnapshot(signals=[signal]))
+
+    loaded = session.load(session.SIGNALS).signals[0]
+    assert loaded.signal == SignalType.BUY
+    assert loaded.strategy_signals[0].indicators == {"above": True, "n": 3, "x": 1.5}
+
+
+def test_daily_report_assembles_from_session(tmp_db, monkeypatch):
+    calls = []
+    def kospi():
+        calls.append("kospi")
+        return 2700.0, 0.5
+
+    def screen():
+        calls.append("screen")
+        return _screening("complete")
+
+    monkeypatch.setattr(generator, "get_kospi_data", kospi)
+    monkeypatch.setattr(generator, "MY_POSITIONS", {})
+    import signals.screener as sc
+    monkeypatch.setattr(sc, "run_screening", screen)
+
+    session.record(session.SCREENING, _screening("complete"))
+    generator.build_daily_report([])
+    report = generator.build_daily_report([])
+
+    assert calls == ["kospi"]
+    assert report.kospi == 2700.0
+    assert [r.stock_code for r in report.recommendations] == ["000001"]
+
+
+def test_reuse_disabled_always_produces(tmp_db, monkeypatch):
+    monkeypatch.setattr(session, "SESSION_REUSE", False)
+    produced = []
+
+    def produce():
+        produced.append(1)
+        return IndexQuote(price=1, change_pct=0)
+
+    for _ in range(2):
+        session.reuse_or_produce(session.KOSPI, produce)
+    assert len(produced) == 2
+
+
+def test_degraded_market_regime_is_not_reused(tmp_db, monkeypatch):
+    import signals.screener as sc
+
+    regimes = [
+        MarketRegime(is_bull=True, message="데이터 없음", degraded=True),
+        MarketRegime(is_bull=False, message="120일선 기준: KOSPI 약세"),
+        MarketRegime(is_bull=True, message="호출되면 안 됨"),
+    ]
+    monkeypatch.setattr(sc, "check_global_market_status", lambda _: regimes.pop(0))
+
+    assert sc._market_regime().degraded
+    assert session.load(session.REGIME) is None
+    assert not sc._market_regime().is_bull
+    assert sc._market_regime().message == "120일선 기준: KOSPI 약세"
+    assert len(regimes) == 1
@@ -0,0 +1,77 @@
+"""전략 시그널 메모이제이션 테스트"""
+import numpy as np
+import pandas as pd
+import pytest
+from db.signal_memo import load_signal_memo
+from strategies.base import BaseStrategy
+from strategies.ensemble import _STRATEGIES, generate_ensemble_signal
+
+
+def _make_df(n: int = 300) -> pd.DataFrame:
+    rng = np.random.default_rng(11)
+    close = 60000 * np.exp(np.cumsum(rng.normal(0, 0.02, n)))
+    return pd.DataFrame(
+        {"Open": close, "High": close * 1.01, "Low": close * 0.99, "Close": close,
+         "Volume": rng.lognormal(15, 0.5, n)},
+        index=pd.bdate_range("2023-01-02", periods=n),
+    )
+
+
+@pytest.fixture
+def calls(monkeypatch):
+    counter = {"n": 0}
+    original = BaseStrategy._safe_analyze
+
+    def counting(self, df, stock_code):
+        counter["n"] += 1
+        return original(self, df, stock_code)
+
+    monkeypatch.setattr(BaseStrategy, "_safe_analyze", counting)
+    return counter
+
+
+def test_unchanged_input_reuses_saved_signals(tmp_db, calls):
+    df = _make_df()
+    first = generate_ensemble_signal("005930", df, 75000.0, 1.0, memo=True)
+    assert calls["n"] == len(_STRATEGIES)
+    assert len(load_signal_memo("005930")) == len(_STRATEGIES)
+
+    second = generate_ensemble_signal("005930", df, 76000.0, 2.3, memo=True)
+    assert calls["n"] == len(_STRATEGIES)
+    assert second.strategy_signals == first.strategy_signals
+    assert second.ensemble_score == first.ensemble_score
+    # 현재가 의존 값은 새로 채움
+    assert (second.price, second.change_pct) == (76000.0, 2.3)
+
+
+def test_memo_matches_fresh_analysis(tmp_db):
+    df = _make_df()
+    generate_ensemble_signal("005930", df, 75000.0, 1.0, memo=True)
+    cached = generate_ensemble_signal("005930", df, 75000.0, 1.0, memo=True)
+    fresh = generate_ensemble_signal("005930", df, 75000.0, 1.0)
+    assert cached.strategy_signals == fresh.strategy_signals
+    assert cached.signal == fresh.signal
+
+
+def test_changed_bar_recomputes_only_affected_strategies(tmp_db, calls):
+    df = _make_df()
+    generate_ensemble_signal("005930", df, 75000.0, 1.0, memo=True)
+
+    # 장중 당일 봉 값이 바뀌면 모든 전략 구간에 포함되므로 전부 재계산
+    df.iloc[-1, df.columns.get_loc("Close")] *= 1.01
+    generate_ensemble_signal("005930", df, 75000.0, 1.0, memo=True)
+    assert calls["n"] == 2 * len(_STRATEGIES)
+
+    # 200봉 전 값만 바뀌면 lookback 이 짧은 전략
+    # (일목·와인스타인·볼린저·윌리엄스)은 재사용
+    df.iloc[100, df.columns.get_loc("Volume")] += 1
+    generate_ensemble_signal("005930", df, 75000.0, 1.0, memo=True)
+    assert calls["n"] == 3 * len(_STRATEGIES) - 4
+
+
+def test_version_bump_invalidates(tmp_db, calls, monkeypatch):
+    df = _make_df()
+    generate_ensemble_signal("005930", df, 75000.0, 1.0, memo=True)
+    monkeypatch.setattr(type(_STRATEGIES[0]), "version", "2")
+    generate_ensemble_signal("005930", df, 75000.0, 1.0, memo=True)
+    assert calls["n"] == len(_STRATEGIES) + 1
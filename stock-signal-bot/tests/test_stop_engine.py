@@ -0,0 +1,72 @@
+"""손절 엔진 — 손절가 인덱스 판정, 트레일링 증분 갱신, 포지션 저장소 연동"""
+from db.signal_history import get_open_positions, save_position
+from signals.stop_engine import StopEngine, StopPosition
+
+
+def _engine(quotes=None) -> StopEngine:
+    return StopEngine(
+        quotes=lambda codes: {c: (quotes[c], 0.0) for c in codes}, default_trail=0.0
+    )
+
+
+def test_tick_triggers_only_stops_at_or_above_price():
+    engine = _engine()
+    for pid, stop in enumerate([9000, 9500, 9300, 8800], start=1):
+        engine.add(StopPosition(pid, "000001", 10000, stop))
+    engine.add(StopPosition(9, "000002", 10000, 9900))
+
+    assert engine.on_quote("000001", 9600) == []
+    hits = engine.on_quote("000001", 9300)
+    assert sorted(h.position.position_id for h in hits) == [2, 3]
+    assert all(h.exit_reason == "STOP_LOSS" for h in hits)
+    assert len(engine) == 3
+
+    hits = engine.on_quotes({"000001": 8000, "000002": 9950})
+    assert sorted(h.position.position_id for h in hits) == [1, 4]
+    assert engine.tickers() == ["000002"]
+
+
+def test_trailing_stop_follows_new_highs():
+    engine = _engine()
+    engine.add(StopPosition(1, "000001", 10000, 9200, trail_pct=0.1, high_water=10000))
+    engine.add(
+        StopPosition(2, "000001", 11000, 10100, trail_pct=0.05, high_water=11000)
+    )
+
+    engine.on_quote("000001", 10500)        # 1 만 새 고점 → 9450
+    assert engine._positions[1].stop_price == 9450
+    assert engine._positions[2].stop_price == 10100
+
+    engine.on_quote("000001", 12000)        # 둘 다 새 고점 → 10800 / 11400
+    stops = (engine._positions[1].stop_price, engine._positions[2].stop_price)
+    assert stops == (10800, 11400)
+    assert engine.on_quote("000001", 11500) == []
+
+    hits = engine.on_quote("000001", 11400)
+    assert [h.position.position_id for h in hits] == [2]
+    assert hits[0].exit_reason == "TRAILING_STOP"
+    assert "고점 12,000원" in hits[0].reason()
+
+
+def test_poll_persists_closes_and_trailing_state(tmp_db):
+    trailing = save_position("000001", 10000, 9300, trail_pct=0.1)
+    fixed = save_position("000002", 20000, 18600)
+    quotes = {"000001": 11000.0, "000002": 19000.0}
+    engine = _engine(quotes)
+
+    assert engine.poll() == []
+    row = {r["id"]: r for r in get_open_positions()}[trailing]
+    assert (row["stop_loss_price"], row["high_water"]) == (9900, 11000)
+
+    # 외부에서 추가된 포지션은 다음 poll 에서 인덱스에 반영
+    added = save_position("000003", 5000, 4600)
+    quotes.update({"000002": 18500.0, "000003": 4500.0})
+    hits = engine.poll()
+    assert sorted(h.position.position_id for h in hits) == [fixed, added]
+    assert [r["id"] for r in get_open_positions()] == [trailing]
+
+    # 재시작 — 저장된 트레일링 고점·손절가에서 이어감
+    restarted = _engine({"000001": 9900.0})
+    hits = restarted.poll()
+    assert hits[0].exit_reason == "TRAILING_STOP"
+    assert get_open_positions() == []
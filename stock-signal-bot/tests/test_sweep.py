@@ -0,0 +1,86 @@
+"""파라미터 스윕 테스트"""
+import numpy as np
+import pandas as pd
+from backtest.engine import SignalTensor, compute_signal_tensor, simulate, stop_loss_pct
+from backtest.sweep import (
+    SweepParams,
+    grid_params,
+    random_params,
+    run_sweep,
+    walk_forward_splits,
+    walk_forward_summary,
+)
+
+
+def _panel() -> dict[str, pd.DataFrame]:
+    rng = np.random.default_rng(3)
+    idx = pd.bdate_range("2022-01-03", periods=320)
+    close = pd.DataFrame(
+        50000 * np.exp(np.cumsum(rng.normal(0, 0.02, (320, 3)), axis=0)), index=idx
+    )
+    return {"Open": close, "High": close * 1.01, "Low": close * 0.99, "Close": close,
+            "Volume": close * 0 + 1e6}
+
+
+def test_walk_forward_splits_are_expanding_and_contiguous():
+    splits = walk_forward_splits(100, n_splits=4)
+    assert [s[0].start for s in splits] == [0, 0, 0, 0]
+    assert [s[0].stop for s in splits] == [s[1].start for s in splits]
+    assert splits[-1][1].stop == 100
+
+
+def test_grid_skips_inverted_thresholds():
+    params = grid_params([(1.0,) * 7], [0.5, 1.0], [1.0, 1.5])
+    thresholds = [(p.buy, p.strong_buy) for p in params]
+    assert thresholds == [(0.5, 1.0), (0.5, 1.5), (1.0, 1.5)]
+    assert all(p.sell == -p.buy for p in params)
+
+
+def test_random_params_are_seeded():
+    base = np.ones(7)
+    assert random_params(5, base, seed=1) == random_params(5, base, seed=1)
+    assert all(abs(sum(p.weights) - 1) < 1e-3 for p in random_params(5, base, seed=1))
+
+
+def test_sweep_matches_direct_simulation():
+    panel = _panel()
+    tensor = compute_signal_tensor(panel)
+    params = [
+        SweepParams(tuple(tensor.weights)),
+        SweepParams((1.0,) * 7, buy=0.3, strong_buy=0.8),
+    ]
+
+    table = run_sweep(params, panel, tensor=tensor, n_splits=3, workers=1)
+    assert len(table) == len(params) * 3
+    expected = {"w_엘더 Triple Screen", "buy", "test_sharpe", "train_return"}
+    assert expected <= set(table.columns)
+
+    _, final = tensor.ensemble()
+    row = table[(table.param_id == 0) & (table.split == 2)].iloc[0]
+    train, test = walk_forward_splits(len(final), 3)[2]
+    for rows, prefix in ((train, "train"), (test, "test")):
+        sliced = {k: v.iloc[rows] for k, v in panel.items()}
+        stats, returns = simulate(sliced, final[rows], stop_loss_pct(None))
+        assert np.isclose(row[f"{prefix}_return"], np.prod(1 + returns) - 1)
+        assert row[f"{prefix}_trades"] == stats.trades
+        assert row[f"{prefix}_hit_rate"] == stats.hit_rate
+
+    summary = walk_forward_summary(table)
+    assert list(summary.split) == [0, 1, 2]
+
+
+def test_test_split_starts_flat():
+    """학습 구간에서 연 포지션은 검증 구간 수익·거래에 포함되지 않는다"""
+    panel = _panel()
+    n_days = len(panel["Close"])
+    values = np.zeros((n_days, 3, 1), dtype=np.int8)
+    values[0] = 2  # 첫날 매수 후 시그널 없음
+    tensor = SignalTensor(
+        panel["Close"].index, ["a", "b", "c"], ["x"], np.ones(1), values
+    )
+    params = [SweepParams((1.0,), buy=0.5, strong_buy=1.5, sell=-0.5, strong_sell=-1.5)]
+
+    table = run_sweep(params, panel, tensor=tensor, n_splits=3, workers=1)
+    assert (table.train_return != 0).all()
+    assert (table.test_return == 0).all()
+    assert (table.test_trades == 0).all()
@@ -0,0 +1,103 @@
+"""유니버스 서비스 — 거래일당 1회 갱신, 적용일 스냅샷, 시점 기준 구성 테스트"""
+from datetime import date
+
+import data.universe as universe
+import pandas as pd
+import pytest
+from backtest.engine import _point_in_time
+from signals.models import SignalType
+
+
+class _FakeKrx:
+    def __init__(self):
+        self.constituents = {"1028": ["005930", "000660"], "2203": ["247540"]}
+        self.calls = 0
+
+    def get_index_portfolio_deposit_file(self, index_code, day):
+        self.calls += 1
+        return list(self.constituents[index_code])
+
+    def get_market_sector_classifications(self, day, market):
+        return pd.DataFrame(
+            {"종목명": ["삼성전자", "SK하이닉스", "에코프로비엠"],
+             "업종명": ["전기전자", "전기전자", "화학"]},
+            index=pd.Index(["005930", "000660", "247540"], name="종목코드"),
+        )
+
+    def get_market_ticker_name(self, code):
+        return f"종목{code}"
+
+
+@pytest.fixture
+def krx(tmp_db, monkeypatch):
+    fake = _FakeKrx()
+    monkeypatch.setattr(universe, "krx", fake)
+    return fake
+
+
+def test_refresh_once_per_trading_day(krx):
+    monday = date(2024, 3, 4)
+    assert universe.refresh_universe("KOSPI200", monday)
+    assert not universe.refresh_universe("KOSPI200", monday)
+    # 토·일은 직전 금요일 거래일로 취급
+    assert universe.trading_day(date(2024, 3, 10)) == date(2024, 3, 8)
+    assert krx.calls == 1
+
+    assert universe.get_universe("KOSPI200", monday) == {
+        "000660": "SK하이닉스", "005930": "삼성전자"
+    }
+    listings = universe.universe_listings("KOSPI200", monday)
+    assert listings.loc["005930", "sector"] == "전기전자"
+
+
+def test_point_in_time_membership(krx):
+    universe.refresh_universe("KOSPI200", date(2024, 3, 4))
+    krx.constituents["1028"] = ["005930", "035420"]   # SK하이닉스 편출, NAVER 편입
+    universe.refresh_universe("KOSPI200", date(2024, 6, 14))
+
+    def members(day: date) -> dict[str, str]:
+        return universe.get_universe("KOSPI200", day)
+
+    assert set(members(date(2024, 5, 1))) == {"005930", "000660"}
+    assert set(members(date(2024, 6, 14))) == {"005930", "035420"}
+    assert members(date(2024, 1, 2)) == {}
+    assert members(date(2024, 6, 14))["035420"] == "종목035420"
+    assert universe.all_members("KOSPI200") == ["000660", "005930", "035420"]
+
+    dates = pd.DatetimeIndex(["2024-03-01", "2024-03-04", "2024-06-13", "2024-06-14"])
+    mask = universe.membership_mask("KOSPI200", dates, ["000660", "035420"])
+    assert mask.tolist() == [
+        [False, False], [True, False], [True, False], [False, True]
+    ]
+
+    # 편입 전 매수 시그널은 무시, 매도 시그널은 유지
+    signal = pd.DataFrame([[1, 2], [-1, 1]]).to_numpy()
+    masked = _point_in_time(signal, mask[[0, 3]])
+    neutral = SignalType.NEUTRAL.value
+    assert masked.tolist() == [[neutral, neutral], [-1, 1]]
+
+
+def test_named_union_and_failed_refresh_serves_stored(krx, monkeypatch):
+    monkeypatch.setattr(universe, "trading_day", lambda day: date(2024, 3, 4))
+    union = universe.get_universe("KOSPI200+KOSDAQ150")
+    assert set(union) == {"005930", "000660", "247540"}
+
+    def broken(*args):
+        raise ConnectionError("KRX 응답 없음")
+
+    krx.get_index_portfolio_deposit_file = broken
+    monkeypatch.setattr(universe, "trading_day", lambda day: date(2024, 3, 5))
+    assert set(universe.get_universe("KOSPI200")) == {"005930", "000660"}
+    assert universe.get_universe("STATIC")
+
+
+def test_listings_load_in_chunks(tmp_db, monkeypatch):
+    from db import universe as db_universe
+
+    monkeypatch.setattr(db_universe, "_CHUNK", 3)
+    listings = {f"{i:06d}": (f"종목{i}", "KOSPI", None) for i in range(10)}
+    db_universe.save_listings(listings, date(2024, 3, 4))
+
+    loaded = db_universe.load_listings([*listings, "999999"])
+    assert loaded == listings
+    assert db_universe.load_listings([]) == {}